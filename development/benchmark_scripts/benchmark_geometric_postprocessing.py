@@ -0,0 +1,136 @@
+"""
+Micro-benchmark of geometric post-processing of instance segmentation outputs.
+
+Measures rescaling of boxes and polygons from inference input into coordinates of
+original images (undoing static crop and letterbox / stretch resize) - for batches of
+images with high number of detections - processed image by image and as whole batch.
+
+Usage:
+    python -m development.benchmark_scripts.benchmark_geometric_postprocessing \
+        --batch-size 8 --detections 300 --points 200 --repeats 20
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, List
+
+import numpy as np
+
+from inference.core.utils.postprocess import (
+    post_process_bboxes,
+    post_process_polygons,
+    post_process_polygons_batch,
+)
+
+INFER_SHAPE = (640, 640)
+RESIZE_METHODS = ["Stretch to", "Fit (black edges) in"]
+PREPROCESSING_CONFIGS = {
+    "no preproc": {},
+    "static crop": {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 10,
+            "y_min": 10,
+            "x_max": 90,
+            "y_max": 90,
+        }
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--detections", type=int, default=300)
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    rng = np.random.default_rng(seed=42)
+    img_dims = [(1080, 1920)] * args.batch_size
+    predictions = [
+        rng.uniform(0, INFER_SHAPE[0], size=(args.detections, 7 + 32)).tolist()
+        for _ in range(args.batch_size)
+    ]
+    polygons = [
+        [
+            rng.uniform(0, 160, size=(rng.integers(3, 2 * args.points), 2)).astype(
+                np.float32
+            )
+            for _ in range(args.detections)
+        ]
+        for _ in range(args.batch_size)
+    ]
+    print(
+        f"--- batch of {args.batch_size} images, {args.detections} detections each, "
+        f"~{args.points} points per polygon ---"
+    )
+    for config_name, preproc in PREPROCESSING_CONFIGS.items():
+        for resize_method in RESIZE_METHODS:
+            suffix = f"({config_name}, {resize_method})"
+            benchmark(
+                name=f"post_process_bboxes per image {suffix}",
+                function=lambda: [
+                    post_process_bboxes(
+                        [image_predictions],
+                        INFER_SHAPE,
+                        [img_dim],
+                        preproc,
+                        resize_method=resize_method,
+                    )
+                    for image_predictions, img_dim in zip(predictions, img_dims)
+                ],
+                repeats=args.repeats,
+            )
+            benchmark(
+                name=f"post_process_bboxes batch {suffix}",
+                function=lambda: post_process_bboxes(
+                    predictions,
+                    INFER_SHAPE,
+                    img_dims,
+                    preproc,
+                    resize_method=resize_method,
+                ),
+                repeats=args.repeats,
+            )
+            benchmark(
+                name=f"post_process_polygons per image {suffix}",
+                function=lambda: [
+                    post_process_polygons(
+                        img_dim,
+                        image_polygons,
+                        (160, 160),
+                        preproc,
+                        resize_method=resize_method,
+                    )
+                    for image_polygons, img_dim in zip(polygons, img_dims)
+                ],
+                repeats=args.repeats,
+            )
+            benchmark(
+                name=f"post_process_polygons_batch {suffix}",
+                function=lambda: post_process_polygons_batch(
+                    polygons=polygons,
+                    img_dims=img_dims,
+                    infer_shape=(160, 160),
+                    preproc=preproc,
+                    resize_method=resize_method,
+                ),
+                repeats=args.repeats,
+            )
+
+
+def benchmark(name: str, function: Callable[[], object], repeats: int) -> None:
+    function()
+    durations: List[float] = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+    print(
+        f"{name}: min={min(durations) * 1000:.2f}ms "
+        f"mean={np.mean(durations) * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
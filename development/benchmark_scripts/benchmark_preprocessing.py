@@ -0,0 +1,115 @@
+"""
+Micro-benchmark of Roboflow models pre-processing across common input resolutions.
+
+Measures preparation of model input out of decoded frame - Roboflow `preproc` steps
+(static crop, contrast, grayscale) followed by resize into model input (for each
+resize method and interpolation) and conversion into channels-first float32 batch.
+
+Usage:
+    python -m development.benchmark_scripts.benchmark_preprocessing \
+        --model-size 640 --repeats 20
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, List
+
+import numpy as np
+
+from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.utils.preprocess import (
+    AUTO_RESIZE_INTERPOLATION,
+    RESIZE_INTERPOLATIONS,
+)
+
+RESOLUTIONS = {
+    "VGA": (480, 640),
+    "HD": (720, 1280),
+    "FHD": (1080, 1920),
+    "4K": (2160, 3840),
+}
+RESIZE_METHODS = ["Stretch to", "Fit (grey edges) in"]
+PREPROCESSING_CONFIGS = {
+    "no preproc": {},
+    "static crop": {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 10,
+            "y_min": 10,
+            "x_max": 90,
+            "y_max": 90,
+        }
+    },
+    "grayscale": {"grayscale": {"enabled": True}},
+    "contrast + grayscale": {
+        "contrast": {"enabled": True, "type": "Histogram Equalization"},
+        "grayscale": {"enabled": True},
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model-size", type=int, default=640)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    rng = np.random.default_rng(seed=42)
+    for resolution_name, (height, width) in RESOLUTIONS.items():
+        frame = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+        print(f"--- {resolution_name} ({width}x{height}) ---")
+        for resize_method in RESIZE_METHODS:
+            for interpolation in list(RESIZE_INTERPOLATIONS) + [
+                AUTO_RESIZE_INTERPOLATION
+            ]:
+                model = create_model(
+                    model_size=args.model_size,
+                    resize_method=resize_method,
+                    interpolation=interpolation,
+                    preproc={},
+                )
+                benchmark(
+                    name=f"resize_to_model_input({resize_method}, {interpolation})",
+                    function=lambda: model.resize_to_model_input(frame, is_bgr=True),
+                    repeats=args.repeats,
+                )
+        for config_name, preproc in PREPROCESSING_CONFIGS.items():
+            model = create_model(
+                model_size=args.model_size,
+                resize_method="Stretch to",
+                interpolation="linear",
+                preproc=preproc,
+            )
+            benchmark(
+                name=f"preproc_image({config_name})",
+                function=lambda: model.preproc_image(frame),
+                repeats=args.repeats,
+            )
+
+
+def create_model(
+    model_size: int, resize_method: str, interpolation: str, preproc: dict
+) -> OnnxRoboflowInferenceModel:
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.img_size_h = model_size
+    model.img_size_w = model_size
+    model.resize_method = resize_method
+    model.resize_interpolation = interpolation
+    model.preproc = preproc
+    return model
+
+
+def benchmark(name: str, function: Callable[[], object], repeats: int) -> None:
+    function()
+    durations: List[float] = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+    print(
+        f"{name}: min={min(durations) * 1000:.2f}ms "
+        f"mean={np.mean(durations) * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
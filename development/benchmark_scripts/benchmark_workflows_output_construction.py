@@ -0,0 +1,150 @@
+"""
+Micro-benchmark of Workflows output assembly for large detection sets.
+
+Measures the stages executed by Execution Engine after the last step finishes:
+construction of nested output arrays, conversion of sv.Detections into root
+coordinates and serialisation of sv.Detections into inference response format.
+
+Usage:
+    python -m development.benchmark_scripts.benchmark_workflows_output_construction \
+        --detections 5000 --crops 200 --repeats 5
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, List
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.serializers import (
+    serialise_sv_detections,
+)
+from inference.core.workflows.core_steps.common.utils import (
+    attach_parents_coordinates_to_sv_detections,
+    sv_detections_to_root_coordinates,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    OriginCoordinatesSystem,
+    WorkflowImageData,
+)
+from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
+    create_array,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--detections", type=int, default=5000)
+    parser.add_argument("--crops", type=int, default=200)
+    parser.add_argument("--keypoints", type=int, default=17)
+    parser.add_argument("--mask-size", type=int, default=128)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    detections = generate_detections(
+        detections=args.detections, keypoints=args.keypoints
+    )
+    detections_with_masks = generate_detections(
+        detections=args.crops, keypoints=0, mask_size=args.mask_size
+    )
+    indices = np.array(
+        [
+            (crop_id, detection_id)
+            for crop_id in range(args.crops)
+            for detection_id in range(args.detections // args.crops)
+        ]
+    )
+    benchmark(
+        name=f"create_array(indices={len(indices)})",
+        function=lambda: create_array(indices=indices),
+        repeats=args.repeats,
+    )
+    benchmark(
+        name=f"sv_detections_to_root_coordinates(detections={len(detections)})",
+        function=lambda: sv_detections_to_root_coordinates(detections=detections),
+        repeats=args.repeats,
+    )
+    benchmark(
+        name=f"sv_detections_to_root_coordinates(masks={len(detections_with_masks)})",
+        function=lambda: sv_detections_to_root_coordinates(
+            detections=detections_with_masks
+        ),
+        repeats=args.repeats,
+    )
+    benchmark(
+        name=f"serialise_sv_detections(detections={len(detections)})",
+        function=lambda: serialise_sv_detections(detections=detections),
+        repeats=args.repeats,
+    )
+
+
+def generate_detections(
+    detections: int, keypoints: int, mask_size: int = 0
+) -> sv.Detections:
+    rng = np.random.default_rng(seed=42)
+    top_left = rng.uniform(0, mask_size or 1000, size=(detections, 2))
+    sizes = rng.uniform(4, 64, size=(detections, 2))
+    xyxy = np.concatenate([top_left, top_left + sizes], axis=1)
+    mask = None
+    if mask_size:
+        xyxy = np.clip(xyxy, 0, mask_size - 1)
+        mask = np.zeros((detections, mask_size, mask_size), dtype=bool)
+        for detection_mask, (x1, y1, x2, y2) in zip(mask, xyxy.astype(int)):
+            detection_mask[y1 : y2 + 1, x1 : x2 + 1] = True
+    result = sv.Detections(
+        xyxy=xyxy.astype(np.float32),
+        mask=mask,
+        confidence=rng.uniform(size=detections).astype(np.float32),
+        class_id=rng.integers(0, 80, size=detections),
+        tracker_id=np.arange(detections),
+        data={
+            "class_name": np.array([f"class_{i % 80}" for i in range(detections)]),
+            "detection_id": np.array([f"{i}" for i in range(detections)]),
+        },
+    )
+    if keypoints:
+        result["keypoints_class_id"] = np.array(
+            [np.arange(keypoints)] * detections, dtype=object
+        )
+        result["keypoints_class_name"] = np.array(
+            [np.array([f"kp_{i}" for i in range(keypoints)])] * detections,
+            dtype=object,
+        )
+        result["keypoints_confidence"] = np.array(
+            [rng.uniform(size=keypoints) for _ in range(detections)], dtype=object
+        )
+        result["keypoints_xy"] = np.array(
+            [rng.uniform(0, 1000, size=(keypoints, 2)) for _ in range(detections)],
+            dtype=object,
+        )
+    crop = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="crop"),
+        workflow_root_ancestor_metadata=ImageParentMetadata(
+            parent_id="image",
+            origin_coordinates=OriginCoordinatesSystem(
+                left_top_x=100,
+                left_top_y=200,
+                origin_width=2048 + mask_size,
+                origin_height=2048 + mask_size,
+            ),
+        ),
+        numpy_image=np.zeros((mask_size or 1, mask_size or 1, 3), dtype=np.uint8),
+    )
+    return attach_parents_coordinates_to_sv_detections(detections=result, image=crop)
+
+
+def benchmark(name: str, function: Callable[[], object], repeats: int) -> None:
+    durations: List[float] = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+    print(
+        f"{name}: min={min(durations) * 1000:.2f}ms "
+        f"mean={np.mean(durations) * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
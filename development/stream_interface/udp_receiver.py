@@ -2,6 +2,11 @@ import json
 import os
 import socket
 
+from inference.core.interfaces.stream.udp_binary_protocol import (
+    BinaryPredictionsDecoder,
+    MalformedDatagramError,
+)
+
 HOST = os.getenv("HOST", "127.0.0.1")
 PORT = int(os.getenv("PORT", "9999"))
 BUFFER_SIZE = 65535
@@ -10,15 +15,19 @@ BUFFER_SIZE = 65535
 def main() -> None:
     udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
     udp_socket.bind((HOST, PORT))
+    decoder = BinaryPredictionsDecoder()
     try:
         while True:
             message, _ = udp_socket.recvfrom(BUFFER_SIZE)
-            decoded_message = message.decode("utf-8")
-            parsed_message = json.loads(decoded_message)
-            print(parsed_message)
+            try:
+                for parsed_message in decoder.decode_datagram(datagram=message):
+                    print(parsed_message)
+            except MalformedDatagramError:
+                # payload sent by `UDPSink`
+                print(json.loads(message.decode("utf-8")))
     finally:
         udp_socket.close()
 
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     main()
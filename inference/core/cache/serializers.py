@@ -4,7 +4,10 @@ from fastapi.encoders import jsonable_encoder
 
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
-from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.entities.responses.inference import (
+    ColumnarPredictions,
+    InferenceResponse,
+)
 from inference.core.env import TINY_CACHE
 from inference.core.logger import logger
 from inference.core.version import __version__
@@ -52,10 +55,19 @@ def build_condensed_response(responses):
         if not getattr(response, "predictions", None):
             continue
         try:
-            predictions = [
-                {"confidence": pred.confidence, "class": pred.class_name}
-                for pred in response.predictions
-            ]
+            if isinstance(response.predictions, ColumnarPredictions):
+                predictions = [
+                    {"confidence": confidence, "class": class_name}
+                    for confidence, class_name in zip(
+                        response.predictions.confidence.tolist(),
+                        response.predictions.class_name,
+                    )
+                ]
+            else:
+                predictions = [
+                    {"confidence": pred.confidence, "class": pred.class_name}
+                    for pred in response.predictions
+                ]
             formatted_responses.append(
                 {
                     "predictions": predictions,
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, List, Optional, Union
+from typing import Any, ClassVar, List, Literal, Optional, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -102,6 +102,11 @@ class ObjectDetectionInferenceRequest(CVInferenceRequest):
         visualization_labels (Optional[bool]): If true, labels will be rendered on prediction visualizations.
         visualization_stroke_width (Optional[int]): The stroke width used when visualizing predictions.
         visualize_predictions (Optional[bool]): If true, the predictions will be drawn on the original image and returned as a base64 string.
+        predictions_format (Optional[str]): The format of returned predictions, one of 'objects', 'columnar'.
+        slice_width (Optional[int]): The width of slices for tiled inference - used together with `slice_height`.
+        slice_height (Optional[int]): The height of slices for tiled inference - used together with `slice_width`.
+        slice_overlap_ratio_width (Optional[float]): The minimal overlap of neighbouring slices, relative to slice width.
+        slice_overlap_ratio_height (Optional[float]): The minimal overlap of neighbouring slices, relative to slice height.
     """
 
     class_agnostic_nms: Optional[bool] = Field(
@@ -163,6 +168,42 @@ class ObjectDetectionInferenceRequest(CVInferenceRequest):
         examples=["my_dataset"],
         description="Parameter to be used when Active Learning data registration should happen against different dataset than the one pointed by model_id",
     )
+    predictions_format: Optional[Literal["objects", "columnar"]] = Field(
+        default=None,
+        examples=["columnar"],
+        description="The format of returned predictions, one of 'objects', 'columnar'. 'columnar' returns "
+        "predictions as arrays of columns (built without per-prediction objects - much cheaper for "
+        "large numbers of predictions), falling back to 'objects' when visualisation is requested. "
+        "Server default is used if not provided.",
+    )
+    slice_width: Optional[int] = Field(
+        default=None,
+        gt=0,
+        examples=[640],
+        description="If provided together with `slice_height` - each image is split into overlapping slices "
+        "of this size, inferred in batches, and predictions are merged in coordinates of the image "
+        "(tiled inference) - useful for small objects in large images",
+    )
+    slice_height: Optional[int] = Field(
+        default=None,
+        gt=0,
+        examples=[640],
+        description="The height of slices for tiled inference - see `slice_width`",
+    )
+    slice_overlap_ratio_width: Optional[float] = Field(
+        default=0.2,
+        ge=0.0,
+        lt=1.0,
+        examples=[0.2],
+        description="The minimal overlap of neighbouring slices in tiled inference, relative to slice width",
+    )
+    slice_overlap_ratio_height: Optional[float] = Field(
+        default=0.2,
+        ge=0.0,
+        lt=1.0,
+        examples=[0.2],
+        description="The minimal overlap of neighbouring slices in tiled inference, relative to slice height",
+    )
 
 
 class KeypointsDetectionInferenceRequest(ObjectDetectionInferenceRequest):
@@ -171,6 +212,14 @@ class KeypointsDetectionInferenceRequest(ObjectDetectionInferenceRequest):
         examples=[0.5],
         description="The confidence threshold used to filter out non visible keypoints",
     )
+    keypoints_format: Literal["objects", "array"] = Field(
+        default="objects",
+        examples=["array"],
+        description="The format of returned keypoints, one of 'objects', 'array'. 'array' returns "
+        "keypoints of each prediction as [[x, y, confidence], ...] rows (in order of keypoints_names "
+        "of the predicted class) without filtering by keypoint_confidence, which is much cheaper "
+        "to build and serialise for models with many keypoints.",
+    )
 
 
 class InstanceSegmentationInferenceRequest(ObjectDetectionInferenceRequest):
@@ -179,6 +228,7 @@ class InstanceSegmentationInferenceRequest(ObjectDetectionInferenceRequest):
     Attributes:
         mask_decode_mode (Optional[str]): The mode used to decode instance segmentation masks, one of 'accurate', 'fast', 'tradeoff'.
         tradeoff_factor (Optional[float]): The amount to tradeoff between 0='fast' and 1='accurate'.
+        mask_format (Optional[str]): The format of returned instance masks, one of 'polygon', 'rle', 'bitmask'.
     """
 
     mask_decode_mode: Optional[str] = Field(
@@ -191,6 +241,12 @@ class InstanceSegmentationInferenceRequest(ObjectDetectionInferenceRequest):
         examples=[0.5],
         description="The amount to tradeoff between 0='fast' and 1='accurate'",
     )
+    mask_format: Optional[str] = Field(
+        default="polygon",
+        examples=["rle"],
+        description="The format of returned instance masks, one of 'polygon', 'rle', 'bitmask'. "
+        "'rle' and 'bitmask' are pixel-exact masks in the original image resolution.",
+    )
 
 
 class ClassificationInferenceRequest(CVInferenceRequest):
@@ -200,6 +256,9 @@ class ClassificationInferenceRequest(CVInferenceRequest):
         confidence (Optional[float]): The confidence threshold used to filter out predictions.
         visualization_stroke_width (Optional[int]): The stroke width used when visualizing predictions.
         visualize_predictions (Optional[bool]): If true, the predictions will be drawn on the original image and returned as a base64 string.
+        predictions_format (Optional[str]): The format of returned predictions, one of 'objects', 'columnar'.
+        top_k (Optional[int]): If given, only top_k most confident classes are included in predictions.
+        filter_by_confidence (Optional[bool]): If true, only classes with confidence above the threshold are included in predictions.
     """
 
     confidence: Optional[float] = Field(
@@ -227,6 +286,27 @@ class ClassificationInferenceRequest(CVInferenceRequest):
         examples=["my_dataset"],
         description="Parameter to be used when Active Learning data registration should happen against different dataset than the one pointed by model_id",
     )
+    predictions_format: Optional[Literal["objects", "columnar"]] = Field(
+        default=None,
+        examples=["columnar"],
+        description="The format of returned predictions, one of 'objects', 'columnar'. 'columnar' returns "
+        "predictions as arrays of columns (built without per-prediction objects - much cheaper for "
+        "large numbers of predictions), falling back to 'objects' when visualisation is requested. "
+        "Server default is used if not provided.",
+    )
+    top_k: Optional[int] = Field(
+        default=None,
+        gt=0,
+        examples=[5],
+        description="If given, only top_k most confident classes are included in predictions - "
+        "cuts the size of responses of models with large number of classes",
+    )
+    filter_by_confidence: Optional[bool] = Field(
+        default=False,
+        examples=[True],
+        description="If true, only classes with confidence above the confidence threshold are "
+        "included in predictions",
+    )
 
 
 class LMMInferenceRequest(CVInferenceRequest):
@@ -1,7 +1,8 @@
 import base64
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 from uuid import uuid4
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer
 
 
@@ -72,6 +73,42 @@ class Point3D(Point):
     z: float = Field(description="The z-axis pixel coordinate of the point")
 
 
+class RLEMask(BaseModel):
+    """Instance mask in COCO run-length encoding.
+
+    Attributes:
+        size (List[int]): Size of the mask - [height, width] of the image.
+        counts (str): Compressed (pycocotools string format) counts of column-major runs of background and foreground pixels.
+    """
+
+    size: List[int] = Field(
+        description="Size of the mask - [height, width] of the image"
+    )
+    counts: str = Field(
+        description="Compressed (pycocotools string format) counts of column-major runs of background and foreground pixels"
+    )
+
+
+class BitmaskCrop(BaseModel):
+    """Instance mask as bit-packed crop of the image.
+
+    Attributes:
+        x (int): The x-axis pixel coordinate of the top-left corner of the crop.
+        y (int): The y-axis pixel coordinate of the top-left corner of the crop.
+        width (int): The width of the crop.
+        height (int): The height of the crop.
+        data (str): Base64 encoded bits (np.packbits(...) of row-major crop) of the mask.
+    """
+
+    x: int = Field(description="The x-axis pixel coordinate of the top-left corner")
+    y: int = Field(description="The y-axis pixel coordinate of the top-left corner")
+    width: int = Field(description="The width of the crop")
+    height: int = Field(description="The height of the crop")
+    data: str = Field(
+        description="Base64 encoded bits (np.packbits(...) of row-major crop) of the mask"
+    )
+
+
 class InstanceSegmentationPrediction(BaseModel):
     """Instance Segmentation prediction.
 
@@ -85,6 +122,8 @@ class InstanceSegmentationPrediction(BaseModel):
         class_confidence (Union[float, None]): The class label confidence as a fraction between 0 and 1.
         points (List[Point]): The list of points that make up the instance polygon.
         class_id: int = Field(description="The class id of the prediction")
+        rle (Optional[RLEMask]): The instance mask in COCO RLE format, if requested instead of polygon.
+        bitmask (Optional[BitmaskCrop]): The instance mask as bit-packed crop, if requested instead of polygon.
     """
 
     x: float = Field(description="The center x-axis pixel coordinate of the prediction")
@@ -107,6 +146,14 @@ class InstanceSegmentationPrediction(BaseModel):
         description="The list of points that make up the instance polygon"
     )
     class_id: int = Field(description="The class id of the prediction")
+    rle: Optional[RLEMask] = Field(
+        description="The instance mask in COCO RLE format, if requested instead of polygon",
+        default=None,
+    )
+    bitmask: Optional[BitmaskCrop] = Field(
+        description="The instance mask as bit-packed crop, if requested instead of polygon",
+        default=None,
+    )
     detection_id: str = Field(
         description="Unique identifier of detection",
         default_factory=lambda: str(uuid4()),
@@ -232,12 +279,22 @@ class Keypoint(Point):
 
 class KeypointsPrediction(ObjectDetectionPrediction):
     keypoints: List[Keypoint]
+    keypoints_array: Optional[List[List[float]]] = Field(
+        default=None,
+        description="Keypoints as [[x, y, confidence], ...] rows - present when keypoints "
+        "were requested in 'array' format, with row index being keypoint class id",
+    )
 
 
 class KeypointsDetectionInferenceResponse(
     CvInferenceResponse, WithVisualizationResponse
 ):
     predictions: List[KeypointsPrediction]
+    keypoints_names: Optional[Dict[str, List[str]]] = Field(
+        default=None,
+        description="Names of keypoints (in order of `keypoints_array` rows) for each predicted "
+        "class - present when keypoints were requested in 'array' format",
+    )
 
 
 class InstanceSegmentationInferenceResponse(
@@ -290,6 +347,93 @@ class MultiLabelClassificationInferenceResponse(
     )
 
 
+class ColumnarPredictions(BaseModel):
+    """Predictions of a single image as arrays of columns - row `i` of each column describes
+    `i`-th prediction. Columns are kept as numpy arrays, serialised directly by orjson.
+
+    Attributes:
+        class_id (np.ndarray): Array of shape (N, ) with class ids of predictions.
+        class_name (List[str]): Class labels of predictions.
+        confidence (np.ndarray): Array of shape (N, ) with confidences of predictions.
+        xyxy (Optional[np.ndarray]): Array of shape (N, 4) with bounding boxes (x_min, y_min, x_max, y_max) of detections.
+        points (Optional[List[np.ndarray]]): Polygons of instances masks - arrays of shape (M, 2).
+        rle (Optional[List[RLEMask]]): Instances masks in COCO run-length encoding.
+        bitmask (Optional[List[BitmaskCrop]]): Instances masks as bit-packed crops.
+        keypoints (Optional[np.ndarray]): Array of shape (N, K, 3) with (x, y, confidence) of keypoints - NaN for keypoints not visible or not defined for the predicted class.
+        detection_id (Optional[List[str]]): Unique identifiers of detections.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+
+    class_id: np.ndarray = Field(description="Class ids of predictions")
+    class_name: List[str] = Field(
+        alias="class", description="Class labels of predictions"
+    )
+    confidence: np.ndarray = Field(description="Confidences of predictions")
+    xyxy: Optional[np.ndarray] = Field(
+        default=None,
+        description="Bounding boxes (x_min, y_min, x_max, y_max) of detections",
+    )
+    points: Optional[List[np.ndarray]] = Field(
+        default=None, description="Polygons of instances masks"
+    )
+    rle: Optional[List[RLEMask]] = Field(
+        default=None, description="Instances masks in COCO run-length encoding"
+    )
+    bitmask: Optional[List[BitmaskCrop]] = Field(
+        default=None, description="Instances masks as bit-packed crops"
+    )
+    keypoints: Optional[np.ndarray] = Field(
+        default=None,
+        description="(x, y, confidence) of keypoints - null for keypoints not visible or not "
+        "defined for the predicted class",
+    )
+    detection_id: Optional[List[str]] = Field(
+        default=None, description="Unique identifiers of detections"
+    )
+
+    @field_serializer(
+        "class_id", "confidence", "xyxy", "points", "keypoints", when_used="json"
+    )
+    def serialize_columns(
+        self, column: Optional[Union[np.ndarray, List[np.ndarray]]]
+    ) -> Optional[list]:
+        if column is None:
+            return None
+        if isinstance(column, list):
+            return [element.tolist() for element in column]
+        return column.tolist()
+
+
+class ColumnarInferenceResponse(CvInferenceResponse, WithVisualizationResponse):
+    """Inference response with predictions in columnar format.
+
+    Attributes:
+        predictions_format (str): Marker of columnar format of predictions.
+        predictions (inference.core.entities.responses.inference.ColumnarPredictions): Predictions as arrays of columns.
+        predicted_classes (Optional[List[str]]): The list of predicted classes - for multi-label classification.
+        keypoints_names (Optional[Dict[str, List[str]]]): Names of keypoints (in order of keypoints columns) for each predicted class - for keypoints detection.
+    """
+
+    predictions_format: Literal["columnar"] = Field(
+        default="columnar", description="Marker of columnar format of predictions"
+    )
+    predictions: ColumnarPredictions
+    predicted_classes: Optional[List[str]] = Field(
+        default=None,
+        description="The list of predicted classes - for multi-label classification",
+    )
+    keypoints_names: Optional[Dict[str, List[str]]] = Field(
+        default=None,
+        description="Names of keypoints (in order of keypoints columns) for each predicted "
+        "class - for keypoints detection",
+    )
+    parent_id: Optional[str] = Field(
+        description="Identifier of parent image region. Useful when stack of detection-models is in use to refer the RoI being the input to inference",
+        default=None,
+    )
+
+
 class LMMInferenceResponse(CvInferenceResponse):
     response: Union[str, dict] = Field(
         description="Text/structured response generated by model"
@@ -34,6 +34,27 @@ if BLACKLISTED_DESTINATIONS_FOR_URL_INPUT is not None:
         BLACKLISTED_DESTINATIONS_FOR_URL_INPUT.split(",")
     )
 
+# Timeouts (in seconds) of connecting to and reading from locations of URL images
+URL_IMAGE_CONNECT_TIMEOUT = float(os.getenv("URL_IMAGE_CONNECT_TIMEOUT", 5.0))
+URL_IMAGE_READ_TIMEOUT = float(os.getenv("URL_IMAGE_READ_TIMEOUT", 30.0))
+
+# Max size of image fetched from URL, default is 64MB
+URL_IMAGE_MAX_BYTES = int(os.getenv("URL_IMAGE_MAX_BYTES", 64 * 1024 * 1024))
+
+# Time (in seconds) for which bytes of URL images are cached, default is 0 (cache disabled)
+URL_IMAGE_CACHE_TTL = float(os.getenv("URL_IMAGE_CACHE_TTL", 0.0))
+
+# Max total size of cached URL images, default is 256MB
+URL_IMAGE_CACHE_MAX_BYTES = int(
+    os.getenv("URL_IMAGE_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+)
+
+# Number of connections kept alive per host for URL images, default is 32
+URL_IMAGE_CONNECTION_POOL_SIZE = int(os.getenv("URL_IMAGE_CONNECTION_POOL_SIZE", 32))
+
+# Max number of URL images fetched concurrently for a batch, default is 16
+URL_IMAGE_FETCH_MAX_WORKERS = int(os.getenv("URL_IMAGE_FETCH_MAX_WORKERS", 16))
+
 # List of allowed origins
 ALLOW_ORIGINS = os.getenv("ALLOW_ORIGINS", "*")
 ALLOW_ORIGINS = ALLOW_ORIGINS.split(",")
@@ -144,9 +165,26 @@ DISABLE_INFERENCE_CACHE = str2bool(os.getenv("DISABLE_INFERENCE_CACHE", False))
 # Flag to disable auto-orientation preprocessing, default is False
 DISABLE_PREPROC_AUTO_ORIENT = str2bool(os.getenv("DISABLE_PREPROC_AUTO_ORIENT", False))
 
+# Flag to enable decoding oversized JPEG inputs of Roboflow models in reduced resolution
+# (DCT-domain scaling by 2, 4 or 8), default is False
+REDUCED_IMAGE_DECODING_ENABLED = str2bool(
+    os.getenv("REDUCED_IMAGE_DECODING_ENABLED", False)
+)
+
 # Flag to disable contrast preprocessing, default is False
 DISABLE_PREPROC_CONTRAST = str2bool(os.getenv("DISABLE_PREPROC_CONTRAST", False))
 
+# Flag to enable sharing decoded images and model inputs between models processing the same
+# images within one Workflow run, default is True
+REQUEST_PREPROCESSING_CACHE_ENABLED = str2bool(
+    os.getenv("REQUEST_PREPROCESSING_CACHE_ENABLED", True)
+)
+
+# Interpolation used to resize images to input size of Roboflow models, one of "nearest", "linear",
+# "cubic", "area" or "auto" (chosen for each image by scale factor - "area" for large downscales,
+# "cubic" for upscales and "linear" otherwise), default is "linear"
+PREPROC_RESIZE_INTERPOLATION = os.getenv("PREPROC_RESIZE_INTERPOLATION", "linear")
+
 # Flag to disable grayscale preprocessing, default is False
 DISABLE_PREPROC_GRAYSCALE = str2bool(os.getenv("DISABLE_PREPROC_GRAYSCALE", False))
 
@@ -177,6 +215,10 @@ MAX_FPS = os.getenv("MAX_FPS")
 if MAX_FPS is not None:
     MAX_FPS = int(MAX_FPS)
 
+# Default format of predictions returned by HTTP model inference endpoints when not specified
+# in request, "objects" (list of prediction objects) or "columnar" (arrays of columns)
+DEFAULT_PREDICTIONS_FORMAT = os.getenv("DEFAULT_PREDICTIONS_FORMAT", "objects")
+
 # Flag to fix batch size, default is False
 FIX_BATCH_SIZE = str2bool(os.getenv("FIX_BATCH_SIZE", False))
 
@@ -357,6 +399,7 @@ PREDICTIONS_QUEUE_SIZE = int(
     os.getenv("INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE", 512)
 )
 RESTART_ATTEMPT_DELAY = int(os.getenv("INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY", 1))
+MAX_IN_FLIGHT_BATCHES = int(os.getenv("INFERENCE_PIPELINE_MAX_IN_FLIGHT_BATCHES", 1))
 DEFAULT_BUFFER_SIZE = int(os.getenv("VIDEO_SOURCE_BUFFER_SIZE", "64"))
 DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE = float(
     os.getenv("VIDEO_SOURCE_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE", "0.1")
@@ -370,6 +413,10 @@ DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES = int(
 DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW = int(
     os.getenv("VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW", "16")
 )
+DEFAULT_DECODING_BACKEND = os.getenv("VIDEO_SOURCE_DECODING_BACKEND", "THREAD").upper()
+DEFAULT_SHARED_MEMORY_RING_SIZE = int(
+    os.getenv("VIDEO_SOURCE_SHARED_MEMORY_RING_SIZE", "16")
+)
 
 NUM_CELERY_WORKERS = os.getenv("NUM_CELERY_WORKERS", 4)
 CELERY_LOG_LEVEL = os.getenv("CELERY_LOG_LEVEL", "WARNING")
@@ -433,9 +480,20 @@ RUNS_ON_JETSON = str2bool(os.getenv("RUNS_ON_JETSON", "False"))
 
 ENABLE_WORKFLOWS_PROFILING = str2bool(os.getenv("ENABLE_WORKFLOWS_PROFILING", "False"))
 WORKFLOWS_PROFILER_BUFFER_SIZE = int(os.getenv("WORKFLOWS_PROFILER_BUFFER_SIZE", "64"))
+ENABLE_WORKFLOWS_METRICS = str2bool(os.getenv("ENABLE_WORKFLOWS_METRICS", "True"))
+WORKFLOWS_METRICS_SAMPLING_RATE = float(
+    os.getenv("WORKFLOWS_METRICS_SAMPLING_RATE", "0.01")
+)
+WORKFLOWS_METRICS_MEASURE_RESOURCES = str2bool(
+    os.getenv("WORKFLOWS_METRICS_MEASURE_RESOURCES", "False")
+)
+WORKFLOWS_METRICS_MAX_STEPS = int(os.getenv("WORKFLOWS_METRICS_MAX_STEPS", "512"))
 WORKFLOWS_DEFINITION_CACHE_EXPIRY = int(
     os.getenv("WORKFLOWS_DEFINITION_CACHE_EXPIRY", 15 * 60)
 )
 USE_FILE_CACHE_FOR_WORKFLOWS_DEFINITIONS = str2bool(
     os.getenv("USE_FILE_CACHE_FOR_WORKFLOWS_DEFINITIONS", "True")
 )
+ENABLE_WORKFLOWS_STEPS_OUTPUTS_MEMOISATION = str2bool(
+    os.getenv("ENABLE_WORKFLOWS_STEPS_OUTPUTS_MEMOISATION", "True")
+)
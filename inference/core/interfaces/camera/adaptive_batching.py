@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from inference.core.interfaces.camera.entities import (
+    AdaptiveBatchingConfig,
+    AdaptiveBatchingStatistics,
+    SourceBatchingStatistics,
+    VideoFrame,
+)
+
+MAX_PENDING_BATCHES = 128
+
+BatchKey = Tuple[Tuple[Optional[int], int], ...]
+
+
+@dataclass
+class SourceBatchingState:
+    source_id: Optional[int] = None
+    last_frame_timestamp: Optional[datetime] = None
+    frame_interval: Optional[float] = None
+    frames_collected: int = 0
+    total_queueing_delay: float = 0.0
+    max_queueing_delay: float = 0.0
+
+
+class AdaptiveBatchCollectionPolicy:
+    """
+    Decides how long `VideoSourcesManager` waits for frames from sources while collecting
+    batch. Learns frames cadence of each source (from frames timestamps) and batch
+    processing time as a function of batch size (reported back by the consumer of batches
+    with `register_batch_processed(...)`). Batch is closed at the moment that lets its
+    oldest frame be processed within `latency_target`, or earlier - when none of the
+    missing sources is expected to deliver frame before that moment.
+    """
+
+    def __init__(self, config: AdaptiveBatchingConfig):
+        self._config = config
+        self._sources_states: Dict[int, SourceBatchingState] = {}
+        self._batch_processing_times: Dict[int, float] = {}
+        self._pending_batches: OrderedDict[BatchKey, datetime] = OrderedDict()
+        self._batches_collected = 0
+        self._frames_collected = 0
+        self._lock = Lock()
+
+    @property
+    def idle_wait_timeout(self) -> float:
+        return self._config.idle_wait_timeout
+
+    def register_frame(self, source_ord: int, frame: VideoFrame) -> None:
+        with self._lock:
+            state = self._sources_states.setdefault(source_ord, SourceBatchingState())
+            state.source_id = frame.source_id
+            if state.last_frame_timestamp is not None:
+                interval = (
+                    frame.frame_timestamp - state.last_frame_timestamp
+                ).total_seconds()
+                if interval > 0:
+                    state.frame_interval = self._smooth(
+                        previous=state.frame_interval, observation=interval
+                    )
+            state.last_frame_timestamp = frame.frame_timestamp
+
+    def expected_frame_arrival(self, source_ord: int) -> Optional[datetime]:
+        with self._lock:
+            state = self._sources_states.get(source_ord)
+            if state is None or state.frame_interval is None:
+                return None
+            return state.last_frame_timestamp + timedelta(seconds=state.frame_interval)
+
+    def estimate_batch_processing_time(self, batch_size: int) -> float:
+        with self._lock:
+            return self._estimate_batch_processing_time(batch_size=batch_size)
+
+    def compute_batch_deadline(
+        self,
+        collection_start: datetime,
+        collected_frames: List[VideoFrame],
+    ) -> datetime:
+        """
+        Returns the latest moment to close the batch if one more frame was to be added.
+        """
+        oldest_frame_timestamp = min(f.frame_timestamp for f in collected_frames)
+        processing_time = self.estimate_batch_processing_time(
+            batch_size=len(collected_frames) + 1
+        )
+        deadline = oldest_frame_timestamp + timedelta(
+            seconds=self._config.latency_target - processing_time
+        )
+        if self._config.max_collection_timeout is not None:
+            deadline = min(
+                deadline,
+                collection_start
+                + timedelta(seconds=self._config.max_collection_timeout),
+            )
+        return deadline
+
+    def select_source_to_wait_for(
+        self, missing_sources: List[int], deadline: datetime
+    ) -> Optional[int]:
+        """
+        Returns source which frame is expected to arrive the soonest, given the frame is
+        expected before `deadline`. Sources with unknown cadence (or late) are assumed
+        to deliver frame any moment.
+        """
+        candidates = []
+        for source_ord in missing_sources:
+            expected_arrival = self.expected_frame_arrival(source_ord=source_ord)
+            if expected_arrival is None:
+                expected_arrival = datetime.min
+            if expected_arrival <= deadline:
+                candidates.append((expected_arrival, source_ord))
+        if not candidates:
+            return None
+        return min(candidates)[1]
+
+    def register_batch_collected(
+        self,
+        batch: List[Tuple[int, VideoFrame]],
+        closed_at: datetime,
+    ) -> None:
+        if not batch:
+            return None
+        with self._lock:
+            self._batches_collected += 1
+            self._frames_collected += len(batch)
+            for source_ord, frame in batch:
+                state = self._sources_states.setdefault(
+                    source_ord, SourceBatchingState()
+                )
+                delay = max((closed_at - frame.frame_timestamp).total_seconds(), 0.0)
+                state.source_id = frame.source_id
+                state.frames_collected += 1
+                state.total_queueing_delay += delay
+                state.max_queueing_delay = max(state.max_queueing_delay, delay)
+            self._pending_batches[_get_batch_key([f for _, f in batch])] = closed_at
+            while len(self._pending_batches) > MAX_PENDING_BATCHES:
+                self._pending_batches.popitem(last=False)
+
+    def register_batch_processed(
+        self,
+        video_frames: List[VideoFrame],
+        inferred_frames_number: int,
+    ) -> None:
+        """
+        To be called by consumer of batches once predictions for `video_frames` are ready -
+        time since batch was closed is recorded as processing time of batch of size
+        `inferred_frames_number`.
+        """
+        now = datetime.now()
+        with self._lock:
+            closed_at = self._pending_batches.pop(
+                _get_batch_key(frames=video_frames), None
+            )
+            if closed_at is None or inferred_frames_number < 1:
+                return None
+            self._batch_processing_times[inferred_frames_number] = self._smooth(
+                previous=self._batch_processing_times.get(inferred_frames_number),
+                observation=(now - closed_at).total_seconds(),
+            )
+
+    def get_statistics(self) -> AdaptiveBatchingStatistics:
+        with self._lock:
+            sources = {
+                source_ord: SourceBatchingStatistics(
+                    source_id=state.source_id,
+                    frames_collected=state.frames_collected,
+                    average_queueing_delay=state.total_queueing_delay
+                    / max(state.frames_collected, 1),
+                    max_queueing_delay=state.max_queueing_delay,
+                    estimated_frame_interval=state.frame_interval,
+                )
+                for source_ord, state in self._sources_states.items()
+            }
+            return AdaptiveBatchingStatistics(
+                batches_collected=self._batches_collected,
+                average_batch_size=self._frames_collected
+                / max(self._batches_collected, 1),
+                sources=sources,
+                batch_processing_times=dict(
+                    sorted(self._batch_processing_times.items())
+                ),
+            )
+
+    def _estimate_batch_processing_time(self, batch_size: int) -> float:
+        if batch_size in self._batch_processing_times:
+            return self._batch_processing_times[batch_size]
+        if not self._batch_processing_times:
+            return 0.0
+        if len(self._batch_processing_times) == 1:
+            # optimistic until other batch sizes are observed - letting batches grow
+            return next(iter(self._batch_processing_times.values()))
+        sizes = np.array(list(self._batch_processing_times.keys()), dtype=np.float64)
+        times = np.array(list(self._batch_processing_times.values()))
+        slope, intercept = np.polyfit(sizes, times, deg=1)
+        return max(float(slope * batch_size + intercept), 0.0)
+
+    def _smooth(self, previous: Optional[float], observation: float) -> float:
+        if previous is None:
+            return observation
+        alpha = self._config.smoothing_factor
+        return alpha * observation + (1 - alpha) * previous
+
+
+def _get_batch_key(frames: List[VideoFrame]) -> BatchKey:
+    return tuple((f.source_id, f.frame_id) for f in frames)
@@ -83,6 +83,48 @@ class SourceProperties:
     is_reconnectable: Optional[bool] = None
 
 
+@dataclass(frozen=True)
+class AdaptiveBatchingConfig:
+    """
+    Configuration of adaptive collection of batches of frames from multiple sources
+    (see `multiplex_videos(...)`) - instead of waiting fixed time for frames from all
+    sources, batch is closed when waiting longer would make the oldest frame of the batch
+    miss `latency_target`, given learned batch processing time of the model and expected
+    arrival times of frames from sources (learned from their frames cadence). Sources
+    not expected to deliver frame on time are not waited for.
+
+    * `latency_target` - desired number of seconds between frame decoding and end of
+    processing of the batch it belongs to
+    * `max_collection_timeout` - upper bound of batch collection time, not enforced when `None`
+    * `smoothing_factor` - weight of new observation in exponential moving averages of
+    sources frames intervals and batch processing times
+    * `idle_wait_timeout` - max number of seconds to wait for a frame from a source that
+    is expected to deliver next frame, when none of the sources has frame ready
+    """
+
+    latency_target: float = 0.1
+    max_collection_timeout: Optional[float] = None
+    smoothing_factor: float = 0.2
+    idle_wait_timeout: float = 0.05
+
+
+@dataclass(frozen=True)
+class SourceBatchingStatistics:
+    source_id: Optional[int]
+    frames_collected: int
+    average_queueing_delay: float
+    max_queueing_delay: float
+    estimated_frame_interval: Optional[float]
+
+
+@dataclass(frozen=True)
+class AdaptiveBatchingStatistics:
+    batches_collected: int
+    average_batch_size: float
+    sources: Dict[int, SourceBatchingStatistics]
+    batch_processing_times: Dict[int, float]
+
+
 class VideoFrameProducer:
     def grab(self) -> bool:
         raise NotImplementedError
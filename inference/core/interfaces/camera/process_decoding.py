@@ -0,0 +1,291 @@
+"""
+Decoding of video sources in worker processes.
+
+`ProcessVideoFrameProducer` is a drop-in replacement of `CV2VideoFrameProducer` which
+delegates `grab()` / `retrieve()` to a dedicated worker process. Decoded frames are
+written by the worker into a ring of fixed-size slots placed in shared memory, and
+frames returned by `retrieve()` are numpy views of those slots - no copy of the image
+is made on the way from decoder to `VideoFrame`.
+
+Slot is given back to the pool when the last array referencing it is garbage collected,
+so frames may freely be kept by downstream components. When all slots are taken (for
+instance when consumer keeps more frames than the size of the ring) - frames are
+transferred with a copy through the pipe, such that decoding never waits for slots and
+`BufferFillingStrategy` / `BufferConsumptionStrategy` semantics of `VideoSource` are kept.
+"""
+
+import weakref
+from collections import deque
+from multiprocessing import Pipe, Process, resource_tracker, shared_memory
+from multiprocessing.connection import Connection
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import DEFAULT_SHARED_MEMORY_RING_SIZE
+from inference.core.interfaces.camera.entities import (
+    SourceProperties,
+    VideoFrameProducer,
+)
+from inference.core.interfaces.camera.exceptions import SourceConnectionError
+
+GRAB_COMMAND = "grab"
+RETRIEVE_COMMAND = "retrieve"
+ATTACH_COMMAND = "attach"
+INITIALIZE_PROPERTIES_COMMAND = "initialize_source_properties"
+DISCOVER_PROPERTIES_COMMAND = "discover_source_properties"
+RELEASE_COMMAND = "release"
+WORKER_START_TIMEOUT = 30.0
+WORKER_JOIN_TIMEOUT = 5.0
+
+
+class SharedMemoryFramesRing:
+    """
+    Ring of equally-sized frame slots in shared memory. Slots handed out as numpy views
+    are returned when the view (and all arrays derived from it) gets garbage-collected.
+    Shared memory is unlinked at `release()`, but the mapping is only closed once the last
+    frame is gone - numpy does not hold buffer exports, so closing it earlier would
+    invalidate memory of alive frames.
+    """
+
+    def __init__(self, slot_size: int, slots: int):
+        self._segment = shared_memory.SharedMemory(create=True, size=slot_size * slots)
+        self._slot_size = slot_size
+        self._free_slots = deque(range(slots))
+        self._slots_in_use = 0
+        self._released = False
+        self._lock = Lock()
+
+    @property
+    def name(self) -> str:
+        return self._segment.name
+
+    @property
+    def slot_size(self) -> int:
+        return self._slot_size
+
+    @property
+    def free_slots(self) -> int:
+        return len(self._free_slots)
+
+    def acquire_slot(self) -> Optional[int]:
+        with self._lock:
+            if self._released or not self._free_slots:
+                return None
+            self._slots_in_use += 1
+            return self._free_slots.popleft()
+
+    def return_slot(self, slot: int) -> None:
+        with self._lock:
+            self._slots_in_use -= 1
+            if not self._released:
+                self._free_slots.append(slot)
+            elif self._slots_in_use == 0:
+                self._segment.close()
+
+    def wrap_slot(self, slot: int, shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+        frame = np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=self._segment.buf,
+            offset=slot * self._slot_size,
+        )
+        finalizer = weakref.finalize(frame, self.return_slot, slot)
+        # at interpreter exit memory must stay mapped for frames still in use
+        finalizer.atexit = False
+        return frame
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return None
+            self._released = True
+            self._free_slots.clear()
+            self._segment.unlink()
+            if self._slots_in_use == 0:
+                self._segment.close()
+
+
+class ProcessVideoFrameProducer(VideoFrameProducer):
+    def __init__(
+        self,
+        video: Union[str, int],
+        ring_size: int = DEFAULT_SHARED_MEMORY_RING_SIZE,
+    ):
+        # worker must share resource tracker with this process, otherwise shared memory
+        # attached by worker would be reported as leaked
+        resource_tracker.ensure_running()
+        self._connection, worker_connection = Pipe(duplex=True)
+        self._process = Process(
+            target=decode_video_in_worker,
+            args=(video, worker_connection),
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+        self._ring_size = max(ring_size, 0)
+        self._frames_ring: Optional[SharedMemoryFramesRing] = None
+        self._lock = Lock()
+        self._is_opened = False
+        if self._connection.poll(WORKER_START_TIMEOUT):
+            self._is_opened = self._receive(default=False)
+        if not self._is_opened:
+            self.release()
+
+    def isOpened(self) -> bool:
+        return self._is_opened
+
+    def grab(self) -> bool:
+        return self._execute(command=(GRAB_COMMAND,), default=False)
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        frames_ring = self._frames_ring
+        slot = frames_ring.acquire_slot() if frames_ring is not None else None
+        success, result = self._execute(
+            command=(RETRIEVE_COMMAND, slot), default=(False, None)
+        )
+        if isinstance(result, tuple):
+            shape, dtype = result
+            return True, frames_ring.wrap_slot(slot=slot, shape=shape, dtype=dtype)
+        if slot is not None:
+            # frame transferred by copy (or not decoded) - slot was not used
+            frames_ring.return_slot(slot=slot)
+        if not success:
+            return False, None
+        self._ensure_frames_ring(frame=result)
+        return True, result
+
+    def initialize_source_properties(self, properties: Dict[str, float]) -> None:
+        self._execute(command=(INITIALIZE_PROPERTIES_COMMAND, properties), default=None)
+
+    def discover_source_properties(self) -> SourceProperties:
+        properties = self._execute(command=(DISCOVER_PROPERTIES_COMMAND,), default=None)
+        if properties is None:
+            raise SourceConnectionError(
+                "Could not discover video source properties - decoding process is not responding."
+            )
+        return properties
+
+    def release(self) -> None:
+        with self._lock:
+            self._is_opened = False
+            try:
+                self._connection.send((RELEASE_COMMAND,))
+            except (OSError, ValueError):
+                pass
+            self._process.join(timeout=WORKER_JOIN_TIMEOUT)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+            self._connection.close()
+            if self._frames_ring is not None:
+                self._frames_ring.release()
+
+    def _ensure_frames_ring(self, frame: np.ndarray) -> None:
+        # ring is allocated once size of decoded frames is known
+        if self._frames_ring is not None or self._ring_size == 0:
+            return None
+        frames_ring = SharedMemoryFramesRing(
+            slot_size=frame.nbytes, slots=self._ring_size
+        )
+        attached = self._execute(
+            command=(ATTACH_COMMAND, frames_ring.name, frames_ring.slot_size),
+            default=False,
+        )
+        if not attached:
+            logger.warning(
+                "Decoding process could not attach shared memory - frames will be copied."
+            )
+            frames_ring.release()
+            return None
+        self._frames_ring = frames_ring
+
+    def _execute(self, command: tuple, default: Any) -> Any:
+        with self._lock:
+            if not self._is_opened:
+                return default
+            try:
+                self._connection.send(command)
+            except (OSError, ValueError):
+                self._is_opened = False
+                return default
+            return self._receive(default=default)
+
+    def _receive(self, default: Any) -> Any:
+        try:
+            return self._connection.recv()
+        except (EOFError, OSError):
+            logger.warning("Video decoding process terminated unexpectedly.")
+            self._is_opened = False
+            return default
+
+
+def decode_video_in_worker(video: Union[str, int], connection: Connection) -> None:
+    # imported here, as `video_source` module depends on this module
+    from inference.core.interfaces.camera.video_source import CV2VideoFrameProducer
+
+    producer = CV2VideoFrameProducer(video)
+    segment: Optional[shared_memory.SharedMemory] = None
+    slot_size = 0
+    try:
+        connection.send(producer.isOpened())
+        while True:
+            command, *args = connection.recv()
+            if command == GRAB_COMMAND:
+                connection.send(producer.grab())
+            elif command == RETRIEVE_COMMAND:
+                connection.send(
+                    retrieve_frame_into_slot(
+                        producer=producer,
+                        segment=segment,
+                        slot=args[0],
+                        slot_size=slot_size,
+                    )
+                )
+            elif command == ATTACH_COMMAND:
+                segment_name, slot_size = args
+                segment = attach_shared_memory(name=segment_name)
+                connection.send(segment is not None)
+            elif command == INITIALIZE_PROPERTIES_COMMAND:
+                producer.initialize_source_properties(args[0])
+                connection.send(None)
+            elif command == DISCOVER_PROPERTIES_COMMAND:
+                connection.send(producer.discover_source_properties())
+            else:
+                break
+    except (EOFError, OSError, KeyboardInterrupt):
+        pass
+    finally:
+        producer.release()
+        if segment is not None:
+            segment.close()
+        connection.close()
+
+
+def retrieve_frame_into_slot(
+    producer: VideoFrameProducer,
+    segment: Optional[shared_memory.SharedMemory],
+    slot: Optional[int],
+    slot_size: int,
+) -> Tuple[bool, Any]:
+    success, frame = producer.retrieve()
+    if not success:
+        return False, None
+    if segment is None or slot is None or frame.nbytes > slot_size:
+        return True, frame
+    target = np.ndarray(
+        frame.shape, dtype=frame.dtype, buffer=segment.buf, offset=slot * slot_size
+    )
+    target[...] = frame
+    return True, (frame.shape, frame.dtype.str)
+
+
+def attach_shared_memory(name: str) -> Optional[shared_memory.SharedMemory]:
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except OSError as error:
+        logger.warning(f"Could not attach shared memory {name}. Cause: {error}")
+        return None
+    return segment
@@ -19,6 +19,9 @@ from typing import (
 
 from inference.core import logger
 from inference.core.env import RESTART_ATTEMPT_DELAY
+from inference.core.interfaces.camera.adaptive_batching import (
+    AdaptiveBatchCollectionPolicy,
+)
 from inference.core.interfaces.camera.entities import VideoFrame
 from inference.core.interfaces.camera.exceptions import (
     EndOfStreamError,
@@ -118,11 +121,13 @@ class VideoSourcesManager:
         video_sources: VideoSources,
         should_stop: Callable[[], bool],
         on_reconnection_error: Callable[[Optional[int], SourceConnectionError], None],
+        batching_policy: Optional[AdaptiveBatchCollectionPolicy] = None,
     ) -> "VideoSourcesManager":
         return cls(
             video_sources=video_sources,
             should_stop=should_stop,
             on_reconnection_error=on_reconnection_error,
+            batching_policy=batching_policy,
         )
 
     def __init__(
@@ -130,6 +135,7 @@ class VideoSourcesManager:
         video_sources: VideoSources,
         should_stop: Callable[[], bool],
         on_reconnection_error: Callable[[Optional[int], SourceConnectionError], None],
+        batching_policy: Optional[AdaptiveBatchCollectionPolicy] = None,
     ):
         self._video_sources = video_sources
         self._reconnection_threads: Dict[int, Thread] = {}
@@ -139,11 +145,16 @@ class VideoSourcesManager:
         self._ended_sources: Set[int] = set()
         self._threads_to_join: Set[int] = set()
         self._last_batch_yielded_time = datetime.now()
+        self._batching_policy = batching_policy
 
     def retrieve_frames_from_sources(
         self,
         batch_collection_timeout: Optional[float],
     ) -> Optional[List[VideoFrame]]:
+        if self._batching_policy is not None:
+            return self._retrieve_frames_adaptively(
+                batching_policy=self._batching_policy
+            )
         batch_frames = []
         if batch_collection_timeout is not None:
             batch_timeout_moment = self._last_batch_yielded_time + timedelta(
@@ -174,6 +185,85 @@ class VideoSourcesManager:
         self._last_batch_yielded_time = datetime.now()
         return batch_frames
 
+    def _retrieve_frames_adaptively(
+        self, batching_policy: AdaptiveBatchCollectionPolicy
+    ) -> Optional[List[VideoFrame]]:
+        collection_start = datetime.now()
+        collected: Dict[int, VideoFrame] = {}
+        missing_sources = []
+        for source_ord in range(len(self._video_sources.all_sources)):
+            if self._external_should_stop():
+                self.join_all_reconnection_threads(include_not_finished=True)
+                return None
+            if self._is_source_inactive(source_ord=source_ord):
+                continue
+            # taking frames that are ready, without waiting
+            if not self._read_source_frame(
+                source_ord=source_ord,
+                timeout=0.0,
+                collected=collected,
+                batching_policy=batching_policy,
+            ):
+                missing_sources.append(source_ord)
+        if not collected and missing_sources:
+            source_ord = batching_policy.select_source_to_wait_for(
+                missing_sources=missing_sources, deadline=datetime.max
+            )
+            self._read_source_frame(
+                source_ord=source_ord,
+                timeout=batching_policy.idle_wait_timeout,
+                collected=collected,
+                batching_policy=batching_policy,
+            )
+            missing_sources.remove(source_ord)
+        while collected and missing_sources:
+            if self._external_should_stop():
+                self.join_all_reconnection_threads(include_not_finished=True)
+                return None
+            deadline = batching_policy.compute_batch_deadline(
+                collection_start=collection_start,
+                collected_frames=list(collected.values()),
+            )
+            time_left = (deadline - datetime.now()).total_seconds()
+            source_ord = batching_policy.select_source_to_wait_for(
+                missing_sources=missing_sources, deadline=deadline
+            )
+            if time_left <= 0 or source_ord is None:
+                break
+            self._read_source_frame(
+                source_ord=source_ord,
+                timeout=time_left,
+                collected=collected,
+                batching_policy=batching_policy,
+            )
+            missing_sources.remove(source_ord)
+        self.join_all_reconnection_threads()
+        self._last_batch_yielded_time = datetime.now()
+        batch = sorted(collected.items())
+        batching_policy.register_batch_collected(
+            batch=batch, closed_at=self._last_batch_yielded_time
+        )
+        return [frame for _, frame in batch]
+
+    def _read_source_frame(
+        self,
+        source_ord: int,
+        timeout: float,
+        collected: Dict[int, VideoFrame],
+        batching_policy: AdaptiveBatchCollectionPolicy,
+    ) -> bool:
+        source = self._video_sources.all_sources[source_ord]
+        try:
+            frame = source.read_frame(timeout=timeout)
+        except EndOfStreamError:
+            self._register_end_of_stream(source_ord=source_ord)
+            return True
+        if frame is None:
+            return False
+        batching_policy.register_frame(source_ord=source_ord, frame=frame)
+        collected[source_ord] = frame
+        return True
+
     def all_sources_ended(self) -> bool:
         return len(self._ended_sources) >= len(self._video_sources.all_sources)
 
@@ -246,6 +336,7 @@ def multiplex_videos(
     on_reconnection_error: Callable[
         [Optional[int], SourceConnectionError], None
     ] = log_error,
+    batching_policy: Optional[AdaptiveBatchCollectionPolicy] = None,
 ) -> Generator[List[VideoFrame], None, None]:
     """
     Function that is supposed to provide a generator over frames from multiple video sources. It is capable to
@@ -284,6 +375,10 @@ def multiplex_videos(
         on_reconnection_error (Callable[[Optional[int], SourceConnectionError], None]): Function that will be
             called whenever source cannot re-connect after disconnection. First parameter is source_id, second
             is connection error instance.
+        batching_policy (Optional[AdaptiveBatchCollectionPolicy]): When given, batches are collected adaptively -
+            closed when waiting for missing frames would make frames already collected miss latency target
+            (see `AdaptiveBatchingConfig`), `batch_collection_timeout` is ignored then. Consumer of batches
+            is expected to report processing times with `batching_policy.register_batch_processed(...)`.
 
     Returns Generator[List[VideoFrame], None, None]: allowing to iterate through frames from multiple video sources.
 
@@ -310,6 +405,7 @@ def multiplex_videos(
         batch_collection_timeout=batch_collection_timeout,
         should_stop=should_stop,
         on_reconnection_error=on_reconnection_error,
+        batching_policy=batching_policy,
     )
     if max_fps is None:
         yield from generator
@@ -329,11 +425,13 @@ def _multiplex_videos(
     batch_collection_timeout: Optional[float],
     should_stop: Callable[[], bool],
     on_reconnection_error: Callable[[Optional[int], SourceConnectionError], None],
+    batching_policy: Optional[AdaptiveBatchCollectionPolicy] = None,
 ) -> Generator[List[VideoFrame], None, None]:
     sources_manager = VideoSourcesManager.init(
         video_sources=video_sources,
         should_stop=should_stop,
         on_reconnection_error=on_reconnection_error,
+        batching_policy=batching_policy,
     )
     while not sources_manager.all_sources_ended():
         batch_frames = sources_manager.retrieve_frames_from_sources(
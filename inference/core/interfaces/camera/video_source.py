@@ -15,8 +15,10 @@ from inference.core.env import (
     DEFAULT_ADAPTIVE_MODE_READER_PACE_TOLERANCE,
     DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE,
     DEFAULT_BUFFER_SIZE,
+    DEFAULT_DECODING_BACKEND,
     DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
     DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES,
+    DEFAULT_SHARED_MEMORY_RING_SIZE,
     RUNS_ON_JETSON,
 )
 from inference.core.interfaces.camera.entities import (
@@ -32,6 +34,7 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.process_decoding import ProcessVideoFrameProducer
 
 VIDEO_SOURCE_CONTEXT = "video_source"
 VIDEO_CONSUMER_CONTEXT = "video_consumer"
@@ -106,6 +109,11 @@ class BufferConsumptionStrategy(Enum):
     EAGER = "EAGER"
 
 
+class DecodingBackend(Enum):
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
 @dataclass(frozen=True)
 class SourceMetadata:
     source_properties: Optional[SourceProperties]
@@ -192,6 +200,8 @@ class VideoSource:
         maximum_adaptive_frames_dropped_in_row: int = DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
         video_source_properties: Optional[Dict[str, float]] = None,
         source_id: Optional[int] = None,
+        decoding_backend: Optional[DecodingBackend] = None,
+        shared_memory_ring_size: int = DEFAULT_SHARED_MEMORY_RING_SIZE,
     ):
         """
         This class is meant to represent abstraction over video sources - both video files and
@@ -271,12 +281,22 @@ class VideoSource:
         one consuming it and manipulating source state. Implementation of user interface is thread-safe, although
         stream it is meant to be consumed by a single thread only.
 
+        By default, video is decoded by a thread of the process running `VideoSource`. With
+        `DecodingBackend.PROCESS` - grabbing and decoding is delegated to a worker process writing
+        frames into a ring of shared memory slots - frames are emitted as views of those slots (without
+        copy) and slots get back to the pool when frames are garbage-collected. If all slots are in use,
+        frames are transferred by copy, so the behaviour of buffer filling and consumption strategies does
+        not change. This backend is advised when multiple high-resolution sources are consumed by single
+        process and decoding competes for resources with inference.
+
         ENV variables involved:
         * VIDEO_SOURCE_BUFFER_SIZE - default: 64
         * VIDEO_SOURCE_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE - default: 0.1
         * VIDEO_SOURCE_ADAPTIVE_MODE_READER_PACE_TOLERANCE - default: 5.0
         * VIDEO_SOURCE_MINIMUM_ADAPTIVE_MODE_SAMPLES - default: 10
         * VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW - default: 16
+        * VIDEO_SOURCE_DECODING_BACKEND - default: THREAD
+        * VIDEO_SOURCE_SHARED_MEMORY_RING_SIZE - default: 16
 
         As an `inference` user, please use .init() method instead of constructor to instantiate objects.
 
@@ -301,6 +321,11 @@ class VideoSource:
             source_id (Optional[int]): Optional identifier of video source - mainly useful to recognise specific source
                 when multiple ones are in use. Identifier will be added to emitted frames and updates. It is advised
                 to keep it unique within all sources in use.
+            decoding_backend (Optional[DecodingBackend]): Backend used to decode video - if not given, value of
+                VIDEO_SOURCE_DECODING_BACKEND env variable is used. Only applicable for sources given as references
+                (not callables producing `VideoFrameProducer`).
+            shared_memory_ring_size (int): Number of shared memory slots for decoded frames - used only with
+                `DecodingBackend.PROCESS`
 
         Returns: Instance of `VideoSource` class
         """
@@ -323,6 +348,8 @@ class VideoSource:
             video_consumer=video_consumer,
             video_source_properties=video_source_properties,
             source_id=source_id,
+            decoding_backend=decoding_backend,
+            shared_memory_ring_size=shared_memory_ring_size,
         )
 
     def __init__(
@@ -334,7 +361,11 @@ class VideoSource:
         video_consumer: "VideoConsumer",
         video_source_properties: Optional[Dict[str, float]],
         source_id: Optional[int],
+        decoding_backend: Optional[DecodingBackend] = None,
+        shared_memory_ring_size: int = DEFAULT_SHARED_MEMORY_RING_SIZE,
     ):
+        if decoding_backend is None:
+            decoding_backend = DecodingBackend(DEFAULT_DECODING_BACKEND)
         self._stream_reference = stream_reference
         self._video: Optional[VideoFrameProducer] = None
         self._source_properties: Optional[SourceProperties] = None
@@ -349,6 +380,8 @@ class VideoSource:
         self._state_change_lock = Lock()
         self._video_source_properties = video_source_properties or {}
         self._source_id = source_id
+        self._decoding_backend = decoding_backend
+        self._shared_memory_ring_size = shared_memory_ring_size
 
     @property
     def source_id(self) -> Optional[int]:
@@ -583,6 +616,10 @@ class VideoSource:
         self._change_state(target_state=StreamState.INITIALISING)
         if callable(self._stream_reference):
             self._video = self._stream_reference()
+        elif self._decoding_backend is DecodingBackend.PROCESS:
+            self._video = ProcessVideoFrameProducer(
+                self._stream_reference, ring_size=self._shared_memory_ring_size
+            )
         else:
             self._video = CV2VideoFrameProducer(self._stream_reference)
         if not self._video.isOpened():
@@ -3,13 +3,18 @@ import os
 import traceback
 from functools import partial, wraps
 from time import sleep
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Union
 
 import asgi_correlation_id
 import uvicorn
 from fastapi import BackgroundTasks, FastAPI, Path, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse, Response
+from fastapi.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi_cprofile.profiler import CProfileMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -112,6 +117,7 @@ from inference.core.env import (
     CORE_MODEL_YOLO_WORLD_ENABLED,
     CORE_MODELS_ENABLED,
     DEDICATED_DEPLOYMENT_WORKSPACE_URL,
+    DEFAULT_PREDICTIONS_FORMAT,
     DISABLE_WORKFLOW_ENDPOINTS,
     ENABLE_PROMETHEUS,
     ENABLE_STREAM_API,
@@ -168,6 +174,8 @@ from inference.core.interfaces.stream_manager.api.entities import (
     InferencePipelineStatusResponse,
     InitializeWebRTCPipelineResponse,
     ListPipelinesResponse,
+    ResultsDropPolicy,
+    StreamedPipelineResult,
 )
 from inference.core.interfaces.stream_manager.api.errors import (
     ProcessesManagerAuthorisationError,
@@ -175,6 +183,11 @@ from inference.core.interfaces.stream_manager.api.errors import (
     ProcessesManagerInvalidPayload,
     ProcessesManagerNotFoundError,
 )
+from inference.core.interfaces.stream_manager.api.results_streaming import (
+    RESULTS_STREAM_BUFFER_SIZE,
+    buffer_results,
+    serialise_server_sent_event,
+)
 from inference.core.interfaces.stream_manager.api.stream_manager_client import (
     StreamManagerClient,
 )
@@ -224,6 +237,12 @@ from inference.core.workflows.execution_engine.profiling.core import (
     NullWorkflowsProfiler,
     WorkflowsProfiler,
 )
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WORKFLOWS_METRICS_COLLECTOR,
+)
+from inference.core.workflows.execution_engine.profiling.prometheus import (
+    register_workflows_metrics_in_prometheus,
+)
 from inference.core.workflows.execution_engine.v1.compiler.syntactic_parser import (
     get_workflow_schema_description,
     parse_workflow_definition,
@@ -290,7 +309,8 @@ def with_route_exceptions(route):
                 status_code=400,
                 content={
                     "message": "Invalid mask decode argument sent. tradeoff_factor must be in [0.0, 1.0], "
-                    "mask_decode_mode: must be one of ['accurate', 'fast', 'tradeoff']"
+                    "mask_decode_mode: must be one of ['accurate', 'fast', 'tradeoff'], "
+                    "mask_format: must be one of ['bitmask', 'polygon', 'rle']"
                 },
             )
             traceback.print_exc()
@@ -507,6 +527,10 @@ class HttpInterface(BaseInterface):
 
         if ENABLE_PROMETHEUS:
             Instrumentator().expose(app, endpoint="/metrics")
+            if WORKFLOWS_METRICS_COLLECTOR is not None:
+                register_workflows_metrics_in_prometheus(
+                    metrics_collector=WORKFLOWS_METRICS_COLLECTOR
+                )
 
         if METLO_KEY:
             app.add_middleware(
@@ -667,6 +691,11 @@ class HttpInterface(BaseInterface):
             de_aliased_model_id = resolve_roboflow_model_alias(
                 model_id=inference_request.model_id
             )
+            if (
+                hasattr(inference_request, "predictions_format")
+                and inference_request.predictions_format is None
+            ):
+                inference_request.predictions_format = DEFAULT_PREDICTIONS_FORMAT
             self.model_manager.add_model(de_aliased_model_id, inference_request.api_key)
             resp = await self.model_manager.infer_from_request(
                 de_aliased_model_id, inference_request, **kwargs
@@ -1412,6 +1441,69 @@ class HttpInterface(BaseInterface):
                     excluded_fields=request.excluded_fields,
                 )
 
+            @app.get(
+                "/inference_pipelines/{pipeline_id}/results_stream",
+                summary="[EXPERIMENTAL] Streams InferencePipeline results",
+                description="[EXPERIMENTAL] Pushes InferencePipeline results as Server-Sent Events "
+                "(`result` events, with `error` event closing the stream) as they are produced. "
+                "Results not consumed on time are buffered - up to `buffer_size` - and then "
+                "dropped according to `drop_policy` (`block` makes the pipeline buffer drop them).",
+            )
+            @with_route_exceptions
+            async def stream_results(
+                pipeline_id: str,
+                excluded_fields: Optional[List[str]] = Query(None),
+                buffer_size: int = Query(RESULTS_STREAM_BUFFER_SIZE, ge=1),
+                drop_policy: ResultsDropPolicy = Query(ResultsDropPolicy.DROP_OLDEST),
+            ) -> StreamingResponse:
+                # fails with 404 on unknown pipeline - once the stream started only error
+                # event can be emitted
+                await self.stream_manager_client.get_status(pipeline_id=pipeline_id)
+                results = self.stream_manager_client.subscribe_pipeline_results(
+                    pipeline_id=pipeline_id,
+                    excluded_fields=excluded_fields or [],
+                )
+
+                async def serialise_results() -> AsyncIterator[bytes]:
+                    buffered_results = buffer_results(
+                        results=results,
+                        buffer_size=buffer_size,
+                        drop_policy=drop_policy,
+                    )
+                    try:
+                        async for result, dropped in buffered_results:
+                            streamed_result = StreamedPipelineResult(
+                                status=result.status,
+                                context=result.context,
+                                outputs=result.outputs,
+                                frames_metadata=result.frames_metadata,
+                                dropped_results=dropped,
+                            )
+                            yield serialise_server_sent_event(
+                                data=streamed_result.model_dump(mode="json"),
+                                event="result",
+                            )
+                    except (
+                        ProcessesManagerClientError,
+                        CommunicationProtocolError,
+                    ) as error:
+                        yield serialise_server_sent_event(
+                            data={
+                                "message": error.public_message,
+                                "error_type": error.__class__.__name__,
+                                "inner_error_type": error.inner_error_type,
+                            },
+                            event="error",
+                        )
+                    finally:
+                        # generator is not closed by the server when client disconnects -
+                        # closing it ends subscription (and detaches from the pipeline)
+                        await buffered_results.aclose()
+
+                return StreamingResponse(
+                    serialise_results(), media_type="text/event-stream"
+                )
+
         if CORE_MODELS_ENABLED:
             if CORE_MODEL_CLIP_ENABLED:
 
@@ -2079,6 +2171,10 @@ class HttpInterface(BaseInterface):
                     0.0,
                     description="The confidence threshold used to filter out keypoints that are not visible based on model confidence",
                 ),
+                keypoints_format: Literal["objects", "array"] = Query(
+                    "objects",
+                    description="One of 'objects' or 'array'. 'array' returns keypoints of each prediction as [[x, y, confidence], ...] rows (not filtered by keypoint_confidence) - much cheaper to build for models with many keypoints.",
+                ),
                 format: str = Query(
                     "json",
                     description="One of 'json' or 'image'. If 'json' prediction data is return as a JSON string. If 'image' prediction data is visualized and overlayed on the original input image.",
@@ -2103,6 +2199,10 @@ class HttpInterface(BaseInterface):
                     0.0,
                     description="The amount to tradeoff between 0='fast' and 1='accurate'",
                 ),
+                mask_format: Optional[str] = Query(
+                    "polygon",
+                    description="One of 'polygon', 'rle' or 'bitmask'. 'rle' (COCO RLE) and 'bitmask' (bit-packed crop) return pixel-exact masks in the original image resolution instead of polygons.",
+                ),
                 max_detections: int = Query(
                     300,
                     description="The maximum number of detections to return. This is used to limit the number of predictions returned by the model. The model may return more predictions than this number, but only the top `max_detections` predictions will be returned.",
@@ -2244,12 +2344,16 @@ class HttpInterface(BaseInterface):
                     args = {
                         "mask_decode_mode": mask_decode_mode,
                         "tradeoff_factor": tradeoff_factor,
+                        "mask_format": mask_format,
                     }
                 elif task_type == "classification":
                     inference_request_type = ClassificationInferenceRequest
                 elif task_type == "keypoint-detection":
                     inference_request_type = KeypointsDetectionInferenceRequest
-                    args = {"keypoint_confidence": keypoint_confidence}
+                    args = {
+                        "keypoint_confidence": keypoint_confidence,
+                        "keypoints_format": keypoints_format,
+                    }
                 inference_request = inference_request_type(
                     api_key=api_key,
                     model_id=model_id,
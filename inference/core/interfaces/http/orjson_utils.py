@@ -1,5 +1,5 @@
 import base64
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import orjson
 import supervision as sv
@@ -60,6 +60,7 @@ def serialise_workflow_result(
 def serialise_single_workflow_result_element(
     result_element: Dict[str, Any],
     excluded_fields: Optional[List[str]] = None,
+    image_serialiser: Callable[[WorkflowImageData], Any] = serialise_image,
 ) -> Dict[str, Any]:
     if excluded_fields is None:
         excluded_fields = []
@@ -69,41 +70,51 @@ def serialise_single_workflow_result_element(
         if key in excluded_fields:
             continue
         if isinstance(value, WorkflowImageData):
-            value = serialise_image(image=value)
+            value = image_serialiser(value)
         elif isinstance(value, dict):
-            value = serialise_dict(elements=value)
+            value = serialise_dict(elements=value, image_serialiser=image_serialiser)
         elif isinstance(value, list):
-            value = serialise_list(elements=value)
+            value = serialise_list(elements=value, image_serialiser=image_serialiser)
         elif isinstance(value, sv.Detections):
             value = serialise_sv_detections(detections=value)
         serialised_result[key] = value
     return serialised_result
 
 
-def serialise_list(elements: List[Any]) -> List[Any]:
+def serialise_list(
+    elements: List[Any],
+    image_serialiser: Callable[[WorkflowImageData], Any] = serialise_image,
+) -> List[Any]:
     result = []
     for element in elements:
         if isinstance(element, WorkflowImageData):
-            element = serialise_image(image=element)
+            element = image_serialiser(element)
         elif isinstance(element, dict):
-            element = serialise_dict(elements=element)
+            element = serialise_dict(
+                elements=element, image_serialiser=image_serialiser
+            )
         elif isinstance(element, list):
-            element = serialise_list(elements=element)
+            element = serialise_list(
+                elements=element, image_serialiser=image_serialiser
+            )
         elif isinstance(element, sv.Detections):
             element = serialise_sv_detections(detections=element)
         result.append(element)
     return result
 
 
-def serialise_dict(elements: Dict[str, Any]) -> Dict[str, Any]:
+def serialise_dict(
+    elements: Dict[str, Any],
+    image_serialiser: Callable[[WorkflowImageData], Any] = serialise_image,
+) -> Dict[str, Any]:
     serialised_result = {}
     for key, value in elements.items():
         if isinstance(value, WorkflowImageData):
-            value = serialise_image(image=value)
+            value = image_serialiser(value)
         elif isinstance(value, dict):
-            value = serialise_dict(elements=value)
+            value = serialise_dict(elements=value, image_serialiser=image_serialiser)
         elif isinstance(value, list):
-            value = serialise_list(elements=value)
+            value = serialise_list(elements=value, image_serialiser=image_serialiser)
         elif isinstance(value, sv.Detections):
             value = serialise_sv_detections(detections=value)
         serialised_result[key] = value
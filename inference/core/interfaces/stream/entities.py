@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from inference.core.env import (
@@ -16,6 +17,9 @@ from inference.core.env import (
 from inference.core.interfaces.camera.entities import StatusUpdate, VideoFrame
 from inference.core.interfaces.camera.video_source import SourceMetadata
 from inference.core.utils.environment import safe_env_to_type, str2bool
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    StepExecutionMetricsReport,
+)
 
 AnyPrediction = Any
 ObjectDetectionPrediction = dict
@@ -110,6 +114,9 @@ class LatencyMonitorReport:
     frame_decoding_latency: Optional[float] = None
     inference_latency: Optional[float] = None
     e2e_latency: Optional[float] = None
+    preprocessing_latency: Optional[float] = None
+    model_inference_latency: Optional[float] = None
+    postprocessing_latency: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -118,9 +125,91 @@ class PipelineStateReport:
     latency_reports: List[LatencyMonitorReport]
     inference_throughput: float
     sources_metadata: List[SourceMetadata]
+    workflows_steps_metrics: List[StepExecutionMetricsReport] = field(
+        default_factory=list
+    )
+    workflows_blocks_metrics: List[StepExecutionMetricsReport] = field(
+        default_factory=list
+    )
 
 
 InferenceHandler = Callable[[List[VideoFrame]], List[AnyPrediction]]
+
+
+class SinkOverflowPolicy(Enum):
+    DROP = "drop"
+    BLOCK = "block"
+
+
+class FramesGatingMethod(Enum):
+    FRAME_DIFFERENCE = "frame_difference"
+    PERCEPTUAL_HASH = "perceptual_hash"
+
+
+@dataclass(frozen=True)
+class FramesGatingConfig:
+    """
+    Configuration of frames gating in `InferencePipeline` - inference is skipped for
+    frames which do not differ enough from the last frame of the same source that went
+    through inference, and predictions of that frame are re-emitted instead.
+
+    * `method` - `FRAME_DIFFERENCE` compares downscaled grayscale frames and measures
+    fraction of pixels changed by more than `pixel_difference_threshold`;
+    `PERCEPTUAL_HASH` measures fraction of differing bits of 64-bit difference hashes
+    (robust to noise and global lighting changes, less sensitive to small objects)
+    * `change_threshold` - change score (in range [0, 1]) required to run inference,
+    default depends on `method`
+    * `refresh_interval` - max number of seconds (measured with frames timestamps)
+    predictions may be re-emitted before inference is forced
+    * `downscale_width` - width of frames thumbnails compared by `FRAME_DIFFERENCE`
+    * `reused_predictions_adapter` - optional function to update re-emitted predictions
+    for the current frame (for instance - to advance tracked objects), by default
+    predictions are re-emitted as they are
+    """
+
+    method: FramesGatingMethod = FramesGatingMethod.FRAME_DIFFERENCE
+    change_threshold: Optional[float] = None
+    refresh_interval: float = 5.0
+    downscale_width: int = 64
+    pixel_difference_threshold: int = 25
+    reused_predictions_adapter: Optional[
+        Callable[[AnyPrediction, VideoFrame], AnyPrediction]
+    ] = None
+
+
+class InferenceStage(Enum):
+    PREPROCESSING = "preprocessing"
+    MODEL_INFERENCE = "model_inference"
+    POSTPROCESSING = "postprocessing"
+
+
+@dataclass(frozen=True)
+class StagedInferenceHandler:
+    """
+    `InferenceHandler` split into stages, such that `InferencePipeline` can run
+    them concurrently for consecutive batches of frames (preprocessing of batch N+1
+    and postprocessing of batch N-1 overlapping with model inference on batch N).
+    Each stage is always executed by a single thread, and receives batches in order
+    of their arrival.
+
+    * `preprocess(video_frames)` - returns payload for `infer(...)`
+    * `infer(preprocessed)` - returns raw model output
+    * `postprocess(raw_output, video_frames)` - returns predictions for `video_frames`
+
+    Calling the handler runs all stages sequentially - so it can be used wherever
+    `InferenceHandler` is expected.
+    """
+
+    preprocess: Callable[[List[VideoFrame]], Any]
+    infer: Callable[[Any], Any]
+    postprocess: Callable[[Any, List[VideoFrame]], List[AnyPrediction]]
+
+    def __call__(self, video_frames: List[VideoFrame]) -> List[AnyPrediction]:
+        preprocessed = self.preprocess(video_frames)
+        raw_output = self.infer(preprocessed)
+        return self.postprocess(raw_output, video_frames)
+
+
 SinkHandler = Optional[
     Union[
         Callable[[AnyPrediction, VideoFrame], None],
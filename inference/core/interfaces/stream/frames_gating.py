@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.entities import (
+    AnyPrediction,
+    FramesGatingConfig,
+    FramesGatingMethod,
+)
+
+DEFAULT_CHANGE_THRESHOLDS = {
+    FramesGatingMethod.FRAME_DIFFERENCE: 0.01,
+    FramesGatingMethod.PERCEPTUAL_HASH: 0.05,
+}
+HASH_SIZE = 8
+
+
+@dataclass
+class SourceGatingState:
+    reference: np.ndarray
+    reference_timestamp: datetime
+    predictions: Optional[AnyPrediction] = None
+    inferred_frames: int = 0
+    skipped_frames: int = 0
+
+
+class FramesGate:
+    """
+    Decides which frames of the batch yielded by `multiplex_videos(...)` need inference.
+    Frame is compared against the last frame of the same source that went through
+    inference (not against the previous frame - so slow changes accumulate and are not
+    missed). `select_frames_for_inference(...)` and `complete_predictions(...)` may be
+    called from different threads, but each of them must be called for batches in order.
+    """
+
+    def __init__(self, config: FramesGatingConfig):
+        self._config = config
+        self._change_threshold = config.change_threshold
+        if self._change_threshold is None:
+            self._change_threshold = DEFAULT_CHANGE_THRESHOLDS[config.method]
+        self._sources_states: Dict[int, SourceGatingState] = {}
+        self._lock = Lock()
+
+    def select_frames_for_inference(
+        self, video_frames: List[VideoFrame]
+    ) -> List[VideoFrame]:
+        return [
+            video_frame
+            for video_frame in video_frames
+            if self._requires_inference(video_frame=video_frame)
+        ]
+
+    def complete_predictions(
+        self,
+        predictions: List[AnyPrediction],
+        inferred_frames: List[VideoFrame],
+        video_frames: List[VideoFrame],
+    ) -> List[AnyPrediction]:
+        inferred_frames_predictions = {
+            id(video_frame): frame_predictions
+            for frame_predictions, video_frame in zip(predictions, inferred_frames)
+        }
+        result = []
+        with self._lock:
+            for video_frame in video_frames:
+                state = self._sources_states[video_frame.source_id]
+                if id(video_frame) in inferred_frames_predictions:
+                    state.predictions = inferred_frames_predictions[id(video_frame)]
+                    result.append(state.predictions)
+                    continue
+                result.append(
+                    self._reuse_predictions(
+                        predictions=state.predictions, video_frame=video_frame
+                    )
+                )
+        return result
+
+    def get_statistics(self) -> Dict[int, Dict[str, int]]:
+        with self._lock:
+            return {
+                source_id: {
+                    "inferred_frames": state.inferred_frames,
+                    "skipped_frames": state.skipped_frames,
+                }
+                for source_id, state in self._sources_states.items()
+            }
+
+    def _requires_inference(self, video_frame: VideoFrame) -> bool:
+        reference = compute_frame_signature(
+            image=video_frame.image,
+            method=self._config.method,
+            downscale_width=self._config.downscale_width,
+        )
+        with self._lock:
+            state = self._sources_states.get(video_frame.source_id)
+            if state is None or self._should_refresh(
+                state=state, video_frame=video_frame, reference=reference
+            ):
+                self._sources_states[video_frame.source_id] = SourceGatingState(
+                    reference=reference,
+                    reference_timestamp=video_frame.frame_timestamp,
+                    predictions=state.predictions if state is not None else None,
+                    inferred_frames=state.inferred_frames + 1 if state else 1,
+                    skipped_frames=state.skipped_frames if state else 0,
+                )
+                return True
+            state.skipped_frames += 1
+            return False
+
+    def _should_refresh(
+        self,
+        state: SourceGatingState,
+        video_frame: VideoFrame,
+        reference: np.ndarray,
+    ) -> bool:
+        staleness = (
+            video_frame.frame_timestamp - state.reference_timestamp
+        ).total_seconds()
+        if staleness >= self._config.refresh_interval:
+            return True
+        if reference.shape != state.reference.shape:
+            return True
+        change = compute_change_score(
+            reference=state.reference,
+            current=reference,
+            method=self._config.method,
+            pixel_difference_threshold=self._config.pixel_difference_threshold,
+        )
+        return change >= self._change_threshold
+
+    def _reuse_predictions(
+        self, predictions: AnyPrediction, video_frame: VideoFrame
+    ) -> AnyPrediction:
+        if self._config.reused_predictions_adapter is None:
+            return predictions
+        return self._config.reused_predictions_adapter(predictions, video_frame)
+
+
+def compute_frame_signature(
+    image: np.ndarray,
+    method: FramesGatingMethod,
+    downscale_width: int,
+) -> np.ndarray:
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    if method is FramesGatingMethod.PERCEPTUAL_HASH:
+        # difference hash - sign of horizontal gradient of 9x8 thumbnail
+        thumbnail = cv2.resize(
+            image, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA
+        )
+        return thumbnail[:, 1:] > thumbnail[:, :-1]
+    height, width = image.shape[:2]
+    downscale_width = max(min(downscale_width, width), 1)
+    downscale_height = max(round(height * downscale_width / width), 1)
+    return cv2.resize(
+        image, (downscale_width, downscale_height), interpolation=cv2.INTER_AREA
+    )
+
+
+def compute_change_score(
+    reference: np.ndarray,
+    current: np.ndarray,
+    method: FramesGatingMethod,
+    pixel_difference_threshold: int,
+) -> float:
+    if method is FramesGatingMethod.PERCEPTUAL_HASH:
+        return float(np.count_nonzero(reference != current)) / reference.size
+    difference = cv2.absdiff(reference, current)
+    return float(np.count_nonzero(difference > pixel_difference_threshold)) / (
+        difference.size
+    )
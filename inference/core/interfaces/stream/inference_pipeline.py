@@ -3,7 +3,8 @@ from datetime import datetime
 from enum import Enum
 from functools import partial
 from queue import Queue
-from threading import Thread
+from threading import Event, Thread
+from time import perf_counter
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from inference.core import logger
@@ -18,11 +19,17 @@ from inference.core.env import (
     DISABLE_PREPROC_AUTO_ORIENT,
     ENABLE_WORKFLOWS_PROFILING,
     MAX_ACTIVE_MODELS,
+    MAX_IN_FLIGHT_BATCHES,
     PREDICTIONS_QUEUE_SIZE,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
 )
 from inference.core.exceptions import CannotInitialiseModelError, MissingApiKeyError
+from inference.core.interfaces.camera.adaptive_batching import (
+    AdaptiveBatchCollectionPolicy,
+)
 from inference.core.interfaces.camera.entities import (
+    AdaptiveBatchingConfig,
+    AdaptiveBatchingStatistics,
     StatusUpdate,
     UpdateSeverity,
     VideoFrame,
@@ -36,11 +43,16 @@ from inference.core.interfaces.camera.video_source import (
 )
 from inference.core.interfaces.stream.entities import (
     AnyPrediction,
+    FramesGatingConfig,
     InferenceHandler,
+    InferenceStage,
     ModelConfig,
     SinkHandler,
+    StagedInferenceHandler,
 )
+from inference.core.interfaces.stream.frames_gating import FramesGate
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
+    build_staged_roboflow_model_handler,
     default_process_frame,
 )
 from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
@@ -53,6 +65,7 @@ from inference.core.interfaces.stream.watchdog import (
     PipelineWatchDog,
 )
 from inference.core.managers.active_learning import BackgroundTaskActiveLearningManager
+from inference.core.managers.base import ModelManager
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
 from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.utils.function import experimental
@@ -61,6 +74,9 @@ from inference.core.workflows.execution_engine.profiling.core import (
     BaseWorkflowsProfiler,
     NullWorkflowsProfiler,
 )
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WORKFLOWS_METRICS_COLLECTOR,
+)
 from inference.models.aliases import resolve_roboflow_model_alias
 from inference.models.utils import ROBOFLOW_MODEL_TYPES, get_model
 
@@ -107,6 +123,9 @@ class InferencePipeline:
         active_learning_target_dataset: Optional[str] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        max_in_flight_batches: Optional[int] = None,
+        frames_gating: Optional[FramesGatingConfig] = None,
+        adaptive_batching: Optional[AdaptiveBatchingConfig] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from Roboflow models against video stream.
@@ -214,6 +233,19 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
+            max_in_flight_batches (Optional[int]): Number of batches of frames which may wait between consecutive
+                stages of processing (preprocessing, model inference and postprocessing). When set above 1,
+                stages run in separate threads, such that preprocessing and postprocessing of neighbouring
+                batches overlap with model inference. Order of predictions is preserved. If not given - value
+                of env variable "INFERENCE_PIPELINE_MAX_IN_FLIGHT_BATCHES" is used (default: 1 - sequential processing).
+            frames_gating (Optional[FramesGatingConfig]): When given, inference is skipped for frames which did not
+                change enough (see `FramesGatingConfig`) since the last frame of the same source that went through
+                inference - and predictions of that frame are re-emitted to sinks instead. Inference is forced
+                every `refresh_interval` seconds, to bound staleness of predictions. Disabled by default.
+            adaptive_batching (Optional[AdaptiveBatchingConfig]): When given, `batch_collection_timeout` is
+                replaced by adaptive collection of batches from multiple sources - batch is closed once waiting
+                for more frames would make its oldest frame miss `latency_target` (given learned frames cadence of
+                sources and batch processing time of the model). See `get_batching_statistics()`. Disabled by default.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
@@ -238,9 +270,16 @@ class InferencePipeline:
             tradeoff_factor=tradeoff_factor,
         )
         model = get_model(model_id=model_id, api_key=api_key)
-        on_video_frame = partial(
-            default_process_frame, model=model, inference_config=inference_config
-        )
+        if max_in_flight_batches is None:
+            max_in_flight_batches = MAX_IN_FLIGHT_BATCHES
+        if max_in_flight_batches > 1:
+            on_video_frame = build_staged_roboflow_model_handler(
+                model=model, inference_config=inference_config
+            )
+        else:
+            on_video_frame = partial(
+                default_process_frame, model=model, inference_config=inference_config
+            )
         active_learning_middleware = NullActiveLearningMiddleware()
         if active_learning_enabled is None:
             logger.info(
@@ -290,6 +329,9 @@ class InferencePipeline:
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            max_in_flight_batches=max_in_flight_batches,
+            frames_gating=frames_gating,
+            adaptive_batching=adaptive_batching,
         )
 
     @classmethod
@@ -312,6 +354,8 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        frames_gating: Optional[FramesGatingConfig] = None,
+        adaptive_batching: Optional[AdaptiveBatchingConfig] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from YoloWorld against video stream.
@@ -378,7 +422,14 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
-
+            frames_gating (Optional[FramesGatingConfig]): When given, inference is skipped for frames which did not
+                change enough (see `FramesGatingConfig`) since the last frame of the same source that went through
+                inference - and predictions of that frame are re-emitted to sinks instead. Inference is forced
+                every `refresh_interval` seconds, to bound staleness of predictions. Disabled by default.
+            adaptive_batching (Optional[AdaptiveBatchingConfig]): When given, `batch_collection_timeout` is
+                replaced by adaptive collection of batches from multiple sources - batch is closed once waiting
+                for more frames would make its oldest frame miss `latency_target` (given learned frames cadence of
+                sources and batch processing time of the model). See `get_batching_statistics()`. Disabled by default.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
@@ -426,6 +477,8 @@ class InferencePipeline:
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            frames_gating=frames_gating,
+            adaptive_batching=adaptive_batching,
         )
 
     @classmethod
@@ -456,6 +509,9 @@ class InferencePipeline:
         batch_collection_timeout: Optional[float] = None,
         profiling_directory: str = "./inference_profiling",
         use_workflow_definition_cache: bool = True,
+        model_manager: Optional[ModelManager] = None,
+        frames_gating: Optional[FramesGatingConfig] = None,
+        adaptive_batching: Optional[AdaptiveBatchingConfig] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -525,9 +581,25 @@ class InferencePipeline:
             use_workflow_definition_cache (bool): Controls usage of cache for workflow definitions. Set this to False
                 when you frequently modify definition saved in Roboflow app and want to fetch the
                 newest version for the request. Only applies for Workflows definitions saved on Roboflow platform.
+            model_manager (Optional[ModelManager]): Model manager to be used by Workflow steps. When not given -
+                each pipeline creates its own one (loading its own copies of models). Stream Manager passes client
+                of shared model host here - to share models among pipelines.
+            frames_gating (Optional[FramesGatingConfig]): When given, inference is skipped for frames which did not
+                change enough (see `FramesGatingConfig`) since the last frame of the same source that went through
+                inference - and predictions of that frame are re-emitted to sinks instead. Inference is forced
+                every `refresh_interval` seconds, to bound staleness of predictions. Disabled by default.
+            adaptive_batching (Optional[AdaptiveBatchingConfig]): When given, `batch_collection_timeout` is
+                replaced by adaptive collection of batches from multiple sources - batch is closed once waiting
+                for more frames would make its oldest frame miss `latency_target` (given learned frames cadence of
+                sources and batch processing time of the model). See `get_batching_statistics()`. Disabled by default.
+
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * ENABLE_WORKFLOWS_METRICS - enables aggregates of workflow steps execution (latency histograms,
+            batch sizes, images bytes, memory deltas) which are included in `watchdog` report
+        * WORKFLOWS_METRICS_SAMPLING_RATE - fraction of steps executions to be measured
+        * WORKFLOWS_METRICS_MEASURE_RESOURCES - enables measurement of images bytes and memory deltas
 
         Returns: Instance of InferencePipeline
 
@@ -580,14 +652,15 @@ class InferencePipeline:
                         workflow_id=workflow_id,
                         use_cache=use_workflow_definition_cache,
                     )
-            model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
-            model_manager = BackgroundTaskActiveLearningManager(
-                model_registry=model_registry, cache=cache
-            )
-            model_manager = WithFixedSizeCache(
-                model_manager,
-                max_size=MAX_ACTIVE_MODELS,
-            )
+            if model_manager is None:
+                model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+                model_manager = BackgroundTaskActiveLearningManager(
+                    model_registry=model_registry, cache=cache
+                )
+                model_manager = WithFixedSizeCache(
+                    model_manager,
+                    max_size=MAX_ACTIVE_MODELS,
+                )
             if api_key is None:
                 api_key = API_KEY
             if workflow_init_parameters is None:
@@ -619,6 +692,10 @@ class InferencePipeline:
                 f"Could not initialise workflow processing due to lack of dependencies required. "
                 f"Please provide an issue report under https://github.com/roboflow/inference/issues"
             ) from error
+        if watchdog is not None and WORKFLOWS_METRICS_COLLECTOR is not None:
+            watchdog.register_workflows_metrics_collector(
+                collector=WORKFLOWS_METRICS_COLLECTOR
+            )
         on_pipeline_end_closure = partial(
             on_pipeline_end,
             thread_pool_executor=thread_pool_executor,
@@ -639,13 +716,15 @@ class InferencePipeline:
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
+            frames_gating=frames_gating,
+            adaptive_batching=adaptive_batching,
         )
 
     @classmethod
     def init_with_custom_logic(
         cls,
         video_reference: Union[VideoSourceIdentifier, List[VideoSourceIdentifier]],
-        on_video_frame: InferenceHandler,
+        on_video_frame: Union[InferenceHandler, StagedInferenceHandler],
         on_prediction: SinkHandler = None,
         on_pipeline_start: Optional[Callable[[], None]] = None,
         on_pipeline_end: Optional[Callable[[], None]] = None,
@@ -657,6 +736,9 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        max_in_flight_batches: Optional[int] = None,
+        frames_gating: Optional[FramesGatingConfig] = None,
+        adaptive_batching: Optional[AdaptiveBatchingConfig] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -669,9 +751,11 @@ class InferencePipeline:
                 (we handle whatever cv2 handles). It can also be a list of references (since v0.9.18) - and then
                 it will trigger parallel processing of multiple sources. It has some implication on sinks. See:
                 `sink_mode` parameter comments.
-            on_video_frame (Callable[[VideoFrame], AnyPrediction]): function supposed to make prediction (or do another
-                kind of custom processing according to your will). Accept `VideoFrame` object and is supposed
-                to return dictionary with results of any kind.
+            on_video_frame (Union[Callable[[VideoFrame], AnyPrediction], StagedInferenceHandler]): function supposed
+                to make prediction (or do another kind of custom processing according to your will). Accept
+                `VideoFrame` object and is supposed to return dictionary with results of any kind. If
+                `StagedInferenceHandler` is given - its stages can be executed concurrently
+                (see `max_in_flight_batches`).
             on_prediction (Callable[AnyPrediction, VideoFrame], None]): Function to be called
                 once prediction is ready - passing both decoded frame, their metadata and dict with output from your
                 custom callable `on_video_frame(...)`. Logic here must be adjusted to the output of `on_video_frame`.
@@ -720,6 +804,19 @@ class InferencePipeline:
                 prediction element.
 
 
+            max_in_flight_batches (Optional[int]): Number of batches of frames which may wait between consecutive
+                stages of `StagedInferenceHandler` given as `on_video_frame`. When set above 1, stages run in
+                separate threads (preserving order of predictions). Ignored for plain callables.
+                If not given - value of env variable "INFERENCE_PIPELINE_MAX_IN_FLIGHT_BATCHES" is used.
+            frames_gating (Optional[FramesGatingConfig]): When given, inference is skipped for frames which did not
+                change enough (see `FramesGatingConfig`) since the last frame of the same source that went through
+                inference - and predictions of that frame are re-emitted to sinks instead. Inference is forced
+                every `refresh_interval` seconds, to bound staleness of predictions. Disabled by default.
+            adaptive_batching (Optional[AdaptiveBatchingConfig]): When given, `batch_collection_timeout` is
+                replaced by adaptive collection of batches from multiple sources - batch is closed once waiting
+                for more frames would make its oldest frame miss `latency_target` (given learned frames cadence of
+                sources and batch processing time of the model). See `get_batching_statistics()`. Disabled by default.
+
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
@@ -744,6 +841,8 @@ class InferencePipeline:
         )
         watchdog.register_video_sources(video_sources=video_sources)
         predictions_queue = Queue(maxsize=PREDICTIONS_QUEUE_SIZE)
+        if max_in_flight_batches is None:
+            max_in_flight_batches = MAX_IN_FLIGHT_BATCHES
         return cls(
             on_video_frame=on_video_frame,
             video_sources=video_sources,
@@ -756,11 +855,14 @@ class InferencePipeline:
             on_pipeline_end=on_pipeline_end,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            max_in_flight_batches=max_in_flight_batches,
+            frames_gating=frames_gating,
+            adaptive_batching=adaptive_batching,
         )
 
     def __init__(
         self,
-        on_video_frame: InferenceHandler,
+        on_video_frame: Union[InferenceHandler, StagedInferenceHandler],
         video_sources: List[VideoSource],
         predictions_queue: Queue,
         watchdog: PipelineWatchDog,
@@ -771,6 +873,9 @@ class InferencePipeline:
         max_fps: Optional[float] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        max_in_flight_batches: int = 1,
+        frames_gating: Optional[FramesGatingConfig] = None,
+        adaptive_batching: Optional[AdaptiveBatchingConfig] = None,
     ):
         self._on_video_frame = on_video_frame
         self._video_sources = video_sources
@@ -788,6 +893,15 @@ class InferencePipeline:
         self._on_pipeline_end = on_pipeline_end
         self._batch_collection_timeout = batch_collection_timeout
         self._sink_mode = sink_mode
+        self._max_in_flight_batches = max(max_in_flight_batches, 1)
+        self._frames_gate: Optional[FramesGate] = None
+        if frames_gating is not None:
+            self._frames_gate = FramesGate(config=frames_gating)
+        self._batching_policy: Optional[AdaptiveBatchCollectionPolicy] = None
+        if adaptive_batching is not None:
+            self._batching_policy = AdaptiveBatchCollectionPolicy(
+                config=adaptive_batching
+            )
 
     def start(self, use_main_thread: bool = True) -> None:
         self._stop = False
@@ -823,6 +937,16 @@ class InferencePipeline:
             if video_source.source_id == source_id or source_id is None:
                 video_source.resume()
 
+    def get_batching_statistics(self) -> Optional[AdaptiveBatchingStatistics]:
+        """
+        Returns statistics of adaptive batches collection (achieved batch size, queueing
+        delay added to frames of each source, learned batch processing times) - if
+        `adaptive_batching` is enabled.
+        """
+        if self._batching_policy is None:
+            return None
+        return self._batching_policy.get_statistics()
+
     def join(self) -> None:
         if self._inference_thread is not None:
             self._inference_thread.join()
@@ -841,26 +965,10 @@ class InferencePipeline:
         )
         logger.info(f"Inference thread started")
         try:
-            for video_frames in self._generate_frames():
-                self._watchdog.on_model_inference_started(
-                    frames=video_frames,
-                )
-                predictions = self._on_video_frame(video_frames)
-                self._watchdog.on_model_prediction_ready(
-                    frames=video_frames,
-                )
-                self._predictions_queue.put((predictions, video_frames))
-                send_inference_pipeline_status_update(
-                    severity=UpdateSeverity.DEBUG,
-                    event_type=INFERENCE_COMPLETED_EVENT,
-                    payload={
-                        "frames_ids": [f.frame_id for f in video_frames],
-                        "frames_timestamps": [f.frame_timestamp for f in video_frames],
-                        "sources_id": [f.source_id for f in video_frames],
-                    },
-                    status_update_handlers=self._status_update_handlers,
-                )
-
+            if self._should_execute_stages_concurrently():
+                self._execute_inference_stages_concurrently()
+            else:
+                self._execute_inference_sequentially()
         except Exception as error:
             payload = {
                 "error_type": error.__class__.__name__,
@@ -883,6 +991,207 @@ class InferencePipeline:
             )
             logger.info(f"Inference thread finished")
 
+    def _should_execute_stages_concurrently(self) -> bool:
+        return (
+            isinstance(self._on_video_frame, StagedInferenceHandler)
+            and self._max_in_flight_batches > 1
+        )
+
+    def _execute_inference_sequentially(self) -> None:
+        for video_frames in self._generate_frames():
+            self._watchdog.on_model_inference_started(
+                frames=video_frames,
+            )
+            inferred_frames = self._select_frames_for_inference(
+                video_frames=video_frames
+            )
+            predictions = []
+            if not inferred_frames:
+                pass
+            elif isinstance(self._on_video_frame, StagedInferenceHandler):
+                preprocessed = self._execute_inference_stage(
+                    stage=InferenceStage.PREPROCESSING,
+                    stage_input=inferred_frames,
+                    video_frames=inferred_frames,
+                )
+                raw_output = self._execute_inference_stage(
+                    stage=InferenceStage.MODEL_INFERENCE,
+                    stage_input=preprocessed,
+                    video_frames=inferred_frames,
+                )
+                predictions = self._execute_inference_stage(
+                    stage=InferenceStage.POSTPROCESSING,
+                    stage_input=raw_output,
+                    video_frames=inferred_frames,
+                )
+            else:
+                predictions = self._on_video_frame(inferred_frames)
+            self._register_predictions(
+                predictions=predictions,
+                video_frames=video_frames,
+                inferred_frames=inferred_frames,
+            )
+
+    def _execute_inference_stages_concurrently(self) -> None:
+        """
+        Preprocessing runs in inference thread, model inference and postprocessing
+        in their own threads. Stages are connected with FIFO queues bounded by
+        `max_in_flight_batches` and each stage is single-threaded - so the order of
+        batches (hence order of frames for each source) is preserved. Error in any
+        stage stops frames generation, remaining batches are drained and the first
+        error is re-raised in inference thread.
+        """
+        preprocessed_queue = Queue(maxsize=self._max_in_flight_batches)
+        raw_output_queue = Queue(maxsize=self._max_in_flight_batches)
+        stages_failed = Event()
+        stages_errors: List[Exception] = []
+        stages_threads = [
+            Thread(
+                target=self._run_inference_stage_worker,
+                kwargs={
+                    "stage": InferenceStage.MODEL_INFERENCE,
+                    "input_queue": preprocessed_queue,
+                    "output_queue": raw_output_queue,
+                    "stages_failed": stages_failed,
+                    "stages_errors": stages_errors,
+                },
+            ),
+            Thread(
+                target=self._run_inference_stage_worker,
+                kwargs={
+                    "stage": InferenceStage.POSTPROCESSING,
+                    "input_queue": raw_output_queue,
+                    "output_queue": None,
+                    "stages_failed": stages_failed,
+                    "stages_errors": stages_errors,
+                },
+            ),
+        ]
+        for thread in stages_threads:
+            thread.start()
+        try:
+            for video_frames in self._generate_frames():
+                if stages_failed.is_set():
+                    break
+                self._watchdog.on_model_inference_started(
+                    frames=video_frames,
+                )
+                inferred_frames = self._select_frames_for_inference(
+                    video_frames=video_frames
+                )
+                preprocessed = None
+                if inferred_frames:
+                    preprocessed = self._execute_inference_stage(
+                        stage=InferenceStage.PREPROCESSING,
+                        stage_input=inferred_frames,
+                        video_frames=inferred_frames,
+                    )
+                preprocessed_queue.put((preprocessed, inferred_frames, video_frames))
+        finally:
+            preprocessed_queue.put(None)
+            for thread in stages_threads:
+                thread.join()
+        if stages_errors:
+            raise stages_errors[0]
+
+    def _run_inference_stage_worker(
+        self,
+        stage: InferenceStage,
+        input_queue: Queue,
+        output_queue: Optional[Queue],
+        stages_failed: Event,
+        stages_errors: List[Exception],
+    ) -> None:
+        while True:
+            stage_task = input_queue.get()
+            if stage_task is None:
+                break
+            if stages_failed.is_set():
+                # draining queue, such that previous stages are not blocked
+                continue
+            stage_input, inferred_frames, video_frames = stage_task
+            try:
+                stage_output = None
+                if inferred_frames:
+                    stage_output = self._execute_inference_stage(
+                        stage=stage,
+                        stage_input=stage_input,
+                        video_frames=inferred_frames,
+                    )
+                if output_queue is None:
+                    self._register_predictions(
+                        predictions=stage_output or [],
+                        video_frames=video_frames,
+                        inferred_frames=inferred_frames,
+                    )
+                else:
+                    output_queue.put((stage_output, inferred_frames, video_frames))
+            except Exception as error:
+                stages_errors.append(error)
+                stages_failed.set()
+        if output_queue is not None:
+            output_queue.put(None)
+
+    def _execute_inference_stage(
+        self,
+        stage: InferenceStage,
+        stage_input: Any,
+        video_frames: List[VideoFrame],
+    ) -> Any:
+        start = perf_counter()
+        if stage is InferenceStage.PREPROCESSING:
+            result = self._on_video_frame.preprocess(stage_input)
+        elif stage is InferenceStage.MODEL_INFERENCE:
+            result = self._on_video_frame.infer(stage_input)
+        else:
+            result = self._on_video_frame.postprocess(stage_input, video_frames)
+        self._watchdog.on_inference_stage_finished(
+            stage=stage,
+            frames=video_frames,
+            duration=perf_counter() - start,
+        )
+        return result
+
+    def _select_frames_for_inference(
+        self, video_frames: List[VideoFrame]
+    ) -> List[VideoFrame]:
+        if self._frames_gate is None:
+            return video_frames
+        return self._frames_gate.select_frames_for_inference(video_frames=video_frames)
+
+    def _register_predictions(
+        self,
+        predictions: List[AnyPrediction],
+        video_frames: List[VideoFrame],
+        inferred_frames: List[VideoFrame],
+    ) -> None:
+        if self._frames_gate is not None:
+            # skipped frames get predictions re-emitted from previous frames
+            predictions = self._frames_gate.complete_predictions(
+                predictions=predictions,
+                inferred_frames=inferred_frames,
+                video_frames=video_frames,
+            )
+        if self._batching_policy is not None:
+            self._batching_policy.register_batch_processed(
+                video_frames=video_frames,
+                inferred_frames_number=len(inferred_frames),
+            )
+        self._watchdog.on_model_prediction_ready(
+            frames=video_frames,
+        )
+        self._predictions_queue.put((predictions, video_frames))
+        send_inference_pipeline_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type=INFERENCE_COMPLETED_EVENT,
+            payload={
+                "frames_ids": [f.frame_id for f in video_frames],
+                "frames_timestamps": [f.frame_timestamp for f in video_frames],
+                "sources_id": [f.source_id for f in video_frames],
+            },
+            status_update_handlers=self._status_update_handlers,
+        )
+
     def _dispatch_inference_results(self) -> None:
         while True:
             inference_results: Optional[
@@ -968,6 +1277,7 @@ class InferencePipeline:
             max_fps=self._max_fps,
             batch_collection_timeout=self._batch_collection_timeout,
             should_stop=lambda: self._stop,
+            batching_policy=self._batching_policy,
         )
 
 
@@ -1,9 +1,19 @@
-from typing import Any, List
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
+from inference.core.env import MAX_BATCH_SIZE
 from inference.core.interfaces.camera.entities import VideoFrame
-from inference.core.interfaces.stream.entities import ModelConfig
+from inference.core.interfaces.stream.entities import (
+    ModelConfig,
+    StagedInferenceHandler,
+)
 from inference.core.interfaces.stream.utils import wrap_in_list
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.batching import create_batches
+from inference.usage_tracking.collector import usage_collector
 
 
 def default_process_frame(
@@ -27,3 +37,88 @@ def default_process_frame(
         )
         for p in predictions
     ]
+
+
+def build_staged_roboflow_model_handler(
+    model: OnnxRoboflowInferenceModel,
+    inference_config: ModelConfig,
+) -> StagedInferenceHandler:
+    """
+    Splits `model.infer(...)` used in `default_process_frame(...)` into preprocessing,
+    forward pass and postprocessing - giving the same results, but letting
+    `InferencePipeline` to overlap the stages for consecutive batches of frames.
+    """
+    postprocessing_args = inference_config.to_postprocessing_params()
+    return StagedInferenceHandler(
+        preprocess=partial(
+            preprocess_frames, model=model, postprocessing_args=postprocessing_args
+        ),
+        infer=partial(
+            run_model_forward_pass, model=model, postprocessing_args=postprocessing_args
+        ),
+        postprocess=partial(
+            postprocess_model_output,
+            model=model,
+            postprocessing_args=postprocessing_args,
+        ),
+    )
+
+
+def preprocess_frames(
+    video_frames: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    postprocessing_args: Dict[str, Any],
+) -> List[Tuple[np.ndarray, PreprocessReturnMetadata]]:
+    # `model.infer(...)` records usage - here it must be done explicitly
+    usage_collector.record_usage(
+        source=None,
+        category="model",
+        api_key=model.api_key,
+        resource_details={"task_type": model.task_type},
+        resource_id=model.endpoint,
+        fps=video_frames[0].fps,
+    )
+    images = [f.image for f in video_frames]
+    # the same batches as in `OnnxRoboflowInferenceModel.infer(...)`
+    max_batch_size = MAX_BATCH_SIZE if model.batching_enabled else model.batch_size
+    if max_batch_size == float("inf"):
+        max_batch_size = len(images)
+    return [
+        model.preprocess(batch, **postprocessing_args)
+        for batch in create_batches(sequence=images, batch_size=max_batch_size)
+    ]
+
+
+def run_model_forward_pass(
+    preprocessed: List[Tuple[np.ndarray, PreprocessReturnMetadata]],
+    model: OnnxRoboflowInferenceModel,
+    postprocessing_args: Dict[str, Any],
+) -> List[Tuple[Tuple[np.ndarray, ...], PreprocessReturnMetadata]]:
+    return [
+        (model.predict(img_in, **postprocessing_args), preprocess_return_metadata)
+        for img_in, preprocess_return_metadata in preprocessed
+    ]
+
+
+def postprocess_model_output(
+    raw_output: List[Tuple[Tuple[np.ndarray, ...], PreprocessReturnMetadata]],
+    video_frames: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    postprocessing_args: Dict[str, Any],
+) -> List[dict]:
+    predictions = []
+    for predicted_arrays, preprocess_return_metadata in raw_output:
+        predictions.extend(
+            wrap_in_list(
+                model.postprocess(
+                    predicted_arrays, preprocess_return_metadata, **postprocessing_args
+                )
+            )
+        )
+    return [
+        p.dict(
+            by_alias=True,
+            exclude_none=True,
+        )
+        for p in predictions
+    ]
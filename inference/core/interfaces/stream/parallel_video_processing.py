@@ -0,0 +1,560 @@
+import os
+from collections import Counter, deque
+from dataclasses import dataclass, replace
+from functools import partial
+from multiprocessing import Process, Queue, Semaphore
+from queue import Empty
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import cv2
+import numpy as np
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import SourceProperties, VideoFrame
+from inference.core.interfaces.camera.video_source import CV2VideoFrameProducer
+from inference.core.workflows.execution_engine.constants import TRACKER_ID_KEY
+
+DEFAULT_MAX_WORKERS = max(min((os.cpu_count() or 1) // 2, 8), 1)
+DEFAULT_OVERLAP_FRAMES = 30
+DEFAULT_MAX_BUFFERED_RESULTS = 256
+TRACKS_MATCHING_IOU_THRESHOLD = 0.5
+
+RESULTS_POLL_TIMEOUT = 1.0
+
+SEGMENT_COMPLETED = "completed"
+SEGMENT_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class VideoSegment:
+    """
+    Part of the video file - frames in range [start_frame, end_frame) are the ones which
+    results belong to the segment. Processing starts earlier - at `processing_start` -
+    so that stateful blocks (like trackers) are warmed up and their state can be stitched
+    with the previous segment on overlapping frames.
+    """
+
+    segment_id: int
+    start_frame: int
+    end_frame: int
+    processing_start: int
+
+
+class VideoSegmentFrameProducer(CV2VideoFrameProducer):
+    """
+    Produces frames from [start_frame, end_frame) range of video file (till the end of
+    file if `end_frame` is not given) - to be used with `VideoSource`, which assigns frame
+    ids starting from 1 at `start_frame`.
+    """
+
+    def __init__(self, video: str, start_frame: int, end_frame: Optional[int]):
+        super().__init__(video=video)
+        self._start_frame = start_frame
+        self._end_frame = end_frame
+        self._position = start_frame
+        if start_frame > 0:
+            self.stream.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+
+    def grab(self) -> bool:
+        if self._end_frame is not None and self._position >= self._end_frame:
+            return False
+        self._position += 1
+        return self.stream.grab()
+
+    def discover_source_properties(self) -> SourceProperties:
+        source_properties = super().discover_source_properties()
+        end_frame = self._end_frame
+        if end_frame is None:
+            end_frame = max(source_properties.total_frames, self._start_frame)
+        return replace(
+            source_properties,
+            total_frames=end_frame - self._start_frame,
+            is_file=True,
+        )
+
+
+def process_video_in_parallel(
+    video_path: str,
+    on_prediction: Callable[[dict, int], None],
+    workflow_specification: Optional[dict] = None,
+    workspace_name: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    api_key: Optional[str] = None,
+    image_input_name: str = "image",
+    workflows_parameters: Optional[Dict[str, Any]] = None,
+    excluded_fields: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    overlap_frames: int = DEFAULT_OVERLAP_FRAMES,
+    max_buffered_results: int = DEFAULT_MAX_BUFFERED_RESULTS,
+) -> List[VideoSegment]:
+    """
+    Runs Workflow against all frames of video file - splitting the file into segments (at
+    keyframes, when those can be found) which are processed in parallel, by worker processes
+    with their own `InferencePipeline` (and model sessions). Results are merged back and
+    `on_prediction(result, frame_index)` is called in the order of frames (frame index
+    starts from 0) - in the main process, as soon as results of the preceding frames are
+    known. Results are serialised (images in base64), the same as in HTTP API responses.
+
+    Each segment (but the first) starts processing `overlap_frames` earlier - results for
+    those frames are not emitted, but are used to match tracks with the previous segment,
+    such that `tracker_id` of the same object remains the same across segments. Other
+    stateful blocks (like line counters) restart in each segment.
+
+    Segments are planned with frames count reported by the container, which for many formats
+    is only an estimate - so the last segment is processed till the end of file.
+
+    Results of segments which cannot be emitted yet (as results of preceding frames are not
+    known) are buffered - up to `max_buffered_results` per segment (but not less than
+    the overlap), after which worker of the segment is paused until its results get emitted.
+
+    Args:
+        video_path (str): Path to video file.
+        on_prediction (Callable[[dict, int], None]): Function called with serialised Workflow result for each frame
+            and frame index.
+        workflow_specification (Optional[dict]): Valid specification of workflow.
+        workspace_name (Optional[str]): Roboflow workspace name - when registered workflow is used.
+        workflow_id (Optional[str]): ID of registered workflow.
+        api_key (Optional[str]): Roboflow API key.
+        image_input_name (str): Name of Workflow input with video frames.
+        workflows_parameters (Optional[Dict[str, Any]]): Values of other Workflow inputs.
+        excluded_fields (Optional[List[str]]): Workflow outputs not to be returned.
+        max_workers (int): Number of worker processes (and segments).
+        overlap_frames (int): Number of frames each segment is processed ahead of its start, used to stitch tracks.
+        max_buffered_results (int): Max number of results of each segment waiting to be emitted.
+
+    Returns: List of processed video segments
+
+    Raises:
+        ValueError: When video cannot be opened or does not report its frames count.
+        RuntimeError: When processing of any segment fails (or its worker process dies).
+    """
+    total_frames = get_total_frames(video_path=video_path)
+    segments = plan_video_segments(
+        total_frames=total_frames,
+        keyframes=find_keyframes(video_path=video_path),
+        segments_number=max_workers,
+        overlap_frames=overlap_frames,
+    )
+    workflow_configuration = {
+        "workflow_specification": workflow_specification,
+        "workspace_name": workspace_name,
+        "workflow_id": workflow_id,
+        "api_key": api_key,
+        "image_input_name": image_input_name,
+        "workflows_parameters": workflows_parameters,
+    }
+    results_queue = Queue()
+    # results of overlap must fit into the buffer - otherwise stitching would never start
+    max_buffered_results = max(max_buffered_results, overlap_frames + 1)
+    results_credits = {
+        segment.segment_id: Semaphore(max_buffered_results) for segment in segments
+    }
+    workers = [
+        Process(
+            target=process_video_segment,
+            kwargs={
+                "video_path": video_path,
+                "segment": segment,
+                "read_until_end": segment is segments[-1],
+                "workflow_configuration": workflow_configuration,
+                "excluded_fields": excluded_fields,
+                "results_queue": results_queue,
+                "results_credits": results_credits[segment.segment_id],
+            },
+            daemon=True,
+        )
+        for segment in segments
+    ]
+    logger.info(
+        f"Processing video {video_path} (~{total_frames} frames) in {len(segments)} segments"
+    )
+    for worker in workers:
+        worker.start()
+    merger = SegmentsResultsMerger(
+        segments=segments,
+        on_prediction=on_prediction,
+        on_result_released=lambda segment_id: results_credits[segment_id].release(),
+    )
+    try:
+        while not merger.is_completed():
+            try:
+                segment_id, frame_index, payload = results_queue.get(
+                    timeout=RESULTS_POLL_TIMEOUT
+                )
+            except Empty:
+                # worker killed (for instance by OOM killer) cannot report failure
+                ensure_workers_alive(workers=workers, segments=segments, merger=merger)
+                continue
+            if frame_index == SEGMENT_FAILED:
+                raise RuntimeError(
+                    f"Processing of video segment {segment_id} failed. Cause: {payload}"
+                )
+            if frame_index == SEGMENT_COMPLETED:
+                merger.complete_segment(segment_id=segment_id)
+            else:
+                merger.add_result(
+                    segment_id=segment_id, frame_index=frame_index, result=payload
+                )
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+    return segments
+
+
+def ensure_workers_alive(
+    workers: List[Process],
+    segments: List[VideoSegment],
+    merger: "SegmentsResultsMerger",
+) -> None:
+    for worker, segment in zip(workers, segments):
+        if merger.is_segment_completed(segment_id=segment.segment_id):
+            continue
+        if worker.exitcode is not None and worker.exitcode != 0:
+            raise RuntimeError(
+                f"Worker processing video segment {segment.segment_id} died "
+                f"(exit code: {worker.exitcode})"
+            )
+
+
+def process_video_segment(
+    video_path: str,
+    segment: VideoSegment,
+    read_until_end: bool,
+    workflow_configuration: Dict[str, Any],
+    excluded_fields: Optional[List[str]],
+    results_queue: Queue,
+    results_credits: Semaphore,
+) -> None:
+    from inference.core.interfaces.http.orjson_utils import (
+        serialise_single_workflow_result_element,
+    )
+    from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
+
+    def on_prediction(result: dict, video_frame: VideoFrame) -> None:
+        frame_index = segment.processing_start + video_frame.frame_id - 1
+        serialised_result = serialise_single_workflow_result_element(
+            result_element=result,
+            excluded_fields=excluded_fields,
+        )
+        put_segment_result(
+            results_queue=results_queue,
+            results_credits=results_credits,
+            segment_id=segment.segment_id,
+            frame_index=frame_index,
+            result=serialised_result,
+        )
+
+    try:
+        pipeline = InferencePipeline.init_with_workflow(
+            video_reference=partial(
+                VideoSegmentFrameProducer,
+                video=video_path,
+                start_frame=segment.processing_start,
+                end_frame=None if read_until_end else segment.end_frame,
+            ),
+            on_prediction=on_prediction,
+            **workflow_configuration,
+        )
+        pipeline.start(use_main_thread=True)
+        pipeline.join()
+        results_queue.put((segment.segment_id, SEGMENT_COMPLETED, None))
+    except Exception as error:
+        results_queue.put((segment.segment_id, SEGMENT_FAILED, repr(error)))
+
+
+def put_segment_result(
+    results_queue: Queue,
+    results_credits: Semaphore,
+    segment_id: int,
+    frame_index: int,
+    result: dict,
+) -> None:
+    # blocks once buffer of the segment in main process is full - pausing the pipeline
+    results_credits.acquire()
+    results_queue.put((segment_id, frame_index, result))
+
+
+def get_total_frames(video_path: str) -> int:
+    video = cv2.VideoCapture(video_path)
+    try:
+        if not video.isOpened():
+            raise ValueError(f"Could not open video file: {video_path}")
+        total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        video.release()
+    if total_frames <= 0:
+        raise ValueError(
+            f"Could not determine number of frames of video file: {video_path}"
+        )
+    return total_frames
+
+
+def find_keyframes(video_path: str) -> List[int]:
+    """
+    Returns indices of keyframes - found by demuxing packets, without decoding. Segments
+    starting at keyframes can be decoded independently, and seeking to them is cheap.
+    Empty list is returned when `av` package is not available.
+    """
+    try:
+        import av
+    except ImportError:
+        return []
+    keyframes = []
+    with av.open(video_path) as container:
+        if not container.streams.video:
+            return []
+        frame_index = 0
+        for packet in container.demux(container.streams.video[0]):
+            if packet.size == 0:
+                continue
+            if packet.is_keyframe:
+                keyframes.append(frame_index)
+            frame_index += 1
+    return keyframes
+
+
+def plan_video_segments(
+    total_frames: int,
+    keyframes: List[int],
+    segments_number: int,
+    overlap_frames: int,
+) -> List[VideoSegment]:
+    segments_number = max(min(segments_number, total_frames), 1)
+    boundaries = []
+    for segment_id in range(1, segments_number):
+        boundary = round(segment_id * total_frames / segments_number)
+        if keyframes:
+            # snapping to the closest keyframe - segments may become uneven or merge
+            boundary = min(keyframes, key=lambda k: abs(k - boundary))
+        if 0 < boundary < total_frames and boundary not in boundaries:
+            boundaries.append(boundary)
+    boundaries = [0] + sorted(boundaries) + [total_frames]
+    return [
+        VideoSegment(
+            segment_id=segment_id,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            processing_start=max(start_frame - overlap_frames, 0),
+        )
+        for segment_id, (start_frame, end_frame) in enumerate(
+            zip(boundaries[:-1], boundaries[1:])
+        )
+    ]
+
+
+class SegmentsResultsMerger:
+    """
+    Accepts results of segments processed in parallel (each segment in the order of
+    frames) and emits them in global frames order, stitching tracks at segment boundaries.
+    `on_result_released(segment_id)` is called each time result leaves the buffer.
+    """
+
+    def __init__(
+        self,
+        segments: List[VideoSegment],
+        on_prediction: Callable[[dict, int], None],
+        on_result_released: Optional[Callable[[int], None]] = None,
+    ):
+        self._segments = segments
+        self._on_prediction = on_prediction
+        self._on_result_released = on_result_released
+        self._buffers: Dict[int, Deque[Tuple[int, dict]]] = {
+            segment.segment_id: deque() for segment in segments
+        }
+        self._completed_segments: Set[int] = set()
+        self._current_segment = 0
+        self._current_segment_stitched = False
+        self._tracks_stitcher = TracksStitcher(
+            overlap_frames=max(
+                [s.start_frame - s.processing_start for s in segments] + [0]
+            )
+        )
+
+    def is_completed(self) -> bool:
+        return self._current_segment >= len(self._segments)
+
+    def is_segment_completed(self, segment_id: int) -> bool:
+        return segment_id in self._completed_segments
+
+    def add_result(self, segment_id: int, frame_index: int, result: dict) -> None:
+        self._buffers[segment_id].append((frame_index, result))
+        self._emit_results()
+
+    def complete_segment(self, segment_id: int) -> None:
+        self._completed_segments.add(segment_id)
+        self._emit_results()
+
+    def _emit_results(self) -> None:
+        while not self.is_completed():
+            segment = self._segments[self._current_segment]
+            buffer = self._buffers[segment.segment_id]
+            completed = segment.segment_id in self._completed_segments
+            if not self._current_segment_stitched:
+                overlap = [r for r in buffer if r[0] < segment.start_frame]
+                expected_overlap = segment.start_frame - segment.processing_start
+                if len(overlap) < expected_overlap and not completed:
+                    return None
+                for _ in overlap:
+                    buffer.popleft()
+                    self._release_result(segment_id=segment.segment_id)
+                self._tracks_stitcher.start_segment(
+                    overlap_results=overlap,
+                    continues_previous=segment.segment_id > 0,
+                )
+                self._current_segment_stitched = True
+            while buffer:
+                frame_index, result = buffer.popleft()
+                self._release_result(segment_id=segment.segment_id)
+                result = self._tracks_stitcher.remap_tracks(
+                    frame_index=frame_index, result=result
+                )
+                self._on_prediction(result, frame_index)
+            if not completed:
+                return None
+            self._current_segment += 1
+            self._current_segment_stitched = False
+
+    def _release_result(self, segment_id: int) -> None:
+        if self._on_result_released is not None:
+            self._on_result_released(segment_id)
+
+
+class TracksStitcher:
+    """
+    Assigns global tracker ids to tracks of consecutive segments. Tracks of new segment
+    are matched (by IoU of boxes of the same class) with tracks emitted for the same
+    frames by the previous segment - majority vote across overlapping frames decides.
+    Tracks which could not be matched get new ids, not used before.
+    """
+
+    def __init__(self, overlap_frames: int):
+        self._recent_results: Deque[Tuple[int, dict]] = deque(
+            maxlen=max(overlap_frames, 1)
+        )
+        self._mappings: Dict[str, Dict[int, int]] = {}
+        self._keep_ids = True
+        self._max_tracker_id = 0
+
+    def start_segment(
+        self,
+        overlap_results: List[Tuple[int, dict]],
+        continues_previous: bool,
+    ) -> None:
+        self._keep_ids = not continues_previous
+        previous_results = dict(self._recent_results)
+        votes: Dict[str, Counter] = {}
+        for frame_index, result in overlap_results:
+            previous_result = previous_results.get(frame_index)
+            if previous_result is None:
+                continue
+            for field, predictions in find_tracked_predictions(result=result):
+                previous_predictions = previous_result.get(field, {}).get(
+                    "predictions", []
+                )
+                matches = match_tracked_predictions(
+                    predictions=predictions,
+                    reference_predictions=previous_predictions,
+                )
+                votes.setdefault(field, Counter()).update(matches)
+        self._mappings = {}
+        for field, field_votes in votes.items():
+            mapping = {}
+            for (tracker_id, global_tracker_id), _ in field_votes.most_common():
+                if tracker_id in mapping or global_tracker_id in mapping.values():
+                    continue
+                mapping[tracker_id] = global_tracker_id
+            self._mappings[field] = mapping
+
+    def remap_tracks(self, frame_index: int, result: dict) -> dict:
+        for field, predictions in find_tracked_predictions(result=result):
+            mapping = self._mappings.setdefault(field, {})
+            for prediction in predictions:
+                tracker_id = prediction[TRACKER_ID_KEY]
+                if tracker_id not in mapping:
+                    if self._keep_ids:
+                        mapping[tracker_id] = tracker_id
+                    else:
+                        mapping[tracker_id] = self._max_tracker_id + 1
+                global_tracker_id = mapping[tracker_id]
+                self._max_tracker_id = max(self._max_tracker_id, global_tracker_id)
+                prediction[TRACKER_ID_KEY] = global_tracker_id
+        self._recent_results.append((frame_index, result))
+        return result
+
+
+def find_tracked_predictions(result: dict) -> List[Tuple[str, List[dict]]]:
+    tracked_predictions = []
+    for field, value in result.items():
+        if not isinstance(value, dict):
+            continue
+        predictions = value.get("predictions")
+        if not isinstance(predictions, list):
+            continue
+        predictions = [
+            p
+            for p in predictions
+            if isinstance(p, dict) and p.get(TRACKER_ID_KEY) is not None
+        ]
+        if predictions:
+            tracked_predictions.append((field, predictions))
+    return tracked_predictions
+
+
+def match_tracked_predictions(
+    predictions: List[dict],
+    reference_predictions: List[dict],
+    iou_threshold: float = TRACKS_MATCHING_IOU_THRESHOLD,
+) -> List[Tuple[int, int]]:
+    reference_predictions = [
+        p for p in reference_predictions if p.get(TRACKER_ID_KEY) is not None
+    ]
+    if not predictions or not reference_predictions:
+        return []
+    ious = boxes_iou(
+        boxes=predictions_to_xyxy(predictions=predictions),
+        reference_boxes=predictions_to_xyxy(predictions=reference_predictions),
+    )
+    classes = [p.get("class") for p in predictions]
+    reference_classes = [p.get("class") for p in reference_predictions]
+    ious[np.array(classes)[:, None] != np.array(reference_classes)[None, :]] = 0.0
+    matches = []
+    # greedy matching - the best overlapping pairs first
+    for flat_index in np.argsort(-ious, axis=None):
+        row, column = np.unravel_index(flat_index, ious.shape)
+        if ious[row, column] < iou_threshold:
+            break
+        if np.isnan(ious[row, column]):
+            continue
+        matches.append(
+            (
+                predictions[row][TRACKER_ID_KEY],
+                reference_predictions[column][TRACKER_ID_KEY],
+            )
+        )
+        ious[row, :] = np.nan
+        ious[:, column] = np.nan
+    return matches
+
+
+def predictions_to_xyxy(predictions: List[dict]) -> np.ndarray:
+    boxes = np.array(
+        [[p["x"], p["y"], p["width"], p["height"]] for p in predictions],
+        dtype=np.float64,
+    )
+    return np.concatenate(
+        [boxes[:, :2] - boxes[:, 2:] / 2, boxes[:, :2] + boxes[:, 2:] / 2], axis=1
+    )
+
+
+def boxes_iou(boxes: np.ndarray, reference_boxes: np.ndarray) -> np.ndarray:
+    top_left = np.maximum(boxes[:, None, :2], reference_boxes[None, :, :2])
+    bottom_right = np.minimum(boxes[:, None, 2:], reference_boxes[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    areas = np.prod(boxes[:, 2:] - boxes[:, :2], axis=1)
+    reference_areas = np.prod(reference_boxes[:, 2:] - reference_boxes[:, :2], axis=1)
+    union = areas[:, None] + reference_areas[None, :] - intersection
+    return np.divide(
+        intersection, union, out=np.zeros_like(intersection), where=union > 0
+    )
@@ -1,8 +1,11 @@
 import json
 import socket
+import time
 from collections import deque
 from datetime import datetime
 from functools import partial
+from queue import Full, Queue
+from threading import Condition, Lock, Thread
 from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 import cv2
@@ -12,8 +15,20 @@ from supervision.annotators.base import BaseAnnotator
 
 from inference.core import logger
 from inference.core.active_learning.middlewares import ActiveLearningMiddleware
-from inference.core.interfaces.camera.entities import VideoFrame
-from inference.core.interfaces.stream.entities import SinkHandler
+from inference.core.interfaces.camera.entities import (
+    StatusUpdate,
+    UpdateSeverity,
+    VideoFrame,
+)
+from inference.core.interfaces.stream.entities import SinkHandler, SinkOverflowPolicy
+from inference.core.interfaces.stream.udp_binary_protocol import (
+    DATAGRAM_HEADER,
+    DEFAULT_MAX_DATAGRAM_SIZE,
+    MESSAGE_HEADER,
+    FrameMetadata,
+    build_datagrams,
+    encode_frame,
+)
 from inference.core.interfaces.stream.utils import wrap_in_list
 from inference.core.utils.drawing import create_tiles
 from inference.core.utils.preprocess import letterbox_image
@@ -24,6 +39,9 @@ DEFAULT_FPS_MONITOR = sv.FPSMonitor()
 
 ImageWithSourceID = Tuple[Optional[int], np.ndarray]
 
+VIDEO_FILE_SINK_CONTEXT = "video_file_sink"
+VIDEO_FILE_SINK_STATISTICS_EVENT = "VIDEO_FILE_SINK_STATISTICS"
+
 
 def display_image(image: Union[ImageWithSourceID, List[ImageWithSourceID]]) -> None:
     if issubclass(type(image), list):
@@ -318,6 +336,174 @@ class UDPSink:
             )
 
 
+class BinaryUDPSink:
+    @classmethod
+    def init(
+        cls,
+        ip_address: str,
+        port: int,
+        max_datagram_size: int = DEFAULT_MAX_DATAGRAM_SIZE,
+        max_coalesced_frames: int = 1,
+        max_coalescing_delay: float = 0.05,
+    ) -> "BinaryUDPSink":
+        """
+        Creates `InferencePipeline` predictions sink sending model predictions over network using
+        UDP socket - in compact binary format (see `inference.core.interfaces.stream.udp_binary_protocol`),
+        to be decoded by receiver with `BinaryPredictionsDecoder`. Messages larger than single datagram are
+        split into sequence-numbered fragments and reassembled by the decoder.
+
+        As an `inference` user, please use .init() method instead of constructor to instantiate objects.
+        Args:
+            ip_address (str): IP address to send predictions
+            port (int): Port to send predictions
+            max_datagram_size (int): Max size of single datagram - default is safe for Ethernet MTU, increase
+                when sending over loopback interface, to reduce number of fragments.
+            max_coalesced_frames (int): Max number of frames predictions sent in single message - frames
+                are held back until the limit is reached, message would exceed single datagram or predictions
+                are held longer than `max_coalescing_delay` (checked when predictions are sent).
+            max_coalescing_delay (float): Max number of seconds predictions may be held back, when coalescing
+                is enabled. Use `flush()` to send predictions held back when the pipeline ends.
+
+        Returns: Initialised object of `BinaryUDPSink` class.
+        """
+        udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        return cls(
+            ip_address=ip_address,
+            port=port,
+            udp_socket=udp_socket,
+            max_datagram_size=max_datagram_size,
+            max_coalesced_frames=max_coalesced_frames,
+            max_coalescing_delay=max_coalescing_delay,
+        )
+
+    def __init__(
+        self,
+        ip_address: str,
+        port: int,
+        udp_socket: socket.socket,
+        max_datagram_size: int = DEFAULT_MAX_DATAGRAM_SIZE,
+        max_coalesced_frames: int = 1,
+        max_coalescing_delay: float = 0.05,
+    ):
+        self._ip_address = ip_address
+        self._port = port
+        self._socket = udp_socket
+        self._max_datagram_size = max_datagram_size
+        self._max_message_payload = (
+            max_datagram_size - DATAGRAM_HEADER.size - MESSAGE_HEADER.size
+        )
+        self._max_coalesced_frames = max(max_coalesced_frames, 1)
+        self._max_coalescing_delay = max_coalescing_delay
+        self._pending_frames: List[bytes] = []
+        self._pending_size = 0
+        self._pending_since: Optional[float] = None
+        self._sequence_number = 0
+        self._lock = Lock()
+
+    def send_predictions(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        """
+        Method to send predictions via UDP socket in binary format. Useful in combination with
+        `InferencePipeline` as a sink for predictions. Unlike `UDPSink.send_predictions(...)` - it
+        does not mutate `predictions`, frame metadata are sent in binary frame header and added by
+        the decoder as "inference_metadata" key.
+
+        Args:
+            predictions (Union[dict, List[Optional[dict]]]): Roboflow predictions, the function support single
+                prediction processing and batch processing. Order is expected to match with `video_frame`.
+            video_frame (Union[VideoFrame, List[Optional[VideoFrame]]]): frame of video with its basic metadata
+                emitted by `VideoSource` or list of frames. Order is expected to match with `predictions`
+
+        Returns: None
+        Side effects: Sends encoded `predictions` and `video_frame` metadata via the UDP socket.
+
+        Example:
+            ```python
+            from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
+            from inference.core.interfaces.stream.sinks import BinaryUDPSink
+
+            udp_sink = BinaryUDPSink.init(ip_address="127.0.0.1", port=9090, max_coalesced_frames=4)
+
+            pipeline = InferencePipeline.init(
+                 model_id="your-model/3",
+                 video_reference="./some_file.mp4",
+                 on_prediction=udp_sink.send_predictions,
+                 on_pipeline_end=udp_sink.flush,
+            )
+            pipeline.start()
+            pipeline.join()
+            ```
+        """
+        video_frame = wrap_in_list(element=video_frame)
+        predictions = wrap_in_list(element=predictions)
+        with self._lock:
+            for single_frame, frame_predictions in zip(video_frame, predictions):
+                if single_frame is None:
+                    continue
+                metadata = FrameMetadata(
+                    source_id=single_frame.source_id,
+                    frame_id=single_frame.frame_id,
+                    frame_decoding_time=single_frame.frame_timestamp,
+                    emission_time=datetime.now(),
+                )
+                self._add_frame(
+                    encoded_frame=encode_frame(
+                        metadata=metadata, predictions=frame_predictions
+                    )
+                )
+            if (
+                self._pending_since is not None
+                and time.monotonic() - self._pending_since >= self._max_coalescing_delay
+            ):
+                self._send_pending_frames()
+
+    def flush(self) -> None:
+        """
+        Sends predictions held back due to coalescing.
+        """
+        with self._lock:
+            self._send_pending_frames()
+
+    def _add_frame(self, encoded_frame: bytes) -> None:
+        if (
+            self._pending_frames
+            and self._pending_size + len(encoded_frame) > self._max_message_payload
+        ):
+            # not letting small frames to be fragmented together with large one
+            self._send_pending_frames()
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._pending_frames.append(encoded_frame)
+        self._pending_size += len(encoded_frame)
+        if (
+            len(self._pending_frames) >= self._max_coalesced_frames
+            or self._pending_size >= self._max_message_payload
+        ):
+            self._send_pending_frames()
+
+    def _send_pending_frames(self) -> None:
+        if not self._pending_frames:
+            return None
+        datagrams = build_datagrams(
+            sequence_number=self._sequence_number,
+            encoded_frames=self._pending_frames,
+            max_datagram_size=self._max_datagram_size,
+        )
+        self._sequence_number = (self._sequence_number + 1) % 2**32
+        self._pending_frames = []
+        self._pending_size = 0
+        self._pending_since = None
+        for datagram in datagrams:
+            self._socket.sendto(datagram, (self._ip_address, self._port))
+
+
 def multi_sink(
     predictions: Union[dict, List[Optional[dict]]],
     video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
@@ -415,6 +601,11 @@ class VideoFileSink:
         output_fps: int = 25,
         quiet: bool = False,
         video_frame_size: Tuple[int, int] = (1280, 720),
+        background_encoding: bool = False,
+        encoding_queue_size: int = 32,
+        overflow_policy: SinkOverflowPolicy = SinkOverflowPolicy.DROP,
+        status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]] = None,
+        statistics_report_interval: float = 5.0,
     ) -> "VideoFileSink":
         """
         Creates `InferencePipeline` predictions sink capable of saving model predictions into video file.
@@ -435,6 +626,16 @@ class VideoFileSink:
             output_fps (int): desired FPS of output file
             quiet (bool): Flag to decide whether to log progress
             video_frame_size (Tuple[int, int]): The size of frame in target video file.
+            background_encoding (bool): Flag to decide if predictions should be rendered and encoded in background
+                thread - then `on_prediction(...)` only puts predictions into the queue, not to stall pipeline when
+                encoding falls behind. Remember to call `release()` to flush the queue.
+            encoding_queue_size (int): Max number of predictions waiting for background encoding.
+            overflow_policy (SinkOverflowPolicy): Decides what happens with predictions when encoding queue is
+                full - `DROP` discards them (counting dropped frames), `BLOCK` makes `on_prediction(...)` wait.
+            status_update_handlers (Optional[List[Callable[[StatusUpdate], None]]]): Handlers receiving
+                `VIDEO_FILE_SINK_STATISTICS` events with encoded / dropped frames and encoding latency - pass
+                `watchdog.on_status_update` to see them in pipeline status.
+            statistics_report_interval (float): Interval (in seconds) of statistics reporting in background mode.
 
         Attributes:
             on_prediction (Callable[[dict, VideoFrame], None]): callable to be used as a sink for predictions
@@ -470,6 +671,11 @@ class VideoFileSink:
             output_fps=output_fps,
             quiet=quiet,
             video_frame_size=video_frame_size,
+            background_encoding=background_encoding,
+            encoding_queue_size=encoding_queue_size,
+            overflow_policy=overflow_policy,
+            status_update_handlers=status_update_handlers,
+            statistics_report_interval=statistics_report_interval,
         )
 
     def __init__(
@@ -482,6 +688,11 @@ class VideoFileSink:
         output_fps: int,
         quiet: bool,
         video_frame_size: Tuple[int, int],
+        background_encoding: bool = False,
+        encoding_queue_size: int = 32,
+        overflow_policy: SinkOverflowPolicy = SinkOverflowPolicy.DROP,
+        status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]] = None,
+        statistics_report_interval: float = 5.0,
     ):
         self._video_file_name = video_file_name
         self._annotator = annotator
@@ -493,7 +704,7 @@ class VideoFileSink:
         self._frame_idx = 0
         self._video_frame_size = video_frame_size
         self._video_writer: Optional[cv2.VideoWriter] = None
-        self.on_prediction = partial(
+        self._render_predictions = partial(
             render_boxes,
             annotator=self._annotator,
             display_size=self._display_size,
@@ -501,14 +712,119 @@ class VideoFileSink:
             display_statistics=self._display_statistics,
             on_frame_rendered=self._save_predictions,
         )
+        self.on_prediction = self._render_predictions
+        self._overflow_policy = overflow_policy
+        self._status_update_handlers = status_update_handlers or []
+        self._statistics_report_interval = statistics_report_interval
+        self._encoding_queue: Optional[Queue] = None
+        self._encoding_thread: Optional[Thread] = None
+        self._statistics_lock = Lock()
+        self._dropped_frames = 0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        self._latency_samples = 0
+        self._last_report_time = time.monotonic()
+        if background_encoding:
+            self._encoding_queue = Queue(maxsize=encoding_queue_size)
+            self.on_prediction = self._enqueue_predictions
 
     def release(self) -> None:
         """
-        Releases VideoWriter object.
+        Releases VideoWriter object. In background mode - waits for queued predictions
+        to be encoded first.
         """
+        if self._encoding_thread is not None:
+            self._encoding_queue.put(None)
+            self._encoding_thread.join()
+            self._encoding_thread = None
+            self._report_statistics()
         if self._video_writer is not None and self._video_writer.isOpened():
             self._video_writer.release()
 
+    def get_statistics(self) -> dict:
+        """
+        Returns total number of frames encoded and dropped, together with encoding latency
+        (in seconds, from handing predictions to the sink until frame is written) observed
+        since the last report.
+        """
+        with self._statistics_lock:
+            mean_latency = None
+            if self._latency_samples > 0:
+                mean_latency = self._latency_sum / self._latency_samples
+            return {
+                "encoded_frames": self._frame_idx,
+                "dropped_frames": self._dropped_frames,
+                "queue_size": (
+                    self._encoding_queue.qsize()
+                    if self._encoding_queue is not None
+                    else 0
+                ),
+                "encoding_latency": {
+                    "mean": mean_latency,
+                    "max": self._latency_max if self._latency_samples > 0 else None,
+                },
+            }
+
+    def _enqueue_predictions(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        if self._encoding_thread is None:
+            self._encoding_thread = Thread(
+                target=self._encode_in_background, daemon=True
+            )
+            self._encoding_thread.start()
+        item = (predictions, video_frame, time.monotonic())
+        if self._overflow_policy is SinkOverflowPolicy.BLOCK:
+            self._encoding_queue.put(item)
+            return None
+        try:
+            self._encoding_queue.put_nowait(item)
+        except Full:
+            with self._statistics_lock:
+                self._dropped_frames += 1
+
+    def _encode_in_background(self) -> None:
+        while True:
+            item = self._encoding_queue.get()
+            if item is None:
+                return None
+            predictions, video_frame, enqueued_at = item
+            try:
+                self._render_predictions(predictions, video_frame)
+            except Exception as error:
+                logger.warning(f"Could not encode frame into video file. {error}")
+                continue
+            latency = time.monotonic() - enqueued_at
+            with self._statistics_lock:
+                self._latency_sum += latency
+                self._latency_samples += 1
+                self._latency_max = max(self._latency_max, latency)
+            if (
+                time.monotonic() - self._last_report_time
+                >= self._statistics_report_interval
+            ):
+                self._report_statistics()
+
+    def _report_statistics(self) -> None:
+        statistics = self.get_statistics()
+        with self._statistics_lock:
+            self._latency_sum, self._latency_max, self._latency_samples = 0.0, 0.0, 0
+            self._last_report_time = time.monotonic()
+        status_update = StatusUpdate(
+            timestamp=datetime.now(),
+            severity=UpdateSeverity.INFO,
+            event_type=VIDEO_FILE_SINK_STATISTICS_EVENT,
+            payload=statistics,
+            context=VIDEO_FILE_SINK_CONTEXT,
+        )
+        for handler in self._status_update_handlers:
+            try:
+                handler(status_update)
+            except Exception as error:
+                logger.warning(f"Could not execute handler update. Cause: {error}")
+
     def _save_predictions(
         self,
         frame: Union[ImageWithSourceID, List[ImageWithSourceID]],
@@ -549,6 +865,7 @@ class InMemoryBufferSink:
 
     def __init__(self, queue_size: int):
         self._buffer = deque(maxlen=queue_size)
+        self._prediction_available = Condition()
 
     def on_prediction(
         self,
@@ -559,11 +876,23 @@ class InMemoryBufferSink:
             predictions = [predictions]
         if not isinstance(video_frame, list):
             video_frame = [video_frame]
-        self._buffer.append((predictions, video_frame))
+        with self._prediction_available:
+            self._buffer.append((predictions, video_frame))
+            self._prediction_available.notify_all()
 
     def empty(self) -> bool:
         return len(self._buffer) == 0
 
+    def wait_for_prediction(self, timeout: float) -> bool:
+        """
+        Blocks until buffer is not empty or `timeout` (in seconds) elapses.
+        Returns `True` if prediction is ready to be consumed.
+        """
+        with self._prediction_available:
+            return self._prediction_available.wait_for(
+                lambda: not self.empty(), timeout=timeout
+            )
+
     def consume_prediction(
         self,
     ) -> Tuple[List[Optional[dict]], List[Optional[VideoFrame]]]:
@@ -0,0 +1,481 @@
+"""
+Binary format of predictions sent by `BinaryUDPSink`.
+
+Each datagram starts with header: magic bytes, protocol version, message sequence
+number, fragment index and number of fragments of the message. Message (possibly
+split into fragments, when it does not fit in single datagram) carries one or more
+frames records - each with frame metadata and encoded predictions.
+
+Predictions are encoded with tagged values - and lists of dicts (like detections,
+polygon points or keypoints) are encoded column by column, as packed arrays (numbers
+as float32 / int32, repeating strings as indices of strings table, detection ids
+as 16-byte UUIDs). Floating point values inside such lists lose precision beyond
+float32.
+"""
+
+import json
+import struct
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+PROTOCOL_MAGIC = b"RFPB"
+PROTOCOL_VERSION = 1
+DATAGRAM_HEADER = struct.Struct("<4sBIHH")
+MESSAGE_HEADER = struct.Struct("<H")
+FRAME_HEADER = struct.Struct("<IBqqdd")
+DEFAULT_MAX_DATAGRAM_SIZE = 1472
+MAX_FRAGMENTS = 65535
+
+INFERENCE_METADATA_KEY = "inference_metadata"
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_LIST = 6
+TAG_DICT = 7
+TAG_TABLE = 8
+TAG_JSON = 9
+TAG_MISSING = 10
+
+COLUMN_FLOAT32 = 0
+COLUMN_INT32 = 1
+COLUMN_BOOL = 2
+COLUMN_STR = 3
+COLUMN_UUID = 4
+COLUMN_TABLES = 5
+COLUMN_VALUES = 6
+
+INT32_RANGE = (-(2**31), 2**31 - 1)
+INT64_RANGE = (-(2**63), 2**63 - 1)
+
+U8 = struct.Struct("<B")
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+I64 = struct.Struct("<q")
+F64 = struct.Struct("<d")
+
+
+class MalformedDatagramError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class FrameMetadata:
+    source_id: Optional[int]
+    frame_id: int
+    frame_decoding_time: datetime
+    emission_time: datetime
+
+
+def encode_frame(metadata: FrameMetadata, predictions: Any) -> bytes:
+    encoded_predictions = encode_value(value=predictions)
+    header = FRAME_HEADER.pack(
+        len(encoded_predictions),
+        metadata.source_id is not None,
+        metadata.source_id if metadata.source_id is not None else 0,
+        metadata.frame_id,
+        metadata.frame_decoding_time.timestamp(),
+        metadata.emission_time.timestamp(),
+    )
+    return header + encoded_predictions
+
+
+def build_datagrams(
+    sequence_number: int,
+    encoded_frames: List[bytes],
+    max_datagram_size: int = DEFAULT_MAX_DATAGRAM_SIZE,
+) -> List[bytes]:
+    message = MESSAGE_HEADER.pack(len(encoded_frames)) + b"".join(encoded_frames)
+    max_payload_size = max_datagram_size - DATAGRAM_HEADER.size
+    if max_payload_size <= 0:
+        raise ValueError(
+            f"Datagram size must be larger than header size ({DATAGRAM_HEADER.size} bytes)"
+        )
+    chunks = [
+        message[start : start + max_payload_size]
+        for start in range(0, len(message), max_payload_size)
+    ]
+    if len(chunks) > MAX_FRAGMENTS:
+        raise ValueError(
+            f"Message of size {len(message)} bytes cannot be split into at most "
+            f"{MAX_FRAGMENTS} fragments of size {max_datagram_size}"
+        )
+    sequence_number = sequence_number % 2**32
+    return [
+        DATAGRAM_HEADER.pack(
+            PROTOCOL_MAGIC, PROTOCOL_VERSION, sequence_number, index, len(chunks)
+        )
+        + chunk
+        for index, chunk in enumerate(chunks)
+    ]
+
+
+class BinaryPredictionsDecoder:
+    """
+    Reassembles messages from datagrams sent by `BinaryUDPSink` (fragments may arrive in
+    any order) and decodes them into predictions dicts, with `inference_metadata` key
+    added - the same as in payloads sent by `UDPSink`. Messages which are not completed
+    before `max_pending_messages` newer messages are started are dropped.
+
+    Example:
+        ```python
+        import socket
+
+        from inference.core.interfaces.stream.udp_binary_protocol import (
+            BinaryPredictionsDecoder,
+        )
+
+        udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        udp_socket.bind(("127.0.0.1", 9090))
+        decoder = BinaryPredictionsDecoder()
+        while True:
+            datagram, _ = udp_socket.recvfrom(65535)
+            for predictions in decoder.decode_datagram(datagram=datagram):
+                print(predictions["inference_metadata"]["frame_id"], predictions)
+        ```
+    """
+
+    def __init__(self, max_pending_messages: int = 64):
+        self._max_pending_messages = max_pending_messages
+        self._pending_messages: OrderedDict[int, Dict[int, bytes]] = OrderedDict()
+        self._last_sequence_number: Optional[int] = None
+        self._dropped_messages = 0
+        self._lost_messages = 0
+
+    @property
+    def dropped_messages(self) -> int:
+        """Number of messages dropped due to missing fragments"""
+        return self._dropped_messages
+
+    @property
+    def lost_messages(self) -> int:
+        """Number of messages not seen at all - detected from gaps in sequence numbers"""
+        return self._lost_messages
+
+    def decode_datagram(self, datagram: bytes) -> List[dict]:
+        if len(datagram) < DATAGRAM_HEADER.size:
+            raise MalformedDatagramError("Datagram shorter than protocol header")
+        magic, version, sequence_number, index, fragments = DATAGRAM_HEADER.unpack_from(
+            datagram
+        )
+        if magic != PROTOCOL_MAGIC or version != PROTOCOL_VERSION:
+            raise MalformedDatagramError("Datagram of unknown protocol or version")
+        if fragments == 0 or index >= fragments:
+            raise MalformedDatagramError(
+                f"Invalid fragment index {index} of {fragments} fragments"
+            )
+        payload = datagram[DATAGRAM_HEADER.size :]
+        if sequence_number not in self._pending_messages:
+            self._register_sequence_number(sequence_number=sequence_number)
+        if fragments == 1:
+            self._pending_messages.pop(sequence_number, None)
+            return decode_message(message=payload)
+        message_fragments = self._pending_messages.setdefault(sequence_number, {})
+        message_fragments[index] = payload
+        if len(message_fragments) < fragments:
+            self._evict_pending_messages()
+            return []
+        del self._pending_messages[sequence_number]
+        return decode_message(
+            message=b"".join(message_fragments[i] for i in range(fragments))
+        )
+
+    def _register_sequence_number(self, sequence_number: int) -> None:
+        if self._last_sequence_number is not None:
+            gap = (sequence_number - self._last_sequence_number) % 2**32
+            if 1 < gap < 2**31:
+                self._lost_messages += gap - 1
+            if gap >= 2**31:
+                # late (reordered) message - already counted as lost
+                self._lost_messages = max(self._lost_messages - 1, 0)
+                return None
+        self._last_sequence_number = sequence_number
+
+    def _evict_pending_messages(self) -> None:
+        while len(self._pending_messages) > self._max_pending_messages:
+            self._pending_messages.popitem(last=False)
+            self._dropped_messages += 1
+
+
+def decode_message(message: bytes) -> List[dict]:
+    reader = _Reader(buffer=message)
+    frames_number = reader.read_struct(MESSAGE_HEADER)[0]
+    results = []
+    for _ in range(frames_number):
+        (
+            predictions_size,
+            has_source_id,
+            source_id,
+            frame_id,
+            frame_decoding_time,
+            emission_time,
+        ) = reader.read_struct(FRAME_HEADER)
+        predictions_reader = _Reader(buffer=reader.read_bytes(predictions_size))
+        predictions = decode_value(reader=predictions_reader)
+        if not isinstance(predictions, dict):
+            predictions = {"predictions": predictions}
+        predictions[INFERENCE_METADATA_KEY] = {
+            "source_id": source_id if has_source_id else None,
+            "frame_id": frame_id,
+            "frame_decoding_time": datetime.fromtimestamp(
+                frame_decoding_time
+            ).isoformat(),
+            "emission_time": datetime.fromtimestamp(emission_time).isoformat(),
+        }
+        results.append(predictions)
+    return results
+
+
+def encode_value(value: Any) -> bytes:
+    chunks = []
+    _encode_value(value=value, chunks=chunks)
+    return b"".join(chunks)
+
+
+def decode_value(reader: "_Reader") -> Any:
+    tag = reader.read_struct(U8)[0]
+    if tag == TAG_NONE:
+        return None
+    if tag == TAG_FALSE:
+        return False
+    if tag == TAG_TRUE:
+        return True
+    if tag == TAG_INT:
+        return reader.read_struct(I64)[0]
+    if tag == TAG_FLOAT:
+        return reader.read_struct(F64)[0]
+    if tag == TAG_STR:
+        return reader.read_string()
+    if tag == TAG_LIST:
+        length = reader.read_struct(U32)[0]
+        return [decode_value(reader=reader) for _ in range(length)]
+    if tag == TAG_DICT:
+        length = reader.read_struct(U32)[0]
+        result = {}
+        for _ in range(length):
+            key = reader.read_string()
+            result[key] = decode_value(reader=reader)
+        return result
+    if tag == TAG_TABLE:
+        return _decode_table(reader=reader)
+    if tag == TAG_JSON:
+        return json.loads(reader.read_string())
+    raise MalformedDatagramError(f"Unknown value tag: {tag}")
+
+
+def _encode_value(value: Any, chunks: List[bytes]) -> None:
+    if value is None:
+        chunks.append(U8.pack(TAG_NONE))
+    elif isinstance(value, bool):
+        chunks.append(U8.pack(TAG_TRUE if value else TAG_FALSE))
+    elif isinstance(value, int) and INT64_RANGE[0] <= value <= INT64_RANGE[1]:
+        chunks.append(U8.pack(TAG_INT) + I64.pack(value))
+    elif isinstance(value, float):
+        chunks.append(U8.pack(TAG_FLOAT) + F64.pack(value))
+    elif isinstance(value, str):
+        chunks.append(U8.pack(TAG_STR) + _pack_string(value))
+    elif isinstance(value, dict):
+        chunks.append(U8.pack(TAG_DICT) + U32.pack(len(value)))
+        for key, element in value.items():
+            # keys converted to strings, as in JSON
+            chunks.append(_pack_string(str(key)))
+            _encode_value(value=element, chunks=chunks)
+    elif _is_table(value=value):
+        chunks.append(U8.pack(TAG_TABLE))
+        _encode_table(rows=value, chunks=chunks)
+    elif isinstance(value, (list, tuple)):
+        chunks.append(U8.pack(TAG_LIST) + U32.pack(len(value)))
+        for element in value:
+            _encode_value(value=element, chunks=chunks)
+    else:
+        chunks.append(U8.pack(TAG_JSON) + _pack_string(json.dumps(value)))
+
+
+def _is_table(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and {type(row) for row in value} == {dict}
+    )
+
+
+def _encode_table(rows: List[dict], chunks: List[bytes]) -> None:
+    columns = list(dict.fromkeys(chain.from_iterable(rows)))
+    chunks.append(U32.pack(len(rows)) + U16.pack(len(columns)))
+    for column in columns:
+        chunks.append(_pack_string(str(column)))
+        _encode_column(
+            values=[row.get(column, _MISSING) for row in rows], chunks=chunks
+        )
+
+
+def _encode_column(values: List[Any], chunks: List[bytes]) -> None:
+    column_type = _infer_column_type(values=values)
+    packed_uuids = None
+    if column_type == COLUMN_STR:
+        packed_uuids = _pack_canonical_uuids(values=values)
+        if packed_uuids is not None:
+            column_type = COLUMN_UUID
+    chunks.append(U8.pack(column_type))
+    if column_type == COLUMN_FLOAT32:
+        chunks.append(np.array(values, dtype="<f4").tobytes())
+    elif column_type == COLUMN_INT32:
+        chunks.append(np.array(values, dtype="<i4").tobytes())
+    elif column_type == COLUMN_BOOL:
+        chunks.append(np.array(values, dtype=np.uint8).tobytes())
+    elif column_type == COLUMN_STR:
+        strings = list(dict.fromkeys(values))
+        indices = {string: index for index, string in enumerate(strings)}
+        chunks.append(U32.pack(len(strings)))
+        chunks.extend(_pack_string(string) for string in strings)
+        chunks.append(np.array([indices[v] for v in values], dtype="<u4").tobytes())
+    elif column_type == COLUMN_UUID:
+        chunks.append(packed_uuids)
+    elif column_type == COLUMN_TABLES:
+        chunks.append(np.array([len(v) for v in values], dtype="<u4").tobytes())
+        _encode_table(rows=[row for v in values for row in v], chunks=chunks)
+    else:
+        for value in values:
+            if value is _MISSING:
+                chunks.append(U8.pack(TAG_MISSING))
+            else:
+                _encode_value(value=value, chunks=chunks)
+
+
+def _infer_column_type(values: List[Any]) -> int:
+    # exact types - subclasses (like bool for int) are encoded as generic values
+    types = {type(v) for v in values}
+    if types == {int}:
+        if INT32_RANGE[0] <= min(values) and max(values) <= INT32_RANGE[1]:
+            return COLUMN_INT32
+        return COLUMN_VALUES
+    if types == {float} or types == {int, float}:
+        return COLUMN_FLOAT32
+    if types == {bool}:
+        return COLUMN_BOOL
+    if types == {str}:
+        return COLUMN_STR
+    if types == {list} and any(values):
+        if {type(row) for v in values for row in v} == {dict}:
+            return COLUMN_TABLES
+    return COLUMN_VALUES
+
+
+def _pack_canonical_uuids(values: List[str]) -> Optional[bytes]:
+    """
+    Returns UUIDs packed as 16-byte values, if all values are UUIDs in canonical form
+    (lowercase, hyphenated) - such that decoded values are identical.
+    """
+    for value in values:
+        if len(value) != 36 or value[8] != "-" or value[13] != "-":
+            return None
+    hex_digits = "".join(values).replace("-", "")
+    if len(hex_digits) != 32 * len(values) or hex_digits != hex_digits.lower():
+        return None
+    for value in values:
+        if value[18] != "-" or value[23] != "-":
+            return None
+    try:
+        return bytes.fromhex(hex_digits)
+    except ValueError:
+        return None
+
+
+def _decode_table(reader: "_Reader") -> List[dict]:
+    rows_number = reader.read_struct(U32)[0]
+    columns_number = reader.read_struct(U16)[0]
+    rows = [{} for _ in range(rows_number)]
+    for _ in range(columns_number):
+        column = reader.read_string()
+        values = _decode_column(reader=reader, rows_number=rows_number)
+        for row, value in zip(rows, values):
+            if value is not _MISSING:
+                row[column] = value
+    return rows
+
+
+def _decode_column(reader: "_Reader", rows_number: int) -> List[Any]:
+    column_type = reader.read_struct(U8)[0]
+    if column_type == COLUMN_FLOAT32:
+        return reader.read_array(dtype="<f4", count=rows_number).tolist()
+    if column_type == COLUMN_INT32:
+        return reader.read_array(dtype="<i4", count=rows_number).tolist()
+    if column_type == COLUMN_BOOL:
+        return (
+            reader.read_array(dtype=np.uint8, count=rows_number).astype(bool).tolist()
+        )
+    if column_type == COLUMN_STR:
+        strings_number = reader.read_struct(U32)[0]
+        strings = [reader.read_string() for _ in range(strings_number)]
+        indices = reader.read_array(dtype="<u4", count=rows_number)
+        return [strings[i] for i in indices]
+    if column_type == COLUMN_UUID:
+        return [str(uuid.UUID(bytes=reader.read_bytes(16))) for _ in range(rows_number)]
+    if column_type == COLUMN_TABLES:
+        lengths = reader.read_array(dtype="<u4", count=rows_number).tolist()
+        sub_rows = _decode_table(reader=reader)
+        result, start = [], 0
+        for length in lengths:
+            result.append(sub_rows[start : start + length])
+            start += length
+        return result
+    if column_type == COLUMN_VALUES:
+        result = []
+        for _ in range(rows_number):
+            if reader.peek_tag() == TAG_MISSING:
+                reader.read_struct(U8)
+                result.append(_MISSING)
+            else:
+                result.append(decode_value(reader=reader))
+        return result
+    raise MalformedDatagramError(f"Unknown column type: {column_type}")
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return U32.pack(len(encoded)) + encoded
+
+
+class _Missing:
+    pass
+
+
+_MISSING = _Missing()
+
+
+class _Reader:
+    def __init__(self, buffer: bytes):
+        self._buffer = memoryview(buffer)
+        self._offset = 0
+
+    def read_bytes(self, size: int) -> bytes:
+        if self._offset + size > len(self._buffer):
+            raise MalformedDatagramError("Unexpected end of message")
+        result = self._buffer[self._offset : self._offset + size].tobytes()
+        self._offset += size
+        return result
+
+    def read_struct(self, structure: struct.Struct) -> Tuple[Any, ...]:
+        return structure.unpack(self.read_bytes(structure.size))
+
+    def read_string(self) -> str:
+        size = self.read_struct(U32)[0]
+        return self.read_bytes(size).decode("utf-8")
+
+    def read_array(self, dtype: Any, count: int) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self.read_bytes(dtype.itemsize * count), dtype=dtype)
+
+    def peek_tag(self) -> int:
+        if self._offset >= len(self._buffer):
+            raise MalformedDatagramError("Unexpected end of message")
+        return self._buffer[self._offset]
@@ -4,8 +4,9 @@ observability. Please consider them internal details of implementation.
 """
 
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
+from threading import Lock
 from typing import Any, Deque, Dict, Iterable, List, Optional, TypeVar
 
 import supervision as sv
@@ -17,10 +18,14 @@ from inference.core.interfaces.camera.entities import (
 )
 from inference.core.interfaces.camera.video_source import VideoSource
 from inference.core.interfaces.stream.entities import (
+    InferenceStage,
     LatencyMonitorReport,
     ModelActivityEvent,
     PipelineStateReport,
 )
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WorkflowsMetricsCollector,
+)
 
 T = TypeVar("T")
 
@@ -58,6 +63,19 @@ class PipelineWatchDog(ABC):
     def get_report(self) -> Optional[PipelineStateReport]:
         pass
 
+    def on_inference_stage_finished(
+        self,
+        stage: InferenceStage,
+        frames: List[VideoFrame],
+        duration: float,
+    ) -> None:
+        pass
+
+    def register_workflows_metrics_collector(
+        self, collector: WorkflowsMetricsCollector
+    ) -> None:
+        pass
+
 
 class NullPipelineWatchdog(PipelineWatchDog):
     def register_video_sources(self, video_sources: VideoSource) -> None:
@@ -79,44 +97,72 @@ class NullPipelineWatchdog(PipelineWatchDog):
 class LatencyMonitor:
     def __init__(self, source_id: Optional[int]):
         self._source_id = source_id
+        # with staged inference, processing of next frames may start before
+        # predictions for previous ones are ready - hence start events are kept by frame id
+        self._inference_start_events: Dict[int, ModelActivityEvent] = OrderedDict()
         self._inference_start_event: Optional[ModelActivityEvent] = None
         self._prediction_ready_event: Optional[ModelActivityEvent] = None
         self._reports: Deque[LatencyMonitorReport] = deque(maxlen=MAX_LATENCY_CONTEXT)
+        self._stages_latencies: Dict[InferenceStage, Deque[float]] = {
+            stage: deque(maxlen=MAX_LATENCY_CONTEXT) for stage in InferenceStage
+        }
+        self._lock = Lock()
 
     def register_inference_start(
         self, frame_timestamp: datetime, frame_id: int
     ) -> None:
-        self._inference_start_event = ModelActivityEvent(
-            event_timestamp=datetime.now(),
-            frame_id=frame_id,
-            frame_decoding_timestamp=frame_timestamp,
-        )
+        with self._lock:
+            self._inference_start_events[frame_id] = ModelActivityEvent(
+                event_timestamp=datetime.now(),
+                frame_id=frame_id,
+                frame_decoding_timestamp=frame_timestamp,
+            )
+            if len(self._inference_start_events) > MAX_LATENCY_CONTEXT:
+                self._inference_start_events.popitem(last=False)
 
     def register_prediction_ready(
         self, frame_timestamp: datetime, frame_id: int
     ) -> None:
-        self._prediction_ready_event = ModelActivityEvent(
-            event_timestamp=datetime.now(),
-            frame_id=frame_id,
-            frame_decoding_timestamp=frame_timestamp,
-        )
-        self._generate_report()
+        with self._lock:
+            self._inference_start_event = self._inference_start_events.pop(
+                frame_id, None
+            )
+            self._prediction_ready_event = ModelActivityEvent(
+                event_timestamp=datetime.now(),
+                frame_id=frame_id,
+                frame_decoding_timestamp=frame_timestamp,
+            )
+            self._generate_report()
+
+    def register_stage_latency(self, stage: InferenceStage, duration: float) -> None:
+        self._stages_latencies[stage].append(duration)
 
     def summarise_reports(self) -> LatencyMonitorReport:
+        with self._lock:
+            reports = list(self._reports)
         avg_frame_decoding_latency = average_property_values(
-            examined_objects=self._reports, property_name="frame_decoding_latency"
+            examined_objects=reports, property_name="frame_decoding_latency"
         )
         avg_inference_latency = average_property_values(
-            examined_objects=self._reports, property_name="inference_latency"
+            examined_objects=reports, property_name="inference_latency"
         )
         avg_e2e_latency = average_property_values(
-            examined_objects=self._reports, property_name="e2e_latency"
+            examined_objects=reports, property_name="e2e_latency"
         )
+        avg_stages_latencies = {
+            stage: safe_average(values=list(latencies))
+            for stage, latencies in self._stages_latencies.items()
+        }
         return LatencyMonitorReport(
             source_id=self._source_id,
             frame_decoding_latency=avg_frame_decoding_latency,
             inference_latency=avg_inference_latency,
             e2e_latency=avg_e2e_latency,
+            preprocessing_latency=avg_stages_latencies[InferenceStage.PREPROCESSING],
+            model_inference_latency=avg_stages_latencies[
+                InferenceStage.MODEL_INFERENCE
+            ],
+            postprocessing_latency=avg_stages_latencies[InferenceStage.POSTPROCESSING],
         )
 
     def _generate_report(self) -> None:
@@ -198,9 +244,9 @@ def are_events_compatible(events: List[Optional[ModelActivityEvent]]) -> bool:
 
 class BasePipelineWatchDog(PipelineWatchDog):
     """
-    Implementation to be used from single inference thread, as it keeps
-    state assumed to represent status of consecutive stage of prediction process
-    in latency monitor.
+    Implementation to be used with single `InferencePipeline` - latency monitors
+    match events by frame ids, so it is safe to be notified from threads running
+    different inference stages.
     """
 
     def __init__(self):
@@ -209,6 +255,7 @@ class BasePipelineWatchDog(PipelineWatchDog):
         self._inference_throughput_monitor = sv.FPSMonitor()
         self._latency_monitors: Dict[Optional[int], LatencyMonitor] = {}
         self._stream_updates = deque(maxlen=MAX_UPDATES_CONTEXT)
+        self._workflows_metrics_collector: Optional[WorkflowsMetricsCollector] = None
 
     def register_video_sources(self, video_sources: List[VideoSource]) -> None:
         self._video_sources = video_sources
@@ -217,6 +264,11 @@ class BasePipelineWatchDog(PipelineWatchDog):
                 source_id=source.source_id
             )
 
+    def register_workflows_metrics_collector(
+        self, collector: WorkflowsMetricsCollector
+    ) -> None:
+        self._workflows_metrics_collector = collector
+
     def on_status_update(self, status_update: StatusUpdate) -> None:
         if status_update.severity.value <= UpdateSeverity.DEBUG.value:
             return None
@@ -237,6 +289,17 @@ class BasePipelineWatchDog(PipelineWatchDog):
             )
             self._inference_throughput_monitor.tick()
 
+    def on_inference_stage_finished(
+        self,
+        stage: InferenceStage,
+        frames: List[VideoFrame],
+        duration: float,
+    ) -> None:
+        for frame in frames:
+            self._latency_monitors[frame.source_id].register_stage_latency(
+                stage=stage, duration=duration
+            )
+
     def get_report(self) -> PipelineStateReport:
         sources_metadata = []
         if self._video_sources is not None:
@@ -248,9 +311,19 @@ class BasePipelineWatchDog(PipelineWatchDog):
             _inference_throughput_fps = self._inference_throughput_monitor.fps
         else:
             _inference_throughput_fps = self._inference_throughput_monitor()
+        workflows_steps_metrics, workflows_blocks_metrics = [], []
+        if self._workflows_metrics_collector is not None:
+            workflows_steps_metrics = (
+                self._workflows_metrics_collector.get_steps_report()
+            )
+            workflows_blocks_metrics = (
+                self._workflows_metrics_collector.get_blocks_report()
+            )
         return PipelineStateReport(
             video_source_status_updates=list(self._stream_updates),
             latency_reports=latency_reports,
             inference_throughput=_inference_throughput_fps,
             sources_metadata=sources_metadata,
+            workflows_steps_metrics=workflows_steps_metrics,
+            workflows_blocks_metrics=workflows_blocks_metrics,
         )
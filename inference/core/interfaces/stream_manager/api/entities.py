@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -37,6 +38,20 @@ class ConsumePipelineResponse(CommandResponse):
     frames_metadata: List[FrameMetadata]
 
 
+class StreamedPipelineResult(ConsumePipelineResponse):
+    dropped_results: int = Field(
+        description="Number of results dropped for the subscriber since subscription "
+        "started - due to subscriber not keeping up with the pipeline",
+        default=0,
+    )
+
+
+class ResultsDropPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
 class InitializeWebRTCPipelineResponse(CommandResponse):
     sdp: str
     type: str
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from typing import AsyncIterator, Optional, Tuple, TypeVar
+
+from inference.core.interfaces.stream_manager.api.entities import ResultsDropPolicy
+
+RESULTS_STREAM_BUFFER_SIZE = 32
+END_OF_STREAM = object()
+
+T = TypeVar("T")
+
+
+async def buffer_results(
+    results: AsyncIterator[T],
+    buffer_size: int,
+    drop_policy: ResultsDropPolicy = ResultsDropPolicy.DROP_OLDEST,
+) -> AsyncIterator[Tuple[T, int]]:
+    """
+    Decouples reading `results` from their consumer with buffer of `buffer_size` results.
+    When the consumer does not keep up and the buffer is full - `drop_policy` decides if the
+    oldest or the newest result is dropped. `BLOCK` policy stops reading `results` until
+    the consumer takes results out of the buffer, propagating backpressure to the producer.
+    Yields results with total number of results dropped so far. `results` are closed
+    when the buffer is closed - so the subscription is ended even if the consumer
+    disconnects while the reader waits for space in the buffer.
+    """
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+    dropped = 0
+
+    async def read_results() -> None:
+        nonlocal dropped
+        try:
+            async for result in results:
+                if drop_policy is ResultsDropPolicy.BLOCK:
+                    await buffer.put((result, None))
+                    continue
+                if buffer.full():
+                    dropped += 1
+                    if drop_policy is ResultsDropPolicy.DROP_NEWEST:
+                        continue
+                    buffer.get_nowait()
+                buffer.put_nowait((result, None))
+            await buffer.put((END_OF_STREAM, None))
+        except Exception as error:
+            await buffer.put((END_OF_STREAM, error))
+        finally:
+            await close_results(results=results)
+
+    reading_task = asyncio.create_task(read_results())
+    try:
+        while True:
+            result, error = await buffer.get()
+            if error is not None:
+                raise error
+            if result is END_OF_STREAM:
+                return
+            yield result, dropped
+    finally:
+        reading_task.cancel()
+        await asyncio.gather(reading_task, return_exceptions=True)
+
+
+async def close_results(results: AsyncIterator[T]) -> None:
+    aclose = getattr(results, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def serialise_server_sent_event(data: dict, event: Optional[str] = None) -> bytes:
+    lines = []
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
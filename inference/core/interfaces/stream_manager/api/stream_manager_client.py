@@ -1,9 +1,9 @@
 import asyncio
+import base64
 import json
 from asyncio import StreamReader, StreamWriter
 from enum import Enum
-from json import JSONDecodeError
-from typing import List, Optional, Tuple, Union
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
 from inference.core import logger
 from inference.core.interfaces.stream_manager.api.entities import (
@@ -28,6 +28,7 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     ERROR_TYPE_KEY,
     PIPELINE_ID_KEY,
     REQUEST_ID_KEY,
+    RESPONSE_ENCODING_KEY,
     RESPONSE_KEY,
     STATUS_KEY,
     TYPE_KEY,
@@ -36,6 +37,7 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     InitialisePipelinePayload,
     InitialiseWebRTCPipelinePayload,
     OperationStatus,
+    ResponseEncoding,
 )
 from inference.core.interfaces.stream_manager.manager_app.errors import (
     CommunicationProtocolError,
@@ -44,6 +46,9 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
     MessageToBigError,
     TransmissionChannelClosed,
 )
+from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    deserialise_payload,
+)
 
 BUFFER_SIZE = 16384
 HEADER_SIZE = 4
@@ -66,6 +71,7 @@ class StreamManagerClient:
         operations_timeout: Optional[float] = None,
         header_size: int = HEADER_SIZE,
         buffer_size: int = BUFFER_SIZE,
+        binary_responses: bool = True,
     ) -> "StreamManagerClient":
         return cls(
             host=host,
@@ -73,6 +79,7 @@ class StreamManagerClient:
             operations_timeout=operations_timeout,
             header_size=header_size,
             buffer_size=buffer_size,
+            binary_responses=binary_responses,
         )
 
     def __init__(
@@ -82,12 +89,14 @@ class StreamManagerClient:
         operations_timeout: Optional[float],
         header_size: int,
         buffer_size: int,
+        binary_responses: bool = True,
     ):
         self._host = host
         self._port = port
         self._operations_timeout = operations_timeout
         self._header_size = header_size
         self._buffer_size = buffer_size
+        self._binary_responses = binary_responses
 
     async def list_pipelines(self) -> ListPipelinesResponse:
         command = {
@@ -185,22 +194,43 @@ class StreamManagerClient:
             "excluded_fields": excluded_fields,
         }
         response = await self._handle_command(command=command)
-        status = response[RESPONSE_KEY][STATUS_KEY]
-        context = CommandContext(
-            request_id=response.get(REQUEST_ID_KEY),
-            pipeline_id=response.get(PIPELINE_ID_KEY),
+        return build_consume_pipeline_response(response=response)
+
+    async def subscribe_pipeline_results(
+        self,
+        pipeline_id: str,
+        excluded_fields: List[str],
+    ) -> AsyncIterator[ConsumePipelineResponse]:
+        """
+        Yields results of the pipeline as they are pushed by Stream Manager - through
+        single connection, instead of request per result as in
+        `consume_pipeline_result(...)`. Stops with error once pipeline is terminated.
+        """
+        command = self._prepare_command(
+            command={
+                TYPE_KEY: CommandType.SUBSCRIBE_RESULTS,
+                PIPELINE_ID_KEY: pipeline_id,
+                "excluded_fields": excluded_fields,
+            }
         )
-        return ConsumePipelineResponse(
-            status=status,
-            context=context,
-            outputs=response[RESPONSE_KEY]["outputs"],
-            frames_metadata=[
-                FrameMetadata.model_validate(f)
-                for f in response[RESPONSE_KEY]["frames_metadata"]
-            ],
+        responses = stream_command_responses(
+            host=self._host,
+            port=self._port,
+            command=command,
+            header_size=self._header_size,
+            buffer_size=self._buffer_size,
+            timeout=self._operations_timeout,
         )
+        async for response in responses:
+            if is_request_unsuccessful(response=response):
+                dispatch_error(error_response=response)
+            if not response[RESPONSE_KEY]["outputs"]:
+                # heartbeat sent while pipeline does not produce results
+                continue
+            yield build_consume_pipeline_response(response=response)
 
     async def _handle_command(self, command: dict) -> dict:
+        command = self._prepare_command(command=command)
         response = await send_command(
             host=self._host,
             port=self._port,
@@ -213,6 +243,29 @@ class StreamManagerClient:
             dispatch_error(error_response=response)
         return response
 
+    def _prepare_command(self, command: dict) -> dict:
+        if self._binary_responses:
+            # older versions of manager ignore the key and respond with JSON
+            command = {**command, RESPONSE_ENCODING_KEY: ResponseEncoding.BINARY}
+        return command
+
+
+def build_consume_pipeline_response(response: dict) -> ConsumePipelineResponse:
+    status = response[RESPONSE_KEY][STATUS_KEY]
+    context = CommandContext(
+        request_id=response.get(REQUEST_ID_KEY),
+        pipeline_id=response.get(PIPELINE_ID_KEY),
+    )
+    return ConsumePipelineResponse(
+        status=status,
+        context=context,
+        outputs=response[RESPONSE_KEY]["outputs"],
+        frames_metadata=[
+            FrameMetadata.model_validate(f)
+            for f in response[RESPONSE_KEY]["frames_metadata"]
+        ],
+    )
+
 
 async def send_command(
     host: str,
@@ -234,19 +287,55 @@ async def send_command(
         )
         writer.close()
         await writer.wait_closed()
-        return json.loads(data)
-    except JSONDecodeError as error:
-        raise MalformedPayloadError(
-            private_message=f"Could not decode response. Cause: {error}",
-            public_message=f"Could not decode response from InferencePipeline Manager",
+        return deserialise_payload(payload=data, segment_decoder=encode_segment_base64)
+    except (OSError, asyncio.TimeoutError) as error:
+        raise ConnectivityError(
+            private_message=f"Could not communicate with InferencePipeline Manager",
+            public_message="Could not establish communication with InferencePipeline Manager",
             inner_error=error,
         ) from error
+
+
+async def stream_command_responses(
+    host: str,
+    port: int,
+    command: dict,
+    header_size: int,
+    buffer_size: int,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[dict]:
+    try:
+        reader, writer = await establish_socket_connection(
+            host=host, port=port, timeout=timeout
+        )
     except (OSError, asyncio.TimeoutError) as error:
         raise ConnectivityError(
             private_message=f"Could not communicate with InferencePipeline Manager",
             public_message="Could not establish communication with InferencePipeline Manager",
             inner_error=error,
         ) from error
+    try:
+        await send_message(
+            writer=writer, message=command, header_size=header_size, timeout=timeout
+        )
+        while True:
+            data = await receive_message(
+                reader,
+                header_size=header_size,
+                buffer_size=buffer_size,
+                timeout=timeout,
+            )
+            yield deserialise_payload(
+                payload=data, segment_decoder=encode_segment_base64
+            )
+    except (OSError, asyncio.TimeoutError) as error:
+        raise ConnectivityError(
+            private_message=f"Could not communicate with InferencePipeline Manager",
+            public_message="Lost communication with InferencePipeline Manager",
+            inner_error=error,
+        ) from error
+    finally:
+        writer.close()
 
 
 async def establish_socket_connection(
@@ -293,6 +382,11 @@ async def send_message(
         ) from error
 
 
+def encode_segment_base64(segment: memoryview) -> str:
+    # binary segments carry images which are exposed as base64 strings
+    return base64.b64encode(segment).decode("ascii")
+
+
 def _json_serializer(o: object) -> str:
     if isinstance(o, Enum):
         return o.value
@@ -304,7 +398,7 @@ async def receive_message(
     header_size: int,
     buffer_size: int,
     timeout: Optional[float] = None,
-) -> bytes:
+) -> bytearray:
     header = await asyncio.wait_for(reader.read(header_size), timeout=timeout)
     if len(header) != header_size:
         raise MalformedHeaderError(
@@ -313,16 +407,22 @@ async def receive_message(
             "communication protocol - malformed header of message.",
         )
     payload_size = int.from_bytes(bytes=header, byteorder="big")
-    received = b""
-    while len(received) < payload_size:
-        chunk = await asyncio.wait_for(reader.read(buffer_size), timeout=timeout)
+    # preallocated buffer - concatenation of chunks would be quadratic in payload size
+    received = bytearray(payload_size)
+    received_bytes = 0
+    while received_bytes < payload_size:
+        chunk = await asyncio.wait_for(
+            reader.read(min(buffer_size, payload_size - received_bytes)),
+            timeout=timeout,
+        )
         if len(chunk) == 0:
             raise TransmissionChannelClosed(
                 private_message="Socket was closed to read before payload was decoded.",
                 public_message="Internal error in communication with InferencePipeline Manager. Could not receive full "
                 "message.",
             )
-        received += chunk
+        received[received_bytes : received_bytes + len(chunk)] = chunk
+        received_bytes += len(chunk)
     return received
 
 
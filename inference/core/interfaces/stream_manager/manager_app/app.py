@@ -2,11 +2,14 @@ import os
 import signal
 import socket
 import sys
+import time
+from collections import defaultdict
 from functools import partial
 from multiprocessing import Process, Queue
 from socketserver import BaseRequestHandler, BaseServer
+from threading import Condition, RLock, Thread
 from types import FrameType
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Optional, Tuple
 from uuid import uuid4
 
 from inference.core import logger
@@ -16,11 +19,13 @@ from inference.core.interfaces.stream_manager.manager_app.communication import (
 )
 from inference.core.interfaces.stream_manager.manager_app.entities import (
     PIPELINE_ID_KEY,
+    RESPONSE_ENCODING_KEY,
     STATUS_KEY,
     TYPE_KEY,
     CommandType,
     ErrorType,
     OperationStatus,
+    ResponseEncoding,
 )
 from inference.core.interfaces.stream_manager.manager_app.errors import (
     MalformedPayloadError,
@@ -28,6 +33,10 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
 from inference.core.interfaces.stream_manager.manager_app.inference_pipeline_manager import (
     InferencePipelineManager,
 )
+from inference.core.interfaces.stream_manager.manager_app.model_host import (
+    ModelHostConnectionDetails,
+    SharedModelHost,
+)
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
     describe_error,
     prepare_error_response,
@@ -36,13 +45,25 @@ from inference.core.interfaces.stream_manager.manager_app.serialisation import (
 from inference.core.interfaces.stream_manager.manager_app.tcp_server import (
     RoboflowTCPServer,
 )
+from inference.core.utils.environment import str2bool
 
 PROCESSES_TABLE: Dict[str, Tuple[Process, Queue, Queue]] = {}
+# results subscriptions talk to pipelines from their own threads - commands sent to
+# single pipeline must not interleave with its termination
+PIPELINES_LOCKS: DefaultDict[str, RLock] = defaultdict(RLock)
+PIPELINES_RESPONSES: Dict[str, "PipelineResponses"] = {}
 HEADER_SIZE = 4
 SOCKET_BUFFER_SIZE = 16384
 HOST = os.getenv("STREAM_MANAGER_HOST", "127.0.0.1")
 PORT = int(os.getenv("STREAM_MANAGER_PORT", "7070"))
 SOCKET_TIMEOUT = float(os.getenv("STREAM_MANAGER_SOCKET_TIMEOUT", "5.0"))
+SHARED_MODEL_HOST = str2bool(os.getenv("STREAM_MANAGER_SHARED_MODEL_HOST", "False"))
+RESULTS_STREAM_POLL_TIMEOUT = float(
+    os.getenv("STREAM_MANAGER_RESULTS_STREAM_POLL_TIMEOUT", "0.1")
+)
+RESULTS_STREAM_HEARTBEAT_INTERVAL = float(
+    os.getenv("STREAM_MANAGER_RESULTS_STREAM_HEARTBEAT_INTERVAL", "1.0")
+)
 
 
 class InferencePipelinesManagerHandler(BaseRequestHandler):
@@ -52,19 +73,25 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
         client_address: Any,
         server: BaseServer,
         processes_table: Dict[str, Tuple[Process, Queue, Queue]],
+        model_host_connection: Optional[ModelHostConnectionDetails] = None,
     ):
         self._processes_table = processes_table  # in this case it's required to set the state of class before superclass init - as it invokes handle()
+        self._model_host_connection = model_host_connection
         super().__init__(request, client_address, server)
 
     def handle(self) -> None:
         pipeline_id: Optional[str] = None
         request_id = str(uuid4())
+        self._binary_response = False
         try:
             data = receive_socket_data(
                 source=self.request,
                 header_size=HEADER_SIZE,
                 buffer_size=SOCKET_BUFFER_SIZE,
             )
+            self._binary_response = (
+                data.get(RESPONSE_ENCODING_KEY) == ResponseEncoding.BINARY.value
+            )
             data[TYPE_KEY] = CommandType(data[TYPE_KEY])
             if data[TYPE_KEY] is CommandType.LIST_PIPELINES:
                 return self._list_pipelines(request_id=request_id)
@@ -73,6 +100,10 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
             if data[TYPE_KEY] is CommandType.WEBRTC:
                 return self._start_webrtc(request_id=request_id, command=data)
             pipeline_id = data[PIPELINE_ID_KEY]
+            if data[TYPE_KEY] is CommandType.SUBSCRIBE_RESULTS:
+                return self._subscribe_results(
+                    request_id=request_id, pipeline_id=pipeline_id, command=data
+                )
             if data[TYPE_KEY] is CommandType.TERMINATE:
                 self._terminate_pipeline(
                     request_id=request_id, pipeline_id=pipeline_id, command=data
@@ -85,7 +116,10 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
                     command=data,
                 )
                 serialised_response = prepare_response(
-                    request_id=request_id, response=response, pipeline_id=pipeline_id
+                    request_id=request_id,
+                    response=response,
+                    pipeline_id=pipeline_id,
+                    binary=self._binary_response,
                 )
                 send_data_trough_socket(
                     target=self.request,
@@ -103,6 +137,7 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
                 error=error,
                 error_type=ErrorType.INVALID_PAYLOAD,
                 pipeline_id=pipeline_id,
+                binary=self._binary_response,
             )
             send_data_trough_socket(
                 target=self.request,
@@ -120,6 +155,7 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
                 error=error,
                 error_type=ErrorType.INTERNAL_ERROR,
                 pipeline_id=pipeline_id,
+                binary=self._binary_response,
             )
             send_data_trough_socket(
                 target=self.request,
@@ -137,6 +173,7 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
                 STATUS_KEY: OperationStatus.SUCCESS,
             },
             pipeline_id=None,
+            binary=self._binary_response,
         )
         send_data_trough_socket(
             target=self.request,
@@ -153,6 +190,7 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
             pipeline_id=pipeline_id,
             command_queue=command_queue,
             responses_queue=responses_queue,
+            model_host_connection=self._model_host_connection,
         )
         inference_pipeline_manager.start()
         self._processes_table[pipeline_id] = (
@@ -165,7 +203,10 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
             responses_queue=responses_queue, matching_request_id=request_id
         )
         serialised_response = prepare_response(
-            request_id=request_id, response=response, pipeline_id=pipeline_id
+            request_id=request_id,
+            response=response,
+            pipeline_id=pipeline_id,
+            binary=self._binary_response,
         )
         send_data_trough_socket(
             target=self.request,
@@ -183,6 +224,7 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
             pipeline_id=pipeline_id,
             command_queue=command_queue,
             responses_queue=responses_queue,
+            model_host_connection=self._model_host_connection,
         )
         inference_pipeline_manager.start()
         self._processes_table[pipeline_id] = (
@@ -195,7 +237,10 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
             responses_queue=responses_queue, matching_request_id=request_id
         )
         serialised_response = prepare_response(
-            request_id=request_id, response=response, pipeline_id=pipeline_id
+            request_id=request_id,
+            response=response,
+            pipeline_id=pipeline_id,
+            binary=self._binary_response,
         )
         send_data_trough_socket(
             target=self.request,
@@ -205,27 +250,51 @@ class InferencePipelinesManagerHandler(BaseRequestHandler):
             pipeline_id=pipeline_id,
         )
 
-    def _terminate_pipeline(
+    def _subscribe_results(
         self, request_id: str, pipeline_id: str, command: dict
     ) -> None:
-        response = handle_command(
-            processes_table=self._processes_table,
-            request_id=request_id,
-            pipeline_id=pipeline_id,
-            command=command,
+        # connection outlives the handler - results are pushed from separate thread,
+        # so that the server keeps processing other commands
+        self.server.detach_request(self.request)
+        streaming_thread = Thread(
+            target=stream_results,
+            kwargs={
+                "connection": self.request,
+                "processes_table": self._processes_table,
+                "request_id": request_id,
+                "pipeline_id": pipeline_id,
+                "command": command,
+                "binary": self._binary_response,
+            },
+            daemon=True,
         )
-        if response[STATUS_KEY] is OperationStatus.SUCCESS:
-            logger.info(
-                f"Joining inference pipeline. pipeline_id={pipeline_id} request_id={request_id}"
-            )
-            join_inference_pipeline(
-                processes_table=self._processes_table, pipeline_id=pipeline_id
-            )
-            logger.info(
-                f"Joined inference pipeline. pipeline_id={pipeline_id} request_id={request_id}"
+        streaming_thread.start()
+
+    def _terminate_pipeline(
+        self, request_id: str, pipeline_id: str, command: dict
+    ) -> None:
+        with PIPELINES_LOCKS[pipeline_id]:
+            response = handle_command(
+                processes_table=self._processes_table,
+                request_id=request_id,
+                pipeline_id=pipeline_id,
+                command=command,
             )
+            if response[STATUS_KEY] is OperationStatus.SUCCESS:
+                logger.info(
+                    f"Joining inference pipeline. pipeline_id={pipeline_id} request_id={request_id}"
+                )
+                join_inference_pipeline(
+                    processes_table=self._processes_table, pipeline_id=pipeline_id
+                )
+                logger.info(
+                    f"Joined inference pipeline. pipeline_id={pipeline_id} request_id={request_id}"
+                )
         serialised_response = prepare_response(
-            request_id=request_id, response=response, pipeline_id=pipeline_id
+            request_id=request_id,
+            response=response,
+            pipeline_id=pipeline_id,
+            binary=self._binary_response,
         )
         send_data_trough_socket(
             target=self.request,
@@ -242,17 +311,132 @@ def handle_command(
     pipeline_id: str,
     command: dict,
 ) -> dict:
-    if pipeline_id not in processes_table:
-        return describe_error(
-            exception=None,
-            error_type=ErrorType.NOT_FOUND,
-            public_error_message=f"Could not found InferencePipeline with id={pipeline_id}.",
-        )
-    _, command_queue, responses_queue = processes_table[pipeline_id]
-    command_queue.put((request_id, command))
-    return get_response_ignoring_thrash(
-        responses_queue=responses_queue, matching_request_id=request_id
+    with PIPELINES_LOCKS[pipeline_id]:
+        if pipeline_id not in processes_table:
+            return describe_error(
+                exception=None,
+                error_type=ErrorType.NOT_FOUND,
+                public_error_message=f"Could not found InferencePipeline with id={pipeline_id}.",
+            )
+        _, command_queue, responses_queue = processes_table[pipeline_id]
+        if pipeline_id not in PIPELINES_RESPONSES:
+            PIPELINES_RESPONSES[pipeline_id] = PipelineResponses(
+                responses_queue=responses_queue
+            )
+        pipeline_responses = PIPELINES_RESPONSES[pipeline_id]
+        pipeline_responses.expect(request_id=request_id)
+        command_queue.put((request_id, command))
+    # lock is not held while waiting - long-polling commands of results subscriptions
+    # would block other commands (like terminate) otherwise
+    return pipeline_responses.get(request_id=request_id)
+
+
+class PipelineResponses:
+    """
+    Hands responses of the pipeline over to threads waiting for them. Only one of the
+    waiting threads reads the responses queue at a time, passing responses of other
+    threads over - responses of requests nobody waits for are dropped.
+    """
+
+    def __init__(self, responses_queue: Queue):
+        self._responses_queue = responses_queue
+        self._condition = Condition()
+        self._awaited: Dict[str, Optional[dict]] = {}
+        self._reading = False
+
+    def expect(self, request_id: str) -> None:
+        with self._condition:
+            self._awaited[request_id] = None
+
+    def get(self, request_id: str) -> dict:
+        while True:
+            with self._condition:
+                while self._awaited[request_id] is None and self._reading:
+                    self._condition.wait()
+                if self._awaited[request_id] is not None:
+                    return self._awaited.pop(request_id)
+                self._reading = True
+            try:
+                response_request_id, response = self._responses_queue.get()
+            except BaseException:
+                with self._condition:
+                    self._reading = False
+                    self._condition.notify_all()
+                raise
+            with self._condition:
+                self._reading = False
+                if self._awaited.get(response_request_id, False) is None:
+                    self._awaited[response_request_id] = response
+                else:
+                    logger.warning(
+                        f"Dropping response for request_id={response_request_id} "
+                        f"with payload={response}"
+                    )
+                self._condition.notify_all()
+
+
+def stream_results(
+    connection: socket.socket,
+    processes_table: Dict[str, Tuple[Process, Queue, Queue]],
+    request_id: str,
+    pipeline_id: str,
+    command: dict,
+    binary: bool = False,
+) -> None:
+    """
+    Pushes results of the pipeline through the connection as soon as they are produced -
+    each result is sent as separate message, the same as response for `consume_result`
+    command. Empty message is sent if there were no results for the heartbeat interval, to
+    detect disconnected subscribers. Subscription ends with error message (for instance
+    when pipeline is terminated) or when the subscriber disconnects - slow subscriber makes
+    results accumulate (and eventually drop) in the buffer of the pipeline.
+    """
+    consume_command = {
+        **command,
+        TYPE_KEY: CommandType.CONSUME_RESULT,
+        "wait_timeout": RESULTS_STREAM_POLL_TIMEOUT,
+    }
+    logger.info(
+        f"Starting results subscription. pipeline_id={pipeline_id} request_id={request_id}"
     )
+    last_message_time = time.monotonic()
+    try:
+        while True:
+            response = handle_command(
+                processes_table=processes_table,
+                request_id=str(uuid4()),
+                pipeline_id=pipeline_id,
+                command=consume_command,
+            )
+            succeeded = response[STATUS_KEY] == OperationStatus.SUCCESS
+            since_last_message = time.monotonic() - last_message_time
+            if (
+                succeeded
+                and not response["outputs"]
+                and since_last_message < RESULTS_STREAM_HEARTBEAT_INTERVAL
+            ):
+                continue
+            serialised_response = prepare_response(
+                request_id=request_id,
+                response=response,
+                pipeline_id=pipeline_id,
+                binary=binary,
+            )
+            # sent directly (not with `send_data_trough_socket(...)` which suppresses
+            # errors) - to stop once subscriber disconnects
+            header = len(serialised_response).to_bytes(
+                length=HEADER_SIZE, byteorder="big"
+            )
+            connection.sendall(header + serialised_response)
+            last_message_time = time.monotonic()
+            if not succeeded:
+                return None
+    except (OSError, OverflowError) as error:
+        logger.info(
+            f"Results subscription interrupted. pipeline_id={pipeline_id} request_id={request_id} error={error}"
+        )
+    finally:
+        connection.close()
 
 
 def get_response_ignoring_thrash(
@@ -271,6 +455,7 @@ def execute_termination(
     signal_number: int,
     frame: FrameType,
     processes_table: Dict[str, Tuple[Process, Queue, Queue]],
+    model_host: Optional[SharedModelHost] = None,
 ) -> None:
     pipeline_ids = list(processes_table.keys())
     for pipeline_id in pipeline_ids:
@@ -280,6 +465,10 @@ def execute_termination(
         logger.info(f"Joining pipeline: {pipeline_id}")
         processes_table[pipeline_id][0].join()
         logger.info(f"Pipeline: {pipeline_id} joined.")
+    if model_host is not None:
+        logger.info("Terminating shared model host")
+        model_host.terminate()
+        model_host.join()
     logger.info(f"Termination handler completed.")
     sys.exit(0)
 
@@ -292,19 +481,27 @@ def join_inference_pipeline(
     ]
     inference_pipeline_manager.join()
     del processes_table[pipeline_id]
+    PIPELINES_LOCKS.pop(pipeline_id, None)
+    PIPELINES_RESPONSES.pop(pipeline_id, None)
 
 
 def start() -> None:
-    signal.signal(
-        signal.SIGINT, partial(execute_termination, processes_table=PROCESSES_TABLE)
-    )
-    signal.signal(
-        signal.SIGTERM, partial(execute_termination, processes_table=PROCESSES_TABLE)
+    model_host, model_host_connection = None, None
+    if SHARED_MODEL_HOST:
+        model_host = SharedModelHost.init()
+        model_host.start()
+        model_host_connection = model_host.get_connection_details()
+    termination_handler = partial(
+        execute_termination, processes_table=PROCESSES_TABLE, model_host=model_host
     )
+    signal.signal(signal.SIGINT, termination_handler)
+    signal.signal(signal.SIGTERM, termination_handler)
     with RoboflowTCPServer(
         server_address=(HOST, PORT),
         handler_class=partial(
-            InferencePipelinesManagerHandler, processes_table=PROCESSES_TABLE
+            InferencePipelinesManagerHandler,
+            processes_table=PROCESSES_TABLE,
+            model_host_connection=model_host_connection,
         ),
         socket_operations_timeout=SOCKET_TIMEOUT,
     ) as tcp_server:
@@ -1,4 +1,3 @@
-import json
 import socket
 from typing import Optional
 
@@ -6,10 +5,10 @@ from inference.core import logger
 from inference.core.interfaces.stream_manager.manager_app.entities import ErrorType
 from inference.core.interfaces.stream_manager.manager_app.errors import (
     MalformedHeaderError,
-    MalformedPayloadError,
     TransmissionChannelClosed,
 )
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    deserialise_payload,
     prepare_error_response,
 )
 
@@ -29,23 +28,22 @@ def receive_socket_data(
             private_message=f"Header is indicating non positive payload size: {payload_size}",
             public_message=f"Header is indicating non positive payload size: {payload_size}",
         )
-    received = b""
-    while len(received) < payload_size:
-        chunk = source.recv(buffer_size)
+    # preallocated buffer - concatenation of chunks would be quadratic in payload size
+    received = bytearray(payload_size)
+    received_view = memoryview(received)
+    received_bytes = 0
+    while received_bytes < payload_size:
+        chunk = source.recv(min(buffer_size, payload_size - received_bytes))
         if len(chunk) == 0:
             raise TransmissionChannelClosed(
                 private_message="Socket was closed to read before payload was decoded.",
                 public_message="Socket was closed to read before payload was decoded.",
             )
-        received += chunk
-    try:
-        return json.loads(received)
-    except ValueError as error:
-        raise MalformedPayloadError(
-            public_message="Received payload that is not in a JSON format",
-            private_message="Received payload that is not in a JSON format",
-            inner_error=error,
-        )
+        chunk_size = min(len(chunk), payload_size - received_bytes)
+        received_view[received_bytes : received_bytes + chunk_size] = chunk[:chunk_size]
+        received_bytes += chunk_size
+    received_view.release()
+    return deserialise_payload(payload=received)
 
 
 def send_data_trough_socket(
@@ -15,6 +15,7 @@ REQUEST_ID_KEY = "request_id"
 PIPELINE_ID_KEY = "pipeline_id"
 COMMAND_KEY = "command"
 RESPONSE_KEY = "response"
+RESPONSE_ENCODING_KEY = "response_encoding"
 ENCODING = "utf-8"
 
 
@@ -31,6 +32,11 @@ class ErrorType(str, Enum):
     AUTHORISATION_ERROR = "authorisation_error"
 
 
+class ResponseEncoding(str, Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
 class CommandType(str, Enum):
     INIT = "init"
     WEBRTC = "webrtc"
@@ -40,6 +46,7 @@ class CommandType(str, Enum):
     TERMINATE = "terminate"
     LIST_PIPELINES = "list_pipelines"
     CONSUME_RESULT = "consume_result"
+    SUBSCRIBE_RESULTS = "subscribe_results"
 
 
 class VideoConfiguration(BaseModel):
@@ -42,3 +42,7 @@ class TransmissionChannelClosed(CommunicationProtocolError):
 
 class MalformedPayloadError(CommunicationProtocolError):
     pass
+
+
+class ModelHostError(Exception):
+    pass
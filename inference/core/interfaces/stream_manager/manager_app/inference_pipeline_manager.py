@@ -34,6 +34,7 @@ from inference.core.interfaces.stream.watchdog import (
     PipelineWatchDog,
 )
 from inference.core.interfaces.stream_manager.manager_app.entities import (
+    RESPONSE_ENCODING_KEY,
     STATUS_KEY,
     TYPE_KEY,
     CommandType,
@@ -41,15 +42,28 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     InitialisePipelinePayload,
     InitialiseWebRTCPipelinePayload,
     OperationStatus,
+    ResponseEncoding,
     WebRTCOffer,
 )
+from inference.core.interfaces.stream_manager.manager_app.model_host import (
+    ModelHostClient,
+    ModelHostConnectionDetails,
+)
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
     describe_error,
+    serialise_image_to_bytes,
 )
 from inference.core.interfaces.stream_manager.manager_app.webrtc import (
     init_rtc_peer_connection,
 )
+from inference.core.workflows.core_steps.common.serializers import serialise_image
 from inference.core.workflows.execution_engine.entities.base import WorkflowImageData
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    get_peak_memory_usage,
+)
+
+# long-polling consumption blocks commands processing - so the wait is capped
+MAX_RESULTS_WAIT_TIMEOUT = 1.0
 
 
 def ignore_signal(signal_number: int, frame: FrameType) -> None:
@@ -62,19 +76,32 @@ def ignore_signal(signal_number: int, frame: FrameType) -> None:
 class InferencePipelineManager(Process):
     @classmethod
     def init(
-        cls, pipeline_id: str, command_queue: Queue, responses_queue: Queue
+        cls,
+        pipeline_id: str,
+        command_queue: Queue,
+        responses_queue: Queue,
+        model_host_connection: Optional[ModelHostConnectionDetails] = None,
     ) -> "InferencePipelineManager":
         return cls(
             pipeline_id=pipeline_id,
             command_queue=command_queue,
             responses_queue=responses_queue,
+            model_host_connection=model_host_connection,
         )
 
-    def __init__(self, pipeline_id: str, command_queue: Queue, responses_queue: Queue):
+    def __init__(
+        self,
+        pipeline_id: str,
+        command_queue: Queue,
+        responses_queue: Queue,
+        model_host_connection: Optional[ModelHostConnectionDetails] = None,
+    ):
         super().__init__()
         self._pipeline_id = pipeline_id
         self._command_queue = command_queue
         self._responses_queue = responses_queue
+        self._model_host_connection = model_host_connection
+        self._model_host_client: Optional[ModelHostClient] = None
         self._inference_pipeline: Optional[InferencePipeline] = None
         self._watchdog: Optional[PipelineWatchDog] = None
         self._stop = False
@@ -160,6 +187,7 @@ class InferencePipelineManager(Process):
                 cancel_thread_pool_tasks_on_exit=parsed_payload.processing_configuration.cancel_thread_pool_tasks_on_exit,
                 video_metadata_input_name=parsed_payload.processing_configuration.video_metadata_input_name,
                 batch_collection_timeout=parsed_payload.video_configuration.batch_collection_timeout,
+                model_manager=self._connect_model_host(),
             )
             self._watchdog = watchdog
             self._inference_pipeline.start(use_main_thread=False)
@@ -271,6 +299,7 @@ class InferencePipelineManager(Process):
                 cancel_thread_pool_tasks_on_exit=parsed_payload.processing_configuration.cancel_thread_pool_tasks_on_exit,
                 video_metadata_input_name=parsed_payload.processing_configuration.video_metadata_input_name,
                 batch_collection_timeout=parsed_payload.video_configuration.batch_collection_timeout,
+                model_manager=self._connect_model_host(),
             )
             self._watchdog = watchdog
             self._inference_pipeline.start(use_main_thread=False)
@@ -349,8 +378,20 @@ class InferencePipelineManager(Process):
     def _execute_termination(self) -> None:
         self._inference_pipeline.terminate()
         self._inference_pipeline.join()
+        if self._model_host_client is not None:
+            self._model_host_client.close()
         self._stop = True
 
+    def _connect_model_host(self) -> Optional[ModelHostClient]:
+        if self._model_host_connection is None:
+            return None
+        if self._model_host_client is None:
+            self._model_host_client = ModelHostClient.connect(
+                connection_details=self._model_host_connection,
+                pipeline_id=self._pipeline_id,
+            )
+        return self._model_host_client
+
     def _mute_pipeline(self, request_id: str) -> None:
         if self._inference_pipeline is None:
             return self._handle_error(
@@ -408,9 +449,18 @@ class InferencePipelineManager(Process):
                     error_type=ErrorType.OPERATION_ERROR,
                     public_error_message="Cannot retrieve InferencePipeline status. Try again later.",
                 )
+            report = asdict(report)
+            report["memory"] = {
+                "process_peak_memory_bytes": get_peak_memory_usage(),
+            }
+            if self._model_host_client is not None:
+                report["model_host"] = self._model_host_client.get_report()
+                report["memory"][
+                    "shared_memory_bytes"
+                ] = self._model_host_client.shared_memory_bytes
             response_payload = {
                 STATUS_KEY: OperationStatus.SUCCESS,
-                "report": asdict(report),
+                "report": report,
             }
             self._responses_queue.put((request_id, response_payload))
             logger.info(f"Pipeline status returned. request_id={request_id}...")
@@ -424,6 +474,12 @@ class InferencePipelineManager(Process):
 
     def _consume_results(self, request_id: str, payload: dict) -> None:
         try:
+            wait_timeout = payload.get("wait_timeout")
+            if wait_timeout is not None and self._buffer_sink.empty():
+                # long-polling used by results subscriptions
+                self._buffer_sink.wait_for_prediction(
+                    timeout=min(float(wait_timeout), MAX_RESULTS_WAIT_TIMEOUT)
+                )
             if self._buffer_sink.empty():
                 response_payload = {
                     STATUS_KEY: OperationStatus.SUCCESS,
@@ -433,12 +489,17 @@ class InferencePipelineManager(Process):
                 self._responses_queue.put((request_id, response_payload))
                 return None
             excluded_fields = payload.get("excluded_fields")
+            image_serialiser = serialise_image
+            if payload.get(RESPONSE_ENCODING_KEY) == ResponseEncoding.BINARY.value:
+                # images are sent as raw bytes instead of base64 strings
+                image_serialiser = serialise_image_to_bytes
             predictions, frames = self._buffer_sink.consume_prediction()
             predictions = [
                 (
                     serialise_single_workflow_result_element(
                         result_element=result_element,
                         excluded_fields=excluded_fields,
+                        image_serialiser=image_serialiser,
                     )
                     if result_element is not None
                     else None
@@ -0,0 +1,891 @@
+"""
+Shared model host of Stream Manager.
+
+By default, each `InferencePipelineManager` process loads its own copy of every model
+used by its Workflow. With shared model host enabled, models are loaded once - in
+`SharedModelHost` process - and pipelines submit inference requests through
+`ModelHostClient`, which is injected into Workflows Execution Engine in place of
+`ModelManager`.
+
+Requests of different pipelines targeting the same model with the same parameters are
+dynamically batched - host waits up to batch collection timeout for the batch to fill.
+Batches are assembled in round-robin manner across pipelines, such that a pipeline
+submitting a lot of frames cannot starve the others. Images are transferred through
+shared memory ring owned by each client - only slot references are sent to the host.
+"""
+
+import os
+import pickle
+import signal
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import Process, Queue, resource_tracker, shared_memory
+from multiprocessing.connection import Client, Connection, Listener
+from threading import Condition, Lock, Thread
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.entities.requests.inference import (
+    ClassificationInferenceRequest,
+    InferenceRequest,
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.interfaces.camera.process_decoding import SharedMemoryFramesRing
+from inference.core.interfaces.stream_manager.manager_app.errors import ModelHostError
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    get_peak_memory_usage,
+)
+
+MODEL_HOST_MAX_BATCH_SIZE = int(
+    os.getenv("STREAM_MANAGER_MODEL_HOST_MAX_BATCH_SIZE", "16")
+)
+MODEL_HOST_BATCH_COLLECTION_TIMEOUT = float(
+    os.getenv("STREAM_MANAGER_MODEL_HOST_BATCH_COLLECTION_TIMEOUT", "0.01")
+)
+MODEL_HOST_FRAMES_RING_SIZE = int(
+    os.getenv("STREAM_MANAGER_MODEL_HOST_FRAMES_RING_SIZE", "8")
+)
+MODEL_HOST_RESPONSE_TIMEOUT = float(
+    os.getenv("STREAM_MANAGER_MODEL_HOST_RESPONSE_TIMEOUT", "300")
+)
+MODEL_HOST_START_TIMEOUT = 30.0
+MODEL_HOST_DISCONNECT_TIMEOUT = 5.0
+IDLE_WAIT_TIMEOUT = 0.5
+THROUGHPUT_WINDOW = 10.0
+BATCHING_EXCLUDED_REQUEST_FIELDS = {"id", "image", "start", "source", "source_info"}
+# requests of those types are answered with one response for each image - only such
+# requests can be merged into batch and have responses split back
+BATCHABLE_REQUEST_TYPES = (
+    ObjectDetectionInferenceRequest,
+    ClassificationInferenceRequest,
+)
+
+GroupKey = Tuple[str, ...]
+
+
+class ModelHostCommand(str, Enum):
+    HELLO = "hello"
+    ADD_MODEL = "add_model"
+    INFER = "infer"
+    REPORT = "report"
+    DISCONNECT = "disconnect"
+
+
+@dataclass(frozen=True)
+class ModelHostConnectionDetails:
+    address: Any
+    authkey: bytes
+
+
+@dataclass(frozen=True)
+class SharedFrameReference:
+    slot: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@dataclass
+class PendingInference:
+    request_id: str
+    pipeline_id: str
+    model_id: str
+    request: InferenceRequest
+    images: List[Any]
+    single_image: bool
+    submitted_at: float
+
+    @property
+    def images_count(self) -> int:
+        return max(len(self.images), 1)
+
+
+class FairBatchScheduler:
+    """
+    Keeps pending inferences grouped by batching key (model and request parameters) and
+    by pipeline. Batch is assembled for the group with the oldest pending inference,
+    taking inferences from pipelines in round-robin order.
+    """
+
+    def __init__(self, max_batch_size: int):
+        self._max_batch_size = max(max_batch_size, 1)
+        self._groups: Dict[GroupKey, "OrderedDict[str, Deque[PendingInference]]"] = {}
+
+    def submit(self, group_key: GroupKey, pending_inference: PendingInference) -> None:
+        group = self._groups.setdefault(group_key, OrderedDict())
+        group.setdefault(pending_inference.pipeline_id, deque()).append(
+            pending_inference
+        )
+
+    def is_empty(self) -> bool:
+        return len(self._groups) == 0
+
+    def oldest_submission(self) -> Optional[Tuple[GroupKey, float]]:
+        result = None
+        for group_key, group in self._groups.items():
+            for pipeline_queue in group.values():
+                submitted_at = pipeline_queue[0].submitted_at
+                if result is None or submitted_at < result[1]:
+                    result = (group_key, submitted_at)
+        return result
+
+    def pending_images(self, group_key: GroupKey) -> int:
+        return sum(
+            p.images_count
+            for pipeline_queue in self._groups.get(group_key, {}).values()
+            for p in pipeline_queue
+        )
+
+    def is_batch_full(self, group_key: GroupKey) -> bool:
+        return self.pending_images(group_key=group_key) >= self._max_batch_size
+
+    def next_batch(self, group_key: GroupKey) -> List[PendingInference]:
+        group = self._groups.get(group_key)
+        if not group:
+            return []
+        batch, images_in_batch = [], 0
+        while group and images_in_batch < self._max_batch_size:
+            pipeline_id, pipeline_queue = next(iter(group.items()))
+            pending_inference = pipeline_queue[0]
+            if batch and (
+                images_in_batch + pending_inference.images_count > self._max_batch_size
+            ):
+                break
+            pipeline_queue.popleft()
+            batch.append(pending_inference)
+            images_in_batch += pending_inference.images_count
+            # pipeline just served goes to the end of the line
+            group.move_to_end(pipeline_id)
+            if not pipeline_queue:
+                del group[pipeline_id]
+        if not group:
+            del self._groups[group_key]
+        return batch
+
+    def remove_pipeline(self, pipeline_id: str) -> List[PendingInference]:
+        removed = []
+        for group_key in list(self._groups.keys()):
+            group = self._groups[group_key]
+            removed.extend(group.pop(pipeline_id, []))
+            if not group:
+                del self._groups[group_key]
+        return removed
+
+
+class ThroughputMonitor:
+    def __init__(self, window: float = THROUGHPUT_WINDOW):
+        self._window = window
+        self._observations: Deque[Tuple[float, int]] = deque()
+
+    def record(self, frames: int) -> None:
+        now = time.monotonic()
+        self._observations.append((now, frames))
+        self._evict(now=now)
+
+    def fps(self) -> float:
+        now = time.monotonic()
+        self._evict(now=now)
+        if not self._observations:
+            return 0.0
+        elapsed = max(now - self._observations[0][0], 1e-3)
+        return sum(frames for _, frames in self._observations) / elapsed
+
+    def _evict(self, now: float) -> None:
+        while self._observations and now - self._observations[0][0] > self._window:
+            self._observations.popleft()
+
+
+class PipelineStatistics:
+    def __init__(self, shared_memory_bytes: int = 0):
+        self.shared_memory_bytes = shared_memory_bytes
+        self.process_peak_memory_bytes = 0
+        self.requests = 0
+        self.frames = 0
+        self.queue_latency_sum = 0.0
+        self.throughput = ThroughputMonitor()
+
+    def to_report(self) -> dict:
+        return {
+            "requests": self.requests,
+            "frames": self.frames,
+            "fps": self.throughput.fps(),
+            "queue_latency_mean": (
+                self.queue_latency_sum / self.requests if self.requests else None
+            ),
+            "shared_memory_bytes": self.shared_memory_bytes,
+            "process_peak_memory_bytes": self.process_peak_memory_bytes,
+        }
+
+
+class ModelHostStatistics:
+    def __init__(self):
+        self._pipelines: Dict[str, PipelineStatistics] = {}
+        self._batches = 0
+        self._frames = 0
+        self._inference_time = 0.0
+        self._throughput = ThroughputMonitor()
+        self._lock = Lock()
+
+    def register_pipeline(self, pipeline_id: str) -> None:
+        with self._lock:
+            self._pipelines.setdefault(pipeline_id, PipelineStatistics())
+
+    def unregister_pipeline(self, pipeline_id: str) -> None:
+        with self._lock:
+            self._pipelines.pop(pipeline_id, None)
+
+    def record_pipeline_memory(
+        self,
+        pipeline_id: str,
+        shared_memory_bytes: int,
+        process_peak_memory_bytes: int,
+    ) -> None:
+        with self._lock:
+            statistics = self._pipelines.setdefault(pipeline_id, PipelineStatistics())
+            statistics.shared_memory_bytes = shared_memory_bytes
+            statistics.process_peak_memory_bytes = process_peak_memory_bytes
+
+    def record_batch(self, batch: List[PendingInference], duration: float) -> None:
+        now = time.monotonic()
+        frames_in_batch = sum(p.images_count for p in batch)
+        with self._lock:
+            self._batches += 1
+            self._frames += frames_in_batch
+            self._inference_time += duration
+            self._throughput.record(frames=frames_in_batch)
+            for pending_inference in batch:
+                statistics = self._pipelines.setdefault(
+                    pending_inference.pipeline_id, PipelineStatistics()
+                )
+                statistics.requests += 1
+                statistics.frames += pending_inference.images_count
+                statistics.queue_latency_sum += now - pending_inference.submitted_at
+                statistics.throughput.record(frames=pending_inference.images_count)
+
+    def get_report(self, pipeline_id: Optional[str] = None) -> dict:
+        with self._lock:
+            report = {
+                "total": {
+                    "pipelines": len(self._pipelines),
+                    "batches": self._batches,
+                    "frames": self._frames,
+                    "batch_size_mean": (
+                        self._frames / self._batches if self._batches else None
+                    ),
+                    "inference_time": self._inference_time,
+                    "fps": self._throughput.fps(),
+                    "host_peak_memory_bytes": get_peak_memory_usage(),
+                }
+            }
+            if pipeline_id is not None and pipeline_id in self._pipelines:
+                report["pipeline"] = self._pipelines[pipeline_id].to_report()
+            return report
+
+
+class SharedModelHost(Process):
+    @classmethod
+    def init(
+        cls,
+        max_batch_size: int = MODEL_HOST_MAX_BATCH_SIZE,
+        batch_collection_timeout: float = MODEL_HOST_BATCH_COLLECTION_TIMEOUT,
+    ) -> "SharedModelHost":
+        return cls(
+            authkey=os.urandom(32),
+            address_queue=Queue(),
+            max_batch_size=max_batch_size,
+            batch_collection_timeout=batch_collection_timeout,
+        )
+
+    def __init__(
+        self,
+        authkey: bytes,
+        address_queue: Queue,
+        max_batch_size: int,
+        batch_collection_timeout: float,
+    ):
+        super().__init__(daemon=True)
+        self._authkey = authkey
+        self._address_queue = address_queue
+        self._max_batch_size = max_batch_size
+        self._batch_collection_timeout = batch_collection_timeout
+        self._scheduler = FairBatchScheduler(max_batch_size=max_batch_size)
+        self._statistics = ModelHostStatistics()
+        self._condition = Condition()
+        self._model_manager = None
+        # model manager (with its cache of models) is not thread-safe - models are
+        # added by connections threads while dispatcher runs inference
+        self._model_manager_lock = Lock()
+        self._models_definitions: Dict[str, dict] = {}
+        self._connections: Dict[str, "HostedPipelineConnection"] = {}
+        self._pipelines_to_disconnect: List[str] = []
+        self._stop = False
+
+    def start(self) -> None:
+        # all processes must share the resource tracker of shared memory segments
+        resource_tracker.ensure_running()
+        super().start()
+
+    def get_connection_details(
+        self, timeout: float = MODEL_HOST_START_TIMEOUT
+    ) -> ModelHostConnectionDetails:
+        address = self._address_queue.get(timeout=timeout)
+        return ModelHostConnectionDetails(address=address, authkey=self._authkey)
+
+    def run(self) -> None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, self._handle_termination_signal)
+        self._model_manager = initialise_model_manager()
+        listener = Listener(authkey=self._authkey)
+        Thread(target=self._accept_connections, args=(listener,), daemon=True).start()
+        self._address_queue.put(listener.address)
+        logger.info(f"Shared model host is ready at {listener.address}")
+        self._dispatch_batches()
+
+    def _handle_termination_signal(self, signal_number: int, frame: FrameType) -> None:
+        self._stop = True
+
+    def _accept_connections(self, listener: Listener) -> None:
+        while True:
+            try:
+                connection = listener.accept()
+            except (OSError, EOFError) as error:
+                logger.warning(f"Could not accept model host connection: {error}")
+                continue
+            Thread(
+                target=self._serve_connection, args=(connection,), daemon=True
+            ).start()
+
+    def _serve_connection(self, connection: Connection) -> None:
+        try:
+            _, command, payload = connection.recv()
+            if command is not ModelHostCommand.HELLO:
+                connection.close()
+                return None
+        except (EOFError, OSError):
+            return None
+        pipeline_id = payload["pipeline_id"]
+        hosted_connection = HostedPipelineConnection(
+            pipeline_id=pipeline_id, connection=connection
+        )
+        with self._condition:
+            self._connections[pipeline_id] = hosted_connection
+        self._statistics.register_pipeline(pipeline_id=pipeline_id)
+        logger.info(f"Pipeline {pipeline_id} connected to shared model host")
+        try:
+            while True:
+                request_id, command, payload = connection.recv()
+                if command is ModelHostCommand.DISCONNECT:
+                    break
+                self._handle_command(
+                    hosted_connection=hosted_connection,
+                    request_id=request_id,
+                    command=command,
+                    payload=payload,
+                )
+        except (EOFError, OSError):
+            pass
+        logger.info(f"Pipeline {pipeline_id} disconnected from shared model host")
+        with self._condition:
+            # shared memory must be closed by dispatcher - between batches
+            self._pipelines_to_disconnect.append(pipeline_id)
+            self._condition.notify_all()
+
+    def _handle_command(
+        self,
+        hosted_connection: "HostedPipelineConnection",
+        request_id: str,
+        command: ModelHostCommand,
+        payload: dict,
+    ) -> None:
+        if command is ModelHostCommand.REPORT:
+            self._statistics.record_pipeline_memory(
+                pipeline_id=hosted_connection.pipeline_id,
+                shared_memory_bytes=payload["shared_memory_bytes"],
+                process_peak_memory_bytes=payload["process_peak_memory_bytes"],
+            )
+            report = self._statistics.get_report(
+                pipeline_id=hosted_connection.pipeline_id
+            )
+            return hosted_connection.respond(request_id=request_id, result=report)
+        if command is ModelHostCommand.ADD_MODEL:
+            try:
+                with self._model_manager_lock:
+                    self._model_manager.add_model(**payload)
+                    model_alias = payload.get("model_id_alias")
+                    self._models_definitions[model_alias or payload["model_id"]] = (
+                        payload
+                    )
+                return hosted_connection.respond(request_id=request_id, result=None)
+            except Exception as error:
+                return hosted_connection.respond_error(
+                    request_id=request_id, error=error
+                )
+        if command is ModelHostCommand.INFER:
+            frames_ring = payload.get("frames_ring")
+            if frames_ring is not None:
+                hosted_connection.attach_frames_ring(*frames_ring)
+            pending_inference = PendingInference(
+                request_id=request_id,
+                pipeline_id=hosted_connection.pipeline_id,
+                model_id=payload["model_id"],
+                request=payload["request"],
+                images=payload["images"],
+                single_image=payload["single_image"],
+                submitted_at=time.monotonic(),
+            )
+            with self._condition:
+                self._scheduler.submit(
+                    group_key=get_batching_key(pending_inference=pending_inference),
+                    pending_inference=pending_inference,
+                )
+                self._condition.notify_all()
+            return None
+        hosted_connection.respond_error(
+            request_id=request_id,
+            error=ModelHostError(f"Command {command} not supported by model host"),
+        )
+
+    def _dispatch_batches(self) -> None:
+        while True:
+            with self._condition:
+                batch = self._wait_for_batch()
+                if batch is None:
+                    return None
+                connections = dict(self._connections)
+            if not batch:
+                continue
+            try:
+                self._execute_batch(batch=batch, connections=connections)
+            except Exception as error:
+                # dispatcher must survive - otherwise all pipelines would hang
+                logger.exception(
+                    f"Could not execute batch of shared model host: {error}"
+                )
+
+    def _wait_for_batch(self) -> Optional[List[PendingInference]]:
+        while not self._stop:
+            self._disconnect_pipelines()
+            oldest = self._scheduler.oldest_submission()
+            if oldest is None:
+                # signal may be delivered to other thread - wait must not block forever
+                self._condition.wait(timeout=IDLE_WAIT_TIMEOUT)
+                continue
+            group_key, submitted_at = oldest
+            waiting_time = time.monotonic() - submitted_at
+            if (
+                self._scheduler.is_batch_full(group_key=group_key)
+                or waiting_time >= self._batch_collection_timeout
+            ):
+                return self._scheduler.next_batch(group_key=group_key)
+            self._condition.wait(timeout=self._batch_collection_timeout - waiting_time)
+        return None
+
+    def _disconnect_pipelines(self) -> None:
+        while self._pipelines_to_disconnect:
+            pipeline_id = self._pipelines_to_disconnect.pop()
+            self._scheduler.remove_pipeline(pipeline_id=pipeline_id)
+            hosted_connection = self._connections.pop(pipeline_id, None)
+            if hosted_connection is not None:
+                hosted_connection.close()
+            self._statistics.unregister_pipeline(pipeline_id=pipeline_id)
+
+    def _execute_batch(
+        self,
+        batch: List[PendingInference],
+        connections: Dict[str, "HostedPipelineConnection"],
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            responses = self._infer(batch=batch, connections=connections)
+            if len(batch) == 1:
+                results = [responses]
+            else:
+                results = split_batch_responses(batch=batch, responses=responses)
+            if results is None:
+                logger.warning(
+                    f"Model {batch[0].model_id} did not respond for each image of batch "
+                    f"- requests are executed one by one"
+                )
+                for pending_inference in batch:
+                    self._execute_batch(
+                        batch=[pending_inference], connections=connections
+                    )
+                return None
+        except Exception as error:
+            for pending_inference in batch:
+                self._respond_error(
+                    connections=connections,
+                    pending_inference=pending_inference,
+                    error=error,
+                )
+            return None
+        self._statistics.record_batch(batch=batch, duration=time.perf_counter() - start)
+        for pending_inference, result in zip(batch, results):
+            hosted_connection = connections.get(pending_inference.pipeline_id)
+            if hosted_connection is not None:
+                hosted_connection.respond(
+                    request_id=pending_inference.request_id, result=result
+                )
+
+    def _infer(
+        self,
+        batch: List[PendingInference],
+        connections: Dict[str, "HostedPipelineConnection"],
+    ) -> Any:
+        images = []
+        for pending_inference in batch:
+            images.extend(
+                connections[pending_inference.pipeline_id].resolve_images(
+                    images=pending_inference.images
+                )
+            )
+        request = batch[0].request
+        if images:
+            if len(batch) == 1 and batch[0].single_image:
+                # request not merged with others is executed as submitted
+                images = images[0]
+            request = request.model_copy(update={"image": images})
+        with self._model_manager_lock:
+            self._ensure_model_loaded(model_id=batch[0].model_id)
+            return self._model_manager.infer_from_request_sync(
+                model_id=batch[0].model_id, request=request
+            )
+
+    def _ensure_model_loaded(self, model_id: str) -> None:
+        # all pipelines share the cache of models of fixed size - model added by one
+        # pipeline may be evicted by models of others, so it is loaded back on demand
+        model_definition = self._models_definitions.get(model_id)
+        if model_definition is None or model_id in self._model_manager:
+            return None
+        logger.info(f"Model {model_id} evicted from shared model host - loading back")
+        self._model_manager.add_model(**model_definition)
+
+    def _respond_error(
+        self,
+        connections: Dict[str, "HostedPipelineConnection"],
+        pending_inference: PendingInference,
+        error: Exception,
+    ) -> None:
+        hosted_connection = connections.get(pending_inference.pipeline_id)
+        if hosted_connection is not None:
+            hosted_connection.respond_error(
+                request_id=pending_inference.request_id, error=error
+            )
+
+
+class HostedPipelineConnection:
+    def __init__(self, pipeline_id: str, connection: Connection):
+        self.pipeline_id = pipeline_id
+        self._connection = connection
+        self._send_lock = Lock()
+        self._frames_ring: Optional[Tuple[shared_memory.SharedMemory, int]] = None
+
+    def attach_frames_ring(self, name: str, slot_size: int) -> None:
+        if self._frames_ring is not None and self._frames_ring[0].name == name:
+            return None
+        self._frames_ring = (shared_memory.SharedMemory(name=name), slot_size)
+
+    def resolve_images(self, images: List[Any]) -> List[Any]:
+        result = []
+        for image in images:
+            if not isinstance(image, SharedFrameReference):
+                result.append(image)
+                continue
+            segment, slot_size = self._frames_ring
+            frame = np.ndarray(
+                image.shape,
+                dtype=image.dtype,
+                buffer=segment.buf,
+                offset=image.slot * slot_size,
+            )
+            result.append(InferenceRequestImage(type="numpy_object", value=frame))
+        return result
+
+    def respond(self, request_id: str, result: Any) -> None:
+        self._send(message=(request_id, True, result))
+
+    def respond_error(self, request_id: str, error: Exception) -> None:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = ModelHostError(f"{error.__class__.__name__}: {error}")
+        self._send(message=(request_id, False, error))
+
+    def close(self) -> None:
+        self._connection.close()
+        if self._frames_ring is not None:
+            self._frames_ring[0].close()
+            self._frames_ring = None
+
+    def _send(self, message: tuple) -> None:
+        with self._send_lock:
+            try:
+                self._connection.send(message)
+            except (OSError, ValueError) as error:
+                logger.warning(
+                    f"Could not send response to pipeline {self.pipeline_id}: {error}"
+                )
+
+
+class ModelHostClient:
+    """
+    Stands in for `ModelManager` in `InferencePipeline` running Workflow - delegating
+    model loading and inference to `SharedModelHost`. Safe to be used from multiple
+    threads.
+    """
+
+    @classmethod
+    def connect(
+        cls,
+        connection_details: ModelHostConnectionDetails,
+        pipeline_id: str,
+        frames_ring_size: int = MODEL_HOST_FRAMES_RING_SIZE,
+    ) -> "ModelHostClient":
+        connection = Client(
+            connection_details.address, authkey=connection_details.authkey
+        )
+        client = cls(
+            connection=connection,
+            pipeline_id=pipeline_id,
+            frames_ring_size=frames_ring_size,
+        )
+        client.start()
+        return client
+
+    def __init__(self, connection: Connection, pipeline_id: str, frames_ring_size: int):
+        self._connection = connection
+        self._pipeline_id = pipeline_id
+        self._frames_ring_size = frames_ring_size
+        self._frames_ring: Optional[SharedMemoryFramesRing] = None
+        self._frames_ring_lock = Lock()
+        self._send_lock = Lock()
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = Lock()
+        self._loaded_models = set()
+        self._receiver_thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        self._receiver_thread = Thread(target=self._receive_responses, daemon=True)
+        self._receiver_thread.start()
+        self._send(
+            message=(None, ModelHostCommand.HELLO, {"pipeline_id": self._pipeline_id})
+        )
+
+    def add_model(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        resolved_identifier = model_id if model_id_alias is None else model_id_alias
+        if resolved_identifier in self._loaded_models:
+            # host loads the model back on its own if it gets evicted from its cache
+            return None
+        self._execute(
+            command=ModelHostCommand.ADD_MODEL,
+            payload={
+                "model_id": model_id,
+                "api_key": api_key,
+                "model_id_alias": model_id_alias,
+            },
+        )
+        self._loaded_models.add(resolved_identifier)
+
+    def infer_from_request_sync(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> Any:
+        request_images = getattr(request, "image", None)
+        single_image = not isinstance(request_images, list)
+        images = [request_images] if single_image else request_images
+        if request_images is None:
+            images = []
+        # slots stay taken as long as views are referenced - until response arrives
+        frames_views, exported_images = [], []
+        for image in images:
+            frame_view = self._write_to_frames_ring(image=image)
+            if frame_view is None:
+                exported_images.append(image)
+                continue
+            frames_views.append(frame_view)
+            exported_images.append(frame_view[1])
+        payload = {
+            "model_id": model_id,
+            "request": (
+                request.model_copy(update={"image": None}) if images else request
+            ),
+            "images": exported_images,
+            "single_image": single_image,
+        }
+        if frames_views:
+            payload["frames_ring"] = (
+                self._frames_ring.name,
+                self._frames_ring.slot_size,
+            )
+        try:
+            return self._execute(command=ModelHostCommand.INFER, payload=payload)
+        finally:
+            del frames_views
+
+    @property
+    def shared_memory_bytes(self) -> int:
+        if self._frames_ring is None:
+            return 0
+        return self._frames_ring.slot_size * self._frames_ring_size
+
+    def get_report(self) -> dict:
+        return self._execute(
+            command=ModelHostCommand.REPORT,
+            payload={
+                "shared_memory_bytes": self.shared_memory_bytes,
+                "process_peak_memory_bytes": get_peak_memory_usage(),
+            },
+        )
+
+    def close(self) -> None:
+        # host closes its end of connection in response - which stops receiver thread
+        try:
+            self._send(message=(None, ModelHostCommand.DISCONNECT, None))
+        except (OSError, ValueError):
+            pass
+        if self._receiver_thread is not None:
+            self._receiver_thread.join(timeout=MODEL_HOST_DISCONNECT_TIMEOUT)
+        self._connection.close()
+        if self._frames_ring is not None:
+            self._frames_ring.release()
+
+    def _write_to_frames_ring(
+        self, image: Any
+    ) -> Optional[Tuple[np.ndarray, SharedFrameReference]]:
+        value = getattr(image, "value", None)
+        if getattr(image, "type", None) != "numpy_object" or not isinstance(
+            value, np.ndarray
+        ):
+            return None
+        with self._frames_ring_lock:
+            if self._frames_ring is None and self._frames_ring_size > 0:
+                self._frames_ring = SharedMemoryFramesRing(
+                    slot_size=value.nbytes, slots=self._frames_ring_size
+                )
+        if self._frames_ring is None or value.nbytes > self._frames_ring.slot_size:
+            return None
+        slot = self._frames_ring.acquire_slot()
+        if slot is None:
+            # all slots in use - image will be transferred by copy
+            return None
+        frame = self._frames_ring.wrap_slot(
+            slot=slot, shape=value.shape, dtype=value.dtype.str
+        )
+        frame[...] = value
+        return frame, SharedFrameReference(
+            slot=slot, shape=value.shape, dtype=value.dtype.str
+        )
+
+    def _execute(self, command: ModelHostCommand, payload: dict) -> Any:
+        request_id = str(uuid4())
+        future = Future()
+        with self._pending_lock:
+            self._pending[request_id] = future
+        try:
+            self._send(message=(request_id, command, payload))
+        except (OSError, ValueError) as error:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise ModelHostError(
+                f"Could not communicate with shared model host: {error}"
+            ) from error
+        try:
+            return future.result(timeout=MODEL_HOST_RESPONSE_TIMEOUT)
+        except FutureTimeoutError as error:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise ModelHostError(
+                f"Shared model host did not respond to {command.value} command within "
+                f"{MODEL_HOST_RESPONSE_TIMEOUT}s"
+            ) from error
+
+    def _send(self, message: tuple) -> None:
+        with self._send_lock:
+            self._connection.send(message)
+
+    def _receive_responses(self) -> None:
+        try:
+            while True:
+                request_id, success, result = self._connection.recv()
+                with self._pending_lock:
+                    future = self._pending.pop(request_id, None)
+                if future is None:
+                    continue
+                if success:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+        except (EOFError, OSError):
+            pass
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(
+                ModelHostError("Connection to shared model host was closed")
+            )
+
+
+def get_batching_key(pending_inference: PendingInference) -> GroupKey:
+    request = pending_inference.request
+    if not isinstance(request, BATCHABLE_REQUEST_TYPES) or (
+        getattr(request, "image", None) is None and not pending_inference.images
+    ):
+        # requests without images (or of models not responding for each image)
+        # are not batched
+        return (pending_inference.model_id, pending_inference.request_id)
+    parameters = request.model_dump(exclude=BATCHING_EXCLUDED_REQUEST_FIELDS)
+    return (
+        pending_inference.model_id,
+        type(request).__name__,
+        repr(sorted(parameters.items())),
+    )
+
+
+def split_batch_responses(
+    batch: List[PendingInference], responses: Any
+) -> Optional[List[Any]]:
+    """
+    Splits responses of merged batch into results of each of inferences - returns None if
+    model did not respond with exactly one response for each image of the batch.
+    """
+    if not isinstance(responses, list) or len(responses) != sum(
+        pending_inference.images_count for pending_inference in batch
+    ):
+        return None
+    results, responses_offset = [], 0
+    for pending_inference in batch:
+        images_count = pending_inference.images_count
+        inference_responses = responses[
+            responses_offset : responses_offset + images_count
+        ]
+        responses_offset += images_count
+        if pending_inference.single_image:
+            inference_responses = inference_responses[0]
+        results.append(inference_responses)
+    return results
+
+
+def initialise_model_manager() -> Any:
+    from inference.core.cache import cache
+    from inference.core.env import MAX_ACTIVE_MODELS
+    from inference.core.managers.active_learning import (
+        BackgroundTaskActiveLearningManager,
+    )
+    from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+    from inference.core.registries.roboflow import RoboflowModelRegistry
+    from inference.models.utils import ROBOFLOW_MODEL_TYPES
+
+    model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+    model_manager = BackgroundTaskActiveLearningManager(
+        model_registry=model_registry, cache=cache
+    )
+    return WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
@@ -1,7 +1,9 @@
 import json
+import re
+import struct
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from inference.core.interfaces.stream_manager.manager_app.entities import (
     ENCODING,
@@ -13,6 +15,22 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     ErrorType,
     OperationStatus,
 )
+from inference.core.interfaces.stream_manager.manager_app.errors import (
+    MalformedPayloadError,
+)
+from inference.core.utils.image_utils import encode_image_to_jpeg_bytes
+from inference.core.workflows.execution_engine.entities.base import WorkflowImageData
+
+# Binary frame: magic, size of JSON document and number of binary segments, followed by
+# sizes of segments, the document and raw segments. Bytes found in the payload are moved
+# into segments and replaced in the document with {"$segment": <index>} references.
+# Single-key dicts of the payload using such key (or its escaped form) are escaped with
+# additional "$" prefix of the key - so that they are not mistaken with references.
+BINARY_FRAME_MAGIC = b"RFBF"
+BINARY_FRAME_PREAMBLE = struct.Struct(">4sII")
+BINARY_SEGMENT_SIZE = struct.Struct(">Q")
+SEGMENT_REFERENCE_KEY = "$segment"
+SEGMENT_REFERENCE_PATTERN = re.compile(rb'\{"\$+segment":')
 
 
 def serialise_to_json(obj: Any) -> Any:
@@ -41,23 +59,155 @@ def describe_error(
 
 
 def prepare_error_response(
-    request_id: str, error: Exception, error_type: ErrorType, pipeline_id: Optional[str]
+    request_id: str,
+    error: Exception,
+    error_type: ErrorType,
+    pipeline_id: Optional[str],
+    binary: bool = False,
 ) -> bytes:
     error_description = describe_error(exception=error, error_type=error_type)
     return prepare_response(
-        request_id=request_id, response=error_description, pipeline_id=pipeline_id
+        request_id=request_id,
+        response=error_description,
+        pipeline_id=pipeline_id,
+        binary=binary,
     )
 
 
 def prepare_response(
-    request_id: str, response: dict, pipeline_id: Optional[str]
+    request_id: str,
+    response: dict,
+    pipeline_id: Optional[str],
+    binary: bool = False,
 ) -> bytes:
-    payload = json.dumps(
-        {
-            REQUEST_ID_KEY: request_id,
-            RESPONSE_KEY: response,
-            PIPELINE_ID_KEY: pipeline_id,
-        },
-        default=serialise_to_json,
-    )
+    document = {
+        REQUEST_ID_KEY: request_id,
+        RESPONSE_KEY: response,
+        PIPELINE_ID_KEY: pipeline_id,
+    }
+    if binary:
+        return encode_binary_frame(document=document)
+    payload = json.dumps(document, default=serialise_to_json)
     return payload.encode(ENCODING)
+
+
+def serialise_image_to_bytes(image: WorkflowImageData) -> Dict[str, Any]:
+    # JPEG bytes travel as binary segment - the client turns them into base64 string,
+    # so consumers receive the same payload as with JSON responses
+    return {
+        "type": "base64",
+        "value": encode_image_to_jpeg_bytes(image.numpy_image),
+    }
+
+
+def encode_binary_frame(document: dict) -> bytes:
+    segments: List[bytes] = []
+
+    def serialise(obj: Any) -> Any:
+        if isinstance(obj, (bytes, bytearray)):
+            segments.append(obj)
+            return {SEGMENT_REFERENCE_KEY: len(segments) - 1}
+        return serialise_to_json(obj)
+
+    encoded_document = json.dumps(
+        document, default=serialise, separators=(",", ":")
+    ).encode(ENCODING)
+    if len(SEGMENT_REFERENCE_PATTERN.findall(encoded_document)) > len(segments):
+        # payload itself contains dicts looking like references - slow path is taken
+        # only in such (rare) case
+        segments = []
+        encoded_document = json.dumps(
+            escape_segment_references(obj=document),
+            default=serialise,
+            separators=(",", ":"),
+        ).encode(ENCODING)
+    preamble = BINARY_FRAME_PREAMBLE.pack(
+        BINARY_FRAME_MAGIC, len(encoded_document), len(segments)
+    )
+    segments_sizes = [BINARY_SEGMENT_SIZE.pack(len(segment)) for segment in segments]
+    return b"".join([preamble, *segments_sizes, encoded_document, *segments])
+
+
+def escape_segment_references(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        escaped = {
+            key: escape_segment_references(obj=value) for key, value in obj.items()
+        }
+        if len(escaped) == 1:
+            key = next(iter(escaped))
+            if is_segment_reference_key(key=key):
+                return {f"${key}": escaped[key]}
+        return escaped
+    if isinstance(obj, (list, tuple)):
+        return [escape_segment_references(obj=element) for element in obj]
+    return obj
+
+
+def is_segment_reference_key(key: Any) -> bool:
+    return (
+        isinstance(key, str)
+        and key.endswith(SEGMENT_REFERENCE_KEY)
+        and key.strip("$") == SEGMENT_REFERENCE_KEY[1:]
+    )
+
+
+def is_binary_frame(payload: Union[bytes, bytearray]) -> bool:
+    return payload[: len(BINARY_FRAME_MAGIC)] == BINARY_FRAME_MAGIC
+
+
+def deserialise_payload(
+    payload: Union[bytes, bytearray],
+    segment_decoder: Callable[[memoryview], Any] = bytes,
+) -> dict:
+    if is_binary_frame(payload=payload):
+        return decode_binary_frame(payload=payload, segment_decoder=segment_decoder)
+    try:
+        return json.loads(payload)
+    except ValueError as error:
+        raise MalformedPayloadError(
+            public_message="Received payload that is not in a JSON format",
+            private_message="Received payload that is not in a JSON format",
+            inner_error=error,
+        )
+
+
+def decode_binary_frame(
+    payload: Union[bytes, bytearray],
+    segment_decoder: Callable[[memoryview], Any] = bytes,
+) -> dict:
+    view = memoryview(payload)
+    try:
+        _, document_size, segments_number = BINARY_FRAME_PREAMBLE.unpack_from(view)
+        offset = BINARY_FRAME_PREAMBLE.size
+        segments_sizes = []
+        for _ in range(segments_number):
+            segments_sizes.append(BINARY_SEGMENT_SIZE.unpack_from(view, offset)[0])
+            offset += BINARY_SEGMENT_SIZE.size
+        document = view[offset : offset + document_size]
+        offset += document_size
+        segments = []
+        for segment_size in segments_sizes:
+            segments.append(segment_decoder(view[offset : offset + segment_size]))
+            offset += segment_size
+        if offset != len(view):
+            raise ValueError(
+                f"Declared frame size: {offset} does not match received size: {len(view)}"
+            )
+
+        def resolve_segments(obj: dict) -> Any:
+            if len(obj) != 1:
+                return obj
+            if SEGMENT_REFERENCE_KEY in obj:
+                return segments[obj[SEGMENT_REFERENCE_KEY]]
+            key = next(iter(obj))
+            if is_segment_reference_key(key=key):
+                return {key[1:]: obj[key]}
+            return obj
+
+        return json.loads(bytes(document), object_hook=resolve_segments)
+    except (struct.error, ValueError, IndexError, TypeError) as error:
+        raise MalformedPayloadError(
+            public_message="Received binary frame that could not be decoded",
+            private_message=f"Received binary frame that could not be decoded. Cause: {error}",
+            inner_error=error,
+        )
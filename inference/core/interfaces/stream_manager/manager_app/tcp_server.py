@@ -1,6 +1,6 @@
 import socket
 from socketserver import BaseRequestHandler, TCPServer
-from typing import Any, Optional, Tuple, Type
+from typing import Any, Optional, Set, Tuple, Type
 
 
 class RoboflowTCPServer(TCPServer):
@@ -12,8 +12,22 @@ class RoboflowTCPServer(TCPServer):
     ):
         TCPServer.__init__(self, server_address, handler_class)
         self._socket_operations_timeout = socket_operations_timeout
+        self._detached_requests: Set[int] = set()
 
     def get_request(self) -> Tuple[socket.socket, Any]:
         connection, address = self.socket.accept()
         connection.settimeout(self._socket_operations_timeout)
         return connection, address
+
+    def detach_request(self, request: socket.socket) -> None:
+        """
+        Makes the server leave the connection open once handler finishes - ownership
+        of the connection (including closing it) is passed to the caller.
+        """
+        self._detached_requests.add(id(request))
+
+    def shutdown_request(self, request: socket.socket) -> None:
+        if id(request) in self._detached_requests:
+            self._detached_requests.discard(id(request))
+            return None
+        super().shutdown_request(request)
@@ -12,6 +12,7 @@ from inference.core.env import DISABLE_PREPROC_AUTO_ORIENT
 from inference.core.managers.base import ModelManager
 from inference.core.registries.base import ModelRegistry
 from inference.models.aliases import resolve_roboflow_model_alias
+from inference_sdk.http.utils.post_processing import decode_columnar_predictions
 
 ACTIVE_LEARNING_ELIGIBLE_PARAM = "active_learning_eligible"
 DISABLE_ACTIVE_LEARNING_PARAM = "disable_active_learning"
@@ -133,11 +134,14 @@ class ActiveLearningManager(ModelManager):
         if not issubclass(type(inference_inputs), list):
             inference_inputs = [inference_inputs]
         if not issubclass(type(prediction), list):
-            results_dicts = [prediction.dict(by_alias=True, exclude={"visualization"})]
-        else:
-            results_dicts = [
-                e.dict(by_alias=True, exclude={"visualization"}) for e in prediction
-            ]
+            prediction = [prediction]
+        # predictions in columnar format are brought back to the regular one
+        results_dicts = [
+            decode_columnar_predictions(
+                prediction=e.dict(by_alias=True, exclude={"visualization"})
+            )
+            for e in prediction
+        ]
         prediction_type = self.get_task_type(model_id=model_id)
         disable_preproc_auto_orient = (
             getattr(request, "disable_preproc_auto_orient", False)
@@ -1,6 +1,6 @@
 from io import BytesIO
 from time import perf_counter
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -8,16 +8,22 @@ from PIL import Image, ImageDraw, ImageFont
 from inference.core.entities.requests.inference import ClassificationInferenceRequest
 from inference.core.entities.responses.inference import (
     ClassificationInferenceResponse,
+    ColumnarInferenceResponse,
     InferenceResponse,
     InferenceResponseImage,
     MultiLabelClassificationInferenceResponse,
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.columnar import (
+    columnar_predictions_requested,
+    make_columnar_classification,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
 from inference.core.utils.image_utils import load_image_rgb
+from inference.core.utils.postprocess import select_top_classes
 
 
 class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
@@ -162,6 +168,7 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             disable_preproc_grayscale=disable_preproc_grayscale,
             disable_preproc_static_crop=disable_preproc_static_crop,
             return_image_dims=return_image_dims,
+            **kwargs,
         )
 
     def postprocess(
@@ -272,6 +279,8 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         predictions,
         img_dims,
         confidence: float = 0.5,
+        top_k: Optional[int] = None,
+        filter_by_confidence: Optional[bool] = False,
         **kwargs,
     ) -> Union[ClassificationInferenceResponse, List[ClassificationInferenceResponse]]:
         """
@@ -281,6 +290,8 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             predictions (list): List of prediction arrays from the inference process.
             img_dims (list): List of tuples indicating the dimensions (width, height) of each image.
             confidence (float, optional): Confidence threshold for filtering predictions. Defaults to 0.5.
+            top_k (Optional[int], optional): If given, only `top_k` most confident classes are included in predictions. Defaults to None.
+            filter_by_confidence (Optional[bool], optional): If true, only classes with confidence above `confidence` are included in predictions. Defaults to False.
             **kwargs: Additional parameters to influence the response creation process.
 
         Returns:
@@ -291,64 +302,172 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             - If the model is not multiclass, a `ClassificationInferenceResponse` is generated for each image.
             - Predictions below the confidence threshold are filtered out.
         """
-        responses = []
+        if columnar_predictions_requested(
+            predictions_format=kwargs.get("predictions_format"),
+            visualize_predictions=kwargs.get("visualize_predictions"),
+        ):
+            return self.make_columnar_response(
+                predictions=predictions,
+                img_dims=img_dims,
+                confidence=confidence,
+                top_k=top_k,
+                filter_by_confidence=filter_by_confidence,
+            )
         confidence_threshold = float(confidence)
-        for ind, prediction in enumerate(predictions):
+        scores = self.get_classes_scores(
+            predictions=predictions, images_number=len(img_dims)
+        )
+        selected_classes = select_top_classes(
+            scores=scores,
+            top_k=top_k,
+            confidence_threshold=(
+                confidence_threshold if filter_by_confidence else None
+            ),
+        )
+        responses = []
+        for ind, (image_scores, classes_ids) in enumerate(
+            zip(scores, selected_classes)
+        ):
             if self.multiclass:
-                preds = prediction[0]
-                results = dict()
-                predicted_classes = []
-                for i, o in enumerate(preds):
-                    cls_name = self.class_names[i]
-                    score = float(o)
-                    results[cls_name] = {"confidence": score, "class_id": i}
-                    if score > confidence_threshold:
-                        predicted_classes.append(cls_name)
+                results = {
+                    self.class_names[i]: {
+                        "confidence": float(image_scores[i]),
+                        "class_id": i,
+                    }
+                    for i in np.sort(classes_ids).tolist()
+                }
                 response = MultiLabelClassificationInferenceResponse(
                     image=InferenceResponseImage(
                         width=img_dims[ind][0], height=img_dims[ind][1]
                     ),
-                    predicted_classes=predicted_classes,
+                    predicted_classes=[
+                        self.class_names[i]
+                        for i in np.flatnonzero(
+                            image_scores > confidence_threshold
+                        ).tolist()
+                    ],
                     predictions=results,
                 )
             else:
-                preds = prediction[0]
-                preds = self.softmax(preds)
-                results = []
-                for i, cls_name in enumerate(self.class_names):
-                    score = float(preds[i])
-                    pred = {
+                results = [
+                    {
                         "class_id": i,
-                        "class": cls_name,
-                        "confidence": round(score, 4),
+                        "class": self.class_names[i],
+                        "confidence": float(image_scores[i]),
                     }
-                    results.append(pred)
-                results = sorted(results, key=lambda x: x["confidence"], reverse=True)
-
+                    for i in classes_ids.tolist()
+                ]
+                top_class_id = int(np.argmax(image_scores))
                 response = ClassificationInferenceResponse(
                     image=InferenceResponseImage(
                         width=img_dims[ind][1], height=img_dims[ind][0]
                     ),
                     predictions=results,
-                    top=results[0]["class"],
-                    confidence=results[0]["confidence"],
+                    top=self.class_names[top_class_id],
+                    confidence=float(image_scores[top_class_id]),
                 )
             responses.append(response)
 
         return responses
 
+    def make_columnar_response(
+        self,
+        predictions,
+        img_dims,
+        confidence: float = 0.5,
+        top_k: Optional[int] = None,
+        filter_by_confidence: Optional[bool] = False,
+    ) -> List[ColumnarInferenceResponse]:
+        """
+        Create response objects with classification predictions in columnar format - classes
+        sorted by confidence for single-label models, in order of class ids for multi-label ones.
+
+        Args:
+            predictions (list): List of prediction arrays from the inference process.
+            img_dims (list): List of tuples indicating the dimensions (width, height) of each image.
+            confidence (float, optional): Confidence threshold for predicted classes of multi-label models. Defaults to 0.5.
+            top_k (Optional[int], optional): If given, only `top_k` most confident classes are included in predictions. Defaults to None.
+            filter_by_confidence (Optional[bool], optional): If true, only classes with confidence above `confidence` are included in predictions. Defaults to False.
+
+        Returns:
+            List[ColumnarInferenceResponse]: A list of response objects containing columns of predictions.
+        """
+        confidence_threshold = float(confidence)
+        scores = self.get_classes_scores(
+            predictions=predictions, images_number=len(img_dims)
+        )
+        selected_classes = select_top_classes(
+            scores=scores,
+            top_k=top_k,
+            confidence_threshold=(
+                confidence_threshold if filter_by_confidence else None
+            ),
+        )
+        responses = []
+        for ind, (image_scores, classes_ids) in enumerate(
+            zip(scores, selected_classes)
+        ):
+            if self.multiclass:
+                response = ColumnarInferenceResponse(
+                    image=InferenceResponseImage(
+                        width=img_dims[ind][0], height=img_dims[ind][1]
+                    ),
+                    predictions=make_columnar_classification(
+                        class_names=self.class_names,
+                        confidence=image_scores,
+                        class_id=np.sort(classes_ids),
+                    ),
+                    predicted_classes=[
+                        self.class_names[i]
+                        for i in np.flatnonzero(
+                            image_scores > confidence_threshold
+                        ).tolist()
+                    ],
+                )
+            else:
+                response = ColumnarInferenceResponse(
+                    image=InferenceResponseImage(
+                        width=img_dims[ind][1], height=img_dims[ind][0]
+                    ),
+                    predictions=make_columnar_classification(
+                        class_names=self.class_names,
+                        confidence=image_scores,
+                        class_id=classes_ids,
+                    ),
+                )
+            responses.append(response)
+        return responses
+
+    def get_classes_scores(self, predictions, images_number: int) -> np.ndarray:
+        """
+        Computes scores of classes for the whole batch at once.
+
+        Args:
+            predictions (list): List of prediction arrays from the inference process.
+            images_number (int): Number of images in the batch.
+
+        Returns:
+            np.ndarray: Array of shape (images_number, num_classes) - softmax of model outputs
+                (rounded to 4 decimal places) for single-label models and model outputs for
+                multi-label ones.
+        """
+        scores = np.asarray(predictions, dtype=np.float64).reshape(images_number, -1)
+        if self.multiclass:
+            return scores
+        return np.round(self.softmax(scores), 4)
+
     @staticmethod
     def softmax(x):
         """Compute softmax values for each set of scores in x.
 
         Args:
-            x (np.array): The input array containing the scores.
+            x (np.array): The input array containing the scores - sets of scores are expected in the last axis.
 
         Returns:
             np.array: The softmax values for each set of scores.
         """
-        e_x = np.exp(x - np.max(x))
-        return e_x / e_x.sum()
+        e_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
+        return e_x / e_x.sum(axis=-1, keepdims=True)
 
     def get_model_output_shape(self) -> Tuple[int, int, int]:
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
@@ -1,27 +1,52 @@
-from typing import Any, List, Tuple, Union
+import base64
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 
 from inference.core.entities.responses.inference import (
+    BitmaskCrop,
+    ColumnarInferenceResponse,
     InferenceResponseImage,
     InstanceSegmentationInferenceResponse,
     InstanceSegmentationPrediction,
     Point,
+    RLEMask,
 )
 from inference.core.exceptions import InvalidMaskDecodeArgument
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.columnar import (
+    columnar_predictions_requested,
+    make_columnar_detections,
+    make_columnar_detections_response,
+    predictions_to_array,
+    select_predictions_of_classes,
+)
+from inference.core.models.utils.tiling import (
+    DEFAULT_SLICE_OVERLAP_RATIO,
+    get_tiles_dims,
+    merge_tiles_predictions,
+    tiled_inference_requested,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
 from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.postprocess import (
+    get_bbox_pixels_roi,
+    get_origin_to_mask_transform,
+    mask_crop2rle,
+    mask_crops2poly,
     masks2poly,
     post_process_bboxes,
     post_process_polygons,
-    process_mask_accurate,
+    post_process_polygons_batch,
+    preprocess_segmentation_masks,
+    process_mask_accurate_roi,
     process_mask_fast,
     process_mask_tradeoff,
+    resize_mask_roi,
+    rle_counts2string,
 )
 
 DEFAULT_CONFIDENCE = 0.4
@@ -31,6 +56,8 @@ DEFAUlT_MAX_DETECTIONS = 300
 DEFAULT_MAX_CANDIDATES = 3000
 DEFAULT_MASK_DECODE_MODE = "accurate"
 DEFAULT_TRADEOFF_FACTOR = 0.0
+DEFAULT_MASK_FORMAT = "polygon"
+MASK_FORMATS = {"polygon", "rle", "bitmask"}
 
 PREDICTIONS_TYPE = List[List[List[float]]]
 
@@ -56,10 +83,15 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         disable_preproc_static_crop: bool = False,
         iou_threshold: float = DEFAULT_IOU_THRESH,
         mask_decode_mode: str = DEFAULT_MASK_DECODE_MODE,
+        mask_format: str = DEFAULT_MASK_FORMAT,
         max_candidates: int = DEFAULT_MAX_CANDIDATES,
         max_detections: int = DEFAUlT_MAX_DETECTIONS,
         return_image_dims: bool = False,
         tradeoff_factor: float = DEFAULT_TRADEOFF_FACTOR,
+        slice_width: Optional[int] = None,
+        slice_height: Optional[int] = None,
+        slice_overlap_ratio_width: float = DEFAULT_SLICE_OVERLAP_RATIO,
+        slice_overlap_ratio_height: float = DEFAULT_SLICE_OVERLAP_RATIO,
         **kwargs,
     ) -> Union[PREDICTIONS_TYPE, Tuple[PREDICTIONS_TYPE, List[Tuple[int, int]]]]:
         """
@@ -72,6 +104,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             confidence (float, optional): Confidence threshold for predictions. Defaults to 0.5.
             iou_threshold (float, optional): IoU threshold for non-maximum suppression. Defaults to 0.5.
             mask_decode_mode (str, optional): Decoding mode for masks. Choices are "accurate", "tradeoff", and "fast". Defaults to "accurate".
+            mask_format (str, optional): Format of returned masks. Choices are "polygon", "rle" (COCO RLE) and "bitmask" (bit-packed crop). Compact formats are pixel-exact masks in original image resolution, `mask_decode_mode` only applies to polygons. Defaults to "polygon".
             max_candidates (int, optional): Maximum number of candidate detections. Defaults to 3000.
             max_detections (int, optional): Maximum number of detections after non-maximum suppression. Defaults to 300.
             return_image_dims (bool, optional): Whether to return the dimensions of the processed images. Defaults to False.
@@ -80,13 +113,17 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             disable_preproc_contrast (bool, optional): If true, the auto contrast preprocessing step is disabled for this call. Default is False.
             disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
             disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            slice_width (Optional[int], optional): Width of slices for tiled inference - if given together with `slice_height`, each image is split into overlapping slices, inferred in batches and merged with NMS in coordinates of the image. Defaults to None.
+            slice_height (Optional[int], optional): Height of slices for tiled inference. Defaults to None.
+            slice_overlap_ratio_width (float, optional): Minimal overlap of neighbouring slices, relative to slice width. Defaults to 0.2.
+            slice_overlap_ratio_height (float, optional): Minimal overlap of neighbouring slices, relative to slice height. Defaults to 0.2.
             **kwargs: Additional parameters to customize the inference process.
 
         Returns:
             Union[List[List[List[float]]], Tuple[List[List[List[float]]], List[Tuple[int, int]]]]: The list of predictions, with each prediction being a list of lists. Optionally, also returns the dimensions of the processed images.
 
         Raises:
-            InvalidMaskDecodeArgument: If an invalid `mask_decode_mode` is provided or if the `tradeoff_factor` is outside the allowed range.
+            InvalidMaskDecodeArgument: If an invalid `mask_decode_mode` or `mask_format` is provided or if the `tradeoff_factor` is outside the allowed range.
 
         Notes:
             - Processes input images and normalizes them.
@@ -94,6 +131,30 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             - Applies non-maximum suppression to the predictions.
             - Decodes the masks according to the specified mode.
         """
+        if tiled_inference_requested(
+            slice_width=slice_width, slice_height=slice_height
+        ):
+            return self.infer_tiled(
+                image,
+                slice_width=slice_width,
+                slice_height=slice_height,
+                slice_overlap_ratio_width=slice_overlap_ratio_width,
+                slice_overlap_ratio_height=slice_overlap_ratio_height,
+                class_agnostic_nms=class_agnostic_nms,
+                confidence=confidence,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+                iou_threshold=iou_threshold,
+                mask_decode_mode=mask_decode_mode,
+                mask_format=mask_format,
+                max_candidates=max_candidates,
+                max_detections=max_detections,
+                tradeoff_factor=tradeoff_factor,
+                predictions_format=kwargs.get("predictions_format"),
+                visualize_predictions=kwargs.get("visualize_predictions"),
+            )
         return super().infer(
             image,
             class_agnostic_nms=class_agnostic_nms,
@@ -104,10 +165,13 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             disable_preproc_static_crop=disable_preproc_static_crop,
             iou_threshold=iou_threshold,
             mask_decode_mode=mask_decode_mode,
+            mask_format=mask_format,
             max_candidates=max_candidates,
             max_detections=max_detections,
             return_image_dims=return_image_dims,
             tradeoff_factor=tradeoff_factor,
+            predictions_format=kwargs.get("predictions_format"),
+            visualize_predictions=kwargs.get("visualize_predictions"),
         )
 
     def postprocess(
@@ -133,65 +197,311 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         masks = []
         mask_decode_mode = kwargs["mask_decode_mode"]
         tradeoff_factor = kwargs["tradeoff_factor"]
+        mask_format = kwargs.get("mask_format", DEFAULT_MASK_FORMAT)
         img_in_shape = preprocess_return_metadata["im_shape"]
+        if mask_format not in MASK_FORMATS:
+            raise InvalidMaskDecodeArgument(
+                f"Invalid mask_format: {mask_format}. Must be one of {sorted(MASK_FORMATS)}"
+            )
 
         predictions = [np.array(p) for p in predictions]
-
-        for pred, proto, img_dim in zip(
-            predictions, protos, preprocess_return_metadata["img_dims"]
-        ):
-            if pred.size == 0:
-                masks.append([])
-                continue
-            if mask_decode_mode == "accurate":
-                batch_masks = process_mask_accurate(
-                    proto, pred[:, 7:], pred[:, :4], img_in_shape[2:]
+        img_dims = preprocess_return_metadata["img_dims"]
+        disable_preproc_static_crop = preprocess_return_metadata[
+            "disable_preproc_static_crop"
+        ]
+        polys, output_mask_shape = [], None
+        if mask_format == "polygon":
+            # polygons are decoded from boxes in inference input coordinates
+            for pred, proto in zip(predictions, protos):
+                if pred.size == 0:
+                    polys.append([])
+                    continue
+                image_polys, output_mask_shape = self.decode_polygons(
+                    proto=proto,
+                    pred=pred,
+                    infer_shape=img_in_shape[2:],
+                    mask_decode_mode=mask_decode_mode,
+                    tradeoff_factor=tradeoff_factor,
+                )
+                polys.append(image_polys)
+        boxes = post_process_bboxes(
+            [pred[:, :4] if pred.size > 0 else [] for pred in predictions],
+            infer_shape,
+            img_dims,
+            self.preproc,
+            resize_method=self.resize_method,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        )
+        for pred, image_boxes in zip(predictions, boxes):
+            if pred.size > 0:
+                pred[:, :4] = image_boxes
+        if mask_format == "polygon":
+            if output_mask_shape is None:
+                masks = polys
+            else:
+                # masks of all images of the batch are decoded into the same shape
+                masks = post_process_polygons_batch(
+                    polygons=polys,
+                    img_dims=img_dims,
+                    infer_shape=output_mask_shape,
+                    preproc=self.preproc,
+                    disable_preproc_static_crop=disable_preproc_static_crop,
+                    resize_method=self.resize_method,
                 )
-                output_mask_shape = img_in_shape[2:]
-            elif mask_decode_mode == "tradeoff":
-                if not 0 <= tradeoff_factor <= 1:
-                    raise InvalidMaskDecodeArgument(
-                        f"Invalid tradeoff_factor: {tradeoff_factor}. Must be in [0.0, 1.0]"
+        else:
+            for pred, proto, img_dim in zip(predictions, protos, img_dims):
+                if pred.size == 0:
+                    masks.append([])
+                    continue
+                masks.append(
+                    self.encode_masks(
+                        proto=proto,
+                        pred=pred,
+                        img_dim=img_dim,
+                        infer_shape=img_in_shape[2:],
+                        mask_format=mask_format,
+                        disable_preproc_static_crop=disable_preproc_static_crop,
                     )
-                batch_masks = process_mask_tradeoff(
-                    proto,
-                    pred[:, 7:],
-                    pred[:, :4],
-                    img_in_shape[2:],
-                    tradeoff_factor,
                 )
-                output_mask_shape = batch_masks.shape[1:]
-            elif mask_decode_mode == "fast":
-                batch_masks = process_mask_fast(
-                    proto, pred[:, 7:], pred[:, :4], img_in_shape[2:]
+        return self.make_response(predictions, masks, img_dims, **kwargs)
+
+    def postprocess_tiles(
+        self,
+        predictions: Tuple[np.ndarray, np.ndarray],
+        preprocess_return_metadata: PreprocessReturnMetadata,
+        **kwargs,
+    ) -> List[InstanceSegmentationInferenceResponse]:
+        """
+        Postprocesses predictions of tiles - boxes are scaled into coordinates of tiles,
+        shifted by tiles origins and merged with single NMS for each image. Masks are decoded
+        only for detections selected by NMS.
+        """
+        predictions, protos = predictions
+        predictions = w_np_non_max_suppression(
+            predictions,
+            conf_thresh=kwargs["confidence"],
+            iou_thresh=kwargs["iou_threshold"],
+            class_agnostic=kwargs["class_agnostic_nms"],
+            max_detections=kwargs["max_detections"],
+            max_candidate_detections=kwargs["max_candidates"],
+            num_masks=self.num_masks,
+        )
+        mask_format = kwargs.get("mask_format", DEFAULT_MASK_FORMAT)
+        if mask_format not in MASK_FORMATS:
+            raise InvalidMaskDecodeArgument(
+                f"Invalid mask_format: {mask_format}. Must be one of {sorted(MASK_FORMATS)}"
+            )
+        predictions = [np.array(p) for p in predictions]
+        tiles = preprocess_return_metadata["tiles"]
+        tiles_dims = get_tiles_dims(tiles=tiles)
+        tiles_boxes = post_process_bboxes(
+            [pred[:, :4] if pred.size > 0 else [] for pred in predictions],
+            (self.img_size_h, self.img_size_w),
+            tiles_dims,
+            self.preproc,
+            resize_method=self.resize_method,
+            disable_preproc_static_crop=True,
+        )
+        tiles_predictions = []
+        for pred, tile_boxes in zip(predictions, tiles_boxes):
+            tile_predictions = pred.copy()
+            if pred.size > 0:
+                tile_predictions[:, :4] = tile_boxes
+            tiles_predictions.append(tile_predictions)
+        img_dims = preprocess_return_metadata["img_dims"]
+        merged_predictions = merge_tiles_predictions(
+            tiles_predictions=tiles_predictions,
+            tiles=tiles,
+            tiles_images_indices=preprocess_return_metadata["tiles_images_indices"],
+            images_number=len(img_dims),
+            iou_threshold=kwargs["iou_threshold"],
+            class_agnostic=kwargs["class_agnostic_nms"],
+            max_detections=kwargs["max_detections"],
+        )
+        masks = []
+        for (_, sources), img_dim in zip(merged_predictions, img_dims):
+            image_masks = [None] * len(sources)
+            for tile_index in np.unique(sources[:, 0]).tolist():
+                selected = np.flatnonzero(sources[:, 0] == tile_index)
+                tile_masks = self.decode_tile_masks(
+                    proto=protos[tile_index],
+                    pred=predictions[tile_index][sources[selected, 1]],
+                    tile_pred=tiles_predictions[tile_index][sources[selected, 1]],
+                    tile=tiles[tile_index],
+                    tile_dim=tiles_dims[tile_index],
+                    img_dim=img_dim,
+                    infer_shape=preprocess_return_metadata["im_shape"][2:],
+                    mask_format=mask_format,
+                    mask_decode_mode=kwargs["mask_decode_mode"],
+                    tradeoff_factor=kwargs["tradeoff_factor"],
                 )
-                output_mask_shape = batch_masks.shape[1:]
-            else:
+                for index, mask in zip(selected.tolist(), tile_masks):
+                    image_masks[index] = mask
+            masks.append(image_masks)
+        predictions = [image_predictions for image_predictions, _ in merged_predictions]
+        return self.make_response(predictions, masks, img_dims, **kwargs)
+
+    def decode_tile_masks(
+        self,
+        proto: np.ndarray,
+        pred: np.ndarray,
+        tile_pred: np.ndarray,
+        tile: np.ndarray,
+        tile_dim: Tuple[int, int],
+        img_dim: Tuple[int, int],
+        infer_shape: Tuple[int, int],
+        mask_format: str,
+        mask_decode_mode: str,
+        tradeoff_factor: float,
+    ) -> list:
+        """
+        Decodes masks of predictions of tile (`pred` with boxes in inference input coordinates
+        and `tile_pred` - with boxes in coordinates of tile) into masks in coordinates of image.
+        """
+        if mask_format != "polygon":
+            return self.encode_masks(
+                proto=proto,
+                pred=tile_pred,
+                img_dim=tile_dim,
+                infer_shape=infer_shape,
+                mask_format=mask_format,
+                disable_preproc_static_crop=True,
+                origin_offset=(tile[0], tile[1]),
+                origin_shape=img_dim,
+            )
+        polys, output_mask_shape = self.decode_polygons(
+            proto=proto,
+            pred=pred,
+            infer_shape=infer_shape,
+            mask_decode_mode=mask_decode_mode,
+            tradeoff_factor=tradeoff_factor,
+        )
+        polys = post_process_polygons(
+            tile_dim,
+            polys,
+            output_mask_shape,
+            {},
+            resize_method=self.resize_method,
+        )
+        return [poly + tile[:2] for poly in polys]
+
+    def decode_polygons(
+        self,
+        proto: np.ndarray,
+        pred: np.ndarray,
+        infer_shape: Tuple[int, int],
+        mask_decode_mode: str,
+        tradeoff_factor: float,
+    ) -> Tuple[List[np.ndarray], Tuple[int, int]]:
+        """
+        Decodes masks of predictions (with boxes in inference input coordinates) into polygons.
+
+        Returns:
+            Tuple[List[np.ndarray], Tuple[int, int]]: Polygons and shape of the space polygons are expressed in.
+        """
+        if mask_decode_mode == "accurate":
+            polys = mask_crops2poly(
+                process_mask_accurate_roi(proto, pred[:, 7:], pred[:, :4], infer_shape)
+            )
+            output_mask_shape = infer_shape
+        elif mask_decode_mode == "tradeoff":
+            if not 0 <= tradeoff_factor <= 1:
                 raise InvalidMaskDecodeArgument(
-                    f"Invalid mask_decode_mode: {mask_decode_mode}. Must be one of ['accurate', 'fast', 'tradeoff']"
+                    f"Invalid tradeoff_factor: {tradeoff_factor}. Must be in [0.0, 1.0]"
                 )
-            polys = masks2poly(batch_masks)
-            pred[:, :4] = post_process_bboxes(
-                [pred[:, :4]],
+            batch_masks = process_mask_tradeoff(
+                proto,
+                pred[:, 7:],
+                pred[:, :4],
                 infer_shape,
-                [img_dim],
-                self.preproc,
-                resize_method=self.resize_method,
-                disable_preproc_static_crop=preprocess_return_metadata[
-                    "disable_preproc_static_crop"
-                ],
-            )[0]
-            polys = post_process_polygons(
-                img_dim,
-                polys,
-                output_mask_shape,
-                self.preproc,
-                resize_method=self.resize_method,
+                tradeoff_factor,
+            )
+            polys = masks2poly(batch_masks)
+            output_mask_shape = batch_masks.shape[1:]
+        elif mask_decode_mode == "fast":
+            batch_masks = process_mask_fast(
+                proto, pred[:, 7:], pred[:, :4], infer_shape
             )
-            masks.append(polys)
-        return self.make_response(
-            predictions, masks, preprocess_return_metadata["img_dims"], **kwargs
+            polys = masks2poly(batch_masks)
+            output_mask_shape = batch_masks.shape[1:]
+        else:
+            raise InvalidMaskDecodeArgument(
+                f"Invalid mask_decode_mode: {mask_decode_mode}. Must be one of ['accurate', 'fast', 'tradeoff']"
+            )
+        return polys, output_mask_shape
+
+    def encode_masks(
+        self,
+        proto: np.ndarray,
+        pred: np.ndarray,
+        img_dim: Tuple[int, int],
+        infer_shape: Tuple[int, int],
+        mask_format: str,
+        disable_preproc_static_crop: bool = False,
+        origin_offset: Tuple[int, int] = (0, 0),
+        origin_shape: Optional[Tuple[int, int]] = None,
+    ) -> List[Union[RLEMask, BitmaskCrop]]:
+        """
+        Encodes masks of predictions (with boxes already in original image coordinates) in compact format.
+
+        Masks are sampled from prototypes directly at the pixels of original image, only
+        within bounding boxes - so they are pixel-exact and no full-size mask is allocated.
+        If the original image is a part of larger image (like tile in tiled inference), masks
+        are encoded in coordinates of the larger image - pointed by `origin_offset` (x, y)
+        of the part and `origin_shape` of the larger image.
+        """
+        img_dim = (int(img_dim[0]), int(img_dim[1]))
+        if origin_shape is None:
+            origin_shape = img_dim
+        origin_shape = (int(origin_shape[0]), int(origin_shape[1]))
+        offset_x, offset_y = int(origin_offset[0]), int(origin_offset[1])
+        pred_masks = preprocess_segmentation_masks(
+            protos=proto,
+            masks_in=pred[:, 7:],
+            shape=infer_shape,
+        )
+        scale_x, scale_y, shift_x, shift_y = get_origin_to_mask_transform(
+            origin_shape=img_dim,
+            infer_shape=infer_shape,
+            mask_shape=pred_masks.shape[1:],
+            preproc=self.preproc,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+            resize_method=self.resize_method,
         )
+        encoded = []
+        for mask, bbox in zip(pred_masks, pred[:, :4]):
+            roi = get_bbox_pixels_roi(bbox=bbox, shape=img_dim)
+            crop = (
+                resize_mask_roi(
+                    mask=mask,
+                    roi=roi,
+                    scale_x=scale_x,
+                    scale_y=scale_y,
+                    shift_x=shift_x,
+                    shift_y=shift_y,
+                )
+                >= 0.5
+            )
+            if mask_format == "rle":
+                counts = mask_crop2rle(
+                    crop=crop,
+                    offset=(roi[0] + offset_x, roi[1] + offset_y),
+                    shape=origin_shape,
+                )
+                encoded.append(
+                    RLEMask(size=list(origin_shape), counts=rle_counts2string(counts))
+                )
+            else:
+                encoded.append(
+                    BitmaskCrop(
+                        x=roi[0] + offset_x,
+                        y=roi[1] + offset_y,
+                        width=crop.shape[1],
+                        height=crop.shape[0],
+                        data=base64.b64encode(np.packbits(crop)).decode("ascii"),
+                    )
+                )
+        return encoded
 
     def preprocess(
         self, image: Any, **kwargs
@@ -221,6 +531,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         masks: List[List[List[float]]],
         img_dims: List[Tuple[int, int]],
         class_filter: List[str] = [],
+        mask_format: str = DEFAULT_MASK_FORMAT,
         **kwargs,
     ) -> Union[
         InstanceSegmentationInferenceResponse,
@@ -234,6 +545,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             masks (List[List[List[float]]]): List of masks corresponding to the predictions.
             img_dims (List[Tuple[int, int]]): List of image dimensions corresponding to the processed images.
             class_filter (List[str], optional): List of class names to filter predictions by. Defaults to an empty list (no filtering).
+            mask_format (str, optional): Format of masks - polygons for "polygon", encoded masks otherwise. Defaults to "polygon".
 
         Returns:
             Union[InstanceSegmentationInferenceResponse, List[InstanceSegmentationInferenceResponse]]: A single instance segmentation response or a list of instance segmentation responses based on the number of processed images.
@@ -242,6 +554,17 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             - For each image, constructs an `InstanceSegmentationInferenceResponse` object.
             - Each response contains a list of `InstanceSegmentationPrediction` objects.
         """
+        if columnar_predictions_requested(
+            predictions_format=kwargs.get("predictions_format"),
+            visualize_predictions=kwargs.get("visualize_predictions"),
+        ):
+            return self.make_columnar_response(
+                predictions=predictions,
+                masks=masks,
+                img_dims=img_dims,
+                class_filter=class_filter,
+                mask_format=mask_format,
+            )
         responses = []
         for ind, (batch_predictions, batch_masks) in enumerate(zip(predictions, masks)):
             predictions = []
@@ -249,6 +572,12 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
                 if class_filter and self.class_names[int(pred[6])] in class_filter:
                     # TODO: logger.debug
                     continue
+                if mask_format == "polygon":
+                    mask_fields = {
+                        "points": [Point(x=point[0], y=point[1]) for point in mask]
+                    }
+                else:
+                    mask_fields = {"points": [], mask_format: mask}
                 # Passing args as a dictionary here since one of the args is 'class' (a protected term in Python)
                 predictions.append(
                     InstanceSegmentationPrediction(
@@ -257,10 +586,10 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
                             "y": pred[1] + (pred[3] - pred[1]) / 2,
                             "width": pred[2] - pred[0],
                             "height": pred[3] - pred[1],
-                            "points": [Point(x=point[0], y=point[1]) for point in mask],
                             "confidence": pred[4],
                             "class": self.class_names[int(pred[6])],
                             "class_id": int(pred[6]),
+                            **mask_fields,
                         }
                     )
                 )
@@ -273,6 +602,62 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             responses.append(response)
         return responses
 
+    def make_columnar_response(
+        self,
+        predictions: List[List[List[float]]],
+        masks: List[List[List[float]]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: List[str] = [],
+        mask_format: str = DEFAULT_MASK_FORMAT,
+    ) -> List[ColumnarInferenceResponse]:
+        """
+        Create instance segmentation responses with predictions (and masks) in columnar format.
+
+        Args:
+            predictions (List[List[List[float]]]): List of prediction data, one for each image.
+            masks (List[List[List[float]]]): List of masks corresponding to the predictions.
+            img_dims (List[Tuple[int, int]]): List of image dimensions corresponding to the processed images.
+            class_filter (List[str], optional): List of class names to filter predictions by. Defaults to an empty list (no filtering).
+            mask_format (str, optional): Format of masks - polygons for "polygon", encoded masks otherwise. Defaults to "polygon".
+
+        Returns:
+            List[ColumnarInferenceResponse]: A list of response objects containing columns of predictions.
+        """
+        responses = []
+        for ind, (batch_predictions, batch_masks) in enumerate(zip(predictions, masks)):
+            batch_predictions = predictions_to_array(predictions=batch_predictions)
+            selected = np.ones((len(batch_predictions),), dtype=bool)
+            if class_filter:
+                # consistent with predictions in objects format
+                selected = ~select_predictions_of_classes(
+                    predictions=batch_predictions,
+                    class_names=self.class_names,
+                    class_filter=class_filter,
+                )
+            batch_masks = [
+                mask for mask, is_selected in zip(batch_masks, selected) if is_selected
+            ]
+            if mask_format == "polygon":
+                mask_columns = {
+                    "points": [
+                        np.ascontiguousarray(mask, dtype=np.float64).reshape(-1, 2)
+                        for mask in batch_masks
+                    ]
+                }
+            else:
+                mask_columns = {mask_format: batch_masks}
+            responses.append(
+                make_columnar_detections_response(
+                    predictions=make_columnar_detections(
+                        predictions=batch_predictions[selected],
+                        class_names=self.class_names,
+                        **mask_columns,
+                    ),
+                    image_dims=img_dims[ind],
+                )
+            )
+        return responses
+
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
         """Runs inference on the ONNX model.
 
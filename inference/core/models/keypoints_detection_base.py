@@ -1,8 +1,9 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from inference.core.entities.responses.inference import (
+    ColumnarInferenceResponse,
     InferenceResponseImage,
     Keypoint,
     KeypointsDetectionInferenceResponse,
@@ -13,7 +14,20 @@ from inference.core.models.object_detection_base import (
     ObjectDetectionBaseOnnxRoboflowInferenceModel,
 )
 from inference.core.models.types import PreprocessReturnMetadata
-from inference.core.models.utils.keypoints import model_keypoints_to_response
+from inference.core.models.utils.columnar import (
+    columnar_predictions_requested,
+    make_columnar_detections,
+    make_columnar_detections_response,
+    predictions_to_array,
+    select_predictions_of_classes,
+)
+from inference.core.models.utils.keypoints import (
+    get_classes_keypoints_names,
+    model_keypoints_batch_to_array,
+    model_keypoints_batch_to_columns,
+    model_keypoints_batch_to_response,
+)
+from inference.core.models.utils.tiling import get_tiles_dims, merge_tiles_predictions
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -25,6 +39,7 @@ DEFAULT_IOU_THRESH = 0.3
 DEFAULT_CLASS_AGNOSTIC_NMS = False
 DEFAUlT_MAX_DETECTIONS = 300
 DEFAULT_MAX_CANDIDATES = 3000
+DEFAULT_KEYPOINTS_FORMAT = "objects"
 
 
 class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
@@ -109,6 +124,78 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         )
         return self.make_response(predictions, img_dims, **kwargs)
 
+    def postprocess_tiles(
+        self,
+        predictions: Tuple[np.ndarray],
+        preprocess_return_metadata: PreprocessReturnMetadata,
+        class_agnostic_nms=DEFAULT_CLASS_AGNOSTIC_NMS,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou_threshold: float = DEFAULT_IOU_THRESH,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        max_detections: int = DEFAUlT_MAX_DETECTIONS,
+        **kwargs,
+    ) -> List[KeypointsDetectionInferenceResponse]:
+        """Postprocesses predictions of tiles - boxes and keypoints are scaled into coordinates
+        of tiles, shifted by tiles origins and merged with single NMS for each image.
+
+        Args:
+            predictions (Tuple[np.ndarray]): Raw predictions from the model for all tiles.
+            preprocess_return_metadata (PreprocessReturnMetadata): Metadata of tiles returned by `preprocess_tiles(...)`.
+            class_agnostic_nms (bool): Whether to apply class-agnostic non-max suppression. Default is False.
+            confidence (float): Confidence threshold for filtering detections. Default is 0.5.
+            iou_threshold (float): IoU threshold for non-max suppression. Default is 0.5.
+            max_candidates (int): Maximum number of candidate detections. Default is 3000.
+            max_detections (int): Maximum number of final detections. Default is 300.
+
+        Returns:
+            List[KeypointsDetectionInferenceResponse]: The post-processed predictions.
+        """
+        predictions = predictions[0]
+        number_of_classes = len(self.get_class_names)
+        num_masks = predictions.shape[2] - 5 - number_of_classes
+        predictions = w_np_non_max_suppression(
+            predictions,
+            conf_thresh=confidence,
+            iou_thresh=iou_threshold,
+            class_agnostic=class_agnostic_nms,
+            max_detections=max_detections,
+            max_candidate_detections=max_candidates,
+            num_masks=num_masks,
+        )
+        infer_shape = (self.img_size_h, self.img_size_w)
+        tiles = preprocess_return_metadata["tiles"]
+        tiles_dims = get_tiles_dims(tiles=tiles)
+        predictions = post_process_bboxes(
+            predictions=predictions,
+            infer_shape=infer_shape,
+            img_dims=tiles_dims,
+            preproc=self.preproc,
+            resize_method=self.resize_method,
+            disable_preproc_static_crop=True,
+        )
+        predictions = post_process_keypoints(
+            predictions=predictions,
+            keypoints_start_index=-num_masks,
+            infer_shape=infer_shape,
+            img_dims=tiles_dims,
+            preproc=self.preproc,
+            resize_method=self.resize_method,
+            disable_preproc_static_crop=True,
+        )
+        img_dims = preprocess_return_metadata["img_dims"]
+        merged_predictions = merge_tiles_predictions(
+            tiles_predictions=predictions,
+            tiles=tiles,
+            tiles_images_indices=preprocess_return_metadata["tiles_images_indices"],
+            images_number=len(img_dims),
+            iou_threshold=iou_threshold,
+            class_agnostic=class_agnostic_nms,
+            max_detections=max_detections,
+            keypoints_start_index=-num_masks,
+        )
+        predictions = [image_predictions for image_predictions, _ in merged_predictions]
+        return self.make_response(predictions, img_dims, **kwargs)
+
     def make_response(
         self,
         predictions: List[List[float]],
@@ -130,41 +217,179 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         if isinstance(img_dims, dict) and "img_dims" in img_dims:
             img_dims = img_dims["img_dims"]
         keypoint_confidence_threshold = 0.0
+        # request fields are passed as keyword arguments by `infer_from_request(...)`
+        keypoints_format = kwargs.get("keypoints_format") or DEFAULT_KEYPOINTS_FORMAT
         if "request" in kwargs:
             keypoint_confidence_threshold = kwargs["request"].keypoint_confidence
-        responses = [
-            KeypointsDetectionInferenceResponse(
-                predictions=[
-                    KeypointsPrediction(
-                        # Passing args as a dictionary here since one of the args is 'class' (a protected term in Python)
-                        **{
-                            "x": (pred[0] + pred[2]) / 2,
-                            "y": (pred[1] + pred[3]) / 2,
-                            "width": pred[2] - pred[0],
-                            "height": pred[3] - pred[1],
-                            "confidence": pred[4],
-                            "class": self.class_names[int(pred[6])],
-                            "class_id": int(pred[6]),
-                            "keypoints": model_keypoints_to_response(
-                                keypoints_metadata=self.keypoints_metadata,
-                                keypoints=pred[7:],
-                                predicted_object_class_id=int(pred[6]),
-                                keypoint_confidence_threshold=keypoint_confidence_threshold,
-                            ),
-                        }
-                    )
-                    for pred in batch_predictions
-                    if not class_filter
-                    or self.class_names[int(pred[6])] in class_filter
-                ],
-                image=InferenceResponseImage(
-                    width=img_dims[ind][1], height=img_dims[ind][0]
-                ),
+            keypoints_format = getattr(
+                kwargs["request"], "keypoints_format", DEFAULT_KEYPOINTS_FORMAT
+            )
+        if columnar_predictions_requested(
+            predictions_format=kwargs.get("predictions_format"),
+            visualize_predictions=kwargs.get("visualize_predictions"),
+        ):
+            return self.make_columnar_response(
+                predictions=predictions,
+                img_dims=img_dims,
+                class_filter=class_filter,
+                keypoint_confidence_threshold=keypoint_confidence_threshold,
+            )
+        responses = []
+        for ind, batch_predictions in enumerate(predictions):
+            batch_element_predictions = self._make_batch_element_predictions(
+                batch_predictions=batch_predictions,
+                class_filter=class_filter,
+                keypoint_confidence_threshold=keypoint_confidence_threshold,
+                keypoints_format=keypoints_format,
+            )
+            keypoints_names = None
+            if keypoints_format == "array":
+                keypoints_names = self._get_keypoints_names(
+                    predictions=batch_element_predictions
+                )
+            responses.append(
+                KeypointsDetectionInferenceResponse(
+                    predictions=batch_element_predictions,
+                    keypoints_names=keypoints_names,
+                    image=InferenceResponseImage(
+                        width=img_dims[ind][1], height=img_dims[ind][0]
+                    ),
+                )
+            )
+        return responses
+
+    def make_columnar_response(
+        self,
+        predictions: List[List[float]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+        keypoint_confidence_threshold: float = 0.0,
+    ) -> List[ColumnarInferenceResponse]:
+        """Constructs responses with predictions (and keypoints) in columnar format.
+
+        Args:
+            predictions (List[List[float]]): The list of predictions.
+            img_dims (List[Tuple[int, int]]): Dimensions of the images.
+            class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+            keypoint_confidence_threshold (float): Keypoints below the threshold are reported as NaN.
+
+        Returns:
+            List[ColumnarInferenceResponse]: A list of response objects containing columns of predictions.
+        """
+        responses = []
+        for ind, batch_predictions in enumerate(predictions):
+            batch_predictions = predictions_to_array(predictions=batch_predictions)
+            batch_predictions = batch_predictions[
+                select_predictions_of_classes(
+                    predictions=batch_predictions,
+                    class_names=self.class_names,
+                    class_filter=class_filter,
+                )
+            ]
+            classes_ids = batch_predictions[:, 6].astype(int)
+            keypoints = model_keypoints_batch_to_columns(
+                keypoints_metadata=self.keypoints_metadata,
+                keypoints=batch_predictions[:, 7:],
+                predicted_objects_classes_ids=classes_ids,
+                keypoint_confidence_threshold=keypoint_confidence_threshold,
+            )
+            keypoints_names = get_classes_keypoints_names(
+                keypoints_metadata=self.keypoints_metadata,
+                classes_ids=classes_ids.tolist(),
+                number_of_keypoints=keypoints.shape[1],
+            )
+            responses.append(
+                make_columnar_detections_response(
+                    predictions=make_columnar_detections(
+                        predictions=batch_predictions,
+                        class_names=self.class_names,
+                        keypoints=keypoints,
+                    ),
+                    image_dims=img_dims[ind],
+                    keypoints_names={
+                        self.class_names[class_id]: names
+                        for class_id, names in keypoints_names.items()
+                    },
+                )
             )
-            for ind, batch_predictions in enumerate(predictions)
-        ]
         return responses
 
+    def _make_batch_element_predictions(
+        self,
+        batch_predictions: List[List[float]],
+        class_filter: Optional[List[str]],
+        keypoint_confidence_threshold: float,
+        keypoints_format: str,
+    ) -> List[KeypointsPrediction]:
+        if len(batch_predictions) == 0:
+            return []
+        batch_predictions = np.asarray(batch_predictions, dtype=np.float64)
+        classes_ids = batch_predictions[:, 6].astype(int)
+        if class_filter:
+            allowed_classes_ids = [
+                class_id
+                for class_id, class_name in enumerate(self.class_names)
+                if class_name in class_filter
+            ]
+            batch_predictions = batch_predictions[
+                np.isin(classes_ids, allowed_classes_ids)
+            ]
+            classes_ids = batch_predictions[:, 6].astype(int)
+        if keypoints_format == "array":
+            keypoints_fields = [
+                {"keypoints": [], "keypoints_array": object_keypoints}
+                for object_keypoints in model_keypoints_batch_to_array(
+                    keypoints_metadata=self.keypoints_metadata,
+                    keypoints=batch_predictions[:, 7:],
+                    predicted_objects_classes_ids=classes_ids,
+                )
+            ]
+        else:
+            keypoints_fields = [
+                {"keypoints": object_keypoints}
+                for object_keypoints in model_keypoints_batch_to_response(
+                    keypoints_metadata=self.keypoints_metadata,
+                    keypoints=batch_predictions[:, 7:],
+                    predicted_objects_classes_ids=classes_ids,
+                    keypoint_confidence_threshold=keypoint_confidence_threshold,
+                )
+            ]
+        boxes = batch_predictions[:, :4]
+        centers = ((boxes[:, :2] + boxes[:, 2:]) / 2).tolist()
+        sizes = (boxes[:, 2:] - boxes[:, :2]).tolist()
+        confidences = batch_predictions[:, 4].tolist()
+        return [
+            KeypointsPrediction(
+                # Passing args as a dictionary here since one of the args is 'class' (a protected term in Python)
+                **{
+                    "x": center[0],
+                    "y": center[1],
+                    "width": size[0],
+                    "height": size[1],
+                    "confidence": confidence,
+                    "class": self.class_names[class_id],
+                    "class_id": class_id,
+                    **object_keypoints_fields,
+                }
+            )
+            for center, size, confidence, class_id, object_keypoints_fields in zip(
+                centers, sizes, confidences, classes_ids.tolist(), keypoints_fields
+            )
+        ]
+
+    def _get_keypoints_names(
+        self, predictions: List[KeypointsPrediction]
+    ) -> Dict[str, List[str]]:
+        keypoints_names = {}
+        for prediction in predictions:
+            if prediction.class_name in keypoints_names:
+                continue
+            keypoints_names[prediction.class_name] = [
+                self.keypoints_metadata[prediction.class_id][keypoint_id]
+                for keypoint_id in range(len(prediction.keypoints_array))
+            ]
+        return keypoints_names
+
     def keypoints_count(self) -> int:
         raise NotImplementedError
 
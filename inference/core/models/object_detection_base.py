@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Tuple, Union
 import numpy as np
 
 from inference.core.entities.responses.inference import (
+    ColumnarInferenceResponse,
     InferenceResponseImage,
     ObjectDetectionInferenceResponse,
     ObjectDetectionPrediction,
@@ -18,6 +19,19 @@ from inference.core.models.defaults import (
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.columnar import (
+    columnar_predictions_requested,
+    make_columnar_detections,
+    make_columnar_detections_response,
+    predictions_to_array,
+    select_predictions_of_classes,
+)
+from inference.core.models.utils.tiling import (
+    DEFAULT_SLICE_OVERLAP_RATIO,
+    get_tiles_dims,
+    merge_tiles_predictions,
+    tiled_inference_requested,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -45,6 +59,10 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         max_candidates: int = DEFAULT_MAX_CANDIDATES,
         max_detections: int = DEFAUlT_MAX_DETECTIONS,
         return_image_dims: bool = False,
+        slice_width: Optional[int] = None,
+        slice_height: Optional[int] = None,
+        slice_overlap_ratio_width: float = DEFAULT_SLICE_OVERLAP_RATIO,
+        slice_overlap_ratio_height: float = DEFAULT_SLICE_OVERLAP_RATIO,
         **kwargs,
     ) -> Any:
         """
@@ -64,6 +82,10 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             disable_preproc_contrast (bool, optional): If true, the auto contrast preprocessing step is disabled for this call. Default is False.
             disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
             disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            slice_width (Optional[int], optional): Width of slices for tiled inference - if given together with `slice_height`, each image is split into overlapping slices, inferred in batches and merged with NMS in coordinates of the image. Defaults to None.
+            slice_height (Optional[int], optional): Height of slices for tiled inference. Defaults to None.
+            slice_overlap_ratio_width (float, optional): Minimal overlap of neighbouring slices, relative to slice width. Defaults to 0.2.
+            slice_overlap_ratio_height (float, optional): Minimal overlap of neighbouring slices, relative to slice height. Defaults to 0.2.
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
 
@@ -73,6 +95,26 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         Raises:
             ValueError: If batching is not enabled for the model and more than one image is passed for processing.
         """
+        if tiled_inference_requested(
+            slice_width=slice_width, slice_height=slice_height
+        ):
+            return self.infer_tiled(
+                image,
+                slice_width=slice_width,
+                slice_height=slice_height,
+                slice_overlap_ratio_width=slice_overlap_ratio_width,
+                slice_overlap_ratio_height=slice_overlap_ratio_height,
+                class_agnostic_nms=class_agnostic_nms,
+                confidence=confidence,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+                iou_threshold=iou_threshold,
+                max_candidates=max_candidates,
+                max_detections=max_detections,
+                **kwargs,
+            )
         return super().infer(
             image,
             class_agnostic_nms=class_agnostic_nms,
@@ -114,6 +156,15 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         predictions = predictions[
             : len(img_dims)
         ]  # If the batch size was fixed we have empty preds at the end
+        if columnar_predictions_requested(
+            predictions_format=kwargs.get("predictions_format"),
+            visualize_predictions=kwargs.get("visualize_predictions"),
+        ):
+            return self.make_columnar_response(
+                predictions=predictions,
+                img_dims=img_dims,
+                class_filter=class_filter,
+            )
         responses = [
             ObjectDetectionInferenceResponse(
                 predictions=[
@@ -141,6 +192,44 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         ]
         return responses
 
+    def make_columnar_response(
+        self,
+        predictions: List[List[float]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+    ) -> List[ColumnarInferenceResponse]:
+        """Constructs responses with predictions in columnar format - taken directly from
+        arrays of predictions, without creating prediction object for each detection.
+
+        Args:
+            predictions (List[List[float]]): The list of predictions.
+            img_dims (List[Tuple[int, int]]): Dimensions of the images.
+            class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+
+        Returns:
+            List[ColumnarInferenceResponse]: A list of response objects containing columns of predictions.
+        """
+        responses = []
+        for ind, batch_predictions in enumerate(predictions):
+            batch_predictions = predictions_to_array(predictions=batch_predictions)
+            batch_predictions = batch_predictions[
+                select_predictions_of_classes(
+                    predictions=batch_predictions,
+                    class_names=self.class_names,
+                    class_filter=class_filter,
+                )
+            ]
+            responses.append(
+                make_columnar_detections_response(
+                    predictions=make_columnar_detections(
+                        predictions=batch_predictions,
+                        class_names=self.class_names,
+                    ),
+                    image_dims=img_dims[ind],
+                )
+            )
+        return responses
+
     def postprocess(
         self,
         predictions: Tuple[np.ndarray, ...],
@@ -192,6 +281,63 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         )
         return self.make_response(predictions, img_dims, **kwargs)
 
+    def postprocess_tiles(
+        self,
+        predictions: Tuple[np.ndarray, ...],
+        preprocess_return_metadata: PreprocessReturnMetadata,
+        class_agnostic_nms=DEFAULT_CLASS_AGNOSTIC_NMS,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou_threshold: float = DEFAULT_IOU_THRESH,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        max_detections: int = DEFAUlT_MAX_DETECTIONS,
+        **kwargs,
+    ) -> List[ObjectDetectionInferenceResponse]:
+        """Postprocesses predictions of tiles - boxes are scaled into coordinates of tiles,
+        shifted by tiles origins and merged with single NMS for each image.
+
+        Args:
+            predictions (Tuple[np.ndarray, ...]): Raw predictions from the model for all tiles.
+            preprocess_return_metadata (PreprocessReturnMetadata): Metadata of tiles returned by `preprocess_tiles(...)`.
+            class_agnostic_nms (bool): Whether to apply class-agnostic non-max suppression. Default is False.
+            confidence (float): Confidence threshold for filtering detections. Default is 0.5.
+            iou_threshold (float): IoU threshold for non-max suppression. Default is 0.5.
+            max_candidates (int): Maximum number of candidate detections. Default is 3000.
+            max_detections (int): Maximum number of final detections. Default is 300.
+
+        Returns:
+            List[ObjectDetectionInferenceResponse]: The post-processed predictions.
+        """
+        predictions = w_np_non_max_suppression(
+            predictions[0],
+            conf_thresh=confidence,
+            iou_thresh=iou_threshold,
+            class_agnostic=class_agnostic_nms,
+            max_detections=max_detections,
+            max_candidate_detections=max_candidates,
+            box_format=self.box_format,
+        )
+        tiles = preprocess_return_metadata["tiles"]
+        predictions = post_process_bboxes(
+            predictions,
+            (self.img_size_h, self.img_size_w),
+            get_tiles_dims(tiles=tiles),
+            self.preproc,
+            resize_method=self.resize_method,
+            disable_preproc_static_crop=True,
+        )
+        img_dims = preprocess_return_metadata["img_dims"]
+        merged_predictions = merge_tiles_predictions(
+            tiles_predictions=predictions,
+            tiles=tiles,
+            tiles_images_indices=preprocess_return_metadata["tiles_images_indices"],
+            images_number=len(img_dims),
+            iou_threshold=iou_threshold,
+            class_agnostic=class_agnostic_nms,
+            max_detections=max_detections,
+        )
+        predictions = [image_predictions for image_predictions, _ in merged_predictions]
+        return self.make_response(predictions, img_dims, **kwargs)
+
     def preprocess(
         self,
         image: Any,
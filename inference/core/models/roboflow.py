@@ -37,28 +37,46 @@ from inference.core.env import (
     AWS_SECRET_ACCESS_KEY,
     CORE_MODEL_BUCKET,
     DISABLE_PREPROC_AUTO_ORIENT,
+    FIX_BATCH_SIZE,
     INFER_BUCKET,
     LAMBDA,
     MAX_BATCH_SIZE,
     MODEL_CACHE_DIR,
     MODEL_VALIDATION_DISABLED,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
+    PREPROC_RESIZE_INTERPOLATION,
+    REDUCED_IMAGE_DECODING_ENABLED,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
 )
 from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
 from inference.core.logger import logger
 from inference.core.models.base import Model
+from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.batching import create_batches
 from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.tiling import generate_tiles
 from inference.core.roboflow_api import (
     ModelEndpointType,
     get_from_url,
     get_roboflow_model_data,
 )
-from inference.core.utils.image_utils import load_image
+from inference.core.utils.image_utils import DecodingSizeHint, load_image
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.utils.postprocess import get_static_crop_dimensions
+from inference.core.utils.preprocess import (
+    STATIC_CROP_KEY,
+    grayscale_conversion_should_be_applied,
+    image_to_model_input,
+    letterbox_image,
+    prepare,
+    select_resize_interpolation,
+    static_crop_should_be_applied,
+)
+from inference.core.utils.preprocessing_cache import (
+    bind_request_preprocessing_cache,
+    get_request_preprocessing_cache,
+)
 from inference.core.utils.visualisation import draw_detection_predictions
 from inference.models.aliases import resolve_roboflow_model_alias
 
@@ -96,6 +114,9 @@ DEFAULT_COLOR_PALETTE = [
 class RoboflowInferenceModel(Model):
     """Base Roboflow inference model."""
 
+    # interpolation used to resize images to model input - see `select_resize_interpolation(...)`
+    resize_interpolation = PREPROC_RESIZE_INTERPOLATION
+
     def __init__(
         self,
         model_id: str,
@@ -383,47 +404,244 @@ class RoboflowInferenceModel(Model):
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
         """
-        np_image, is_bgr = load_image(
+        # grayscale conversion commutes (up to rounding) with resizing - so it is applied to
+        # (usually much smaller) resized image, while building model input
+        grayscale = grayscale_conversion_should_be_applied(
+            preprocessing_config=self.preproc,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+        )
+        load_and_resize_image = partial(
+            self.load_and_resize_image,
             image,
-            disable_preproc_auto_orient=disable_preproc_auto_orient
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale or grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        )
+        cache = get_request_preprocessing_cache()
+        if cache is None:
+            resized_image, img_dims, is_bgr = load_and_resize_image()
+        else:
+            # models with the same pre-processing share resized image within the request
+            resized_image, img_dims, is_bgr = cache.get_or_compute(
+                image=image,
+                key=self.get_preprocessing_signature(
+                    disable_preproc_auto_orient=disable_preproc_auto_orient,
+                    disable_preproc_contrast=disable_preproc_contrast,
+                    disable_preproc_grayscale=disable_preproc_grayscale,
+                    disable_preproc_static_crop=disable_preproc_static_crop,
+                ),
+                compute=load_and_resize_image,
+            )
+        img_in = image_to_model_input(resized_image, is_bgr=is_bgr, grayscale=grayscale)
+        return img_in, img_dims
+
+    def load_and_resize_image(
+        self,
+        image: Union[Any, InferenceRequestImage],
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[np.ndarray, Tuple[int, int], bool]:
+        """
+        Loads an inference request image, applies pre-processing specified by the Roboflow platform and scales it to the inference input dimensions - without conversion into model input.
+
+        Args:
+            image (Union[Any, InferenceRequestImage]): An object containing information necessary to load the image for inference.
+            disable_preproc_auto_orient (bool, optional): If true, the auto orient preprocessing step is disabled for this call. Default is False.
+            disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
+            disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
+            disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[int, int], bool]: The resized image, the original image size and the flag telling if the image is BGR.
+        """
+        preprocessed_image, img_dims, is_bgr = self.load_and_prepare_image(
+            image,
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        )
+        return self.resize_image(preprocessed_image), img_dims, is_bgr
+
+    def get_preprocessing_signature(
+        self,
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[Any, ...]:
+        """
+        Describes pre-processing of input images - models with equal signatures produce equal inputs out of the same image.
+
+        Args:
+            disable_preproc_auto_orient (bool, optional): If true, the auto orient preprocessing step is disabled for this call. Default is False.
+            disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
+            disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
+            disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+
+        Returns:
+            Tuple[Any, ...]: Hashable signature of pre-processing.
+        """
+        return (
+            "model_input",
+            self.img_size_h,
+            self.img_size_w,
+            self.resize_method,
+            self.resize_interpolation,
+            json.dumps(self.preproc, sort_keys=True),
+            bool(disable_preproc_auto_orient),
+            bool(disable_preproc_contrast),
+            bool(disable_preproc_grayscale),
+            bool(disable_preproc_static_crop),
+        )
+
+    def load_and_prepare_image(
+        self,
+        image: Union[Any, InferenceRequestImage],
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+        allow_reduced_decoding: bool = True,
+    ) -> Tuple[np.ndarray, Tuple[int, int], bool]:
+        """
+        Loads an inference request image and applies pre-processing specified by the Roboflow platform - without scaling it to the inference input dimensions.
+
+        Args:
+            image (Union[Any, InferenceRequestImage]): An object containing information necessary to load the image for inference.
+            disable_preproc_auto_orient (bool, optional): If true, the auto orient preprocessing step is disabled for this call. Default is False.
+            disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
+            disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
+            disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            allow_reduced_decoding (bool, optional): If true, oversized images may be decoded in reduced resolution (when enabled in environment). Default is True.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[int, int], bool]: The pre-processed image, the original image size and the flag telling if the image is BGR.
+        """
+        size_hint = None
+        if REDUCED_IMAGE_DECODING_ENABLED and allow_reduced_decoding:
+            size_hint = self.get_decoding_size_hint(
+                disable_preproc_static_crop=disable_preproc_static_crop
+            )
+        disable_auto_orient = (
+            disable_preproc_auto_orient
             or "auto-orient" not in self.preproc.keys()
-            or DISABLE_PREPROC_AUTO_ORIENT,
+            or DISABLE_PREPROC_AUTO_ORIENT
         )
+        decode_image = partial(
+            load_image,
+            image,
+            disable_preproc_auto_orient=disable_auto_orient,
+            size_hint=size_hint,
+        )
+        cache = get_request_preprocessing_cache()
+        if cache is None or size_hint is not None:
+            np_image, is_bgr = decode_image()
+        else:
+            # models processing the same image within the request decode it once
+            np_image, is_bgr = cache.get_or_compute(
+                image=image,
+                key=("decoded", disable_auto_orient),
+                compute=decode_image,
+            )
         preprocessed_image, img_dims = self.preprocess_image(
             np_image,
             disable_preproc_contrast=disable_preproc_contrast,
             disable_preproc_grayscale=disable_preproc_grayscale,
             disable_preproc_static_crop=disable_preproc_static_crop,
         )
-
-        if self.resize_method == "Stretch to":
-            resized = cv2.resize(
-                preprocessed_image, (self.img_size_w, self.img_size_h), cv2.INTER_CUBIC
+        if size_hint is not None and size_hint.reduction_factor > 1:
+            # reduction is exact, so predictions are rescaled against original size
+            img_dims = (
+                img_dims[0] * size_hint.reduction_factor,
+                img_dims[1] * size_hint.reduction_factor,
             )
+        return preprocessed_image, img_dims, is_bgr
+
+    def resize_to_model_input(
+        self, image: np.ndarray, is_bgr: bool, grayscale: bool = False
+    ) -> np.ndarray:
+        """
+        Scales the pre-processed image to the inference input dimensions (with resize method of the model) and converts it into single-element batch of RGB channels-first float32 data.
+
+        Args:
+            image (np.ndarray): The pre-processed image.
+            is_bgr (bool): Flag telling if the image is BGR.
+            grayscale (bool, optional): If true, the image is converted into grayscale after resizing. Default is False.
+
+        Returns:
+            np.ndarray: Model input of shape (1, 3, img_size_h, img_size_w).
+        """
+        return image_to_model_input(
+            self.resize_image(image), is_bgr=is_bgr, grayscale=grayscale
+        )
+
+    def resize_image(self, image: np.ndarray) -> np.ndarray:
+        """
+        Scales the pre-processed image to the inference input dimensions with resize method of the model.
+
+        Args:
+            image (np.ndarray): The pre-processed image.
+
+        Returns:
+            np.ndarray: Image of shape (img_size_h, img_size_w, channels).
+        """
+        desired_size = (self.img_size_w, self.img_size_h)
+        interpolation = select_resize_interpolation(
+            interpolation=self.resize_interpolation,
+            image_shape=image.shape,
+            desired_size=desired_size,
+        )
+        if image.shape[:2] == (self.img_size_h, self.img_size_w):
+            # image of exact input shape is neither stretched nor padded
+            resized = image
+        elif self.resize_method == "Stretch to":
+            resized = cv2.resize(image, desired_size, interpolation=interpolation)
         elif self.resize_method == "Fit (black edges) in":
-            resized = letterbox_image(
-                preprocessed_image, (self.img_size_w, self.img_size_h)
-            )
+            resized = letterbox_image(image, desired_size, interpolation=interpolation)
         elif self.resize_method == "Fit (white edges) in":
             resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
+                image,
+                desired_size,
                 color=(255, 255, 255),
+                interpolation=interpolation,
             )
         elif self.resize_method == "Fit (grey edges) in":
             resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
+                image,
+                desired_size,
                 color=(114, 114, 114),
+                interpolation=interpolation,
             )
+        return resized
 
-        if is_bgr:
-            resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-        img_in = np.transpose(resized, (2, 0, 1))
-        img_in = img_in.astype(np.float32)
-        img_in = np.expand_dims(img_in, axis=0)
+    def get_decoding_size_hint(
+        self, disable_preproc_static_crop: bool = False
+    ) -> DecodingSizeHint:
+        """
+        Creates hint letting oversized input images be decoded in reduced resolution.
 
-        return img_in, img_dims
+        Args:
+            disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+
+        Returns:
+            DecodingSizeHint: Size of model input, resize method and static crop to be applied.
+        """
+        static_crop = None
+        if static_crop_should_be_applied(
+            preprocessing_config=self.preproc,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        ):
+            static_crop = self.preproc[STATIC_CROP_KEY]
+        return DecodingSizeHint(
+            height=self.img_size_h,
+            width=self.img_size_w,
+            resize_method=self.resize_method,
+            static_crop=static_crop,
+        )
 
     def preprocess_image(
         self,
@@ -639,6 +857,144 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
+    def infer_tiled(
+        self,
+        image: Any,
+        slice_width: int,
+        slice_height: int,
+        slice_overlap_ratio_width: float,
+        slice_overlap_ratio_height: float,
+        **kwargs,
+    ) -> Any:
+        """Runs tiled inference - each image is split into overlapping slices, all slices
+        (of all images) are inferred in batches and predictions are merged back in
+        coordinates of the original images.
+        - image:
+            can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
+        """
+        img_in, preprocess_return_metadata = self.preprocess_tiles(
+            image,
+            slice_wh=(slice_width, slice_height),
+            overlap_ratio_wh=(slice_overlap_ratio_width, slice_overlap_ratio_height),
+            disable_preproc_auto_orient=kwargs.get("disable_preproc_auto_orient"),
+            disable_preproc_contrast=kwargs.get("disable_preproc_contrast"),
+            disable_preproc_grayscale=kwargs.get("disable_preproc_grayscale"),
+            disable_preproc_static_crop=kwargs.get("disable_preproc_static_crop"),
+        )
+        logger.debug(f"Tiled inference input shape: {img_in.shape}")
+        predicted_arrays = self.predict_tiles(img_in, **kwargs)
+        return self.postprocess_tiles(
+            predicted_arrays, preprocess_return_metadata, **kwargs
+        )
+
+    def preprocess_tiles(
+        self,
+        image: Any,
+        slice_wh: Tuple[int, int],
+        overlap_ratio_wh: Tuple[float, float],
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
+        """Loads and pre-processes images (in full resolution), then cuts them into tiles
+        scaled to the inference input dimensions.
+
+        Returns:
+            Tuple[np.ndarray, PreprocessReturnMetadata]: Batch of tiles of all images and metadata
+                with original images dimensions, tiles coordinates in original images (shape (n, 4),
+                [x_min, y_min, x_max, y_max]) and indices of images the tiles are cut from.
+        """
+        images = image if isinstance(image, list) else [image]
+        load_and_prepare_image = partial(
+            self.load_and_prepare_image,
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+            allow_reduced_decoding=False,
+        )
+        img_in, img_dims, tiles, tiles_images_indices = [], [], [], []
+        prepared_images = self.image_loader_threadpool.map(
+            bind_request_preprocessing_cache(load_and_prepare_image), images
+        )
+        for image_index, (prepared_image, image_dims, is_bgr) in enumerate(
+            prepared_images
+        ):
+            (crop_shift_x, crop_shift_y), _ = get_static_crop_dimensions(
+                image_dims,
+                self.preproc,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+            )
+            image_tiles = generate_tiles(
+                image_shape=prepared_image.shape[:2],
+                slice_wh=slice_wh,
+                overlap_ratio_wh=overlap_ratio_wh,
+            )
+            for x_min, y_min, x_max, y_max in image_tiles.tolist():
+                # tile is a view - pixels are copied once, while scaling to model input
+                img_in.append(
+                    self.resize_to_model_input(
+                        prepared_image[y_min:y_max, x_min:x_max], is_bgr=is_bgr
+                    )
+                )
+            img_dims.append(image_dims)
+            tiles.append(
+                image_tiles + [crop_shift_x, crop_shift_y, crop_shift_x, crop_shift_y]
+            )
+            tiles_images_indices.append(np.full(len(image_tiles), image_index))
+        img_in = np.concatenate(img_in, axis=0)
+        img_in /= 255.0
+        return img_in, PreprocessReturnMetadata(
+            {
+                "img_dims": img_dims,
+                "im_shape": img_in.shape,
+                "tiles": np.concatenate(tiles),
+                "tiles_images_indices": np.concatenate(tiles_images_indices),
+            }
+        )
+
+    def predict_tiles(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, ...]:
+        """Runs the model on batch of tiles - in chunks not exceeding the maximum batch size.
+        Chunks are padded (the same way `preprocess(...)` pads batches) when the model
+        requires fixed batch size, and predictions for padding are dropped."""
+        if self.batching_enabled:
+            max_batch_size = MAX_BATCH_SIZE
+            fix_batch_size = FIX_BATCH_SIZE or kwargs.get("fix_batch_size", False)
+        else:
+            max_batch_size = self.batch_size
+            fix_batch_size = True
+        if max_batch_size == float("inf"):
+            return self.predict(img_in, **kwargs)
+        batch_size = int(max_batch_size)
+        batches_predictions = []
+        for start in range(0, len(img_in), batch_size):
+            batch = img_in[start : start + batch_size]
+            batch_padding = batch_size - len(batch) if fix_batch_size else 0
+            if batch_padding > 0:
+                batch = np.pad(batch, ((0, batch_padding), (0, 0), (0, 0), (0, 0)))
+            predictions = self.predict(batch, **kwargs)
+            batches_predictions.append(
+                tuple(output[: batch_size - batch_padding] for output in predictions)
+            )
+        if len(batches_predictions) == 1:
+            return batches_predictions[0]
+        return tuple(
+            np.concatenate(outputs, axis=0) for outputs in zip(*batches_predictions)
+        )
+
+    def postprocess_tiles(
+        self,
+        predictions: Tuple[np.ndarray, ...],
+        preprocess_return_metadata: PreprocessReturnMetadata,
+        **kwargs,
+    ) -> Any:
+        """Merges predictions of tiles into predictions of the original images. To be
+        implemented by models supporting tiled inference."""
+        raise NotImplementedError(
+            f"Tiled inference is not supported by {self.__class__.__name__}"
+        )
+
     def validate_model(self) -> None:
         if MODEL_VALIDATION_DISABLED:
             logger.debug("Model validation disabled.")
@@ -804,7 +1160,9 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 disable_preproc_grayscale=disable_preproc_grayscale,
                 disable_preproc_static_crop=disable_preproc_static_crop,
             )
-            imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
+            imgs_with_dims = self.image_loader_threadpool.map(
+                bind_request_preprocessing_cache(preproc_image), image
+            )
             imgs, img_dims = zip(*imgs_with_dims)
             img_in = np.concatenate(imgs, axis=0)
         else:
@@ -0,0 +1,98 @@
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from inference.core.entities.responses.inference import (
+    ColumnarInferenceResponse,
+    ColumnarPredictions,
+    InferenceResponseImage,
+)
+
+OBJECTS_PREDICTIONS_FORMAT = "objects"
+COLUMNAR_PREDICTIONS_FORMAT = "columnar"
+PREDICTIONS_ROW_MIN_SIZE = 7
+
+
+def columnar_predictions_requested(
+    predictions_format: Optional[str],
+    visualize_predictions: Optional[bool] = False,
+) -> bool:
+    # visualisation is drawn from prediction objects - so they must be created anyway
+    return (
+        predictions_format == COLUMNAR_PREDICTIONS_FORMAT and not visualize_predictions
+    )
+
+
+def predictions_to_array(predictions: List[List[float]]) -> np.ndarray:
+    if len(predictions) == 0:
+        return np.zeros((0, PREDICTIONS_ROW_MIN_SIZE), dtype=np.float64)
+    return np.asarray(predictions, dtype=np.float64)
+
+
+def select_predictions_of_classes(
+    predictions: np.ndarray,
+    class_names: List[str],
+    class_filter: Optional[List[str]],
+) -> np.ndarray:
+    """
+    Returns boolean mask of predictions (rows of [x1, y1, x2, y2, conf, cls_conf, class_id, ...])
+    matching `class_filter` - all predictions are selected if filter is empty.
+    """
+    if not class_filter:
+        return np.ones((len(predictions),), dtype=bool)
+    allowed_classes_ids = [
+        class_id
+        for class_id, class_name in enumerate(class_names)
+        if class_name in class_filter
+    ]
+    return np.isin(predictions[:, 6].astype(int), allowed_classes_ids)
+
+
+def make_columnar_detections(
+    predictions: np.ndarray,
+    class_names: List[str],
+    **columns,
+) -> ColumnarPredictions:
+    """
+    Creates columns of detections out of array of predictions (rows of
+    [x1, y1, x2, y2, conf, cls_conf, class_id, ...]) - additional columns (like masks
+    or keypoints) are to be passed as kwargs.
+    """
+    class_id = predictions[:, 6].astype(int)
+    return ColumnarPredictions(
+        class_id=class_id,
+        class_name=[class_names[i] for i in class_id.tolist()],
+        confidence=np.ascontiguousarray(predictions[:, 4]),
+        xyxy=np.ascontiguousarray(predictions[:, :4]),
+        detection_id=[str(uuid4()) for _ in range(len(class_id))],
+        **columns,
+    )
+
+
+def make_columnar_detections_response(
+    predictions: ColumnarPredictions,
+    image_dims: Tuple[int, int],
+    **kwargs,
+) -> ColumnarInferenceResponse:
+    return ColumnarInferenceResponse(
+        predictions=predictions,
+        image=InferenceResponseImage(width=image_dims[1], height=image_dims[0]),
+        **kwargs,
+    )
+
+
+def make_columnar_classification(
+    class_names: List[str],
+    confidence: np.ndarray,
+    class_id: np.ndarray,
+) -> ColumnarPredictions:
+    """
+    Creates columns of classification predictions for classes `class_id` (in given order)
+    out of `confidence` scores of all classes.
+    """
+    return ColumnarPredictions(
+        class_id=class_id,
+        class_name=[class_names[i] for i in class_id.tolist()],
+        confidence=np.ascontiguousarray(confidence[class_id], dtype=np.float64),
+    )
@@ -1,4 +1,6 @@
-from typing import List
+from typing import Dict, List
+
+import numpy as np
 
 from inference.core.entities.responses.inference import Keypoint
 from inference.core.exceptions import ModelArtefactError
@@ -39,3 +41,139 @@ def model_keypoints_to_response(
         )
         results.append(keypoint)
     return results
+
+
+def model_keypoints_batch_to_response(
+    keypoints_metadata: dict,
+    keypoints: np.ndarray,
+    predicted_objects_classes_ids: np.ndarray,
+    keypoint_confidence_threshold: float,
+) -> List[List[dict]]:
+    """
+    Vectorised counterpart of `model_keypoints_to_response(...)` - converts keypoints of
+    all detected objects (array of shape (number of objects, 3 * number of keypoints))
+    at once, returning serialised `Keypoint` entities to be validated as part of
+    `KeypointsPrediction`.
+    """
+    number_of_keypoints = keypoints.shape[1] // 3
+    keypoints = keypoints[:, : number_of_keypoints * 3].reshape(
+        len(keypoints), number_of_keypoints, 3
+    )
+    classes_ids = predicted_objects_classes_ids.astype(int).tolist()
+    keypoints_names = get_classes_keypoints_names(
+        keypoints_metadata=keypoints_metadata,
+        classes_ids=classes_ids,
+        number_of_keypoints=number_of_keypoints,
+    )
+    classes_keypoints_counts = np.array(
+        [len(keypoints_names[class_id]) for class_id in classes_ids], dtype=int
+    ).reshape(-1, 1)
+    # Ultralytics only supports single class keypoint detection, so points might be padded with zeros
+    selected = (keypoints[:, :, 2] >= keypoint_confidence_threshold) & (
+        np.arange(number_of_keypoints) < classes_keypoints_counts
+    )
+    results = []
+    for object_keypoints, object_selected, class_id in zip(
+        keypoints.tolist(), selected.tolist(), classes_ids
+    ):
+        names = keypoints_names[class_id]
+        results.append(
+            [
+                {
+                    "x": keypoint[0],
+                    "y": keypoint[1],
+                    "confidence": keypoint[2],
+                    "class_id": keypoint_id,
+                    "class_name": names[keypoint_id],
+                }
+                for keypoint_id, (keypoint, is_selected) in enumerate(
+                    zip(object_keypoints, object_selected)
+                )
+                if is_selected
+            ]
+        )
+    return results
+
+
+def model_keypoints_batch_to_array(
+    keypoints_metadata: dict,
+    keypoints: np.ndarray,
+    predicted_objects_classes_ids: np.ndarray,
+) -> List[List[List[float]]]:
+    """
+    Converts keypoints of all detected objects (array of shape (number of objects,
+    3 * number of keypoints)) into [[x, y, confidence], ...] rows, skipping zero-padded
+    keypoints not defined for the predicted class.
+    """
+    number_of_keypoints = keypoints.shape[1] // 3
+    classes_ids = predicted_objects_classes_ids.astype(int).tolist()
+    keypoints_names = get_classes_keypoints_names(
+        keypoints_metadata=keypoints_metadata,
+        classes_ids=classes_ids,
+        number_of_keypoints=number_of_keypoints,
+    )
+    keypoints_values = (
+        keypoints[:, : number_of_keypoints * 3]
+        .reshape(len(keypoints), number_of_keypoints, 3)
+        .tolist()
+    )
+    return [
+        object_keypoints[: len(keypoints_names[class_id])]
+        for object_keypoints, class_id in zip(keypoints_values, classes_ids)
+    ]
+
+
+def model_keypoints_batch_to_columns(
+    keypoints_metadata: dict,
+    keypoints: np.ndarray,
+    predicted_objects_classes_ids: np.ndarray,
+    keypoint_confidence_threshold: float,
+) -> np.ndarray:
+    """
+    Converts keypoints of all detected objects (array of shape (number of objects,
+    3 * number of keypoints)) into array of shape (number of objects, number of keypoints, 3)
+    with NaN in place of keypoints below confidence threshold or not defined for the
+    predicted class.
+    """
+    number_of_keypoints = keypoints.shape[1] // 3
+    classes_ids = predicted_objects_classes_ids.astype(int).tolist()
+    keypoints_names = get_classes_keypoints_names(
+        keypoints_metadata=keypoints_metadata,
+        classes_ids=classes_ids,
+        number_of_keypoints=number_of_keypoints,
+    )
+    columns = np.array(
+        keypoints[:, : number_of_keypoints * 3].reshape(
+            len(keypoints), number_of_keypoints, 3
+        ),
+        dtype=np.float64,
+    )
+    classes_keypoints_counts = np.array(
+        [len(keypoints_names[class_id]) for class_id in classes_ids], dtype=int
+    ).reshape(-1, 1)
+    not_selected = (columns[:, :, 2] < keypoint_confidence_threshold) | (
+        np.arange(number_of_keypoints) >= classes_keypoints_counts
+    )
+    columns[not_selected] = np.nan
+    return columns
+
+
+def get_classes_keypoints_names(
+    keypoints_metadata: dict,
+    classes_ids: List[int],
+    number_of_keypoints: int,
+) -> Dict[int, list]:
+    """
+    Returns names of keypoints (in order of keypoints ids) for each of `classes_ids`.
+    """
+    if keypoints_metadata is None:
+        raise ModelArtefactError("Keypoints metadata not available.")
+    return {
+        class_id: [
+            keypoints_metadata[class_id][keypoint_id]
+            for keypoint_id in range(
+                min(len(keypoints_metadata[class_id]), number_of_keypoints)
+            )
+        ]
+        for class_id in set(classes_ids)
+    }
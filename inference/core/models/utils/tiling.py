@@ -0,0 +1,134 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core.models.utils.columnar import predictions_to_array
+from inference.core.nms import np_detections_non_max_suppression
+
+DEFAULT_SLICE_OVERLAP_RATIO = 0.2
+
+
+def tiled_inference_requested(
+    slice_width: Optional[int], slice_height: Optional[int]
+) -> bool:
+    return slice_width is not None and slice_height is not None
+
+
+def generate_tiles(
+    image_shape: Tuple[int, int],
+    slice_wh: Tuple[int, int],
+    overlap_ratio_wh: Tuple[float, float],
+) -> np.ndarray:
+    """
+    Generates tiles covering image of `image_shape` (height, width) with slices of size
+    `slice_wh`, overlapping by at least `overlap_ratio_wh` of slice size.
+
+    Contrary to `image_slicer` workflow block, tiles are never cut at the right and bottom
+    edges of the image (which would make them mostly padding once resized to model input) -
+    tiles are spread evenly instead, so that the last one ends at the image edge.
+    Slice larger than the image is cut to the image size.
+
+    Returns:
+        np.ndarray: Array of shape (n, 4) with tiles in format [x_min, y_min, x_max, y_max].
+    """
+    height, width = image_shape
+    xs = _generate_tiles_starts(
+        length=width, slice_length=slice_wh[0], overlap_ratio=overlap_ratio_wh[0]
+    )
+    ys = _generate_tiles_starts(
+        length=height, slice_length=slice_wh[1], overlap_ratio=overlap_ratio_wh[1]
+    )
+    x_min, y_min = np.meshgrid(xs, ys)
+    x_max = np.minimum(x_min + slice_wh[0], width)
+    y_max = np.minimum(y_min + slice_wh[1], height)
+    return np.stack([x_min, y_min, x_max, y_max], axis=-1).reshape(-1, 4)
+
+
+def _generate_tiles_starts(
+    length: int, slice_length: int, overlap_ratio: float
+) -> np.ndarray:
+    if slice_length >= length:
+        return np.zeros((1,), dtype=int)
+    stride = max(slice_length - int(overlap_ratio * slice_length), 1)
+    tiles_number = int(np.ceil((length - slice_length) / stride)) + 1
+    return np.round(np.linspace(0, length - slice_length, tiles_number)).astype(int)
+
+
+def get_tiles_dims(tiles: np.ndarray) -> List[Tuple[int, int]]:
+    return [
+        (int(y_max - y_min), int(x_max - x_min))
+        for x_min, y_min, x_max, y_max in tiles.tolist()
+    ]
+
+
+def merge_tiles_predictions(
+    tiles_predictions: List[Union[np.ndarray, List[List[float]]]],
+    tiles: np.ndarray,
+    tiles_images_indices: np.ndarray,
+    images_number: int,
+    iou_threshold: float,
+    class_agnostic: bool,
+    max_detections: int,
+    keypoints_start_index: Optional[int] = None,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Merges predictions of tiles (rows of [x1, y1, x2, y2, conf, cls_conf, class_id, ...]
+    in coordinates of tiles) into predictions of images, shifting boxes (and keypoints - if
+    `keypoints_start_index` is given) by tiles origins and running single NMS over all
+    predictions of the image - with predictions of different tiles matched by intersection
+    over area of the smaller box.
+
+    Returns:
+        List[Tuple[np.ndarray, np.ndarray]]: For each image - array of predictions in image
+            coordinates and array of shape (n, 2) with [tile index, prediction index within tile]
+            pointing the source of each prediction.
+    """
+    tiles_predictions = [
+        predictions_to_array(predictions=predictions)
+        for predictions in tiles_predictions
+    ]
+    results = []
+    for image_index in range(images_number):
+        image_tiles = [
+            tile_index
+            for tile_index in np.flatnonzero(tiles_images_indices == image_index)
+            if len(tiles_predictions[tile_index]) > 0
+        ]
+        if not image_tiles:
+            results.append((predictions_to_array([]), np.zeros((0, 2), dtype=int)))
+            continue
+        predictions = np.concatenate(
+            [tiles_predictions[tile_index] for tile_index in image_tiles]
+        )
+        sources = np.concatenate(
+            [
+                np.stack(
+                    [
+                        np.full(len(tiles_predictions[tile_index]), tile_index),
+                        np.arange(len(tiles_predictions[tile_index])),
+                    ],
+                    axis=1,
+                )
+                for tile_index in image_tiles
+            ]
+        )
+        shift_x = tiles[sources[:, 0], 0:1]
+        shift_y = tiles[sources[:, 0], 1:2]
+        predictions[:, [0, 2]] += shift_x
+        predictions[:, [1, 3]] += shift_y
+        if keypoints_start_index is not None:
+            predictions[:, keypoints_start_index::3] += shift_x
+            predictions[:, keypoints_start_index + 1 :: 3] += shift_y
+        # objects cut by tile border are detected partially - such detection is mostly
+        # contained within (but has low IoU with) detection from neighbouring tile,
+        # while detections of the same tile already went through NMS
+        selected = np_detections_non_max_suppression(
+            predictions,
+            iou_thresh=iou_threshold,
+            class_agnostic=class_agnostic,
+            max_detections=max_detections,
+            match_metric="ios",
+            groups=sources[:, 0],
+        )
+        results.append((predictions[selected], sources[selected]))
+    return results
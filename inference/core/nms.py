@@ -161,3 +161,87 @@ def non_max_suppression_fast(boxes, overlapThresh):
     # return only the bounding boxes that were picked using the
     # integer data type
     return boxes[pick].astype("float")
+
+
+def np_detections_non_max_suppression(
+    detections: np.ndarray,
+    iou_thresh: float = 0.45,
+    class_agnostic: bool = False,
+    max_detections: int = 300,
+    match_metric: str = "iou",
+    groups: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Applies non-maximum suppression to post-processed detections.
+
+    Classes are separated by shifting boxes of each class into disjoint region of
+    coordinates space, so all detections are suppressed in single pass regardless of
+    `class_agnostic`. Overlap of each selected detection is computed against all remaining
+    candidates at once.
+
+    Args:
+        detections (np.ndarray): Array of detections, format of single detection is
+            [x1, y1, x2, y2, confidence, class_confidence, class_id, ...]
+        iou_thresh (float, optional): Overlap threshold. Defaults to 0.45.
+        class_agnostic (bool, optional): Whether to ignore class labels. Defaults to False.
+        max_detections (int, optional): Maximum number of detections. Defaults to 300.
+        match_metric (str, optional): Overlap metric - 'iou' (intersection over union) or 'ios'
+            (intersection over area of the smaller box). Defaults to 'iou'.
+        groups (Optional[np.ndarray], optional): Group of each detection - detections of the
+            same group never suppress each other. Defaults to None.
+
+    Returns:
+        np.ndarray: Indices of selected detections, sorted by confidence (descending).
+    """
+    if match_metric not in {"iou", "ios"}:
+        raise ValueError(
+            "match_metric must be either 'iou' or 'ios', got {}".format(match_metric)
+        )
+    if len(detections) == 0:
+        return np.zeros((0,), dtype=int)
+    order = np.argsort(-detections[:, 4], kind="stable")
+    boxes = detections[order, :4].astype(np.float64)
+    if not class_agnostic:
+        span = boxes.max() - boxes.min() + 1
+        boxes = boxes + detections[order, 6:7] * span
+    if groups is not None:
+        groups = groups[order]
+    areas = np.clip(boxes[:, 2] - boxes[:, 0], 0, None) * np.clip(
+        boxes[:, 3] - boxes[:, 1], 0, None
+    )
+    suppressed = np.zeros((len(boxes),), dtype=bool)
+    selected = []
+    for i in range(len(boxes)):
+        if suppressed[i]:
+            continue
+        selected.append(i)
+        if len(selected) >= max_detections:
+            break
+        candidates = boxes[i + 1 :]
+        intersection_width = np.clip(
+            np.minimum(boxes[i, 2], candidates[:, 2])
+            - np.maximum(boxes[i, 0], candidates[:, 0]),
+            0,
+            None,
+        )
+        intersection_height = np.clip(
+            np.minimum(boxes[i, 3], candidates[:, 3])
+            - np.maximum(boxes[i, 1], candidates[:, 1]),
+            0,
+            None,
+        )
+        intersection = intersection_width * intersection_height
+        if match_metric == "iou":
+            denominator = areas[i] + areas[i + 1 :] - intersection
+        else:
+            denominator = np.minimum(areas[i], areas[i + 1 :])
+        overlap = np.divide(
+            intersection,
+            denominator,
+            out=np.zeros_like(intersection),
+            where=denominator > 0,
+        )
+        to_suppress = overlap > iou_thresh
+        if groups is not None:
+            to_suppress &= groups[i + 1 :] != groups[i]
+        suppressed[i + 1 :] |= to_suppress
+    return order[selected]
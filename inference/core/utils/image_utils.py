@@ -3,15 +3,14 @@ import os
 import pickle
 import re
 import urllib.parse
+from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 import pybase64
-import requests
-import tldextract
 from _io import _IOBase
 from PIL import Image
 from requests import RequestException
@@ -34,9 +33,43 @@ from inference.core.exceptions import (
     InvalidNumpyInput,
 )
 from inference.core.utils.function import deprecated
-from inference.core.utils.requests import api_key_safe_raise_for_status
+from inference.core.utils.url_images import fetch_image_bytes, get_domain_extractor
 
 BASE64_DATA_TYPE_PATTERN = re.compile(r"^data:image\/[a-z]+;base64,")
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+EXIF_ORIENTATION_TAG = 0x0112
+TRANSPOSING_EXIF_ORIENTATIONS = {5, 6, 7, 8}
+REDUCED_DECODING_FLAGS = {
+    2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+
+@dataclass
+class DecodingSizeHint:
+    """Size of the model input that decoded image is about to be resized to.
+
+    Lets encoded JPEG images be decoded in reduced resolution (scaled by 2, 4 or 8 in DCT
+    domain, with `cv2.IMREAD_REDUCED_*` flags) when they are at least that many times
+    larger than needed. Reduction is only applied when it is exact - dimensions of image
+    and boundaries of static crop must be divisible by the factor - so that coordinates
+    in original image are the ones of decoded image multiplied by `reduction_factor`,
+    which is filled in by the decoder.
+
+    Attributes:
+        height (int): Height of model input.
+        width (int): Width of model input.
+        resize_method (str): Resize method of model - "Stretch to" or one of "Fit ... in".
+        static_crop (Optional[Dict[str, int]]): Static crop config to be applied on decoded image.
+        reduction_factor (int): Factor the image was reduced by while decoding.
+    """
+
+    height: int
+    width: int
+    resize_method: str = "Stretch to"
+    static_crop: Optional[Dict[str, int]] = None
+    reduction_factor: int = 1
 
 
 class ImageType(Enum):
@@ -70,12 +103,16 @@ def load_image_bgr(value: Any, disable_preproc_auto_orient: bool = False) -> np.
 def load_image(
     value: Any,
     disable_preproc_auto_orient: bool = False,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> Tuple[np.ndarray, bool]:
     """Loads an image based on the specified type and value.
 
     Args:
         value (Any): Image value which could be an instance of InferenceRequestImage,
             a dict with 'type' and 'value' keys, or inferred based on the value's content.
+        disable_preproc_auto_orient (bool): Flag to disable preprocessing auto-orientation.
+        size_hint (Optional[DecodingSizeHint]): If given, encoded images may be decoded in
+            reduced resolution - `size_hint.reduction_factor` tells by how much.
 
     Returns:
         Image.Image: The loaded PIL image, converted to RGB.
@@ -93,10 +130,11 @@ def load_image(
             value=value,
             image_type=image_type,
             cv_imread_flags=cv_imread_flags,
+            size_hint=size_hint,
         )
     else:
         np_image, is_bgr = load_image_with_inferred_type(
-            value, cv_imread_flags=cv_imread_flags
+            value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
         )
     np_image = convert_gray_image_to_bgr(image=np_image)
     logger.debug(f"Loaded inference image. Shape: {getattr(np_image, 'shape', None)}")
@@ -152,6 +190,7 @@ def load_image_with_known_type(
     value: Any,
     image_type: ImageType,
     cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> Tuple[np.ndarray, bool]:
     """Load an image using the known image type.
 
@@ -161,25 +200,28 @@ def load_image_with_known_type(
         value (Any): The image data.
         image_type (ImageType): The type of the image.
         cv_imread_flags (int): Flags used for OpenCV's imread function.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         Tuple[np.ndarray, bool]: A tuple of the loaded image as a numpy array and a boolean indicating if the image is in BGR format.
     """
     loader = IMAGE_LOADERS[image_type]
     is_bgr = True if image_type is not ImageType.PILLOW else False
-    image = loader(value, cv_imread_flags)
+    image = loader(value, cv_imread_flags, size_hint)
     return image, is_bgr
 
 
 def load_image_with_inferred_type(
     value: Any,
     cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> Tuple[np.ndarray, bool]:
     """Load an image by inferring its type.
 
     Args:
         value (Any): The image data.
         cv_imread_flags (int): Flags used for OpenCV's imread function.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         Tuple[np.ndarray, bool]: Loaded image as a numpy array and a boolean indicating if the image is in BGR format.
@@ -193,18 +235,29 @@ def load_image_with_inferred_type(
     elif isinstance(value, Image.Image):
         return np.asarray(value.convert("RGB")), False
     elif isinstance(value, str) and (value.startswith("http")):
-        return load_image_from_url(value=value, cv_imread_flags=cv_imread_flags), True
+        return (
+            load_image_from_url(
+                value=value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+            ),
+            True,
+        )
     elif isinstance(value, str) and os.path.isfile(value):
-        return cv2.imread(value, cv_imread_flags), True
+        return (
+            load_image_from_file(
+                value=value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+            ),
+            True,
+        )
     else:
         return attempt_loading_image_from_string(
-            value=value, cv_imread_flags=cv_imread_flags
+            value=value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
         )
 
 
 def attempt_loading_image_from_string(
     value: Union[str, bytes, bytearray, _IOBase],
     cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> Tuple[np.ndarray, bool]:
     """
     Attempt to load an image from a string.
@@ -212,24 +265,34 @@ def attempt_loading_image_from_string(
     Args:
         value (Union[str, bytes, bytearray, _IOBase]): The image data in string format.
         cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         Tuple[np.ndarray, bool]: A tuple of the loaded image in numpy array format and a boolean flag indicating if the image is in BGR format.
     """
     try:
-        return load_image_base64(value=value, cv_imread_flags=cv_imread_flags), True
+        return (
+            load_image_base64(
+                value=value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+            ),
+            True,
+        )
     except:
         pass
     try:
         return (
-            load_image_from_encoded_bytes(value=value, cv_imread_flags=cv_imread_flags),
+            load_image_from_encoded_bytes(
+                value=value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+            ),
             True,
         )
     except:
         pass
     try:
         return (
-            load_image_from_buffer(value=value, cv_imread_flags=cv_imread_flags),
+            load_image_from_buffer(
+                value=value, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+            ),
             True,
         )
     except:
@@ -246,12 +309,16 @@ def attempt_loading_image_from_string(
 
 
 def load_image_base64(
-    value: Union[str, bytes], cv_imread_flags=cv2.IMREAD_COLOR
+    value: Union[str, bytes],
+    cv_imread_flags=cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> np.ndarray:
     """Loads an image from a base64 encoded string using OpenCV.
 
     Args:
         value (str): Base64 encoded string representing the image.
+        cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         np.ndarray: The loaded image as a numpy array.
@@ -273,7 +340,9 @@ def load_image_base64(
             public_message="Empty image payload.",
         )
     image_np = np.frombuffer(value, np.uint8)
-    result = cv2.imdecode(image_np, cv_imread_flags)
+    result = decode_image_bytes(
+        image_np=image_np, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+    )
     if result is None:
         raise InputImageLoadError(
             message="Could not load valid image from base64 string.",
@@ -285,18 +354,23 @@ def load_image_base64(
 def load_image_from_buffer(
     value: _IOBase,
     cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> np.ndarray:
     """Loads an image from a multipart-encoded input.
 
     Args:
         value (Any): Multipart-encoded input representing the image.
+        cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         Image.Image: The loaded PIL image.
     """
     value.seek(0)
     image_np = np.frombuffer(value.read(), np.uint8)
-    result = cv2.imdecode(image_np, cv_imread_flags)
+    result = decode_image_bytes(
+        image_np=image_np, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+    )
     if result is None:
         raise InputImageLoadError(
             message="Could not load valid image from buffer.",
@@ -368,12 +442,16 @@ def validate_numpy_image(data: np.ndarray) -> None:
 
 
 def load_image_from_url(
-    value: str, cv_imread_flags: int = cv2.IMREAD_COLOR
+    value: str,
+    cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> np.ndarray:
     """Loads an image from a given URL.
 
     Args:
         value (str): URL of the image.
+        cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         Image.Image: The loaded PIL image.
@@ -388,7 +466,7 @@ def load_image_from_url(
             public_message=message,
         ) from error
     _ensure_resource_schema_allowed(schema=parsed_url.scheme)
-    domain_extraction_result = tldextract.TLDExtract(suffix_list_urls=())(
+    domain_extraction_result = get_domain_extractor()(
         parsed_url.netloc
     )  # we get rid of potential ports and parse FQDNs
     _ensure_resource_fqdn_allowed(fqdn=domain_extraction_result.fqdn)
@@ -403,16 +481,17 @@ def load_image_from_url(
         destination=address_parts_concatenated
     )
     try:
-        response = requests.get(value, stream=True)
-        api_key_safe_raise_for_status(response=response)
-        return load_image_from_encoded_bytes(
-            value=response.content, cv_imread_flags=cv_imread_flags
-        )
+        content = fetch_image_bytes(url=value)
     except (RequestException, ConnectionError) as error:
         raise InputImageLoadError(
             message=f"Could not load image from url: {value}. Details: {error}",
             public_message="Data pointed by URL could not be decoded into image.",
         )
+    return load_image_from_encoded_bytes(
+        value=content,
+        cv_imread_flags=cv_imread_flags,
+        size_hint=size_hint,
+    )
 
 
 def _ensure_url_input_allowed() -> None:
@@ -484,7 +563,9 @@ def _ensure_location_matches_destination_blacklist(destination: str) -> None:
 
 
 def load_image_from_encoded_bytes(
-    value: bytes, cv_imread_flags: int = cv2.IMREAD_COLOR
+    value: bytes,
+    cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
 ) -> np.ndarray:
     """
     Load an image from encoded bytes.
@@ -492,12 +573,15 @@ def load_image_from_encoded_bytes(
     Args:
         value (bytes): The byte sequence representing the image.
         cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
 
     Returns:
         np.ndarray: The loaded image as a numpy array.
     """
-    image_np = np.asarray(bytearray(value), dtype=np.uint8)
-    image = cv2.imdecode(image_np, cv_imread_flags)
+    image_np = np.frombuffer(value, dtype=np.uint8)
+    image = decode_image_bytes(
+        image_np=image_np, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+    )
     if image is None:
         raise InputImageLoadError(
             message=f"Could not decode bytes as image.",
@@ -506,13 +590,153 @@ def load_image_from_encoded_bytes(
     return image
 
 
+def load_image_from_file(
+    value: str,
+    cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
+) -> Optional[np.ndarray]:
+    """
+    Load an image from local file.
+
+    Args:
+        value (str): Path to the image file.
+        cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding.
+
+    Returns:
+        Optional[np.ndarray]: The loaded image as a numpy array or None if file could not be decoded.
+    """
+    if size_hint is None:
+        return cv2.imread(value, cv_imread_flags)
+    try:
+        image_np = np.fromfile(value, dtype=np.uint8)
+    except OSError:
+        return None
+    return decode_image_bytes(
+        image_np=image_np, cv_imread_flags=cv_imread_flags, size_hint=size_hint
+    )
+
+
+def decode_image_bytes(
+    image_np: np.ndarray,
+    cv_imread_flags: int = cv2.IMREAD_COLOR,
+    size_hint: Optional[DecodingSizeHint] = None,
+) -> Optional[np.ndarray]:
+    """
+    Decode encoded image, in reduced resolution if `size_hint` allows that.
+
+    Args:
+        image_np (np.ndarray): Encoded image bytes.
+        cv_imread_flags (int): OpenCV flags used for image reading.
+        size_hint (Optional[DecodingSizeHint]): Optional hint allowing reduced resolution decoding -
+            `reduction_factor` of the hint is updated with the factor actually applied.
+
+    Returns:
+        Optional[np.ndarray]: Decoded image or None if bytes could not be decoded.
+    """
+    if size_hint is None:
+        return cv2.imdecode(image_np, cv_imread_flags)
+    size_hint.reduction_factor = 1
+    image_size = get_jpeg_image_size(
+        image_np=image_np,
+        apply_orientation=not cv_imread_flags & cv2.IMREAD_IGNORE_ORIENTATION,
+    )
+    if image_size is None:
+        return cv2.imdecode(image_np, cv_imread_flags)
+    reduction_factor = choose_decoding_reduction_factor(
+        image_size=image_size, size_hint=size_hint
+    )
+    if reduction_factor == 1:
+        return cv2.imdecode(image_np, cv_imread_flags)
+    image = cv2.imdecode(
+        image_np, cv_imread_flags | REDUCED_DECODING_FLAGS[reduction_factor]
+    )
+    expected_size = (
+        image_size[0] // reduction_factor,
+        image_size[1] // reduction_factor,
+    )
+    if image is None or image.shape[:2] != expected_size:
+        return cv2.imdecode(image_np, cv_imread_flags)
+    size_hint.reduction_factor = reduction_factor
+    return image
+
+
+def get_jpeg_image_size(
+    image_np: np.ndarray, apply_orientation: bool = True
+) -> Optional[Tuple[int, int]]:
+    """
+    Read (height, width) of JPEG image (as it is after decoding) from its header.
+
+    Args:
+        image_np (np.ndarray): Encoded image bytes.
+        apply_orientation (bool): Flag to decide if EXIF orientation is to be taken into account.
+
+    Returns:
+        Optional[Tuple[int, int]]: Size of image, None if bytes are not JPEG or header is malformed.
+    """
+    if image_np[: len(JPEG_SIGNATURE)].tobytes() != JPEG_SIGNATURE:
+        return None
+    try:
+        with Image.open(BytesIO(image_np.tobytes())) as image:
+            width, height = image.size
+            orientation = image.getexif().get(EXIF_ORIENTATION_TAG, 1)
+    except Exception:
+        return None
+    if apply_orientation and orientation in TRANSPOSING_EXIF_ORIENTATIONS:
+        return width, height
+    return height, width
+
+
+def choose_decoding_reduction_factor(
+    image_size: Tuple[int, int], size_hint: DecodingSizeHint
+) -> int:
+    """
+    Choose the largest factor (2, 4 or 8) by which image can be reduced while decoding, such that
+    (statically cropped) image is still not smaller than what the model resizes it to and the
+    reduction is exact - image dimensions and static crop boundaries are divisible by the factor.
+
+    Args:
+        image_size (Tuple[int, int]): Size of image (height, width).
+        size_hint (DecodingSizeHint): Hint with the size of model input.
+
+    Returns:
+        int: Reduction factor, 1 if image cannot be reduced.
+    """
+    height, width = image_size
+    boundaries = [0, 0, width, height]
+    if size_hint.static_crop is not None:
+        boundaries = [
+            int(size_hint.static_crop["x_min"] / 100 * width),
+            int(size_hint.static_crop["y_min"] / 100 * height),
+            int(size_hint.static_crop["x_max"] / 100 * width),
+            int(size_hint.static_crop["y_max"] / 100 * height),
+        ]
+    crop_width = boundaries[2] - boundaries[0]
+    crop_height = boundaries[3] - boundaries[1]
+    if crop_width <= 0 or crop_height <= 0:
+        return 1
+    height_ratio = crop_height / size_hint.height
+    width_ratio = crop_width / size_hint.width
+    if size_hint.resize_method == "Stretch to":
+        max_reduction = min(height_ratio, width_ratio)
+    else:
+        # image keeping aspect ratio is fitted into model input
+        max_reduction = max(height_ratio, width_ratio)
+    for factor in sorted(REDUCED_DECODING_FLAGS, reverse=True):
+        if factor > max_reduction:
+            continue
+        if all(value % factor == 0 for value in [height, width] + boundaries):
+            return factor
+    return 1
+
+
 IMAGE_LOADERS = {
     ImageType.BASE64: load_image_base64,
-    ImageType.FILE: cv2.imread,
+    ImageType.FILE: load_image_from_file,
     ImageType.MULTIPART: load_image_from_buffer,
-    ImageType.NUMPY: lambda v, _: load_image_from_numpy_str(v),
-    ImageType.NUMPY_OBJECT: lambda v, _: load_image_from_numpy_object(v),
-    ImageType.PILLOW: lambda v, _: np.asarray(v.convert("RGB")),
+    ImageType.NUMPY: lambda v, *_: load_image_from_numpy_str(v),
+    ImageType.NUMPY_OBJECT: lambda v, *_: load_image_from_numpy_object(v),
+    ImageType.PILLOW: lambda v, *_: np.asarray(v.convert("RGB")),
     ImageType.URL: load_image_from_url,
 }
 
@@ -1,5 +1,6 @@
+import math
 from copy import deepcopy
-from typing import Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -118,49 +119,34 @@ def post_process_bboxes(
         List[List[List[float]]]: The scaled and shifted predictions, indices are: batch x prediction x [x1, y1, x2, y2, ...].
     """
 
-    # Get static crop params
-    scaled_predictions = []
-    # Loop through batches
-    for i, batch_predictions in enumerate(predictions):
-        if len(batch_predictions) == 0:
-            scaled_predictions.append([])
-            continue
-        np_batch_predictions = np.array(batch_predictions)
-        # Get bboxes from predictions (x1,y1,x2,y2)
-        predicted_bboxes = np_batch_predictions[:, :4]
-        (crop_shift_x, crop_shift_y), origin_shape = get_static_crop_dimensions(
-            img_dims[i],
-            preproc,
-            disable_preproc_static_crop=disable_preproc_static_crop,
-        )
-        if resize_method == "Stretch to":
-            predicted_bboxes = stretch_bboxes(
-                predicted_bboxes=predicted_bboxes,
-                infer_shape=infer_shape,
-                origin_shape=origin_shape,
-            )
-        elif (
-            resize_method == "Fit (black edges) in"
-            or resize_method == "Fit (white edges) in"
-            or resize_method == "Fit (grey edges) in"
-        ):
-            predicted_bboxes = undo_image_padding_for_predicted_boxes(
-                predicted_bboxes=predicted_bboxes,
-                infer_shape=infer_shape,
-                origin_shape=origin_shape,
-            )
-        predicted_bboxes = clip_boxes_coordinates(
-            predicted_bboxes=predicted_bboxes,
-            origin_shape=origin_shape,
-        )
-        predicted_bboxes = shift_bboxes(
-            bboxes=predicted_bboxes,
-            shift_x=crop_shift_x,
-            shift_y=crop_shift_y,
-        )
-        np_batch_predictions[:, :4] = predicted_bboxes
-        scaled_predictions.append(np_batch_predictions.tolist())
-    return scaled_predictions
+    predictions_counts = [len(batch_predictions) for batch_predictions in predictions]
+    if sum(predictions_counts) == 0:
+        return [[] for _ in predictions]
+    np_predictions = np.concatenate(
+        [
+            np.asarray(batch_predictions, dtype=np.float64)
+            for batch_predictions in predictions
+            if len(batch_predictions) > 0
+        ]
+    )
+    transform_parameters = get_batch_transform_parameters(
+        img_dims=img_dims,
+        counts=predictions_counts,
+        infer_shape=infer_shape,
+        preproc=preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+        resize_method=resize_method,
+        padded_size_rounding=round,
+    )
+    # [x1, y1, x2, y2] viewed as two (x, y) points of each box
+    corners = np_predictions[:, :4].reshape(-1, 2, 2)
+    transform_coordinates(
+        coordinates=corners,
+        transform_parameters=transform_parameters,
+        clip_and_round=True,
+    )
+    np_predictions[:, :4] = corners.reshape(-1, 4)
+    return split_batch(np_predictions.tolist(), counts=predictions_counts)
 
 
 def stretch_bboxes(
@@ -261,6 +247,237 @@ def process_mask_accurate(
     return masks
 
 
+def process_mask_accurate_roi(
+    protos: np.ndarray,
+    masks_in: np.ndarray,
+    bboxes: np.ndarray,
+    shape: Tuple[int, int],
+) -> List[Tuple[np.ndarray, Tuple[int, int]]]:
+    """Returns binary masks of `process_mask_accurate(...)` quality, cropped to bounding boxes.
+
+    Only the region of interest of each bounding box is upsampled (with the same bilinear
+    sampling that full-size resize uses), so no mask of the size of the original image
+    is ever allocated.
+
+    Args:
+        protos (numpy.ndarray): Prototype masks.
+        masks_in (numpy.ndarray): Input masks.
+        bboxes (numpy.ndarray): Bounding boxes.
+        shape (tuple): Target shape.
+
+    Returns:
+        list: Tuples of boolean mask crop and (x, y) coordinates of its top-left corner in target shape.
+    """
+    masks = preprocess_segmentation_masks(
+        protos=protos,
+        masks_in=masks_in,
+        shape=shape,
+    )
+    scale_x, scale_y = masks.shape[2] / shape[1], masks.shape[1] / shape[0]
+    results = []
+    for mask, bbox in zip(masks, bboxes):
+        roi = get_bbox_pixels_roi(bbox=bbox, shape=shape)
+        crop = resize_mask_roi(mask=mask, roi=roi, scale_x=scale_x, scale_y=scale_y)
+        results.append((crop >= 0.5, roi[:2]))
+    return results
+
+
+def get_bbox_pixels_roi(
+    bbox: np.ndarray, shape: Tuple[int, int]
+) -> Tuple[int, int, int, int]:
+    """Returns (x_min, y_min, x_max, y_max) range of pixels that `crop_mask(...)` retains for bbox."""
+    height, width = shape
+    x_min = min(max(math.ceil(bbox[0]), 0), width)
+    y_min = min(max(math.ceil(bbox[1]), 0), height)
+    x_max = min(max(math.ceil(bbox[2]), x_min), width)
+    y_max = min(max(math.ceil(bbox[3]), y_min), height)
+    return x_min, y_min, x_max, y_max
+
+
+def resize_mask_roi(
+    mask: np.ndarray,
+    roi: Tuple[int, int, int, int],
+    scale_x: float,
+    scale_y: float,
+    shift_x: float = 0.0,
+    shift_y: float = 0.0,
+) -> np.ndarray:
+    """Bilinearly samples `roi` of upsampled mask without upsampling the whole mask.
+
+    Pixel (x, y) of output space is sampled from mask at
+    ((x + 0.5) * scale_x + shift_x - 0.5, (y + 0.5) * scale_y + shift_y - 0.5) - with zero shifts
+    this is the pixel-centers convention of `cv2.resize(...)` with `cv2.INTER_LINEAR`.
+
+    Args:
+        mask (np.ndarray): Mask of shape (h, w).
+        roi (tuple): (x_min, y_min, x_max, y_max) range of output pixels to compute.
+        scale_x (float): Mask width to output width ratio.
+        scale_y (float): Mask height to output height ratio.
+        shift_x (float): Shift of output coordinates expressed in mask pixels.
+        shift_y (float): Shift of output coordinates expressed in mask pixels.
+
+    Returns:
+        np.ndarray: Values of mask of shape (y_max - y_min, x_max - x_min).
+    """
+    x_min, y_min, x_max, y_max = roi
+    x_0, x_1, x_weights = _get_linear_interpolation_indices(
+        start=x_min, end=x_max, scale=scale_x, shift=shift_x, size=mask.shape[1]
+    )
+    y_0, y_1, y_weights = _get_linear_interpolation_indices(
+        start=y_min, end=y_max, scale=scale_y, shift=shift_y, size=mask.shape[0]
+    )
+    top, bottom = mask[y_0], mask[y_1]
+    rows = top + (bottom - top) * y_weights[:, None]
+    left, right = rows[:, x_0], rows[:, x_1]
+    return left + (right - left) * x_weights[None, :]
+
+
+def _get_linear_interpolation_indices(
+    start: int, end: int, scale: float, shift: float, size: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    source = (np.arange(start, end, dtype=np.float64) + 0.5) * scale + shift - 0.5
+    lower = np.floor(source)
+    weights = (source - lower).astype(np.float32)
+    lower = lower.astype(np.int64)
+    out_of_range = (lower < 0) | (lower >= size - 1)
+    weights[out_of_range] = 0.0
+    lower = np.clip(lower, 0, size - 1)
+    upper = np.minimum(lower + 1, size - 1)
+    return lower, upper, weights
+
+
+def mask_crops2poly(
+    crops: List[Tuple[np.ndarray, Tuple[int, int]]]
+) -> List[np.ndarray]:
+    """Converts binary mask crops (as returned by `process_mask_accurate_roi(...)`) to polygons.
+
+    Args:
+        crops (list): Tuples of binary mask crop and (x, y) coordinates of its top-left corner.
+
+    Returns:
+        list: A list of segments expressed in coordinates of the full mask.
+    """
+    segments = []
+    for crop, (x_min, y_min) in crops:
+        # padding with background, so that contours of crops touching the box are closed
+        padded = np.pad(crop.astype(np.uint8), 1)
+        polygon = mask2poly(padded)
+        polygon[:, 0] += x_min - 1
+        polygon[:, 1] += y_min - 1
+        segments.append(polygon)
+    return segments
+
+
+def get_origin_to_mask_transform(
+    origin_shape: Tuple[int, int],
+    infer_shape: Tuple[int, int],
+    mask_shape: Tuple[int, int],
+    preproc: dict,
+    disable_preproc_static_crop: bool = False,
+    resize_method: str = "Stretch to",
+) -> Tuple[float, float, float, float]:
+    """Computes (scale_x, scale_y, shift_x, shift_y) to be used with `resize_mask_roi(...)`,
+    such that masks predicted in inference space are sampled directly at the pixels of the
+    original image.
+
+    Args:
+        origin_shape (Tuple[int, int]): The dimensions of the original image - (height, width).
+        infer_shape (Tuple[int, int]): The shape of the inference image.
+        mask_shape (Tuple[int, int]): The shape of the (prototype) masks, covering the whole inference image.
+        preproc (dict): Preprocessing configuration dictionary.
+        disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+        resize_method (str, optional): Resize method for image. Defaults to "Stretch to".
+
+    Returns:
+        Tuple[float, float, float, float]: Scales and shifts of the transformation.
+    """
+    (crop_shift_x, crop_shift_y), origin_shape = get_static_crop_dimensions(
+        origin_shape,
+        preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+    )
+    if resize_method == "Stretch to":
+        ratio_x = infer_shape[1] / origin_shape[1]
+        ratio_y = infer_shape[0] / origin_shape[0]
+        pad_x, pad_y = 0.0, 0.0
+    elif resize_method in {
+        "Fit (black edges) in",
+        "Fit (white edges) in",
+        "Fit (grey edges) in",
+    }:
+        ratio_x = ratio_y = min(
+            infer_shape[0] / origin_shape[0], infer_shape[1] / origin_shape[1]
+        )
+        pad_x = (infer_shape[1] - round(origin_shape[1] * ratio_x)) / 2
+        pad_y = (infer_shape[0] - round(origin_shape[0] * ratio_y)) / 2
+    else:
+        raise PostProcessingError(
+            f"Could not map masks to original image for resize method: {resize_method}"
+        )
+    mask_scale_x = mask_shape[1] / infer_shape[1]
+    mask_scale_y = mask_shape[0] / infer_shape[0]
+    return (
+        ratio_x * mask_scale_x,
+        ratio_y * mask_scale_y,
+        (pad_x - crop_shift_x * ratio_x) * mask_scale_x,
+        (pad_y - crop_shift_y * ratio_y) * mask_scale_y,
+    )
+
+
+def mask_crop2rle(
+    crop: np.ndarray, offset: Tuple[int, int], shape: Tuple[int, int]
+) -> List[int]:
+    """Computes COCO run-length encoding counts of the full mask of given `shape`, which is
+    empty except of `crop` placed at `offset` - without materialising the full mask.
+
+    Args:
+        crop (np.ndarray): Binary mask crop.
+        offset (Tuple[int, int]): (x, y) coordinates of the top-left corner of crop.
+        shape (Tuple[int, int]): Shape of the full mask - (height, width).
+
+    Returns:
+        List[int]: Lengths of alternating runs of background and foreground pixels in column-major order.
+    """
+    height, width = shape
+    x_min, y_min = offset
+    columns = np.pad(crop.T.astype(np.int8), ((0, 0), (1, 1)))
+    changes = np.diff(columns, axis=1)
+    starts_columns, starts_rows = np.nonzero(changes == 1)
+    ends_columns, ends_rows = np.nonzero(changes == -1)
+    starts = (starts_columns + x_min) * height + starts_rows + y_min
+    ends = (ends_columns + x_min) * height + ends_rows + y_min
+    if len(starts) == 0:
+        return [height * width]
+    # runs spanning whole columns continue in the next column
+    continued = ends[:-1] == starts[1:]
+    starts = starts[np.concatenate(([True], ~continued))]
+    ends = ends[np.concatenate((~continued, [True]))]
+    boundaries = np.empty(2 * len(starts) + 2, dtype=np.int64)
+    boundaries[0], boundaries[-1] = 0, height * width
+    boundaries[1:-1:2], boundaries[2:-1:2] = starts, ends
+    counts = np.diff(boundaries).tolist()
+    if counts[-1] == 0:
+        counts.pop()
+    return counts
+
+
+def rle_counts2string(counts: List[int]) -> str:
+    """Compresses COCO run-length encoding counts into the string format used by pycocotools."""
+    result = []
+    for i, value in enumerate(counts):
+        if i > 2:
+            value -= counts[i - 2]
+        more = True
+        while more:
+            char = value & 0x1F
+            value >>= 5
+            more = value != -1 if char & 0x10 else value != 0
+            if more:
+                char |= 0x20
+            result.append(chr(char + 48))
+    return "".join(result)
+
+
 def process_mask_tradeoff(
     protos: np.ndarray,
     masks_in: np.ndarray,
@@ -392,11 +609,11 @@ def crop_mask(masks: np.ndarray, boxes: np.ndarray) -> np.ndarray:
 
 def post_process_polygons(
     origin_shape: Tuple[int, int],
-    polys: List[List[Tuple[float, float]]],
+    polys: List[np.ndarray],
     infer_shape: Tuple[int, int],
     preproc: dict,
     resize_method: str = "Stretch to",
-) -> List[List[Tuple[float, float]]]:
+) -> List[np.ndarray]:
     """Scales and shifts polygons based on the given image shapes and preprocessing method.
 
     This function performs polygon scaling and shifting based on the specified resizing method and
@@ -405,71 +622,198 @@ def post_process_polygons(
     Args:
         origin_shape (tuple of int): Shape of the source image (height, width).
         infer_shape (tuple of int): Shape of the target image (height, width).
-        polys (list of list of tuple): List of polygons, where each polygon is represented by a list of (x, y) coordinates.
+        polys (list of np.ndarray): List of polygons, where each polygon is represented by (x, y) coordinates of its points.
         preproc (object): Preprocessing details used for generating the transformation.
         resize_method (str, optional): Resizing method, either "Stretch to", "Fit (black edges) in", "Fit (white edges) in", or "Fit (grey edges) in". Defaults to "Stretch to".
 
     Returns:
-        list of list of tuple: A list of shifted and scaled polygons.
+        list of np.ndarray: A list of shifted and scaled polygons - arrays of shape (n, 2).
     """
-    (crop_shift_x, crop_shift_y), origin_shape = get_static_crop_dimensions(
-        origin_shape, preproc
-    )
-    new_polys = []
-    if resize_method == "Stretch to":
-        width_ratio = origin_shape[1] / infer_shape[1]
-        height_ratio = origin_shape[0] / infer_shape[0]
-        new_polys = scale_polygons(
-            polygons=polys,
-            x_scale=width_ratio,
-            y_scale=height_ratio,
-        )
-    elif resize_method in {
-        "Fit (black edges) in",
-        "Fit (white edges) in",
-        "Fit (grey edges) in",
-    }:
-        new_polys = undo_image_padding_for_predicted_polygons(
-            polygons=polys,
-            infer_shape=infer_shape,
-            origin_shape=origin_shape,
+    return post_process_polygons_batch(
+        polygons=[polys],
+        img_dims=[origin_shape],
+        infer_shape=infer_shape,
+        preproc=preproc,
+        resize_method=resize_method,
+    )[0]
+
+
+def post_process_polygons_batch(
+    polygons: List[List[np.ndarray]],
+    img_dims: List[Tuple[int, int]],
+    infer_shape: Tuple[int, int],
+    preproc: dict,
+    disable_preproc_static_crop: bool = False,
+    resize_method: str = "Stretch to",
+) -> List[List[np.ndarray]]:
+    """Scales and shifts polygons of the whole batch based on the given image shapes and preprocessing method.
+
+    Points of all polygons are concatenated and transformed at once - and then split back into polygons.
+
+    Args:
+        polygons (list of list of np.ndarray): Polygons of each image, each represented by (x, y) coordinates of its points.
+        img_dims (list of tuple of int): Shapes of the source images (height, width).
+        infer_shape (tuple of int): Shape of the space polygons are expressed in (height, width).
+        preproc (object): Preprocessing details used for generating the transformation.
+        disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+        resize_method (str, optional): Resizing method, either "Stretch to", "Fit (black edges) in", "Fit (white edges) in", or "Fit (grey edges) in". Defaults to "Stretch to".
+
+    Returns:
+        list of list of np.ndarray: Shifted and scaled polygons of each image - arrays of shape (n, 2).
+    """
+    points, polygons_counts, points_counts = concatenate_polygons(polygons=polygons)
+    images_points_counts = [
+        sum(points_counts[offset : offset + count])
+        for offset, count in zip(
+            np.cumsum([0] + polygons_counts[:-1]).tolist(), polygons_counts
         )
-    shifted_polys = []
-    for poly in new_polys:
-        poly = [(p[0] + crop_shift_x, p[1] + crop_shift_y) for p in poly]
-        shifted_polys.append(poly)
-    return shifted_polys
+    ]
+    transform_parameters = get_batch_transform_parameters(
+        img_dims=img_dims,
+        counts=images_points_counts,
+        infer_shape=infer_shape,
+        preproc=preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+        resize_method=resize_method,
+    )
+    transform_coordinates(
+        coordinates=points[:, None, :],
+        transform_parameters=transform_parameters,
+        clip_and_round=False,
+    )
+    return split_batch(
+        split_polygons(points=points, counts=points_counts),
+        counts=polygons_counts,
+    )
 
 
 def scale_polygons(
-    polygons: List[List[Tuple[float, float]]],
+    polygons: List[np.ndarray],
     x_scale: float,
     y_scale: float,
-) -> List[List[Tuple[float, float]]]:
-    result = []
-    for poly in polygons:
-        poly = [(p[0] * x_scale, p[1] * y_scale) for p in poly]
-        result.append(poly)
-    return result
+) -> List[np.ndarray]:
+    points, _, points_counts = concatenate_polygons(polygons=[polygons])
+    points *= (x_scale, y_scale)
+    return split_polygons(points=points, counts=points_counts)
 
 
 def undo_image_padding_for_predicted_polygons(
-    polygons: List[List[Tuple[float, float]]],
+    polygons: List[np.ndarray],
     origin_shape: Tuple[int, int],
     infer_shape: Tuple[int, int],
-) -> List[List[Tuple[float, float]]]:
+) -> List[np.ndarray]:
     scale = min(infer_shape[0] / origin_shape[0], infer_shape[1] / origin_shape[1])
     inter_w = int(origin_shape[1] * scale)
     inter_h = int(origin_shape[0] * scale)
     pad_x = (infer_shape[1] - inter_w) / 2
     pad_y = (infer_shape[0] - inter_h) / 2
+    points, _, points_counts = concatenate_polygons(polygons=[polygons])
+    points -= (pad_x, pad_y)
+    points /= scale
+    return split_polygons(points=points, counts=points_counts)
+
+
+def concatenate_polygons(
+    polygons: List[List[np.ndarray]],
+) -> Tuple[np.ndarray, List[int], List[int]]:
+    """
+    Concatenates points of polygons of the batch into single (ragged) array of shape (n, 2).
+
+    Returns:
+        Tuple[np.ndarray, List[int], List[int]]: Points of all polygons, number of polygons of
+            each image and number of points of each polygon - to split the points back.
+    """
+    polygons_counts = [len(image_polygons) for image_polygons in polygons]
+    flat_polygons = [
+        np.asarray(polygon).reshape(-1, 2)
+        for image_polygons in polygons
+        for polygon in image_polygons
+    ]
+    points_counts = [len(polygon) for polygon in flat_polygons]
+    if not flat_polygons:
+        return np.zeros((0, 2), dtype=np.float64), polygons_counts, points_counts
+    points = np.concatenate(flat_polygons, dtype=np.float64)
+    return points, polygons_counts, points_counts
+
+
+def split_polygons(points: np.ndarray, counts: List[int]) -> List[np.ndarray]:
+    if not counts:
+        return []
+    return np.split(points, np.cumsum(counts[:-1]))
+
+
+def split_batch(elements: list, counts: List[int]) -> List[list]:
     result = []
-    for poly in polygons:
-        poly = [((p[0] - pad_x) / scale, (p[1] - pad_y) / scale) for p in poly]
-        result.append(poly)
+    offset = 0
+    for count in counts:
+        result.append(elements[offset : offset + count])
+        offset += count
     return result
 
 
+def get_batch_transform_parameters(
+    img_dims: List[Tuple[int, int]],
+    counts: List[int],
+    infer_shape: Tuple[int, int],
+    preproc: dict,
+    disable_preproc_static_crop: bool,
+    resize_method: str,
+    padded_size_rounding: Callable[[float], int] = int,
+) -> np.ndarray:
+    """
+    Creates parameters of transformation from inference input into coordinates of original
+    image (undoing static crop and resize) for each of `counts[i]` elements of i-th image.
+    Transformation is expressed as: x' = round(clip((x - pad_x) * mult_x / div_x)) + shift_x
+    (the same for OY) - see `transform_coordinates(...)`.
+
+    Returns:
+        np.ndarray: Array (possibly read-only broadcast view) of shape (sum(counts), 10) with rows
+            of [pad_x, pad_y, mult_x, mult_y, div_x, div_y, clip_x, clip_y, shift_x, shift_y].
+    """
+    transform_parameters = np.array(
+        [
+            _get_transform_parameters(
+                img_dims=img_dims[i],
+                infer_shape=infer_shape,
+                preproc=preproc,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+                resize_method=resize_method,
+                padded_size_rounding=padded_size_rounding,
+            )
+            for i in range(len(counts))
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 10)
+    if len(transform_parameters) > 0 and np.all(
+        transform_parameters == transform_parameters[0]
+    ):
+        # images of the same size (like frames of video) share parameters - which are
+        # broadcast instead of being repeated for each element
+        return np.broadcast_to(transform_parameters[0], (sum(counts), 10))
+    return np.repeat(transform_parameters, counts, axis=0)
+
+
+def transform_coordinates(
+    coordinates: np.ndarray,
+    transform_parameters: np.ndarray,
+    clip_and_round: bool,
+) -> None:
+    """
+    Transforms in-place `coordinates` of shape (n, m, 2) - m points (x, y) for each of n
+    elements - with parameters of shape (n, 10) created by `get_batch_transform_parameters(...)`.
+    """
+    pad, mult, div, clip_max, shift = np.split(
+        transform_parameters[:, None, :], 5, axis=2
+    )
+    coordinates -= pad
+    coordinates *= mult
+    coordinates /= div
+    if clip_and_round:
+        np.clip(coordinates, 0, clip_max, out=coordinates)
+        np.round(coordinates, out=coordinates)
+    coordinates += shift
+
+
 def get_static_crop_dimensions(
     orig_shape: Tuple[int, int],
     preproc: dict,
@@ -544,45 +888,76 @@ def post_process_keypoints(
     Returns:
         list of list of list: predictions with post-processed keypoints
     """
-    # Get static crop params
-    scaled_predictions = []
-    # Loop through batches
-    for i, batch_predictions in enumerate(predictions):
-        if len(batch_predictions) == 0:
-            scaled_predictions.append([])
-            continue
-        np_batch_predictions = np.array(batch_predictions)
-        keypoints = np_batch_predictions[:, keypoints_start_index:]
-        (crop_shift_x, crop_shift_y), origin_shape = get_static_crop_dimensions(
-            img_dims[i],
-            preproc,
-            disable_preproc_static_crop=disable_preproc_static_crop,
-        )
-        if resize_method == "Stretch to":
-            keypoints = stretch_keypoints(
-                keypoints=keypoints,
-                infer_shape=infer_shape,
-                origin_shape=origin_shape,
-            )
-        elif (
-            resize_method == "Fit (black edges) in"
-            or resize_method == "Fit (white edges) in"
-            or resize_method == "Fit (grey edges) in"
-        ):
-            keypoints = undo_image_padding_for_predicted_keypoints(
-                keypoints=keypoints,
-                infer_shape=infer_shape,
-                origin_shape=origin_shape,
-            )
-        keypoints = clip_keypoints_coordinates(
-            keypoints=keypoints, origin_shape=origin_shape
-        )
-        keypoints = shift_keypoints(
-            keypoints=keypoints, shift_x=crop_shift_x, shift_y=crop_shift_y
+    predictions_counts = [len(batch_predictions) for batch_predictions in predictions]
+    if sum(predictions_counts) == 0:
+        return [[] for _ in predictions]
+    np_predictions = np.concatenate(
+        [
+            np.asarray(batch_predictions, dtype=np.float64)
+            for batch_predictions in predictions
+            if len(batch_predictions) > 0
+        ]
+    )
+    transform_parameters = get_batch_transform_parameters(
+        img_dims=img_dims,
+        counts=predictions_counts,
+        infer_shape=infer_shape,
+        preproc=preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+        resize_method=resize_method,
+    )
+    keypoints_slice = np_predictions[:, keypoints_start_index:]
+    number_of_keypoints = keypoints_slice.shape[1] // 3
+    keypoints = keypoints_slice[:, : number_of_keypoints * 3].reshape(
+        -1, number_of_keypoints, 3
+    )
+    transform_coordinates(
+        coordinates=keypoints[:, :, :2],
+        transform_parameters=transform_parameters,
+        clip_and_round=True,
+    )
+    keypoints_slice[:, : number_of_keypoints * 3] = keypoints.reshape(
+        -1, number_of_keypoints * 3
+    )
+    return split_batch(np_predictions.tolist(), counts=predictions_counts)
+
+
+def _get_transform_parameters(
+    img_dims: Tuple[int, int],
+    infer_shape: Tuple[int, int],
+    preproc: dict,
+    disable_preproc_static_crop: bool,
+    resize_method: str,
+    padded_size_rounding: Callable[[float], int],
+) -> List[float]:
+    (crop_shift_x, crop_shift_y), origin_shape = get_static_crop_dimensions(
+        img_dims,
+        preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+    )
+    pad, mult, div = (0.0, 0.0), (1.0, 1.0), (1.0, 1.0)
+    if resize_method == "Stretch to":
+        mult = (origin_shape[1] / infer_shape[1], origin_shape[0] / infer_shape[0])
+    elif (
+        resize_method == "Fit (black edges) in"
+        or resize_method == "Fit (white edges) in"
+        or resize_method == "Fit (grey edges) in"
+    ):
+        scale = min(infer_shape[0] / origin_shape[0], infer_shape[1] / origin_shape[1])
+        pad = (
+            (infer_shape[1] - padded_size_rounding(origin_shape[1] * scale)) / 2,
+            (infer_shape[0] - padded_size_rounding(origin_shape[0] * scale)) / 2,
         )
-        np_batch_predictions[:, keypoints_start_index:] = keypoints
-        scaled_predictions.append(np_batch_predictions.tolist())
-    return scaled_predictions
+        div = (scale, scale)
+    return [
+        *pad,
+        *mult,
+        *div,
+        origin_shape[1],
+        origin_shape[0],
+        crop_shift_x,
+        crop_shift_y,
+    ]
 
 
 def stretch_keypoints(
@@ -592,9 +967,8 @@ def stretch_keypoints(
 ) -> np.ndarray:
     scale_width = origin_shape[1] / infer_shape[1]
     scale_height = origin_shape[0] / infer_shape[0]
-    for keypoint_id in range(keypoints.shape[1] // 3):
-        keypoints[:, keypoint_id * 3] *= scale_width
-        keypoints[:, keypoint_id * 3 + 1] *= scale_height
+    keypoints[:, 0::3] *= scale_width
+    keypoints[:, 1::3] *= scale_height
     return keypoints
 
 
@@ -610,11 +984,10 @@ def undo_image_padding_for_predicted_keypoints(
 
     pad_x = (infer_shape[1] - inter_w) / 2
     pad_y = (infer_shape[0] - inter_h) / 2
-    for coord_id in range(keypoints.shape[1] // 3):
-        keypoints[:, coord_id * 3] -= pad_x
-        keypoints[:, coord_id * 3] /= scale
-        keypoints[:, coord_id * 3 + 1] -= pad_y
-        keypoints[:, coord_id * 3 + 1] /= scale
+    keypoints[:, 0::3] -= pad_x
+    keypoints[:, 0::3] /= scale
+    keypoints[:, 1::3] -= pad_y
+    keypoints[:, 1::3] /= scale
     return keypoints
 
 
@@ -622,13 +995,12 @@ def clip_keypoints_coordinates(
     keypoints: np.ndarray,
     origin_shape: Tuple[int, int],
 ) -> np.ndarray:
-    for keypoint_id in range(keypoints.shape[1] // 3):
-        keypoints[:, keypoint_id * 3] = np.round(
-            np.clip(keypoints[:, keypoint_id * 3], a_min=0, a_max=origin_shape[1])
-        )
-        keypoints[:, keypoint_id * 3 + 1] = np.round(
-            np.clip(keypoints[:, keypoint_id * 3 + 1], a_min=0, a_max=origin_shape[0])
-        )
+    keypoints[:, 0::3] = np.round(
+        np.clip(keypoints[:, 0::3], a_min=0, a_max=origin_shape[1])
+    )
+    keypoints[:, 1::3] = np.round(
+        np.clip(keypoints[:, 1::3], a_min=0, a_max=origin_shape[0])
+    )
     return keypoints
 
 
@@ -637,9 +1009,8 @@ def shift_keypoints(
     shift_x: Union[int, float],
     shift_y: Union[int, float],
 ) -> np.ndarray:
-    for keypoint_id in range(keypoints.shape[1] // 3):
-        keypoints[:, keypoint_id * 3] += shift_x
-        keypoints[:, keypoint_id * 3 + 1] += shift_y
+    keypoints[:, 0::3] += shift_x
+    keypoints[:, 1::3] += shift_y
     return keypoints
 
 
@@ -656,3 +1027,41 @@ def sigmoid(x: Union[float, np.ndarray]) -> Union[float, np.number, np.ndarray]:
         float or numpy.ndarray: The computed sigmoid value(s).
     """
     return 1 / (1 + np.exp(-x))
+
+
+def select_top_classes(
+    scores: np.ndarray,
+    top_k: Optional[int] = None,
+    confidence_threshold: Optional[float] = None,
+) -> List[np.ndarray]:
+    """Selects classes to be returned for each row of the batch of classification scores.
+
+    For each row - `top_k` classes with the highest scores are selected (all classes if
+    `top_k` is not given), optionally only those with score above `confidence_threshold`.
+    Candidates are found with partial partitioning (linear in the number of classes), so
+    only the selected classes get sorted.
+
+    Args:
+        scores (np.ndarray): Scores of shape (batch_size, num_classes).
+        top_k (Optional[int]): Max number of classes to be selected for each row.
+        confidence_threshold (Optional[float]): If given, only classes with score above the
+            threshold are selected.
+
+    Returns:
+        List[np.ndarray]: For each row - ids of selected classes, sorted by score descending
+            (ties resolved by class id).
+    """
+    classes_number = scores.shape[1]
+    results = []
+    for row in scores:
+        if top_k is not None and top_k < classes_number:
+            kth_score = -np.partition(-row, top_k - 1)[top_k - 1]
+            # all classes scored as k-th are taken, so that ties are resolved by class id
+            candidates = np.flatnonzero(row >= kth_score)
+        else:
+            candidates = np.arange(classes_number)
+        if confidence_threshold is not None:
+            candidates = candidates[row[candidates] > confidence_threshold]
+        order = np.argsort(-row[candidates], kind="stable")[:top_k]
+        results.append(candidates[order])
+    return results
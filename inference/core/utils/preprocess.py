@@ -18,6 +18,15 @@ GRAYSCALE_KEY = "grayscale"
 ENABLED_KEY = "enabled"
 TYPE_KEY = "type"
 
+RESIZE_INTERPOLATIONS = {
+    "nearest": cv2.INTER_NEAREST,
+    "linear": cv2.INTER_LINEAR,
+    "cubic": cv2.INTER_CUBIC,
+    "area": cv2.INTER_AREA,
+}
+AUTO_RESIZE_INTERPOLATION = "auto"
+AREA_INTERPOLATION_MAX_SCALE = 0.5
+
 
 class ContrastAdjustmentType(Enum):
     CONTRAST_STRETCHING = "Contrast Stretching"
@@ -67,6 +76,7 @@ def prepare(
             image = take_static_crop(
                 image=image, crop_parameters=preproc[STATIC_CROP_KEY]
             )
+        image_is_grayscale = False
         if contrast_adjustments_should_be_applied(
             preprocessing_config=preproc,
             disable_preproc_contrast=disable_preproc_contrast,
@@ -75,9 +85,13 @@ def prepare(
             image = apply_contrast_adjustment(
                 image=image, adjustment_type=adjustment_type
             )
-        if grayscale_conversion_should_be_applied(
-            preprocessing_config=preproc,
-            disable_preproc_grayscale=disable_preproc_grayscale,
+            image_is_grayscale = adjustment_type in GRAYSCALE_CONTRAST_ADJUSTMENTS
+        if (
+            grayscale_conversion_should_be_applied(
+                preprocessing_config=preproc,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+            )
+            and not image_is_grayscale
         ):
             image = apply_grayscale_conversion(image=image)
         return image, img_dims
@@ -151,6 +165,11 @@ CONTRAST_ADJUSTMENTS_METHODS = {
     ContrastAdjustmentType.HISTOGRAM_EQUALISATION: apply_histogram_equalisation,
     ContrastAdjustmentType.ADAPTIVE_EQUALISATION: apply_adaptive_equalisation,
 }
+# adjustments equalising luminance - their results are already grayscale images
+GRAYSCALE_CONTRAST_ADJUSTMENTS = {
+    ContrastAdjustmentType.HISTOGRAM_EQUALISATION,
+    ContrastAdjustmentType.ADAPTIVE_EQUALISATION,
+}
 
 
 def grayscale_conversion_should_be_applied(
@@ -170,40 +189,99 @@ def apply_grayscale_conversion(image: np.ndarray) -> np.ndarray:
     return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
 
 
+def select_resize_interpolation(
+    interpolation: str,
+    image_shape: Tuple[int, ...],
+    desired_size: Tuple[int, int],
+) -> int:
+    """
+    Selects OpenCV interpolation flag to resize image.
+
+    Parameters:
+    - interpolation: name of interpolation (one of `RESIZE_INTERPOLATIONS`) or "auto" - to
+        choose by scale factor: "area" (slow, but free of aliasing) when image is shrunk more
+        than twice, "cubic" when it is enlarged and "linear" otherwise.
+    - image_shape: shape of the image to be resized.
+    - desired_size: tuple (width, height) representing the target dimensions.
+
+    Returns:
+    - OpenCV interpolation flag.
+    """
+    if interpolation == AUTO_RESIZE_INTERPOLATION:
+        scale = min(desired_size[0] / image_shape[1], desired_size[1] / image_shape[0])
+        if scale < AREA_INTERPOLATION_MAX_SCALE:
+            return cv2.INTER_AREA
+        if scale > 1:
+            return cv2.INTER_CUBIC
+        return cv2.INTER_LINEAR
+    if interpolation not in RESIZE_INTERPOLATIONS:
+        raise PreProcessingError(
+            f"Unknown resize interpolation: {interpolation}. Expected one of: "
+            f"{list(RESIZE_INTERPOLATIONS.keys()) + [AUTO_RESIZE_INTERPOLATION]}."
+        )
+    return RESIZE_INTERPOLATIONS[interpolation]
+
+
 def letterbox_image(
     image: np.ndarray,
     desired_size: Tuple[int, int],
     color: Tuple[int, int, int] = (0, 0, 0),
+    interpolation: int = cv2.INTER_LINEAR,
 ) -> np.ndarray:
     """
     Resize and pad image to fit the desired size, preserving its aspect ratio.
+    Image is resized directly into the padded output canvas - without intermediate frame.
 
     Parameters:
     - image: numpy array representing the image.
     - desired_size: tuple (width, height) representing the target dimensions.
     - color: tuple (B, G, R) representing the color to pad with.
+    - interpolation: OpenCV interpolation flag used to resize the image.
 
     Returns:
     - letterboxed image.
     """
-    resized_img = resize_image_keeping_aspect_ratio(
-        image=image,
-        desired_size=desired_size,
+    new_width, new_height = get_size_keeping_aspect_ratio(
+        image_shape=image.shape, desired_size=desired_size
     )
-    new_height, new_width = resized_img.shape[:2]
     top_padding = (desired_size[1] - new_height) // 2
-    bottom_padding = desired_size[1] - new_height - top_padding
     left_padding = (desired_size[0] - new_width) // 2
-    right_padding = desired_size[0] - new_width - left_padding
-    return cv2.copyMakeBorder(
-        resized_img,
-        top_padding,
-        bottom_padding,
-        left_padding,
-        right_padding,
-        cv2.BORDER_CONSTANT,
-        value=color,
+    canvas = np.empty(
+        (desired_size[1], desired_size[0]) + image.shape[2:], dtype=image.dtype
+    )
+    padding_row = _make_padding_row(color=color, image=image, width=desired_size[0])
+    canvas[:top_padding] = padding_row
+    canvas[top_padding + new_height :] = padding_row
+    canvas[top_padding : top_padding + new_height, :left_padding] = padding_row[
+        :left_padding
+    ]
+    canvas[top_padding : top_padding + new_height, left_padding + new_width :] = (
+        padding_row[left_padding + new_width :]
+    )
+    cv2.resize(
+        image,
+        (new_width, new_height),
+        dst=canvas[
+            top_padding : top_padding + new_height,
+            left_padding : left_padding + new_width,
+        ],
+        interpolation=interpolation,
     )
+    return canvas
+
+
+def _make_padding_row(
+    color: Tuple[int, int, int], image: np.ndarray, width: int
+) -> np.ndarray:
+    # whole rows are broadcast into canvas - much faster than broadcasting single pixel
+    padding_row = np.zeros((width,) + image.shape[2:], dtype=image.dtype)
+    if image.ndim == 2:
+        padding_row[:] = color[0]
+        return padding_row
+    # missing channels are padded with zeros - the same way as `cv2.copyMakeBorder(...)` does
+    channels = min(len(color), image.shape[2])
+    padding_row[:, :channels] = color[:channels]
+    return padding_row
 
 
 def downscale_image_keeping_aspect_ratio(
@@ -218,6 +296,7 @@ def downscale_image_keeping_aspect_ratio(
 def resize_image_keeping_aspect_ratio(
     image: np.ndarray,
     desired_size: Tuple[int, int],
+    interpolation: int = cv2.INTER_LINEAR,
 ) -> np.ndarray:
     """
     Resize reserving its aspect ratio.
@@ -225,8 +304,23 @@ def resize_image_keeping_aspect_ratio(
     Parameters:
     - image: numpy array representing the image.
     - desired_size: tuple (width, height) representing the target dimensions.
+    - interpolation: OpenCV interpolation flag used to resize the image.
+    """
+    new_width, new_height = get_size_keeping_aspect_ratio(
+        image_shape=image.shape, desired_size=desired_size
+    )
+    return cv2.resize(image, (new_width, new_height), interpolation=interpolation)
+
+
+def get_size_keeping_aspect_ratio(
+    image_shape: Tuple[int, ...],
+    desired_size: Tuple[int, int],
+) -> Tuple[int, int]:
+    """
+    Computes size (width, height) of image of `image_shape` resized to fit `desired_size`
+    (width, height), preserving its aspect ratio.
     """
-    img_ratio = image.shape[1] / image.shape[0]
+    img_ratio = image_shape[1] / image_shape[0]
     desired_ratio = desired_size[0] / desired_size[1]
 
     # Determine the new dimensions
@@ -238,6 +332,30 @@ def resize_image_keeping_aspect_ratio(
         # Resize by height
         new_height = desired_size[1]
         new_width = int(desired_size[1] * img_ratio)
+    return new_width, new_height
 
-    # Resize the image to new dimensions
-    return cv2.resize(image, (new_width, new_height))
+
+def image_to_model_input(
+    image: np.ndarray,
+    is_bgr: bool,
+    grayscale: bool = False,
+) -> np.ndarray:
+    """
+    Converts image into single-element batch of RGB channels-first float32 data. For
+    `grayscale` conversion the luminance is written straight into all channels of the output.
+
+    Parameters:
+    - image: numpy array representing the image (height, width, 3).
+    - is_bgr: flag telling if the image is BGR.
+    - grayscale: flag telling if the image is to be converted into grayscale.
+
+    Returns:
+    - model input of shape (1, 3, height, width).
+    """
+    if grayscale:
+        img_in = np.empty((1, 3) + image.shape[:2], dtype=np.float32)
+        img_in[0, :] = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return img_in
+    if is_bgr:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return np.expand_dims(np.transpose(image, (2, 0, 1)).astype(np.float32), axis=0)
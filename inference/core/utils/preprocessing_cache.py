@@ -0,0 +1,101 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Callable, Dict, Generator, Hashable, Optional, Tuple, TypeVar
+
+from inference.core.env import REQUEST_PREPROCESSING_CACHE_ENABLED
+from inference.core.utils.image_utils import extract_image_payload_and_type
+
+T = TypeVar("T")
+
+
+class RequestPreprocessingCache:
+    """
+    Cache of decoded images and model inputs shared by models processing the same images
+    within one request (or Workflow run). Entries are keyed by identity of the image payload
+    (numpy arrays and other objects by identity, encoded images by content) and by key
+    describing processing applied to the image. Cached values are shared - so they must not
+    be modified in-place by consumers, the same way as images are not to be modified in-place
+    while the request is processed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[Hashable, Hashable], Tuple[Any, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, image: Any, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get((_get_image_identity(image=image), key))
+        if entry is None:
+            return None
+        return entry[1]
+
+    def set(self, image: Any, key: Hashable, value: Any) -> None:
+        payload, _ = extract_image_payload_and_type(value=image)
+        with self._lock:
+            # payload is kept alive with the entry, so that its id is not reused
+            self._entries[(_get_image_identity(image=image), key)] = (payload, value)
+
+    def get_or_compute(self, image: Any, key: Hashable, compute: Callable[[], T]) -> T:
+        value = self.get(image=image, key=key)
+        if value is None:
+            value = compute()
+            self.set(image=image, key=key, value=value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _get_image_identity(image: Any) -> Hashable:
+    payload, image_type = extract_image_payload_and_type(value=image)
+    if isinstance(payload, (str, bytes)):
+        return image_type, payload
+    return image_type, id(payload)
+
+
+_REQUEST_PREPROCESSING_CACHE: ContextVar[Optional[RequestPreprocessingCache]] = (
+    ContextVar("request_preprocessing_cache", default=None)
+)
+
+
+def get_request_preprocessing_cache() -> Optional[RequestPreprocessingCache]:
+    return _REQUEST_PREPROCESSING_CACHE.get()
+
+
+@contextmanager
+def request_preprocessing_cache_scope() -> (
+    Generator[Optional[RequestPreprocessingCache], None, None]
+):
+    """
+    Opens scope of request - models run within the scope share `RequestPreprocessingCache`
+    (nested scopes share the cache of the outermost one). Cache is dropped once the scope
+    is closed. No cache is created if `REQUEST_PREPROCESSING_CACHE_ENABLED` is off.
+    """
+    cache = get_request_preprocessing_cache()
+    if cache is not None or not REQUEST_PREPROCESSING_CACHE_ENABLED:
+        yield cache
+        return None
+    token = _REQUEST_PREPROCESSING_CACHE.set(RequestPreprocessingCache())
+    try:
+        yield _REQUEST_PREPROCESSING_CACHE.get()
+    finally:
+        _REQUEST_PREPROCESSING_CACHE.reset(token)
+
+
+def bind_request_preprocessing_cache(function: Callable[..., T]) -> Callable[..., T]:
+    """
+    Binds cache of request processed by the calling thread to `function` - to be used when
+    the function is executed by pool of threads, which do not inherit context of the caller.
+    """
+    cache = get_request_preprocessing_cache()
+    if cache is None:
+        return function
+
+    def _run_with_cache(*args, **kwargs) -> T:
+        token = _REQUEST_PREPROCESSING_CACHE.set(cache)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _REQUEST_PREPROCESSING_CACHE.reset(token)
+
+    return _run_with_cache
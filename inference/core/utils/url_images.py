@@ -0,0 +1,182 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+import requests
+import tldextract
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from inference.core.env import (
+    URL_IMAGE_CACHE_MAX_BYTES,
+    URL_IMAGE_CACHE_TTL,
+    URL_IMAGE_CONNECT_TIMEOUT,
+    URL_IMAGE_CONNECTION_POOL_SIZE,
+    URL_IMAGE_FETCH_MAX_WORKERS,
+    URL_IMAGE_MAX_BYTES,
+    URL_IMAGE_READ_TIMEOUT,
+)
+from inference.core.exceptions import InputImageLoadError
+from inference.core.utils.requests import api_key_safe_raise_for_status
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+FETCH_CHUNK_SIZE = 64 * 1024
+
+
+class URLImagesBytesCache:
+    """
+    In-memory cache of bytes of images fetched from URLs. Entries expire after `ttl`
+    seconds and the least recently used ones are evicted once total size of cached
+    content exceeds `max_bytes`. Cache with non-positive `ttl` is disabled.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_bytes > 0
+
+    def get(self, url: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            expires_at, content = entry
+            if expires_at < time.monotonic():
+                self._remove(url=url)
+                return None
+            self._entries.move_to_end(url)
+            return content
+
+    def set(self, url: str, content: bytes) -> None:
+        if not self.enabled or len(content) > self._max_bytes:
+            return None
+        with self._lock:
+            if url in self._entries:
+                self._remove(url=url)
+            self._entries[url] = (time.monotonic() + self._ttl, content)
+            self._total_bytes += len(content)
+            while self._total_bytes > self._max_bytes:
+                self._remove(url=next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, url: str) -> None:
+        _, content = self._entries.pop(url)
+        self._total_bytes -= len(content)
+
+
+URL_IMAGES_CACHE = URLImagesBytesCache(
+    ttl=URL_IMAGE_CACHE_TTL,
+    max_bytes=URL_IMAGE_CACHE_MAX_BYTES,
+)
+
+
+@lru_cache(maxsize=None)
+def get_domain_extractor() -> tldextract.TLDExtract:
+    return tldextract.TLDExtract(suffix_list_urls=())
+
+
+@lru_cache(maxsize=None)
+def get_url_images_session() -> requests.Session:
+    """
+    Returns HTTP session shared by all URL images fetches - keeping connections alive
+    in pool. Session does not persist cookies, as it serves requests of different clients.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=URL_IMAGE_CONNECTION_POOL_SIZE,
+        pool_maxsize=URL_IMAGE_CONNECTION_POOL_SIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=URL_IMAGE_FETCH_MAX_WORKERS,
+        thread_name_prefix="url_images_fetch",
+    )
+
+
+def fetch_image_bytes(url: str) -> bytes:
+    """
+    Fetches bytes of image from URL (which must be validated by the caller) using shared
+    session, timeouts and size limit configured in environment - serving the content from
+    cache if enabled.
+
+    Args:
+        url (str): URL of the image.
+
+    Returns:
+        bytes: Content of the resource.
+
+    Raises:
+        requests.RequestException: If the resource could not be fetched.
+        InputImageLoadError: If the resource exceeds `URL_IMAGE_MAX_BYTES`.
+    """
+    content = URL_IMAGES_CACHE.get(url=url)
+    if content is not None:
+        return content
+    with get_url_images_session().get(
+        url,
+        stream=True,
+        timeout=(URL_IMAGE_CONNECT_TIMEOUT, URL_IMAGE_READ_TIMEOUT),
+    ) as response:
+        api_key_safe_raise_for_status(response=response)
+        content = _read_content_with_limit(
+            response=response, max_bytes=URL_IMAGE_MAX_BYTES
+        )
+    URL_IMAGES_CACHE.set(url=url, content=content)
+    return content
+
+
+def _read_content_with_limit(response: Response, max_bytes: int) -> bytes:
+    declared_length = response.headers.get("Content-Length", "")
+    if declared_length.isdigit() and int(declared_length) > max_bytes:
+        _raise_size_limit_exceeded(max_bytes=max_bytes)
+    chunks = []
+    total_size = 0
+    for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+        total_size += len(chunk)
+        if total_size > max_bytes:
+            _raise_size_limit_exceeded(max_bytes=max_bytes)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _raise_size_limit_exceeded(max_bytes: int) -> None:
+    message = f"Image pointed by URL exceeds size limit of {max_bytes} bytes."
+    raise InputImageLoadError(
+        message=message,
+        public_message=message,
+    )
+
+
+def fetch_concurrently(function: Callable[[T], R], values: List[T]) -> List[R]:
+    """
+    Applies `function` (fetching URL images) to `values` in the shared pool of threads,
+    preserving order of results. The first error raised by `function` is re-raised.
+    """
+    if len(values) < 2:
+        return [function(value) for value in values]
+    return list(_get_fetch_executor().map(function, values))
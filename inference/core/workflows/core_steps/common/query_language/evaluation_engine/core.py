@@ -1,6 +1,8 @@
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Union
 
+from pydantic_core import PydanticSerializationError
+
 from inference.core.workflows.core_steps.common.query_language.entities.enums import (
     StatementsGroupsOperator,
 )
@@ -24,6 +26,12 @@ from inference.core.workflows.core_steps.common.query_language.errors import (
 from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.geometry import (
     is_point_in_zone,
 )
+from inference.core.workflows.core_steps.common.query_language.operations.utils import (
+    hash_definition,
+)
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+)
 
 BINARY_OPERATORS = {
     "==": lambda a, b: a == b,
@@ -53,6 +61,15 @@ UNARY_OPERATORS = {
 }
 
 
+EVAL_FUNCTIONS_CACHE = BasicWorkflowsCache[Callable[[T], bool]](
+    cache_size=1024,
+    hash_functions=[
+        ("definition", hash_definition),
+        ("execution_context", str),
+    ],
+)
+
+
 def evaluate(values: dict, definition: dict) -> bool:
     parsed_definition = StatementGroup.model_validate(definition)
     eval_function = build_eval_function(parsed_definition)
@@ -62,6 +79,32 @@ def evaluate(values: dict, definition: dict) -> bool:
 def build_eval_function(
     definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
     execution_context: str = "<root>",
+) -> Callable[[T], bool]:
+    """
+    Compiles evaluation function for the definition, re-using functions compiled
+    earlier for the same definition (blocks build their functions on each run).
+    """
+    try:
+        cache_key = EVAL_FUNCTIONS_CACHE.get_hash_key(
+            definition=definition, execution_context=execution_context
+        )
+    except PydanticSerializationError:
+        # static operands may hold values that are not serialisable
+        return compile_eval_function(
+            definition=definition, execution_context=execution_context
+        )
+    eval_function = EVAL_FUNCTIONS_CACHE.get(key=cache_key)
+    if eval_function is None:
+        eval_function = compile_eval_function(
+            definition=definition, execution_context=execution_context
+        )
+        EVAL_FUNCTIONS_CACHE.cache(key=cache_key, value=eval_function)
+    return eval_function
+
+
+def compile_eval_function(
+    definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
+    execution_context: str = "<root>",
 ) -> Callable[[T], bool]:
     if isinstance(definition, BinaryStatement):
         return build_binary_statement(definition, execution_context=execution_context)
@@ -71,7 +114,7 @@ def build_eval_function(
     for statement_id, statement in enumerate(definition.statements):
         statement_execution_context = f"{execution_context}.statements[{statement_id}]"
         statements_functions.append(
-            build_eval_function(
+            compile_eval_function(
                 statement, execution_context=statement_execution_context
             )
         )
@@ -131,10 +174,10 @@ def create_static_operand_builder(
 ) -> Callable[[Dict[str, T]], V]:
     # local import to avoid circular dependency of modules with operations and evaluation
     from inference.core.workflows.core_steps.common.query_language.operations.core import (
-        build_operations_chain,
+        compile_operations_chain,
     )
 
-    operations_fun = build_operations_chain(
+    operations_fun = compile_operations_chain(
         operations=definition.operations,
         execution_context=f"{execution_context}.operations",
     )
@@ -159,10 +202,10 @@ def create_dynamic_operand_builder(
 ) -> Callable[[Dict[str, T]], V]:
     # local import to avoid circular dependency of modules with operations and evaluation
     from inference.core.workflows.core_steps.common.query_language.operations.core import (
-        build_operations_chain,
+        compile_operations_chain,
     )
 
-    operations_fun = build_operations_chain(
+    operations_fun = compile_operations_chain(
         operations=definition.operations,
         execution_context=f"{execution_context}.operations",
     )
@@ -0,0 +1,308 @@
+"""
+Lowering of the most common detections filtering predicates into NumPy masks.
+
+Filtering in `filter_detections(...)` evaluates compiled UQL statement for each
+detection separately. Statements comparing single property of detection (class
+membership, confidence, size, position) against static values or parameters
+can be evaluated at once for all detections - this module builds such functions.
+
+Mask function returns `None` whenever it cannot guarantee the same result as
+the interpreter (unsupported types of values, missing properties etc.) - the
+caller is expected to fall back to the interpreter then, which is also responsible
+for raising errors in the same way as it always did.
+"""
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import shapely
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.enums import (
+    DetectionsProperty,
+    StatementsGroupsOperator,
+)
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    DEFAULT_OPERAND_NAME,
+    BinaryStatement,
+    DynamicOperand,
+    ExtractDetectionProperty,
+    StatementGroup,
+    StaticOperand,
+    UnaryStatement,
+)
+
+DetectionsMaskFunction = Callable[[sv.Detections, Dict[str, Any]], Optional[np.ndarray]]
+
+
+class _MissingValue:
+    pass
+
+
+MISSING_VALUE = _MissingValue()
+
+
+def extract_box_coordinate(
+    detections: sv.Detections, coordinate_id: int
+) -> Optional[np.ndarray]:
+    return detections.xyxy[:, coordinate_id].astype(np.float64)
+
+
+def extract_confidence(detections: sv.Detections) -> Optional[np.ndarray]:
+    if detections.confidence is None:
+        return None
+    return detections.confidence.astype(np.float64)
+
+
+def extract_class_id(detections: sv.Detections) -> Optional[np.ndarray]:
+    if detections.class_id is None:
+        return None
+    return detections.class_id.astype(np.int64)
+
+
+def extract_class_name(detections: sv.Detections) -> Optional[np.ndarray]:
+    class_name = detections.data.get("class_name")
+    if class_name is None or class_name.dtype.kind != "U":
+        # interpreter fails on object arrays, as it expects numpy scalars
+        return None
+    return class_name
+
+
+def extract_size(detections: sv.Detections) -> Optional[np.ndarray]:
+    # order of operations must match `DETECTION_PROPERTY_EXTRACTION` to give identical results
+    xyxy = detections.xyxy
+    return ((xyxy[:, 3] - xyxy[:, 1]) * (xyxy[:, 2] - xyxy[:, 0])).astype(np.float64)
+
+
+def extract_center(detections: sv.Detections) -> Optional[np.ndarray]:
+    # interpreter subtracts numpy scalars of boxes dtype and promotes to float64 on division
+    xyxy = detections.xyxy
+    width = (xyxy[:, 2] - xyxy[:, 0]).astype(np.float64)
+    height = (xyxy[:, 3] - xyxy[:, 1]).astype(np.float64)
+    center_x = xyxy[:, 0].astype(np.float64) + width / 2
+    center_y = xyxy[:, 1].astype(np.float64) + height / 2
+    return np.stack([center_x, center_y], axis=1)
+
+
+PROPERTIES_COLUMNS_EXTRACTORS = {
+    DetectionsProperty.X_MIN: partial(extract_box_coordinate, coordinate_id=0),
+    DetectionsProperty.Y_MIN: partial(extract_box_coordinate, coordinate_id=1),
+    DetectionsProperty.X_MAX: partial(extract_box_coordinate, coordinate_id=2),
+    DetectionsProperty.Y_MAX: partial(extract_box_coordinate, coordinate_id=3),
+    DetectionsProperty.CONFIDENCE: extract_confidence,
+    DetectionsProperty.CLASS_ID: extract_class_id,
+    DetectionsProperty.CLASS_NAME: extract_class_name,
+    DetectionsProperty.SIZE: extract_size,
+    DetectionsProperty.CENTER: extract_center,
+}
+
+
+def is_number(value: Any) -> bool:
+    # numpy scalars of lower precision are excluded, as they would change comparison precision
+    return isinstance(value, (int, float))
+
+
+def is_value_matching_column(column: np.ndarray, value: Any) -> bool:
+    if column.dtype.kind == "U":
+        return isinstance(value, str)
+    return is_number(value)
+
+
+def equal_mask(column: np.ndarray, value: Any) -> Optional[np.ndarray]:
+    if column.ndim != 1 or not is_value_matching_column(column=column, value=value):
+        return None
+    return column == value
+
+
+def not_equal_mask(column: np.ndarray, value: Any) -> Optional[np.ndarray]:
+    if column.ndim != 1 or not is_value_matching_column(column=column, value=value):
+        return None
+    return column != value
+
+
+def numeric_comparison_mask(
+    column: np.ndarray,
+    value: Any,
+    comparison: Callable[[np.ndarray, Any], np.ndarray],
+) -> Optional[np.ndarray]:
+    if column.ndim != 1 or column.dtype.kind == "U" or not is_number(value):
+        return None
+    return comparison(column, value)
+
+
+def in_sequence_mask(column: np.ndarray, value: Any) -> Optional[np.ndarray]:
+    if column.ndim != 1 or not isinstance(value, (list, tuple, set)):
+        return None
+    value = list(value)
+    if not all(is_value_matching_column(column=column, value=v) for v in value):
+        return None
+    if not value:
+        return np.zeros(column.shape, dtype=bool)
+    return np.isin(column, value)
+
+
+def in_zone_mask(column: np.ndarray, value: Any) -> Optional[np.ndarray]:
+    if column.ndim != 2 or not isinstance(value, (list, tuple)) or len(value) < 3:
+        return None
+    try:
+        polygon = shapely.geometry.Polygon(
+            [(zone_point[0], zone_point[1]) for zone_point in value]
+        )
+    except Exception:
+        return None
+    # `contains_xy(...)` has the same semantics as `Point.within(polygon)`
+    return shapely.contains_xy(polygon, column[:, 0], column[:, 1])
+
+
+MASK_OPERATORS = {
+    "==": equal_mask,
+    "(Number) ==": equal_mask,
+    "!=": not_equal_mask,
+    "(Number) !=": not_equal_mask,
+    "(Number) >": partial(numeric_comparison_mask, comparison=np.greater),
+    "(Number) >=": partial(numeric_comparison_mask, comparison=np.greater_equal),
+    "(Number) <": partial(numeric_comparison_mask, comparison=np.less),
+    "(Number) <=": partial(numeric_comparison_mask, comparison=np.less_equal),
+    "in (Sequence)": in_sequence_mask,
+    "(Detection) in zone": in_zone_mask,
+}
+
+COMPOUND_MASKS_COMBINERS = {
+    StatementsGroupsOperator.AND: np.logical_and,
+    StatementsGroupsOperator.OR: np.logical_or,
+}
+
+
+def build_detections_mask_function(
+    definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
+) -> Optional[DetectionsMaskFunction]:
+    """
+    Returns function calculating boolean mask of detections fulfilling the
+    filtering `definition` (evaluated against each detection as `DEFAULT_OPERAND_NAME`),
+    or `None` if the definition cannot be lowered into vectorised form.
+    """
+    if isinstance(definition, BinaryStatement):
+        return build_binary_statement_mask_function(definition=definition)
+    if isinstance(definition, StatementGroup):
+        return build_statement_group_mask_function(definition=definition)
+    return None
+
+
+def build_statement_group_mask_function(
+    definition: StatementGroup,
+) -> Optional[DetectionsMaskFunction]:
+    if not definition.statements:
+        return None
+    if definition.operator not in COMPOUND_MASKS_COMBINERS:
+        return None
+    statements_functions = []
+    for statement in definition.statements:
+        statement_function = build_detections_mask_function(definition=statement)
+        if statement_function is None:
+            return None
+        statements_functions.append(statement_function)
+    return partial(
+        compound_mask,
+        statements_functions=statements_functions,
+        combiner=COMPOUND_MASKS_COMBINERS[definition.operator],
+    )
+
+
+def compound_mask(
+    detections: sv.Detections,
+    parameters: Dict[str, Any],
+    statements_functions: List[DetectionsMaskFunction],
+    combiner: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> Optional[np.ndarray]:
+    result = None
+    for statement_function in statements_functions:
+        mask = statement_function(detections, parameters)
+        if mask is None:
+            return None
+        result = mask if result is None else combiner(result, mask)
+    return result
+
+
+def build_binary_statement_mask_function(
+    definition: BinaryStatement,
+) -> Optional[DetectionsMaskFunction]:
+    comparator = definition.comparator.type
+    if comparator not in MASK_OPERATORS:
+        return None
+    property_name = get_extracted_detection_property(operand=definition.left_operand)
+    if property_name not in PROPERTIES_COLUMNS_EXTRACTORS:
+        return None
+    if (property_name is DetectionsProperty.CENTER) != (
+        comparator == "(Detection) in zone"
+    ):
+        return None
+    value_getter = build_detection_independent_value_getter(
+        operand=definition.right_operand
+    )
+    if value_getter is None:
+        return None
+    return partial(
+        binary_statement_mask,
+        column_extractor=PROPERTIES_COLUMNS_EXTRACTORS[property_name],
+        value_getter=value_getter,
+        operator=MASK_OPERATORS[comparator],
+        negate=definition.negate,
+    )
+
+
+def binary_statement_mask(
+    detections: sv.Detections,
+    parameters: Dict[str, Any],
+    column_extractor: Callable[[sv.Detections], Optional[np.ndarray]],
+    value_getter: Callable[[Dict[str, Any]], Any],
+    operator: Callable[[np.ndarray, Any], Optional[np.ndarray]],
+    negate: bool,
+) -> Optional[np.ndarray]:
+    value = value_getter(parameters)
+    if value is MISSING_VALUE:
+        return None
+    column = column_extractor(detections)
+    if column is None:
+        return None
+    mask = operator(column, value)
+    if mask is None:
+        return None
+    if negate:
+        mask = ~mask
+    return mask
+
+
+def get_extracted_detection_property(
+    operand: Union[StaticOperand, DynamicOperand],
+) -> Optional[DetectionsProperty]:
+    if not isinstance(operand, DynamicOperand):
+        return None
+    if operand.operand_name != DEFAULT_OPERAND_NAME or len(operand.operations) != 1:
+        return None
+    operation = operand.operations[0]
+    if not isinstance(operation, ExtractDetectionProperty):
+        return None
+    return operation.property_name
+
+
+def build_detection_independent_value_getter(
+    operand: Union[StaticOperand, DynamicOperand],
+) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    # operands with operations are not lowered - operations may be non-deterministic
+    # (like random numbers) and interpreter evaluates them for each detection
+    if operand.operations:
+        return None
+    if isinstance(operand, StaticOperand):
+        return partial(get_static_value, value=operand.value)
+    if operand.operand_name == DEFAULT_OPERAND_NAME:
+        return None
+    return partial(get_parameter_value, parameter_name=operand.operand_name)
+
+
+def get_static_value(parameters: Dict[str, Any], value: Any) -> Any:
+    return value
+
+
+def get_parameter_value(parameters: Dict[str, Any], parameter_name: str) -> Any:
+    return parameters.get(parameter_name, MISSING_VALUE)
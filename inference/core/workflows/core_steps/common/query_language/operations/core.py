@@ -1,6 +1,8 @@
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
+from pydantic_core import PydanticSerializationError
+
 from inference.core.workflows.core_steps.common.query_language.entities.operations import (
     TYPE_PARAMETER_NAME,
     DetectionsFilter,
@@ -15,6 +17,9 @@ from inference.core.workflows.core_steps.common.query_language.entities.types im
 from inference.core.workflows.core_steps.common.query_language.errors import (
     OperationTypeNotRecognisedError,
 )
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.vectorised import (
+    build_detections_mask_function,
+)
 from inference.core.workflows.core_steps.common.query_language.operations.booleans.base import (
     to_bool,
 )
@@ -60,6 +65,20 @@ from inference.core.workflows.core_steps.common.query_language.operations.string
     string_to_upper,
     to_string,
 )
+from inference.core.workflows.core_steps.common.query_language.operations.utils import (
+    hash_definition,
+)
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+)
+
+OPERATIONS_CHAINS_CACHE = BasicWorkflowsCache[Callable[[T, Dict[str, Any]], V]](
+    cache_size=1024,
+    hash_functions=[
+        ("operations", hash_definition),
+        ("execution_context", str),
+    ],
+)
 
 
 def execute_operations(
@@ -78,6 +97,31 @@ def identity(value: Any, **kwargs) -> Any:
 
 def build_operations_chain(
     operations: List[OperationDefinition], execution_context: str = "<root>"
+) -> Callable[[T, Dict[str, Any]], V]:
+    """
+    Compiles operations chain, re-using chains compiled earlier for the same
+    definition (blocks build their chains on each run).
+    """
+    try:
+        cache_key = OPERATIONS_CHAINS_CACHE.get_hash_key(
+            operations=operations, execution_context=execution_context
+        )
+    except PydanticSerializationError:
+        # operations may hold values that are not serialisable
+        return compile_operations_chain(
+            operations=operations, execution_context=execution_context
+        )
+    operations_chain = OPERATIONS_CHAINS_CACHE.get(key=cache_key)
+    if operations_chain is None:
+        operations_chain = compile_operations_chain(
+            operations=operations, execution_context=execution_context
+        )
+        OPERATIONS_CHAINS_CACHE.cache(key=cache_key, value=operations_chain)
+    return operations_chain
+
+
+def compile_operations_chain(
+    operations: List[OperationDefinition], execution_context: str = "<root>"
 ) -> Callable[[T, Dict[str, Any]], V]:
     if not len(operations):
         return identity  # return identity function
@@ -153,14 +197,19 @@ def build_detections_filter_operation(
 ) -> Callable[[T], V]:
     # local import to avoid circular dependency of modules with operations and evaluation
     from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
-        build_eval_function,
+        compile_eval_function,
     )
 
-    filtering_fun = build_eval_function(
+    filtering_fun = compile_eval_function(
         definition=definition.filter_operation,
         execution_context=execution_context,
     )
-    return partial(filter_detections, filtering_fun=filtering_fun)
+    mask_function = build_detections_mask_function(
+        definition=definition.filter_operation
+    )
+    return partial(
+        filter_detections, filtering_fun=filtering_fun, mask_function=mask_function
+    )
 
 
 REGISTERED_SIMPLE_OPERATIONS = {
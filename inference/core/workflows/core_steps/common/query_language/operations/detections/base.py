@@ -1,5 +1,5 @@
 from copy import copy, deepcopy
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import supervision as sv
@@ -18,6 +18,9 @@ from inference.core.workflows.core_steps.common.query_language.errors import (
     OperationError,
     UndeclaredSymbolError,
 )
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.vectorised import (
+    DetectionsMaskFunction,
+)
 from inference.core.workflows.core_steps.common.query_language.operations.utils import (
     safe_stringify,
 )
@@ -56,6 +59,7 @@ def filter_detections(
     detections: Any,
     filtering_fun: Callable[[Dict[str, Any]], bool],
     global_parameters: Dict[str, Any],
+    mask_function: Optional[DetectionsMaskFunction] = None,
 ) -> sv.Detections:
     if not isinstance(detections, sv.Detections):
         value_as_str = safe_stringify(value=detections)
@@ -64,6 +68,10 @@ def filter_detections(
             f"got {value_as_str} of type {type(detections)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
+    if mask_function is not None:
+        mask = mask_function(detections, global_parameters)
+        if mask is not None:
+            return detections[mask]
     local_parameters = copy(global_parameters)
     result = []
     for detection in detections:
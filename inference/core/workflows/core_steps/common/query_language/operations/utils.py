@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, List, Union
+
+from pydantic import BaseModel
 
 
 def safe_stringify(value: Any, max_characters: int = 128) -> str:
@@ -9,3 +11,9 @@ def safe_stringify(value: Any, max_characters: int = 128) -> str:
         return str_value
     except Exception:
         return "could not get string representation of value"
+
+
+def hash_definition(definition: Union[BaseModel, List[BaseModel]]) -> str:
+    if isinstance(definition, list):
+        return "[" + ",".join(hash_definition(d) for d in definition) + "]"
+    return definition.model_dump_json()
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 import numpy as np
 import supervision as sv
@@ -39,92 +39,133 @@ from inference.core.workflows.execution_engine.entities.base import WorkflowImag
 
 
 def serialise_sv_detections(detections: sv.Detections) -> dict:
-    serialized_detections = []
-    image_dimensions = None
-    for xyxy, mask, confidence, class_id, tracker_id, data in detections:
-        detection_dict = {}
-        image_dimensions = data.get(IMAGE_DIMENSIONS_KEY)
-        if isinstance(xyxy, np.ndarray):
-            xyxy = xyxy.astype(float).tolist()
-        x1, y1, x2, y2 = xyxy
-        detection_dict[WIDTH_KEY] = abs(x2 - x1)
-        detection_dict[HEIGHT_KEY] = abs(y2 - y1)
-        detection_dict[X_KEY] = x1 + detection_dict[WIDTH_KEY] / 2
-        detection_dict[Y_KEY] = y1 + detection_dict[HEIGHT_KEY] / 2
-
-        detection_dict[CONFIDENCE_KEY] = float(confidence)
-        detection_dict[CLASS_ID_KEY] = int(class_id)
-        if mask is not None:
+    # Serialisation is done column-wise - numeric fields are converted with
+    # single vectorised operation per field, such that the cost of per-detection
+    # Python work is limited to assembling output dictionaries.
+    xyxy = detections.xyxy.astype(float)
+    widths = np.abs(xyxy[:, 2] - xyxy[:, 0])
+    heights = np.abs(xyxy[:, 3] - xyxy[:, 1])
+    serialized_detections = [
+        {
+            WIDTH_KEY: width,
+            HEIGHT_KEY: height,
+            X_KEY: x,
+            Y_KEY: y,
+            CONFIDENCE_KEY: confidence,
+            CLASS_ID_KEY: class_id,
+        }
+        for width, height, x, y, confidence, class_id in zip(
+            widths.tolist(),
+            heights.tolist(),
+            (xyxy[:, 0] + widths / 2).tolist(),
+            (xyxy[:, 1] + heights / 2).tolist(),
+            _column_to_list(detections.confidence, dtype=float),
+            _column_to_list(detections.class_id, dtype=int),
+        )
+    ]
+    if detections.mask is not None:
+        for detection_dict, mask in zip(serialized_detections, detections.mask):
             polygon = sv.mask_to_polygons(mask=mask)
-            detection_dict[POLYGON_KEY] = []
-            for x, y in polygon[0]:
-                detection_dict[POLYGON_KEY].append(
-                    {
-                        X_KEY: float(x),
-                        Y_KEY: float(y),
-                    }
-                )
-        if tracker_id is not None:
-            detection_dict[TRACKER_ID_KEY] = int(tracker_id)
-        detection_dict[CLASS_NAME_KEY] = str(data["class_name"])
-        detection_dict[DETECTION_ID_KEY] = str(data[DETECTION_ID_KEY])
-        if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE] = data[
-                PATH_DEVIATION_KEY_IN_SV_DETECTIONS
-            ]
-        if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE] = data[
-                TIME_IN_ZONE_KEY_IN_SV_DETECTIONS
-            ]
-        if (
-            BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
-        ):
-            detection_dict[BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS
+            detection_dict[POLYGON_KEY] = [
+                {X_KEY: float(x), Y_KEY: float(y)} for x, y in polygon[0].tolist()
             ]
-        if PARENT_ID_KEY in data:
-            detection_dict[PARENT_ID_KEY] = str(data[PARENT_ID_KEY])
-        if (
-            KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
-        ):
-            kp_class_id = data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS]
-            kp_class_name = data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS]
-            kp_confidence = data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS]
-            kp_xy = data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS]
-            detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = []
-            for (
-                keypoint_class_id,
-                keypoint_class_name,
-                keypoint_confidence,
-                (x, y),
-            ) in zip(kp_class_id, kp_class_name, kp_confidence, kp_xy):
-                detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE].append(
-                    {
-                        "class_id": int(keypoint_class_id),
-                        "class": str(keypoint_class_name),
-                        "confidence": float(keypoint_confidence),
-                        "x": float(x),
-                        "y": float(y),
-                    }
+    if detections.tracker_id is not None:
+        _attach_column(
+            serialized_detections=serialized_detections,
+            key=TRACKER_ID_KEY,
+            values=_column_to_list(detections.tracker_id, dtype=int),
+        )
+    data = detections.data
+    _attach_column(
+        serialized_detections=serialized_detections,
+        key=CLASS_NAME_KEY,
+        values=[str(e) for e in data["class_name"]],
+    )
+    _attach_column(
+        serialized_detections=serialized_detections,
+        key=DETECTION_ID_KEY,
+        values=[str(e) for e in data[DETECTION_ID_KEY]],
+    )
+    if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
+        _attach_column(
+            serialized_detections=serialized_detections,
+            key=PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE,
+            values=data[PATH_DEVIATION_KEY_IN_SV_DETECTIONS],
+        )
+    if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
+        _attach_column(
+            serialized_detections=serialized_detections,
+            key=TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE,
+            values=data[TIME_IN_ZONE_KEY_IN_SV_DETECTIONS],
+        )
+    if (
+        BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
+    ):
+        for sv_key, response_key in [
+            (
+                BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE,
+            ),
+            (
+                BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE,
+            ),
+            (
+                BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE,
+            ),
+            (
+                BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE,
+            ),
+        ]:
+            _attach_column(
+                serialized_detections=serialized_detections,
+                key=response_key,
+                values=data[sv_key],
+            )
+    if PARENT_ID_KEY in data:
+        _attach_column(
+            serialized_detections=serialized_detections,
+            key=PARENT_ID_KEY,
+            values=[str(e) for e in data[PARENT_ID_KEY]],
+        )
+    if (
+        KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
+    ):
+        _attach_column(
+            serialized_detections=serialized_detections,
+            key=KEYPOINTS_KEY_IN_INFERENCE_RESPONSE,
+            values=[
+                serialise_keypoints(
+                    class_ids=kp_class_id,
+                    class_names=kp_class_name,
+                    confidences=kp_confidence,
+                    xy=kp_xy,
                 )
-        if DETECTED_CODE_KEY in data:
-            detection_dict[DETECTED_CODE_KEY] = data[DETECTED_CODE_KEY]
-        serialized_detections.append(detection_dict)
+                for kp_class_id, kp_class_name, kp_confidence, kp_xy in zip(
+                    data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS],
+                    data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS],
+                    data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS],
+                    data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS],
+                )
+            ],
+        )
+    if DETECTED_CODE_KEY in data:
+        _attach_column(
+            serialized_detections=serialized_detections,
+            key=DETECTED_CODE_KEY,
+            values=data[DETECTED_CODE_KEY],
+        )
+    image_dimensions = None
+    if len(detections) > 0 and IMAGE_DIMENSIONS_KEY in data:
+        image_dimensions = data[IMAGE_DIMENSIONS_KEY][-1]
     image_metadata = {
         "width": None,
         "height": None,
@@ -139,6 +180,42 @@ def serialise_sv_detections(detections: sv.Detections) -> dict:
     return {"image": image_metadata, "predictions": serialized_detections}
 
 
+def serialise_keypoints(
+    class_ids: Any,
+    class_names: Any,
+    confidences: Any,
+    xy: Any,
+) -> List[dict]:
+    return [
+        {
+            "class_id": keypoint_class_id,
+            "class": str(keypoint_class_name),
+            "confidence": keypoint_confidence,
+            "x": x,
+            "y": y,
+        }
+        for keypoint_class_id, keypoint_class_name, keypoint_confidence, (x, y) in zip(
+            _column_to_list(class_ids, dtype=int),
+            class_names,
+            _column_to_list(confidences, dtype=float),
+            _column_to_list(xy, dtype=float),
+        )
+    ]
+
+
+def _column_to_list(values: Any, dtype: type) -> list:
+    return np.asarray(values).astype(dtype).tolist()
+
+
+def _attach_column(
+    serialized_detections: List[dict],
+    key: str,
+    values: Iterable[Any],
+) -> None:
+    for detection_dict, value in zip(serialized_detections, values):
+        detection_dict[key] = value
+
+
 def serialise_image(image: WorkflowImageData) -> Dict[str, Any]:
     return {
         "type": "base64",
@@ -8,12 +8,20 @@ import numpy as np
 import supervision as sv
 from supervision.config import CLASS_NAME_DATA_FIELD
 
-from inference.core.entities.requests.clip import ClipCompareRequest
+from inference.core.cache import cache
+from inference.core.entities.requests.clip import (
+    ClipCompareRequest,
+    ClipImageEmbeddingRequest,
+    ClipTextEmbeddingRequest,
+)
 from inference.core.entities.requests.cogvlm import CogVLMInferenceRequest
 from inference.core.entities.requests.doctr import DoctrOCRInferenceRequest
 from inference.core.entities.requests.sam2 import Sam2InferenceRequest
 from inference.core.entities.requests.yolo_world import YOLOWorldInferenceRequest
+from inference.core.env import CLIP_MAX_BATCH_SIZE
 from inference.core.managers.base import ModelManager
+from inference.core.models.utils.batching import create_batches
+from inference.core.utils.hash import get_text_hash
 from inference.core.workflows.execution_engine.constants import (
     DETECTION_ID_KEY,
     HEIGHT_KEY,
@@ -49,12 +57,16 @@ from inference.core.workflows.execution_engine.entities.base import (
 
 T = TypeVar("T")
 
+CLIP_TEXT_EMBEDDINGS_EXPIRE_TIMEOUT = 1800  # 30 min
+
 
 def load_core_model(
     model_manager: ModelManager,
     inference_request: Union[
         DoctrOCRInferenceRequest,
         ClipCompareRequest,
+        ClipImageEmbeddingRequest,
+        ClipTextEmbeddingRequest,
         CogVLMInferenceRequest,
         YOLOWorldInferenceRequest,
         Sam2InferenceRequest,
@@ -69,6 +81,113 @@ def load_core_model(
     return core_model_id
 
 
+def compare_images_with_texts_using_clip_locally(
+    model_manager: ModelManager,
+    images: Batch[WorkflowImageData],
+    texts: List[str],
+    clip_version: str,
+    api_key: Optional[str],
+) -> List[dict]:
+    """
+    Batched counterpart of sending one `ClipCompareRequest` per image - text
+    prompts are embedded once for the whole batch and images are embedded in
+    chunks of `CLIP_MAX_BATCH_SIZE`, such that N images result in ceil(N / batch size)
+    forward passes of visual encoder instead of N forward passes of both encoders.
+    Output format matches `ClipCompareResponse.model_dump()`.
+    """
+    text_embedding_request = ClipTextEmbeddingRequest(
+        clip_version_id=clip_version,
+        text=texts,
+        api_key=api_key,
+    )
+    clip_model_id = load_core_model(
+        model_manager=model_manager,
+        inference_request=text_embedding_request,
+        core_model="clip",
+    )
+    text_embeddings = embed_texts_with_clip_locally(
+        model_manager=model_manager,
+        clip_model_id=clip_model_id,
+        texts=texts,
+        clip_version=clip_version,
+        api_key=api_key,
+    )
+    image_embeddings = []
+    for images_batch in create_batches(sequence=images, batch_size=CLIP_MAX_BATCH_SIZE):
+        image_embedding_request = ClipImageEmbeddingRequest(
+            clip_version_id=clip_version,
+            image=[i.to_inference_format(numpy_preferred=True) for i in images_batch],
+            api_key=api_key,
+        )
+        image_embeddings.extend(
+            model_manager.infer_from_request_sync(
+                clip_model_id, image_embedding_request
+            ).embeddings
+        )
+    similarities = calculate_cosine_similarity_matrix(
+        a=np.array(image_embeddings), b=np.array(text_embeddings)
+    )
+    return [{"similarity": row} for row in similarities.tolist()]
+
+
+def embed_texts_with_clip_locally(
+    model_manager: ModelManager,
+    clip_model_id: str,
+    texts: List[str],
+    clip_version: str,
+    api_key: Optional[str],
+) -> List[np.ndarray]:
+    """
+    Text prompts are usually fixed for the whole video stream, so their embeddings
+    are cached (similarly to YOLO-World class embeddings) and only cache misses
+    are sent to the model.
+    """
+    embeddings = {}
+    texts_to_embed = []
+    for text in texts:
+        if text in embeddings:
+            continue
+        embedding = cache.get_numpy(
+            _get_clip_text_embedding_cache_key(text=text, clip_version=clip_version)
+        )
+        if embedding is not None:
+            embeddings[text] = embedding
+        elif text not in texts_to_embed:
+            texts_to_embed.append(text)
+    if texts_to_embed:
+        text_embedding_request = ClipTextEmbeddingRequest(
+            clip_version_id=clip_version,
+            text=texts_to_embed,
+            api_key=api_key,
+        )
+        calculated_embeddings = model_manager.infer_from_request_sync(
+            clip_model_id, text_embedding_request
+        ).embeddings
+        for text, embedding in zip(texts_to_embed, calculated_embeddings):
+            embedding = np.asarray(embedding)
+            cache.set_numpy(
+                _get_clip_text_embedding_cache_key(
+                    text=text, clip_version=clip_version
+                ),
+                embedding,
+                expire=CLIP_TEXT_EMBEDDINGS_EXPIRE_TIMEOUT,
+            )
+            embeddings[text] = embedding
+    return [embeddings[text] for text in texts]
+
+
+def _get_clip_text_embedding_cache_key(text: str, clip_version: str) -> str:
+    return f"clip-embedding:{clip_version}:{get_text_hash(text=text)}"
+
+
+def calculate_cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)))
+    a_normalised = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b_normalised = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return a_normalised @ b_normalised.T
+
+
 def attach_prediction_type_info(
     predictions: List[Dict[str, Any]],
     prediction_type: str,
@@ -234,35 +353,29 @@ KEYS_REQUIRED_TO_EMBED_IN_ROOT_COORDINATES = {
 def sv_detections_to_root_coordinates(
     detections: sv.Detections, keypoints_key: str = KEYPOINTS_XY_KEY_IN_SV_DETECTIONS
 ) -> sv.Detections:
-    detections_copy = deepcopy(detections)
-    if len(detections_copy) == 0:
-        return detections_copy
-
-    if any(
-        key not in detections_copy.data
-        for key in KEYS_REQUIRED_TO_EMBED_IN_ROOT_COORDINATES
+    if len(detections) == 0 or any(
+        key not in detections.data for key in KEYS_REQUIRED_TO_EMBED_IN_ROOT_COORDINATES
     ):
-        logging.warning(
-            "Could not execute detections_to_root_coordinates(...) on detections with "
-            f"the following metadata registered: {list(detections_copy.data.keys())}"
-        )
-        return detections_copy
-    if SCALING_RELATIVE_TO_ROOT_PARENT_KEY in detections_copy.data:
-        scale = detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY][0]
+        if len(detections) > 0:
+            logging.warning(
+                "Could not execute detections_to_root_coordinates(...) on detections with "
+                f"the following metadata registered: {list(detections.data.keys())}"
+            )
+        return deepcopy(detections)
+    if SCALING_RELATIVE_TO_ROOT_PARENT_KEY in detections.data:
+        scale = detections[SCALING_RELATIVE_TO_ROOT_PARENT_KEY][0]
         detections_copy = scale_sv_detections(
             detections=detections,
             scale=1 / scale,
         )
-    detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] = np.array(
-        [1.0] * len(detections_copy)
-    )
-    detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array(
-        [1.0] * len(detections_copy)
-    )
+    else:
+        detections_copy = deepcopy(detections)
+    detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] = np.ones(len(detections_copy))
+    detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.ones(len(detections_copy))
     origin_height = detections_copy[ROOT_PARENT_DIMENSIONS_KEY][0][0]
     origin_width = detections_copy[ROOT_PARENT_DIMENSIONS_KEY][0][1]
-    detections_copy[IMAGE_DIMENSIONS_KEY] = np.array(
-        [[origin_height, origin_width]] * len(detections_copy)
+    detections_copy[IMAGE_DIMENSIONS_KEY] = np.tile(
+        [origin_height, origin_width], (len(detections_copy), 1)
     )
     root_parent_id = detections_copy[ROOT_PARENT_ID_KEY][0]
     shift_x, shift_y = detections_copy[ROOT_PARENT_COORDINATES_KEY][0]
@@ -272,19 +385,17 @@ def sv_detections_to_root_coordinates(
             if len(keypoints):
                 keypoints += [shift_x, shift_y]
     if detections_copy.mask is not None:
-        origin_mask_base = np.full((origin_height, origin_width), False)
-        new_anchored_masks = np.array(
-            [origin_mask_base.copy() for _ in detections_copy]
+        # all masks in sv.Detections share the same shape, so whole batch of masks
+        # is anchored in root coordinates with single slice assignment
+        # TODO: instead of shifting mask we could store contours in data instead of storing mask (even if calculated)
+        #       it would be faster to shift contours but at expense of having to remember to generate mask from contour when it's needed
+        _, mask_h, mask_w = detections_copy.mask.shape
+        new_anchored_masks = np.zeros(
+            (len(detections_copy), origin_height, origin_width), dtype=bool
         )
-        for anchored_mask, original_mask in zip(
-            new_anchored_masks, detections_copy.mask
-        ):
-            mask_h, mask_w = original_mask.shape
-            # TODO: instead of shifting mask we could store contours in data instead of storing mask (even if calculated)
-            #       it would be faster to shift contours but at expense of having to remember to generate mask from contour when it's needed
-            anchored_mask[shift_y : shift_y + mask_h, shift_x : shift_x + mask_w] = (
-                original_mask
-            )
+        new_anchored_masks[
+            :, shift_y : shift_y + mask_h, shift_x : shift_x + mask_w
+        ] = detections_copy.mask
         detections_copy.mask = new_anchored_masks
     new_root_metadata = ImageParentMetadata(
         parent_id=root_parent_id,
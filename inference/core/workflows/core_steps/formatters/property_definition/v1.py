@@ -86,6 +86,10 @@ class BlockManifest(WorkflowBlockManifest):
     def get_execution_engine_compatibility(cls) -> Optional[str]:
         return ">=1.0.0,<2.0.0"
 
+    @classmethod
+    def is_deterministic(cls) -> bool:
+        return True
+
 
 class PropertyDefinitionBlockV1(WorkflowBlock):
 
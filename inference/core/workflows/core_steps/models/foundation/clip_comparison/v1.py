@@ -3,8 +3,8 @@ from typing import List, Literal, Optional, Type, Union
 
 from pydantic import AliasChoices, ConfigDict, Field
 
-from inference.core.entities.requests.clip import ClipCompareRequest
 from inference.core.env import (
+    CLIP_VERSION_ID,
     HOSTED_CORE_MODEL_URL,
     LOCAL_INFERENCE_API_URL,
     WORKFLOWS_REMOTE_API_TARGET,
@@ -13,7 +13,7 @@ from inference.core.env import (
 from inference.core.managers.base import ModelManager
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.utils import (
-    load_core_model,
+    compare_images_with_texts_using_clip_locally,
     remove_unexpected_keys_from_dictionary,
     run_in_parallel,
 )
@@ -136,24 +136,13 @@ class ClipComparisonBlockV1(WorkflowBlock):
         images: Batch[WorkflowImageData],
         texts: List[str],
     ) -> BlockResult:
-        predictions = []
-        for single_image in images:
-            inference_request = ClipCompareRequest(
-                subject=single_image.to_inference_format(numpy_preferred=True),
-                subject_type="image",
-                prompt=texts,
-                prompt_type="text",
-                api_key=self._api_key,
-            )
-            clip_model_id = load_core_model(
-                model_manager=self._model_manager,
-                inference_request=inference_request,
-                core_model="clip",
-            )
-            prediction = self._model_manager.infer_from_request_sync(
-                clip_model_id, inference_request
-            )
-            predictions.append(prediction.model_dump())
+        predictions = compare_images_with_texts_using_clip_locally(
+            model_manager=self._model_manager,
+            images=images,
+            texts=texts,
+            clip_version=CLIP_VERSION_ID,
+            api_key=self._api_key,
+        )
         return self._post_process_result(
             images=images,
             predictions=predictions,
@@ -4,7 +4,6 @@ from typing import List, Literal, Optional, Type, Union
 import numpy as np
 from pydantic import ConfigDict, Field
 
-from inference.core.entities.requests.clip import ClipCompareRequest
 from inference.core.env import (
     HOSTED_CORE_MODEL_URL,
     LOCAL_INFERENCE_API_URL,
@@ -14,7 +13,7 @@ from inference.core.env import (
 from inference.core.managers.base import ModelManager
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.utils import (
-    load_core_model,
+    compare_images_with_texts_using_clip_locally,
     run_in_parallel,
 )
 from inference.core.workflows.execution_engine.constants import (
@@ -162,25 +161,13 @@ class ClipComparisonBlockV2(WorkflowBlock):
         classes: List[str],
         version: str,
     ) -> BlockResult:
-        predictions = []
-        for single_image in images:
-            inference_request = ClipCompareRequest(
-                clip_version_id=version,
-                subject=single_image.to_inference_format(numpy_preferred=True),
-                subject_type="image",
-                prompt=classes,
-                prompt_type="text",
-                api_key=self._api_key,
-            )
-            clip_model_id = load_core_model(
-                model_manager=self._model_manager,
-                inference_request=inference_request,
-                core_model="clip",
-            )
-            prediction = self._model_manager.infer_from_request_sync(
-                clip_model_id, inference_request
-            )
-            predictions.append(prediction.model_dump())
+        predictions = compare_images_with_texts_using_clip_locally(
+            model_manager=self._model_manager,
+            images=images,
+            texts=classes,
+            clip_version=version,
+            api_key=self._api_key,
+        )
         return self._post_process_result(
             images=images,
             predictions=predictions,
@@ -129,21 +129,21 @@ class OCRModelBlockV1(WorkflowBlock):
         self,
         images: Batch[WorkflowImageData],
     ) -> BlockResult:
-        predictions = []
-        for single_image in images:
-            inference_request = DoctrOCRInferenceRequest(
-                image=single_image.to_inference_format(numpy_preferred=True),
-                api_key=self._api_key,
-            )
-            doctr_model_id = load_core_model(
-                model_manager=self._model_manager,
-                inference_request=inference_request,
-                core_model="doctr",
-            )
-            result = self._model_manager.infer_from_request_sync(
-                doctr_model_id, inference_request
-            )
-            predictions.append(result.model_dump())
+        inference_request = DoctrOCRInferenceRequest(
+            image=[i.to_inference_format(numpy_preferred=True) for i in images],
+            api_key=self._api_key,
+        )
+        doctr_model_id = load_core_model(
+            model_manager=self._model_manager,
+            inference_request=inference_request,
+            core_model="doctr",
+        )
+        results = self._model_manager.infer_from_request_sync(
+            doctr_model_id, inference_request
+        )
+        if not isinstance(results, list):
+            results = [results]
+        predictions = [result.model_dump() for result in results]
         return self._post_process_result(
             predictions=predictions,
             images=images,
@@ -170,24 +170,26 @@ class YoloWorldModelBlockV1(WorkflowBlock):
         version: str,
         confidence: Optional[float],
     ) -> BlockResult:
-        predictions = []
-        for single_image in images:
-            inference_request = YOLOWorldInferenceRequest(
-                image=single_image.to_inference_format(numpy_preferred=True),
-                yolo_world_version_id=version,
-                confidence=confidence,
-                text=class_names,
-                api_key=self._api_key,
-            )
-            yolo_world_model_id = load_core_model(
-                model_manager=self._model_manager,
-                inference_request=inference_request,
-                core_model="yolo_world",
-            )
-            prediction = self._model_manager.infer_from_request_sync(
-                yolo_world_model_id, inference_request
-            )
-            predictions.append(prediction.model_dump(by_alias=True, exclude_none=True))
+        inference_request = YOLOWorldInferenceRequest(
+            image=[i.to_inference_format(numpy_preferred=True) for i in images],
+            yolo_world_version_id=version,
+            confidence=confidence,
+            text=class_names,
+            api_key=self._api_key,
+        )
+        yolo_world_model_id = load_core_model(
+            model_manager=self._model_manager,
+            inference_request=inference_request,
+            core_model="yolo_world",
+        )
+        predictions = self._model_manager.infer_from_request_sync(
+            yolo_world_model_id, inference_request
+        )
+        if not isinstance(predictions, list):
+            predictions = [predictions]
+        predictions = [
+            e.model_dump(by_alias=True, exclude_none=True) for e in predictions
+        ]
         return self._post_process_result(
             images=images,
             predictions=predictions,
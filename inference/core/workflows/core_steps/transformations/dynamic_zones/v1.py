@@ -76,6 +76,10 @@ class DynamicZonesManifest(WorkflowBlockManifest):
     def get_execution_engine_compatibility(cls) -> Optional[str]:
         return ">=1.0.0,<2.0.0"
 
+    @classmethod
+    def is_deterministic(cls) -> bool:
+        return True
+
 
 def calculate_simplified_polygon(
     mask: np.ndarray, required_number_of_vertices: int, max_steps: int = 1000
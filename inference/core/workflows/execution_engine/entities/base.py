@@ -26,6 +26,7 @@ from inference.core.utils.image_utils import (
     encode_image_to_jpeg_bytes,
     load_image_from_url,
 )
+from inference.core.utils.preprocessing_cache import get_request_preprocessing_cache
 from inference.core.workflows.execution_engine.entities.types import (
     IMAGE_KIND,
     VIDEO_METADATA_KIND,
@@ -182,6 +183,9 @@ class ImageParentMetadata:
     origin_coordinates: Optional[OriginCoordinatesSystem] = None
 
 
+WORKFLOW_IMAGE_DECODING_KEY = "workflow_image"
+
+
 class WorkflowImageData:
 
     def __init__(
@@ -239,16 +243,33 @@ class WorkflowImageData:
     def numpy_image(self) -> np.ndarray:
         if self._numpy_image is not None:
             return self._numpy_image
+        cache = get_request_preprocessing_cache()
+        if cache is None:
+            self._numpy_image = self._decode_image()
+        else:
+            # images sharing the same encoded source are decoded once within Workflow run
+            self._numpy_image = cache.get_or_compute(
+                image=self._base64_image or self._image_reference,
+                key=WORKFLOW_IMAGE_DECODING_KEY,
+                compute=self._decode_image,
+            )
+        return self._numpy_image
+
+    def _decode_image(self) -> np.ndarray:
         if self._base64_image:
-            self._numpy_image = attempt_loading_image_from_string(self._base64_image)[0]
-            return self._numpy_image
+            return attempt_loading_image_from_string(self._base64_image)[0]
         if self._image_reference.startswith(
             "http://"
         ) or self._image_reference.startswith("https://"):
-            self._numpy_image = load_image_from_url(value=self._image_reference)
-        else:
-            self._numpy_image = cv2.imread(self._image_reference)
-        return self._numpy_image
+            return load_image_from_url(value=self._image_reference)
+        return cv2.imread(self._image_reference)
+
+    @property
+    def numpy_image_nbytes(self) -> int:
+        # does not trigger decoding - 0 is returned when image is not materialised
+        if self._numpy_image is None:
+            return 0
+        return self._numpy_image.nbytes
 
     @property
     def base64_image(self) -> str:
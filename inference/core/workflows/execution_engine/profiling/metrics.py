@@ -0,0 +1,441 @@
+"""
+Always-on, low-overhead aggregates of Workflows steps execution.
+
+In contrast to `WorkflowsProfiler` which records full trace of selected requests,
+components of this module keep only aggregates (latency histograms, batch sizes,
+bytes of images materialised and peak memory deltas) per step and per block type.
+Aggregates are exposed through Prometheus `/metrics` endpoint and `InferencePipeline`
+watchdog. Overhead is controlled with sampling rate - only sampled step executions
+are measured - and bytes of images and memory deltas are only measured on demand, as
+they are much more expensive than measuring latency.
+
+Memory deltas are approximate - they are differences of process resident memory
+measured before and after step execution, so they are only meaningful when steps run
+one at a time (concurrently running steps, other requests and garbage collection
+affect the value). They are reported as 0 when procfs is not available.
+"""
+
+import os
+import random
+import sys
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from copy import deepcopy
+from dataclasses import dataclass
+from threading import Lock
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+)
+
+from inference.core.env import (
+    ENABLE_WORKFLOWS_METRICS,
+    WORKFLOWS_METRICS_MAX_STEPS,
+    WORKFLOWS_METRICS_MEASURE_RESOURCES,
+    WORKFLOWS_METRICS_SAMPLING_RATE,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    WorkflowImageData,
+)
+from inference.core.workflows.prototypes.block import WorkflowBlockManifest
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows - memory deltas are not reported then
+    resource = None
+
+PROC_STATM_PATH = "/proc/self/statm"
+try:
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    # not available on Windows - procfs is not there either
+    PAGE_SIZE = 4096
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+OTHER_WORKFLOW_ID = "other"
+OTHER_STEP_NAME = "other"
+NOT_SAMPLED_EXECUTION = nullcontext()
+MAX_IMAGES_LOOKUP_DEPTH = 4
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def cumulative_counts(self) -> List[int]:
+        result, total = [], 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates quantile with linear interpolation inside the bucket,
+        the same way as Prometheus `histogram_quantile(...)` does.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        lower_bound, cumulative_count = 0.0, 0
+        for upper_bound, count in zip(self.buckets, self.counts):
+            if cumulative_count + count >= rank and count > 0:
+                if upper_bound == float("inf"):
+                    return self.max
+                fraction = (rank - cumulative_count) / count
+                return min(
+                    lower_bound + (upper_bound - lower_bound) * fraction, self.max
+                )
+            cumulative_count += count
+            lower_bound = upper_bound
+        return self.max
+
+
+@dataclass(frozen=True)
+class StepExecutionMetricsReport:
+    workflow_id: Optional[str]
+    step_name: Optional[str]
+    block_type: str
+    executions: int
+    latency_mean: Optional[float]
+    latency_p50: Optional[float]
+    latency_p95: Optional[float]
+    latency_p99: Optional[float]
+    latency_max: Optional[float]
+    batch_size_mean: Optional[float]
+    batch_size_max: int
+    images_bytes: int
+    peak_memory_delta_bytes: int
+
+
+class StepExecutionMetrics:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.batch_elements = 0
+        self.batch_size_max = 0
+        self.images_bytes = 0
+        self.peak_memory_delta_bytes = 0
+
+    def record(
+        self,
+        duration: float,
+        batch_size: int,
+        images_bytes: int,
+        peak_memory_delta_bytes: int,
+    ) -> None:
+        self.latency.observe(duration)
+        self.batch_elements += batch_size
+        self.batch_size_max = max(self.batch_size_max, batch_size)
+        self.images_bytes += images_bytes
+        self.peak_memory_delta_bytes = max(
+            self.peak_memory_delta_bytes, peak_memory_delta_bytes
+        )
+
+    def to_report(
+        self,
+        workflow_id: Optional[str],
+        step_name: Optional[str],
+        block_type: str,
+    ) -> StepExecutionMetricsReport:
+        executions = self.latency.count
+        return StepExecutionMetricsReport(
+            workflow_id=workflow_id,
+            step_name=step_name,
+            block_type=block_type,
+            executions=executions,
+            latency_mean=self.latency.sum / executions if executions else None,
+            latency_p50=self.latency.quantile(0.5),
+            latency_p95=self.latency.quantile(0.95),
+            latency_p99=self.latency.quantile(0.99),
+            latency_max=self.latency.max if executions else None,
+            batch_size_mean=self.batch_elements / executions if executions else None,
+            batch_size_max=self.batch_size_max,
+            images_bytes=self.images_bytes,
+            peak_memory_delta_bytes=self.peak_memory_delta_bytes,
+        )
+
+
+StepKey = Tuple[str, str, str]
+
+
+class WorkflowsMetricsCollector:
+    """
+    Thread-safe collector of steps execution aggregates. Each step execution is
+    measured with probability equal to `sampling_rate`, such that aggregates of
+    the busiest workflows can be kept with negligible overhead.
+
+    Aggregates are keyed by workflow id, step name and block type - and additionally
+    by block type alone, to make it easy to find regressions of particular block.
+    Steps of workflows without id (specifications sent in requests, with names of steps
+    chosen by users) are only aggregated per block type. At most `max_steps` steps are
+    tracked - executions of further steps are aggregated under "other" workflow and step,
+    per block type.
+    """
+
+    def __init__(
+        self,
+        sampling_rate: float = 1.0,
+        measure_resources: bool = False,
+        max_steps: int = WORKFLOWS_METRICS_MAX_STEPS,
+    ):
+        self._sampling_rate = min(max(sampling_rate, 0.0), 1.0)
+        self._measure_resources = measure_resources
+        self._max_steps = max_steps
+        self._steps_metrics: Dict[StepKey, StepExecutionMetrics] = {}
+        self._blocks_metrics: Dict[str, StepExecutionMetrics] = {}
+        self._block_types: Dict[Type[WorkflowBlockManifest], str] = {}
+        self._lock = Lock()
+
+    @property
+    def sampling_rate(self) -> float:
+        return self._sampling_rate
+
+    def should_sample(self) -> bool:
+        if self._sampling_rate >= 1.0:
+            return True
+        return random.random() < self._sampling_rate
+
+    def measure_step_execution(
+        self,
+        workflow_id: Optional[str],
+        step_name: str,
+        step_manifest: WorkflowBlockManifest,
+        batch_size: int,
+        step_input: Any,
+    ) -> ContextManager[None]:
+        if not self.should_sample():
+            return NOT_SAMPLED_EXECUTION
+        return self._measure_step_execution(
+            workflow_id=workflow_id,
+            step_name=step_name,
+            step_manifest=step_manifest,
+            batch_size=batch_size,
+            step_input=step_input,
+        )
+
+    @contextmanager
+    def _measure_step_execution(
+        self,
+        workflow_id: Optional[str],
+        step_name: str,
+        step_manifest: WorkflowBlockManifest,
+        batch_size: int,
+        step_input: Any,
+    ) -> Generator[None, None, None]:
+        memory_before = 0
+        if self._measure_resources:
+            memory_before = get_current_memory_usage()
+        start = time.perf_counter()
+        yield None
+        duration = time.perf_counter() - start
+        images_bytes, peak_memory_delta = 0, 0
+        if self._measure_resources:
+            # approximate, see module docstring
+            peak_memory_delta = max(get_current_memory_usage() - memory_before, 0)
+            # images are counted after step execution, as blocks may materialise them
+            images_bytes = calculate_images_bytes(value=step_input)
+        self.record_step_execution(
+            workflow_id=workflow_id,
+            step_name=step_name,
+            block_type=self.get_block_type(step_manifest=step_manifest),
+            duration=duration,
+            batch_size=batch_size,
+            images_bytes=images_bytes,
+            peak_memory_delta_bytes=peak_memory_delta,
+        )
+
+    def record_step_execution(
+        self,
+        workflow_id: Optional[str],
+        step_name: str,
+        block_type: str,
+        duration: float,
+        batch_size: int,
+        images_bytes: int = 0,
+        peak_memory_delta_bytes: int = 0,
+    ) -> None:
+        with self._lock:
+            if block_type not in self._blocks_metrics:
+                self._blocks_metrics[block_type] = StepExecutionMetrics()
+            aggregates = [self._blocks_metrics[block_type]]
+            step_key = self._get_step_key(
+                workflow_id=workflow_id, step_name=step_name, block_type=block_type
+            )
+            if step_key is not None:
+                if step_key not in self._steps_metrics:
+                    self._steps_metrics[step_key] = StepExecutionMetrics()
+                aggregates.append(self._steps_metrics[step_key])
+            for metrics in aggregates:
+                metrics.record(
+                    duration=duration,
+                    batch_size=batch_size,
+                    images_bytes=images_bytes,
+                    peak_memory_delta_bytes=peak_memory_delta_bytes,
+                )
+
+    def _get_step_key(
+        self, workflow_id: Optional[str], step_name: str, block_type: str
+    ) -> Optional[StepKey]:
+        if workflow_id is None:
+            return None
+        step_key = (workflow_id, step_name, block_type)
+        if (
+            step_key in self._steps_metrics
+            or len(self._steps_metrics) < self._max_steps
+        ):
+            return step_key
+        return OTHER_WORKFLOW_ID, OTHER_STEP_NAME, block_type
+
+    def get_block_type(self, step_manifest: WorkflowBlockManifest) -> str:
+        manifest_class = type(step_manifest)
+        if manifest_class not in self._block_types:
+            type_annotation = manifest_class.model_fields["type"].annotation
+            type_identifiers = get_args(type_annotation)
+            self._block_types[manifest_class] = (
+                type_identifiers[0] if type_identifiers else step_manifest.type
+            )
+        return self._block_types[manifest_class]
+
+    def for_workflow(self, workflow_id: Optional[str]) -> "WorkflowMetricsRecorder":
+        return WorkflowMetricsRecorder(collector=self, workflow_id=workflow_id)
+
+    def get_steps_metrics(self) -> Dict[StepKey, StepExecutionMetrics]:
+        with self._lock:
+            return deepcopy(self._steps_metrics)
+
+    def get_blocks_metrics(self) -> Dict[str, StepExecutionMetrics]:
+        with self._lock:
+            return deepcopy(self._blocks_metrics)
+
+    def get_steps_report(self) -> List[StepExecutionMetricsReport]:
+        return [
+            metrics.to_report(
+                workflow_id=workflow_id, step_name=step_name, block_type=block_type
+            )
+            for (
+                workflow_id,
+                step_name,
+                block_type,
+            ), metrics in self.get_steps_metrics().items()
+        ]
+
+    def get_blocks_report(self) -> List[StepExecutionMetricsReport]:
+        return [
+            metrics.to_report(workflow_id=None, step_name=None, block_type=block_type)
+            for block_type, metrics in self.get_blocks_metrics().items()
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._steps_metrics = {}
+            self._blocks_metrics = {}
+
+
+class WorkflowMetricsRecorder:
+    """
+    View of `WorkflowsMetricsCollector` bound to specific workflow, used by
+    Execution Engine to record its steps.
+    """
+
+    def __init__(
+        self, collector: WorkflowsMetricsCollector, workflow_id: Optional[str]
+    ):
+        self._collector = collector
+        self._workflow_id = workflow_id
+
+    def measure_step_execution(
+        self,
+        step_name: str,
+        step_manifest: WorkflowBlockManifest,
+        batch_size: int,
+        step_input: Any,
+    ) -> ContextManager[None]:
+        return self._collector.measure_step_execution(
+            workflow_id=self._workflow_id,
+            step_name=step_name,
+            step_manifest=step_manifest,
+            batch_size=batch_size,
+            step_input=step_input,
+        )
+
+
+def get_peak_memory_usage() -> int:
+    if resource is None:
+        return 0
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_memory
+    return peak_memory * 1024
+
+
+def get_current_memory_usage() -> int:
+    # in contrast to ru_maxrss, current RSS is not monotonic - so it can be compared
+    # before and after step execution
+    try:
+        with open(PROC_STATM_PATH, "rb") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return resident_pages * PAGE_SIZE
+
+
+def calculate_images_bytes(value: Any, depth: int = 0) -> int:
+    """
+    Sums sizes of numpy images already present in `value` - images which were not
+    decoded yet are skipped (they are not materialised, and we must not decode them).
+    """
+    if depth > MAX_IMAGES_LOOKUP_DEPTH:
+        return 0
+    if isinstance(value, WorkflowImageData):
+        return value.numpy_image_nbytes
+    if isinstance(value, dict):
+        return sum(calculate_images_bytes(v, depth + 1) for v in value.values())
+    if isinstance(value, (list, tuple, Batch)):
+        return sum(calculate_images_bytes(v, depth + 1) for v in value)
+    return 0
+
+
+WORKFLOWS_METRICS_COLLECTOR: Optional[WorkflowsMetricsCollector] = (
+    WorkflowsMetricsCollector(
+        sampling_rate=WORKFLOWS_METRICS_SAMPLING_RATE,
+        measure_resources=WORKFLOWS_METRICS_MEASURE_RESOURCES,
+    )
+    if ENABLE_WORKFLOWS_METRICS
+    else None
+)
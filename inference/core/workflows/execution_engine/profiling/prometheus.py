@@ -0,0 +1,129 @@
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
+
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+    Metric,
+)
+from prometheus_client.registry import Collector
+
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    StepExecutionMetrics,
+    WorkflowsMetricsCollector,
+)
+
+STEP_LABELS = ["workflow_id", "step", "block_type"]
+BLOCK_LABELS = ["block_type"]
+
+_REGISTERED_COLLECTORS: Dict[Tuple[int, int], Collector] = {}
+_REGISTRATION_LOCK = Lock()
+
+
+class WorkflowsMetricsPrometheusCollector(Collector):
+    """
+    Translates aggregates of `WorkflowsMetricsCollector` into Prometheus metrics
+    families at scrape time - nothing is computed on the execution path.
+    """
+
+    def __init__(self, metrics_collector: WorkflowsMetricsCollector):
+        self._metrics_collector = metrics_collector
+
+    def collect(self) -> Iterable[Metric]:
+        steps_metrics = {
+            tuple(key): metrics
+            for key, metrics in self._metrics_collector.get_steps_metrics().items()
+        }
+        blocks_metrics = {
+            (block_type,): metrics
+            for block_type, metrics in self._metrics_collector.get_blocks_metrics().items()
+        }
+        yield from build_metrics_families(
+            prefix="workflows_step",
+            description_subject="Workflow step",
+            labels=STEP_LABELS,
+            metrics=steps_metrics,
+        )
+        yield from build_metrics_families(
+            prefix="workflows_block",
+            description_subject="Workflow block type",
+            labels=BLOCK_LABELS,
+            metrics=blocks_metrics,
+        )
+
+
+def register_workflows_metrics_in_prometheus(
+    metrics_collector: WorkflowsMetricsCollector,
+    registry: Optional[CollectorRegistry] = None,
+) -> WorkflowsMetricsPrometheusCollector:
+    """
+    Registers Prometheus collector of Workflows metrics - safe to be called multiple
+    times (for instance when app is created more than once), as each metrics collector
+    is only registered once in given registry.
+    """
+    if registry is None:
+        registry = REGISTRY
+    registration_key = (id(registry), id(metrics_collector))
+    with _REGISTRATION_LOCK:
+        if registration_key not in _REGISTERED_COLLECTORS:
+            prometheus_collector = WorkflowsMetricsPrometheusCollector(
+                metrics_collector=metrics_collector
+            )
+            registry.register(prometheus_collector)
+            _REGISTERED_COLLECTORS[registration_key] = prometheus_collector
+        return _REGISTERED_COLLECTORS[registration_key]
+
+
+def build_metrics_families(
+    prefix: str,
+    description_subject: str,
+    labels: list,
+    metrics: Dict[Tuple[str, ...], StepExecutionMetrics],
+) -> Iterable[Metric]:
+    latency = HistogramMetricFamily(
+        f"{prefix}_execution_seconds",
+        f"{description_subject} execution latency (sampled executions only)",
+        labels=labels,
+    )
+    batch_elements = CounterMetricFamily(
+        f"{prefix}_batch_elements",
+        f"Number of batch elements processed by {description_subject.lower()}",
+        labels=labels,
+    )
+    batch_size_max = GaugeMetricFamily(
+        f"{prefix}_batch_size_max",
+        f"Max batch size processed by {description_subject.lower()}",
+        labels=labels,
+    )
+    images_bytes = CounterMetricFamily(
+        f"{prefix}_images_bytes",
+        f"Bytes of decoded images passed into {description_subject.lower()}",
+        labels=labels,
+    )
+    peak_memory_delta = GaugeMetricFamily(
+        f"{prefix}_peak_memory_delta_bytes",
+        f"Max increase of process resident memory during {description_subject.lower()} "
+        "execution (approximate, meaningful only when steps run one at a time)",
+        labels=labels,
+    )
+    for label_values, step_metrics in metrics.items():
+        label_values = list(label_values)
+        histogram = step_metrics.latency
+        buckets = [
+            (format_bucket_bound(bound), count)
+            for bound, count in zip(histogram.buckets, histogram.cumulative_counts())
+        ]
+        latency.add_metric(label_values, buckets=buckets, sum_value=histogram.sum)
+        batch_elements.add_metric(label_values, step_metrics.batch_elements)
+        batch_size_max.add_metric(label_values, step_metrics.batch_size_max)
+        images_bytes.add_metric(label_values, step_metrics.images_bytes)
+        peak_memory_delta.add_metric(label_values, step_metrics.peak_memory_delta_bytes)
+    return [latency, batch_elements, batch_size_max, images_bytes, peak_memory_delta]
+
+
+def format_bucket_bound(bound: float) -> str:
+    if bound == float("inf"):
+        return "+Inf"
+    return repr(bound)
@@ -51,6 +51,11 @@ class BasicWorkflowsCache(Generic[V]):
 
     def cache(self, key: str, value: V) -> None:
         with self._cache_lock:
+            if key in self._cache:
+                # threads missing the same key concurrently cache it more than once -
+                # key must be kept in buffer once, otherwise its eviction would fail
+                self._cache[key] = value
+                return None
             if len(self._keys_buffer) == self._keys_buffer.maxlen:
                 to_pop = self._keys_buffer.popleft()
                 del self._cache[to_pop]
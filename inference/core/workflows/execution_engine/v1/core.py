@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional
 
 from packaging.version import Version
 
+from inference.core.env import ENABLE_WORKFLOWS_STEPS_OUTPUTS_MEMOISATION
 from inference.core.workflows.execution_engine.entities.engine import (
     BaseExecutionEngine,
 )
@@ -9,11 +10,17 @@ from inference.core.workflows.execution_engine.profiling.core import (
     NullWorkflowsProfiler,
     WorkflowsProfiler,
 )
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WORKFLOWS_METRICS_COLLECTOR,
+)
 from inference.core.workflows.execution_engine.v1.compiler.core import compile_workflow
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
 )
 from inference.core.workflows.execution_engine.v1.executor.core import run_workflow
+from inference.core.workflows.execution_engine.v1.executor.memoisation import (
+    StepsOutputsMemory,
+)
 from inference.core.workflows.execution_engine.v1.executor.runtime_input_assembler import (
     assemble_runtime_parameters,
 )
@@ -67,6 +74,17 @@ class ExecutionEngineV1(BaseExecutionEngine):
         self._prevent_local_images_loading = prevent_local_images_loading
         self._workflow_id = workflow_id
         self._profiler = profiler
+        # Execution Engine instance is re-used across video frames in `InferencePipeline`
+        # - outputs of deterministic steps not depending on batch-oriented inputs are
+        # computed once and memoised until their inputs change.
+        self._steps_outputs_memory = (
+            StepsOutputsMemory() if ENABLE_WORKFLOWS_STEPS_OUTPUTS_MEMOISATION else None
+        )
+        self._metrics_recorder = (
+            WORKFLOWS_METRICS_COLLECTOR.for_workflow(workflow_id=workflow_id)
+            if WORKFLOWS_METRICS_COLLECTOR is not None
+            else None
+        )
 
     def run(
         self,
@@ -94,6 +112,8 @@ class ExecutionEngineV1(BaseExecutionEngine):
             usage_workflow_id=self._workflow_id,
             usage_workflow_preview=_is_preview,
             profiler=self._profiler,
+            steps_outputs_memory=self._steps_outputs_memory,
+            metrics_recorder=self._metrics_recorder,
         )
         self._profiler.end_workflow_run()
         return result
@@ -1,8 +1,10 @@
+from contextlib import nullcontext
 from datetime import datetime
 from functools import partial
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional
 
 from inference.core import logger
+from inference.core.utils.preprocessing_cache import request_preprocessing_cache_scope
 from inference.core.workflows.errors import (
     ExecutionEngineRuntimeError,
     StepExecutionError,
@@ -13,6 +15,9 @@ from inference.core.workflows.execution_engine.profiling.core import (
     WorkflowsProfiler,
     execution_phase,
 )
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WorkflowMetricsRecorder,
+)
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
 )
@@ -25,13 +30,20 @@ from inference.core.workflows.execution_engine.v1.executor.execution_data_manage
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
     ParallelStepExecutionCoordinator,
 )
+from inference.core.workflows.execution_engine.v1.executor.memoisation import (
+    StepsOutputsMemory,
+    fingerprint_step_input,
+)
 from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
     construct_workflow_output,
 )
 from inference.core.workflows.execution_engine.v1.executor.utils import (
     run_steps_in_parallel,
 )
-from inference.core.workflows.prototypes.block import WorkflowBlock
+from inference.core.workflows.prototypes.block import (
+    WorkflowBlock,
+    WorkflowBlockManifest,
+)
 from inference.usage_tracking.collector import usage_collector
 
 
@@ -45,33 +57,41 @@ def run_workflow(
     runtime_parameters: Dict[str, Any],
     max_concurrent_steps: int,
     profiler: Optional[WorkflowsProfiler] = None,
+    steps_outputs_memory: Optional[StepsOutputsMemory] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> List[Dict[str, Any]]:
-    execution_data_manager = ExecutionDataManager.init(
-        execution_graph=workflow.execution_graph,
-        runtime_parameters=runtime_parameters,
-    )
-    execution_coordinator = ParallelStepExecutionCoordinator.init(
-        execution_graph=workflow.execution_graph,
-    )
-    next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
-    while next_steps is not None:
-        execute_steps(
-            next_steps=next_steps,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
-            max_concurrent_steps=max_concurrent_steps,
-            profiler=profiler,
+    # images decoded and pre-processed by models are shared between steps of the run
+    with request_preprocessing_cache_scope():
+        execution_data_manager = ExecutionDataManager.init(
+            execution_graph=workflow.execution_graph,
+            runtime_parameters=runtime_parameters,
         )
-        next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
-    with profiler.profile_execution_phase(
-        name="outputs_construction",
-        categories=["execution_engine_operation"],
-    ):
-        return construct_workflow_output(
-            workflow_outputs=workflow.workflow_definition.outputs,
+        execution_coordinator = ParallelStepExecutionCoordinator.init(
             execution_graph=workflow.execution_graph,
-            execution_data_manager=execution_data_manager,
         )
+        next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
+        while next_steps is not None:
+            execute_steps(
+                next_steps=next_steps,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                max_concurrent_steps=max_concurrent_steps,
+                profiler=profiler,
+                steps_outputs_memory=steps_outputs_memory,
+                metrics_recorder=metrics_recorder,
+            )
+            next_steps = execution_coordinator.get_steps_to_execute_next(
+                profiler=profiler
+            )
+        with profiler.profile_execution_phase(
+            name="outputs_construction",
+            categories=["execution_engine_operation"],
+        ):
+            return construct_workflow_output(
+                workflow_outputs=workflow.workflow_definition.outputs,
+                execution_graph=workflow.execution_graph,
+                execution_data_manager=execution_data_manager,
+            )
 
 
 @execution_phase(
@@ -85,6 +105,8 @@ def execute_steps(
     execution_data_manager: ExecutionDataManager,
     max_concurrent_steps: int,
     profiler: Optional[WorkflowsProfiler] = None,
+    steps_outputs_memory: Optional[StepsOutputsMemory] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     logger.info(f"Executing steps: {next_steps}.")
     steps_functions = [
@@ -94,6 +116,8 @@ def execute_steps(
             workflow=workflow,
             execution_data_manager=execution_data_manager,
             profiler=profiler,
+            steps_outputs_memory=steps_outputs_memory,
+            metrics_recorder=metrics_recorder,
         )
         for step_selector in next_steps
     ]
@@ -110,6 +134,8 @@ def safe_execute_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    steps_outputs_memory: Optional[StepsOutputsMemory] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     if profiler is None:
         profiler = NullWorkflowsProfiler.init()
@@ -122,6 +148,8 @@ def safe_execute_step(
             workflow=workflow,
             execution_data_manager=execution_data_manager,
             profiler=profiler,
+            steps_outputs_memory=steps_outputs_memory,
+            metrics_recorder=metrics_recorder,
         )
         logger.info(
             f"finished execution of: {step_selector} - {datetime.now().isoformat()}"
@@ -142,6 +170,8 @@ def run_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: WorkflowsProfiler,
+    steps_outputs_memory: Optional[StepsOutputsMemory] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     if execution_data_manager.is_step_simd(step_selector=step_selector):
         return run_simd_step(
@@ -149,12 +179,15 @@ def run_step(
             workflow=workflow,
             execution_data_manager=execution_data_manager,
             profiler=profiler,
+            metrics_recorder=metrics_recorder,
         )
     return run_non_simd_step(
         step_selector=step_selector,
         workflow=workflow,
         execution_data_manager=execution_data_manager,
         profiler=profiler,
+        steps_outputs_memory=steps_outputs_memory,
+        metrics_recorder=metrics_recorder,
     )
 
 
@@ -163,6 +196,7 @@ def run_simd_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     step_name = get_last_chunk_of_selector(selector=step_selector)
     step_instance = workflow.steps[step_name].step
@@ -173,12 +207,16 @@ def run_simd_step(
             step_instance=step_instance,
             execution_data_manager=execution_data_manager,
             profiler=profiler,
+            step_manifest=step_manifest,
+            metrics_recorder=metrics_recorder,
         )
     return run_simd_step_in_non_batch_mode(
         step_selector=step_selector,
         step_instance=step_instance,
         execution_data_manager=execution_data_manager,
         profiler=profiler,
+        step_manifest=step_manifest,
+        metrics_recorder=metrics_recorder,
     )
 
 
@@ -187,6 +225,8 @@ def run_simd_step_in_batch_mode(
     step_instance: WorkflowBlock,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    step_manifest: Optional[WorkflowBlockManifest] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     with profiler.profile_execution_phase(
         name="step_input_assembly",
@@ -208,7 +248,14 @@ def run_simd_step_in_batch_mode(
             # no inputs - discarded either by conditional exec or by not accepting empty
             outputs = []
         else:
-            outputs = step_instance.run(**step_input.parameters)
+            with measure_step_execution(
+                metrics_recorder=metrics_recorder,
+                step_selector=step_selector,
+                step_manifest=step_manifest,
+                batch_size=len(step_input.indices),
+                step_input=step_input.parameters,
+            ):
+                outputs = step_instance.run(**step_input.parameters)
     with profiler.profile_execution_phase(
         name="step_output_registration",
         categories=["execution_engine_operation"],
@@ -226,6 +273,8 @@ def run_simd_step_in_non_batch_mode(
     step_instance: WorkflowBlock,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    step_manifest: Optional[WorkflowBlockManifest] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     indices, results = [], []
     with profiler.profile_execution_phase(
@@ -244,6 +293,12 @@ def run_simd_step_in_non_batch_mode(
                 metadata={
                     "step": step_selector,
                 },
+            ), measure_step_execution(
+                metrics_recorder=metrics_recorder,
+                step_selector=step_selector,
+                step_manifest=step_manifest,
+                batch_size=1,
+                step_input=input_definition.parameters,
             ):
                 result = step_instance.run(**input_definition.parameters)
             results.append(result)
@@ -265,6 +320,8 @@ def run_non_simd_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    steps_outputs_memory: Optional[StepsOutputsMemory] = None,
+    metrics_recorder: Optional[WorkflowMetricsRecorder] = None,
 ) -> None:
     with profiler.profile_execution_phase(
         name="step_input_assembly",
@@ -279,14 +336,39 @@ def run_non_simd_step(
         return None
     step_name = get_last_chunk_of_selector(selector=step_selector)
     step_instance = workflow.steps[step_name].step
-    with profiler.profile_execution_phase(
-        name="step_code_execution",
-        categories=["workflow_block_operation"],
-        metadata={
-            "step": step_selector,
-        },
-    ):
-        step_result = step_instance.run(**step_input)
+    step_manifest = workflow.steps[step_name].manifest
+    input_fingerprint = None
+    if steps_outputs_memory is not None and step_manifest.is_deterministic():
+        input_fingerprint = fingerprint_step_input(step_input=step_input)
+    step_result = None
+    if input_fingerprint is not None:
+        step_result = steps_outputs_memory.retrieve(
+            step_selector=step_selector,
+            fingerprint=input_fingerprint,
+        )
+    if step_result is None:
+        with profiler.profile_execution_phase(
+            name="step_code_execution",
+            categories=["workflow_block_operation"],
+            metadata={
+                "step": step_selector,
+            },
+        ), measure_step_execution(
+            metrics_recorder=metrics_recorder,
+            step_selector=step_selector,
+            step_manifest=step_manifest,
+            batch_size=1,
+            step_input=step_input,
+        ):
+            step_result = step_instance.run(**step_input)
+        if input_fingerprint is not None and not isinstance(step_result, list):
+            steps_outputs_memory.register(
+                step_selector=step_selector,
+                fingerprint=input_fingerprint,
+                output=step_result,
+            )
+    else:
+        logger.debug(f"Re-using memoised output of step: {step_selector}")
     if isinstance(step_result, list):
         raise ExecutionEngineRuntimeError(
             public_message=f"Error in execution engine. Non-SIMD step {step_name} "
@@ -305,3 +387,20 @@ def run_non_simd_step(
             step_selector=step_selector,
             output=step_result,
         )
+
+
+def measure_step_execution(
+    metrics_recorder: Optional[WorkflowMetricsRecorder],
+    step_selector: str,
+    step_manifest: Optional[WorkflowBlockManifest],
+    batch_size: int,
+    step_input: Any,
+) -> ContextManager[None]:
+    if metrics_recorder is None or step_manifest is None:
+        return nullcontext()
+    return metrics_recorder.measure_step_execution(
+        step_name=get_last_chunk_of_selector(selector=step_selector),
+        step_manifest=step_manifest,
+        batch_size=batch_size,
+        step_input=step_input,
+    )
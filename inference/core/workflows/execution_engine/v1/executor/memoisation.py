@@ -0,0 +1,114 @@
+import hashlib
+from copy import deepcopy
+from enum import Enum
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from inference.core.workflows.execution_engine.v1.entities import FlowControl
+
+StepOutput = Union[Dict[str, Any], FlowControl]
+
+
+class NotFingerprintableValueError(ValueError):
+    pass
+
+
+class StepsOutputsMemory:
+    """
+    Memory of outputs of non-SIMD steps (steps not depending on batch-oriented inputs)
+    which persists across `ExecutionEngine.run(...)` calls. When the same Execution
+    Engine serves consecutive video frames, steps operating only on workflow parameters
+    yield the same output for each frame - those are computed once and re-used
+    as long as their inputs stay the same.
+
+    Only the last output is kept for each step - change of step inputs
+    (for instance due to change of workflow parameters) invalidates memoised output.
+
+    Outputs are copied on registration and on retrieval, such that memoised values
+    are never shared with (and potentially mutated by) downstream steps.
+
+    Thread safe thanks to thread lock on `retrieve(...)` and `register(...)`.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[str, StepOutput]] = {}
+        self._lock = Lock()
+
+    def retrieve(self, step_selector: str, fingerprint: str) -> Optional[StepOutput]:
+        with self._lock:
+            entry = self._entries.get(step_selector)
+        if entry is None:
+            return None
+        memoised_fingerprint, output = entry
+        if memoised_fingerprint != fingerprint:
+            return None
+        return deepcopy(output)
+
+    def register(
+        self, step_selector: str, fingerprint: str, output: StepOutput
+    ) -> None:
+        output = deepcopy(output)
+        with self._lock:
+            self._entries[step_selector] = (fingerprint, output)
+
+    def invalidate(self, step_selector: Optional[str] = None) -> None:
+        with self._lock:
+            if step_selector is None:
+                self._entries = {}
+            else:
+                self._entries.pop(step_selector, None)
+
+
+def fingerprint_step_input(step_input: Dict[str, Any]) -> Optional[str]:
+    """
+    Calculates stable fingerprint of step input. Returns `None` when any of
+    the values cannot be fingerprinted - in such case step output must not be memoised.
+    """
+    hashing_object = hashlib.md5()
+    try:
+        _update_fingerprint(hashing_object=hashing_object, value=step_input)
+    except NotFingerprintableValueError:
+        return None
+    return hashing_object.hexdigest()
+
+
+def _update_fingerprint(hashing_object: Any, value: Any) -> None:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        hashing_object.update(f"{type(value).__name__}:{value!r};".encode("utf-8"))
+    elif isinstance(value, bytes):
+        hashing_object.update(b"bytes:")
+        hashing_object.update(value)
+        hashing_object.update(b";")
+    elif isinstance(value, Enum):
+        hashing_object.update(f"enum:{type(value).__name__}.{value.name};".encode())
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            _update_fingerprint(hashing_object=hashing_object, value=value.tolist())
+            return None
+        hashing_object.update(f"ndarray:{value.dtype}:{value.shape}:".encode())
+        hashing_object.update(np.ascontiguousarray(value).tobytes())
+        hashing_object.update(b";")
+    elif isinstance(value, np.generic):
+        _update_fingerprint(hashing_object=hashing_object, value=value.item())
+    elif isinstance(value, (list, tuple)):
+        hashing_object.update(f"{type(value).__name__}[".encode())
+        for element in value:
+            _update_fingerprint(hashing_object=hashing_object, value=element)
+        hashing_object.update(b"];")
+    elif isinstance(value, dict):
+        hashing_object.update(b"dict{")
+        for key in sorted(value.keys(), key=str):
+            _update_fingerprint(hashing_object=hashing_object, value=key)
+            _update_fingerprint(hashing_object=hashing_object, value=value[key])
+        hashing_object.update(b"};")
+    elif isinstance(value, BaseModel):
+        hashing_object.update(f"model:{type(value).__name__}:".encode())
+        hashing_object.update(value.model_dump_json().encode("utf-8"))
+        hashing_object.update(b";")
+    else:
+        raise NotFingerprintableValueError(
+            f"Could not fingerprint value of type {type(value)}"
+        )
@@ -127,11 +127,16 @@ def construct_workflow_output(
 def create_array(indices: np.ndarray) -> Optional[list]:
     if indices.size == 0:
         return None
-    result = []
     max_idx = indices[:, 0].max() + 1
+    if indices.shape[-1] == 1:
+        return [None] * max_idx
+    # grouping by first index element with stable sort - linear scan over sorted
+    # indices instead of comparing whole indices array for each position
+    sorted_indices = indices[np.argsort(indices[:, 0], kind="stable")]
+    boundaries = np.searchsorted(sorted_indices[:, 0], np.arange(max_idx + 1))
+    result = []
     for idx in range(max_idx):
-        idx_selector = indices[:, 0] == idx
-        indices_subset = indices[idx_selector][:, 1:]
+        indices_subset = sorted_indices[boundaries[idx] : boundaries[idx + 1], 1:]
         inner_array = create_array(indices_subset)
         if (
             inner_array is None
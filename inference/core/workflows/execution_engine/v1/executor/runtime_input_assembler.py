@@ -1,5 +1,5 @@
 import os.path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -9,6 +9,7 @@ from inference.core.utils.image_utils import (
     attempt_loading_image_from_string,
     load_image_from_url,
 )
+from inference.core.utils.url_images import fetch_concurrently
 from inference.core.workflows.errors import RuntimeInputError
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
@@ -95,15 +96,23 @@ def assemble_input_image(
                 prevent_local_images_loading=prevent_local_images_loading,
             )
         ] * input_batch_size
-    result = [
-        _assemble_input_image(
+
+    def assemble_element(idx_and_element: Tuple[int, Any]) -> WorkflowImageData:
+        idx, element = idx_and_element
+        return _assemble_input_image(
             parameter=parameter,
             image=element,
             identifier=idx,
             prevent_local_images_loading=prevent_local_images_loading,
         )
-        for idx, element in enumerate(image)
-    ]
+
+    if any(_is_url_image(image=element) for element in image):
+        # images pointed by URLs are fetched concurrently
+        result = fetch_concurrently(assemble_element, list(enumerate(image)))
+    else:
+        result = [
+            assemble_element(idx_and_element) for idx_and_element in enumerate(image)
+        ]
     if len(result) != input_batch_size:
         raise RuntimeInputError(
             public_message="Expected all batch-oriented workflow inputs be the same length, or of length 1 - "
@@ -114,6 +123,14 @@ def assemble_input_image(
     return result
 
 
+def _is_url_image(image: Any) -> bool:
+    if isinstance(image, dict):
+        image = image.get("value")
+    return isinstance(image, str) and (
+        image.startswith("http://") or image.startswith("https://")
+    )
+
+
 def _assemble_input_image(
     parameter: str,
     image: Any,
@@ -1,5 +1,6 @@
 import concurrent
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context, copy_context
 from typing import Callable, List, TypeVar
 
 T = TypeVar("T")
@@ -8,9 +9,12 @@ T = TypeVar("T")
 def run_steps_in_parallel(
     steps: List[Callable[[], T]], max_workers: int = 1
 ) -> List[T]:
+    # worker threads do not inherit context of the caller (like cache of Workflow run) -
+    # so each step runs in copy of it
+    contexts = [copy_context() for _ in steps]
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        return list(executor.map(_run, steps))
+        return list(executor.map(_run, steps, contexts))
 
 
-def _run(fun: Callable[[], T]) -> T:
-    return fun()
+def _run(fun: Callable[[], T], context: Context) -> T:
+    return context.run(fun)
@@ -65,6 +65,13 @@ class WorkflowBlockManifest(BaseModel, ABC):
     def get_execution_engine_compatibility(cls) -> Optional[str]:
         return None
 
+    @classmethod
+    def is_deterministic(cls) -> bool:
+        # Blocks declaring deterministic behaviour (output depends only on inputs,
+        # no side effects and no internal state) may have their outputs memoised
+        # by Execution Engine when they do not operate on batch-oriented inputs.
+        return False
+
 
 class WorkflowBlock(ABC):
 
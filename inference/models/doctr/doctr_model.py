@@ -70,9 +70,15 @@ class DocTR(RoboflowCoreModel):
 
     def infer_from_request(
         self, request: DoctrOCRInferenceRequest
-    ) -> OCRInferenceResponse:
+    ) -> Union[OCRInferenceResponse, List[OCRInferenceResponse]]:
         t1 = perf_counter()
         result = self.infer(**request.dict())
+        if isinstance(result, list):
+            inference_time = perf_counter() - t1
+            return [
+                OCRInferenceResponse(result=single_result, time=inference_time)
+                for single_result in result
+            ]
         return OCRInferenceResponse(
             result=result,
             time=perf_counter() - t1,
@@ -82,36 +88,39 @@ class DocTR(RoboflowCoreModel):
         """
         Run inference on a provided image.
             - image: can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
+                or list of those - in such case all images are processed as pages of single document,
+                which lets DocTR batch detection and recognition across the images.
 
         Args:
             request (DoctrOCRInferenceRequest): The inference request.
 
         Returns:
-            OCRInferenceResponse: The inference response.
+            str or list of str (if list of images is given): Recognised text.
         """
+        images = image if isinstance(image, list) else [image]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pages_paths = []
+            for image_id, single_image in enumerate(images):
+                img = load_image(single_image)
+                page_path = os.path.join(tmp_dir, f"{image_id}.jpg")
+                Image.fromarray(img[0]).save(page_path)
+                pages_paths.append(page_path)
 
-        img = load_image(image)
-
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as f:
-            image = Image.fromarray(img[0])
-
-            image.save(f.name)
-
-            doc = DocumentFile.from_images([f.name])
+            doc = DocumentFile.from_images(pages_paths)
 
-            result = self.model(doc).export()
-
-            result = result["pages"][0]["blocks"]
+            pages = self.model(doc).export()["pages"]
 
+        results = []
+        for page in pages:
             result = [
                 " ".join([word["value"] for word in line["words"]])
-                for block in result
+                for block in page["blocks"]
                 for line in block["lines"]
             ]
-
-            result = " ".join(result)
-
-            return result
+            results.append(" ".join(result))
+        if isinstance(image, list):
+            return results
+        return results[0]
 
     def get_infer_bucket_file_list(self) -> list:
         """Get the list of required files for inference.
@@ -90,20 +90,24 @@ class YOLOWorld(RoboflowCoreModel):
         **kwargs,
     ):
         """
-        Run inference on a provided image.
+        Run inference on a provided image or list of images.
 
         Args:
             image - can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
+                or list of those - in such case whole batch is processed with single forward pass and
+                class embeddings are calculated once for the batch.
             class_filter (Optional[List[str]]): A list of class names to filter, if provided.
 
         Returns:
-            GroundingDINOInferenceRequest: The inference response.
+            ObjectDetectionInferenceResponse or list of responses (if list of images is given).
         """
         logger.debug("YOLOWorld infer() - image preprocessing.")
         t1 = perf_counter()
-        image = self.preproc_image(image)
+        if isinstance(image, list):
+            images = [self.preproc_image(i) for i in image]
+        else:
+            images = [self.preproc_image(image)]
         logger.debug("YOLOWorld infer() - image ready.")
-        img_dims = image.shape
 
         if text is not None and text != self.class_names:
             logger.debug("YOLOWorld infer() - classes embeddings are calculated.")
@@ -115,14 +119,43 @@ class YOLOWorld(RoboflowCoreModel):
             )
         logger.debug("YOLOWorld infer() - prediction starts.")
         results = self.model.predict(
-            image,
+            images,
             conf=confidence,
             verbose=False,
-        )[0]
+        )
         logger.debug("YOLOWorld infer() - predictions ready.")
         t2 = perf_counter() - t1
 
         logger.debug("YOLOWorld infer() - post-processing starting")
+        responses = [
+            self.make_response(
+                results=image_results,
+                img_dims=np_image.shape,
+                inference_time=t2,
+                confidence=confidence,
+                iou_threshold=iou_threshold,
+                class_agnostic_nms=class_agnostic_nms,
+                max_detections=max_detections,
+                max_candidates=max_candidates,
+            )
+            for image_results, np_image in zip(results, images)
+        ]
+        logger.debug("YOLOWorld infer() - post-processing done")
+        if isinstance(image, list):
+            return responses
+        return responses[0]
+
+    def make_response(
+        self,
+        results: Any,
+        img_dims: tuple,
+        inference_time: float,
+        confidence: float,
+        iou_threshold: float,
+        class_agnostic_nms: bool,
+        max_detections: Optional[int],
+        max_candidates: int,
+    ) -> ObjectDetectionInferenceResponse:
         if len(results) > 0:
             bbox_array = np.array([box.xywh.tolist()[0] for box in results.boxes])
             conf_array = np.array([[float(box.conf)] for box in results.boxes])
@@ -150,7 +183,6 @@ class YOLOWorld(RoboflowCoreModel):
         else:
             pred_array = []
         predictions = []
-        logger.debug("YOLOWorld infer() - post-processing done")
         for i, pred in enumerate(pred_array):
             predictions.append(
                 ObjectDetectionPrediction(
@@ -165,13 +197,11 @@ class YOLOWorld(RoboflowCoreModel):
                     }
                 )
             )
-
-        responses = ObjectDetectionInferenceResponse(
+        return ObjectDetectionInferenceResponse(
             predictions=predictions,
             image=InferenceResponseImage(width=img_dims[1], height=img_dims[0]),
-            time=t2,
+            time=inference_time,
         )
-        return responses
 
     def set_classes(self, text: list):
         """Set the class names for the model.
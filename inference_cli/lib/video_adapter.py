@@ -0,0 +1,67 @@
+import json
+import os.path
+from typing import Any, Dict, List, Optional
+
+from tqdm import tqdm
+
+from inference_cli.lib.env import ROBOFLOW_API_KEY
+from inference_cli.lib.exceptions import InferencePackageMissingError
+
+
+def process_video_with_workflow(
+    video_path: str,
+    output_location: str,
+    workflow_specification: Optional[Dict[str, Any]] = None,
+    workspace_name: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    image_input_name: str = "image",
+    excluded_fields: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    overlap_frames: Optional[int] = None,
+    api_key: Optional[str] = None,
+) -> None:
+    try:
+        from inference.core.interfaces.stream.parallel_video_processing import (
+            DEFAULT_MAX_WORKERS,
+            DEFAULT_OVERLAP_FRAMES,
+            get_total_frames,
+            process_video_in_parallel,
+        )
+    except ImportError as error:
+        raise InferencePackageMissingError(
+            "You need to install `inference` package to use this feature. Run `pip install inference`"
+        ) from error
+    if api_key is None:
+        api_key = ROBOFLOW_API_KEY
+    parent_dir = os.path.dirname(os.path.abspath(output_location))
+    os.makedirs(parent_dir, exist_ok=True)
+    progress_bar = tqdm(
+        total=get_total_frames(video_path=video_path), desc="Processing video"
+    )
+    with open(output_location, "w") as f:
+
+        def on_prediction(result: dict, frame_index: int) -> None:
+            f.write(json.dumps({"frame_index": frame_index, **result}) + "\n")
+            progress_bar.update()
+
+        try:
+            process_video_in_parallel(
+                video_path=video_path,
+                on_prediction=on_prediction,
+                workflow_specification=workflow_specification,
+                workspace_name=workspace_name,
+                workflow_id=workflow_id,
+                api_key=api_key,
+                image_input_name=image_input_name,
+                workflows_parameters=workflow_parameters,
+                excluded_fields=excluded_fields,
+                max_workers=max_workers or DEFAULT_MAX_WORKERS,
+                overlap_frames=(
+                    overlap_frames
+                    if overlap_frames is not None
+                    else DEFAULT_OVERLAP_FRAMES
+                ),
+            )
+        finally:
+            progress_bar.close()
@@ -0,0 +1,130 @@
+import json
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+from inference_cli.lib.video_adapter import process_video_with_workflow
+
+video_app = typer.Typer(help="Commands for offline processing of video files.")
+
+
+@video_app.command()
+def process(
+    video_path: Annotated[
+        str,
+        typer.Option(
+            "--video_path",
+            "-v",
+            help="Path to video file to be processed.",
+        ),
+    ],
+    output_location: Annotated[
+        str,
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Path to JSON lines file where results (one line per frame, in frames order) are saved.",
+        ),
+    ],
+    workflow_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-id",
+            "-wid",
+            help="Workflow ID.",
+        ),
+    ] = None,
+    workspace_name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workspace-name",
+            "-wn",
+            help="Workspace Name.",
+        ),
+    ] = None,
+    workflow_specification: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-specification",
+            "-ws",
+            help="Workflow specification.",
+        ),
+    ] = None,
+    workflow_parameters: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-parameters",
+            "-wp",
+            help="JSON document with values of Workflow inputs other than image.",
+        ),
+    ] = None,
+    image_input_name: Annotated[
+        str,
+        typer.Option(
+            "--image_input_name",
+            "-ii",
+            help="Name of Workflow input that accepts video frames.",
+        ),
+    ] = "image",
+    excluded_fields: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            "--exclude",
+            "-e",
+            help="Workflow output to be excluded from results (option may be given multiple times).",
+        ),
+    ] = None,
+    max_workers: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max_workers",
+            "-w",
+            help="Number of processes processing video segments in parallel.",
+        ),
+    ] = None,
+    overlap_frames: Annotated[
+        Optional[int],
+        typer.Option(
+            "--overlap_frames",
+            "-of",
+            help="Number of frames each segment is processed ahead of its start to stitch tracks.",
+        ),
+    ] = None,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+):
+    try:
+        if workflow_specification:
+            workflow_specification = json.loads(workflow_specification)
+        if workflow_parameters:
+            workflow_parameters = json.loads(workflow_parameters)
+        process_video_with_workflow(
+            video_path=video_path,
+            output_location=output_location,
+            workflow_specification=workflow_specification,
+            workspace_name=workspace_name,
+            workflow_id=workflow_id,
+            workflow_parameters=workflow_parameters,
+            image_input_name=image_input_name,
+            excluded_fields=excluded_fields,
+            max_workers=max_workers,
+            overlap_frames=overlap_frames,
+            api_key=api_key,
+        )
+    except KeyboardInterrupt:
+        print("Processing interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    video_app()
@@ -1,3 +1,4 @@
+import json
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, List, Literal, Optional, Tuple, Union
 
@@ -29,6 +30,7 @@ from inference_sdk.http.errors import (
     ModelNotInitializedError,
     ModelNotSelectedError,
     ModelTaskTypeNotSupportedError,
+    ResultsStreamError,
     WrongClientModeError,
 )
 from inference_sdk.http.utils.aliases import (
@@ -50,6 +52,7 @@ from inference_sdk.http.utils.post_processing import (
     adjust_prediction_to_client_scaling_factor,
     combine_clip_embeddings,
     combine_gaze_detections,
+    decode_columnar_predictions,
     decode_workflow_outputs,
     filter_model_descriptions,
     response_contains_jpeg_image,
@@ -66,6 +69,7 @@ from inference_sdk.http.utils.requests import (
     deduct_api_key_from_string,
     inject_images_into_payload,
 )
+from inference_sdk.http.utils.server_sent_events import parse_server_sent_events
 from inference_sdk.utils.decorators import deprecated, experimental
 
 SUCCESSFUL_STATUS_CODE = 200
@@ -330,7 +334,7 @@ class InferenceHTTPClient:
                         expected_format=self.__inference_configuration.output_visualisation_format,
                     )
             parsed_response = adjust_prediction_to_client_scaling_factor(
-                prediction=parsed_response,
+                prediction=decode_columnar_predictions(prediction=parsed_response),
                 scaling_factor=request_data.image_scaling_factors[0],
             )
             results.append(parsed_response)
@@ -394,7 +398,7 @@ class InferenceHTTPClient:
                         expected_format=self.__inference_configuration.output_visualisation_format,
                     )
             parsed_response = adjust_prediction_to_client_scaling_factor(
-                prediction=parsed_response,
+                prediction=decode_columnar_predictions(prediction=parsed_response),
                 scaling_factor=request_data.image_scaling_factors[0],
             )
             results.append(parsed_response)
@@ -465,7 +469,9 @@ class InferenceHTTPClient:
                         )
                     )
                 parsed_response_element = adjust_prediction_to_client_scaling_factor(
-                    prediction=parsed_response_element,
+                    prediction=decode_columnar_predictions(
+                        prediction=parsed_response_element
+                    ),
                     scaling_factor=scaling_factor,
                 )
                 results.append(parsed_response_element)
@@ -537,7 +543,9 @@ class InferenceHTTPClient:
                         )
                     )
                 parsed_response_element = adjust_prediction_to_client_scaling_factor(
-                    prediction=parsed_response_element,
+                    prediction=decode_columnar_predictions(
+                        prediction=parsed_response_element
+                    ),
                     scaling_factor=scaling_factor,
                 )
                 results.append(parsed_response_element)
@@ -1421,6 +1429,39 @@ class InferenceHTTPClient:
         api_key_safe_raise_for_status(response=response)
         return response.json()
 
+    @experimental(
+        info="Video processing in inference server is under development. Breaking changes are possible."
+    )
+    @wrap_errors
+    def stream_inference_pipeline_results(
+        self,
+        pipeline_id: str,
+        excluded_fields: Optional[List[str]] = None,
+        buffer_size: Optional[int] = None,
+        drop_policy: Optional[Literal["drop_oldest", "drop_newest", "block"]] = None,
+    ) -> Generator[dict, None, None]:
+        """
+        Yields results of the pipeline as they are pushed by the server, through single
+        connection - instead of request per result, as with
+        `consume_inference_pipeline_result(...)`. Server buffers up to `buffer_size` results
+        for slow consumer, dropping them afterwards according to `drop_policy` - each result
+        carries `dropped_results` counter. Stop iterating to close the connection.
+        """
+        self._ensure_pipeline_id_not_empty(pipeline_id=pipeline_id)
+        params = {
+            "api_key": self.__api_key,
+            "excluded_fields": excluded_fields or [],
+            "buffer_size": buffer_size,
+            "drop_policy": drop_policy,
+        }
+        response = requests.get(
+            f"{self.__api_url}/inference_pipelines/{pipeline_id}/results_stream",
+            params=params,
+            stream=True,
+        )
+        api_key_safe_raise_for_status(response=response)
+        return _iterate_streamed_results(response=response)
+
     def _ensure_pipeline_id_not_empty(self, pipeline_id: str) -> None:
         if not pipeline_id:
             raise InvalidParameterError("Empty `pipeline_id` parameter detected")
@@ -1535,3 +1576,20 @@ def _ensure_model_is_selected(model_id: Optional[str]) -> None:
 def _ensure_api_key_provided(api_key: Optional[str]) -> None:
     if api_key is None:
         raise APIKeyNotProvided("API key must be provided in this case")
+
+
+def _iterate_streamed_results(
+    response: requests.Response,
+) -> Generator[dict, None, None]:
+    try:
+        # chunk_size=None makes events available as soon as they arrive
+        lines = response.iter_lines(chunk_size=None, decode_unicode=True)
+        for event, data in parse_server_sent_events(lines=lines):
+            payload = json.loads(data)
+            if event == "error":
+                raise ResultsStreamError(
+                    f"Results stream interrupted by server: {payload.get('message')}"
+                )
+            yield payload
+    finally:
+        response.close()
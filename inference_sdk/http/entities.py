@@ -64,11 +64,20 @@ class VisualisationResponseFormat(str, Enum):
 class InferenceConfiguration:
     confidence_threshold: Optional[float] = None
     keypoint_confidence_threshold: Optional[float] = None
+    keypoints_format: Optional[str] = None
     format: Optional[str] = None
     mask_decode_mode: Optional[str] = None
     tradeoff_factor: Optional[float] = None
+    mask_format: Optional[str] = None
+    predictions_format: Optional[str] = None
+    slice_width: Optional[int] = None
+    slice_height: Optional[int] = None
+    slice_overlap_ratio_width: Optional[float] = None
+    slice_overlap_ratio_height: Optional[float] = None
     max_candidates: Optional[int] = None
     max_detections: Optional[int] = None
+    top_k: Optional[int] = None
+    filter_by_confidence: Optional[bool] = None
     iou_threshold: Optional[float] = None
     stroke_width: Optional[int] = None
     count_inference: Optional[bool] = None
@@ -136,6 +145,11 @@ class InferenceConfiguration:
             ("stroke_width", "visualization_stroke_width"),
             ("visualize_predictions", "visualize_predictions"),
             ("disable_active_learning", "disable_active_learning"),
+            ("predictions_format", "predictions_format"),
+            ("slice_width", "slice_width"),
+            ("slice_height", "slice_height"),
+            ("slice_overlap_ratio_width", "slice_overlap_ratio_width"),
+            ("slice_overlap_ratio_height", "slice_overlap_ratio_height"),
             ("active_learning_target_dataset", "active_learning_target_dataset"),
             ("source", "source"),
             ("source_info", "source_info"),
@@ -148,6 +162,7 @@ class InferenceConfiguration:
     def to_keypoints_detection_parameters(self) -> Dict[str, Any]:
         parameters = self.to_object_detection_parameters()
         parameters["keypoint_confidence"] = self.keypoint_confidence_threshold
+        parameters["keypoints_format"] = self.keypoints_format
         return remove_empty_values(dictionary=parameters)
 
     def to_instance_segmentation_parameters(self) -> Dict[str, Any]:
@@ -155,6 +170,7 @@ class InferenceConfiguration:
         parameters_specs = [
             ("mask_decode_mode", "mask_decode_mode"),
             ("tradeoff_factor", "tradeoff_factor"),
+            ("mask_format", "mask_format"),
         ]
         for internal_name, external_name in parameters_specs:
             parameters[external_name] = getattr(self, internal_name)
@@ -170,6 +186,9 @@ class InferenceConfiguration:
             ("visualize_predictions", "visualize_predictions"),
             ("stroke_width", "visualization_stroke_width"),
             ("disable_active_learning", "disable_active_learning"),
+            ("predictions_format", "predictions_format"),
+            ("top_k", "top_k"),
+            ("filter_by_confidence", "filter_by_confidence"),
             ("source", "source"),
             ("source_info", "source_info"),
             ("active_learning_target_dataset", "active_learning_target_dataset"),
@@ -183,10 +202,12 @@ class InferenceConfiguration:
         parameters_specs = [
             ("confidence_threshold", "confidence"),
             ("keypoint_confidence_threshold", "keypoint_confidence"),
+            ("keypoints_format", "keypoints_format"),
             ("format", "format"),
             ("visualize_labels", "labels"),
             ("mask_decode_mode", "mask_decode_mode"),
             ("tradeoff_factor", "tradeoff_factor"),
+            ("mask_format", "mask_format"),
             ("max_detections", "max_detections"),
             ("iou_threshold", "overlap"),
             ("stroke_width", "stroke"),
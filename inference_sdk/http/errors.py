@@ -75,3 +75,7 @@ class WrongClientModeError(HTTPClientError):
 
 class InvalidParameterError(HTTPClientError):
     pass
+
+
+class ResultsStreamError(HTTPClientError):
+    pass
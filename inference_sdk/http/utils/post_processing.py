@@ -1,6 +1,7 @@
 import base64
 import itertools
 from typing import Any, Dict, List, Optional, Union
+from uuid import uuid4
 
 import numpy as np
 from PIL import Image
@@ -14,6 +15,7 @@ from inference_sdk.http.utils.encoding import (
 )
 
 CONTENT_TYPE_HEADERS = ["content-type", "Content-Type"]
+COLUMNAR_PREDICTIONS_FORMAT = "columnar"
 IMAGES_TRANSCODING_METHODS = {
     VisualisationResponseFormat.BASE64: encode_base_64,
     VisualisationResponseFormat.NUMPY: bytes_to_opencv_image,
@@ -131,6 +133,108 @@ def transform_visualisation_bytes(
     return transcoding_method(visualisation)
 
 
+def decode_columnar_predictions(prediction: dict) -> dict:
+    """
+    Converts predictions returned by server in columnar format (arrays of columns) into
+    the regular format - list of predictions (or dict of multi-label classification
+    predictions), leaving predictions in other formats untouched.
+    """
+    if prediction.get("predictions_format") != COLUMNAR_PREDICTIONS_FORMAT:
+        return prediction
+    prediction = dict(prediction)
+    del prediction["predictions_format"]
+    columns = prediction["predictions"]
+    keypoints_names = prediction.pop("keypoints_names", None)
+    predicted_classes = prediction.pop("predicted_classes", None)
+    class_ids = np.asarray(columns["class_id"], dtype=int).reshape(-1).tolist()
+    class_names = list(columns["class"])
+    confidences = np.asarray(columns["confidence"], dtype=float).reshape(-1).tolist()
+    if columns.get("xyxy") is None:
+        if predicted_classes is not None:
+            prediction["predictions"] = {
+                class_name: {"confidence": confidence, "class_id": class_id}
+                for class_name, class_id, confidence in zip(
+                    class_names, class_ids, confidences
+                )
+            }
+            prediction["predicted_classes"] = predicted_classes
+            return prediction
+        prediction["predictions"] = [
+            {"class": class_name, "class_id": class_id, "confidence": confidence}
+            for class_name, class_id, confidence in zip(
+                class_names, class_ids, confidences
+            )
+        ]
+        if class_names:
+            prediction["top"] = class_names[0]
+            prediction["confidence"] = confidences[0]
+        return prediction
+    xyxy = np.asarray(columns["xyxy"], dtype=float).reshape(-1, 4)
+    centers = ((xyxy[:, :2] + xyxy[:, 2:]) / 2).tolist()
+    sizes = (xyxy[:, 2:] - xyxy[:, :2]).tolist()
+    detection_ids = columns.get("detection_id")
+    if detection_ids is None:
+        # responses of older servers do not carry ids of detections
+        detection_ids = [str(uuid4()) for _ in range(len(class_ids))]
+    results = [
+        {
+            "x": center[0],
+            "y": center[1],
+            "width": size[0],
+            "height": size[1],
+            "confidence": confidence,
+            "class": class_name,
+            "class_id": class_id,
+            "detection_id": detection_id,
+        }
+        for center, size, confidence, class_name, class_id, detection_id in zip(
+            centers, sizes, confidences, class_names, class_ids, detection_ids
+        )
+    ]
+    if columns.get("points") is not None:
+        for result, polygon in zip(results, columns["points"]):
+            result["points"] = [
+                {"x": point[0], "y": point[1]}
+                for point in np.asarray(polygon, dtype=float).reshape(-1, 2).tolist()
+            ]
+    for mask_format in ("rle", "bitmask"):
+        if columns.get(mask_format) is None:
+            continue
+        for result, mask in zip(results, columns[mask_format]):
+            result["points"] = []
+            result[mask_format] = mask
+    if columns.get("keypoints") is not None:
+        _decode_columnar_keypoints(
+            results=results,
+            keypoints=columns["keypoints"],
+            keypoints_names=keypoints_names or {},
+        )
+    prediction["predictions"] = results
+    return prediction
+
+
+def _decode_columnar_keypoints(
+    results: List[dict],
+    keypoints: list,
+    keypoints_names: Dict[str, List[str]],
+) -> None:
+    for result, object_keypoints in zip(results, keypoints):
+        object_keypoints = np.asarray(object_keypoints, dtype=float).reshape(-1, 3)
+        visible = np.flatnonzero(~np.isnan(object_keypoints).any(axis=1)).tolist()
+        names = keypoints_names.get(result["class"], [])
+        values = object_keypoints.tolist()
+        result["keypoints"] = [
+            {
+                "x": values[keypoint_id][0],
+                "y": values[keypoint_id][1],
+                "confidence": values[keypoint_id][2],
+                "class_id": keypoint_id,
+                "class_name": names[keypoint_id],
+            }
+            for keypoint_id in visible
+        ]
+
+
 def adjust_prediction_to_client_scaling_factor(
     prediction: dict,
     scaling_factor: Optional[float],
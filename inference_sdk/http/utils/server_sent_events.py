@@ -0,0 +1,29 @@
+from typing import Generator, Iterable, List, Optional, Tuple
+
+
+def parse_server_sent_events(
+    lines: Iterable[str],
+) -> Generator[Tuple[Optional[str], str], None, None]:
+    """
+    Turns lines of `text/event-stream` into (event name, data) tuples - comments and
+    fields other than `event` and `data` are ignored.
+    """
+    event_name: Optional[str] = None
+    data_lines: List[str] = []
+    for line in lines:
+        if not line:
+            if data_lines:
+                yield event_name, "\n".join(data_lines)
+            event_name, data_lines = None, []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event_name = value
+        elif field == "data":
+            data_lines.append(value)
+    if data_lines:
+        yield event_name, "\n".join(data_lines)
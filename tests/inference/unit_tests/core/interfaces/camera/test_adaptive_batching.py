@@ -0,0 +1,273 @@
+import time
+from datetime import datetime, timedelta
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.adaptive_batching import (
+    AdaptiveBatchCollectionPolicy,
+)
+from inference.core.interfaces.camera.entities import AdaptiveBatchingConfig, VideoFrame
+from inference.core.interfaces.camera.utils import VideoSources, VideoSourcesManager
+
+START = datetime(2024, 1, 1)
+
+
+def assembly_video_frame(
+    source_id: int, frame_id: int, timestamp: datetime
+) -> VideoFrame:
+    return VideoFrame(
+        image=np.zeros((2, 2, 3), dtype=np.uint8),
+        frame_id=frame_id,
+        frame_timestamp=timestamp,
+        source_id=source_id,
+    )
+
+
+def test_policy_learns_frames_cadence_of_source() -> None:
+    # given
+    policy = AdaptiveBatchCollectionPolicy(config=AdaptiveBatchingConfig())
+
+    # when
+    expected_arrival_before_cadence_known = policy.expected_frame_arrival(source_ord=0)
+    for frame_id in range(3):
+        policy.register_frame(
+            source_ord=0,
+            frame=assembly_video_frame(
+                source_id=0,
+                frame_id=frame_id,
+                timestamp=START + timedelta(seconds=0.1 * frame_id),
+            ),
+        )
+
+    # then
+    assert expected_arrival_before_cadence_known is None
+    assert (
+        abs((policy.expected_frame_arrival(source_ord=0) - START).total_seconds() - 0.3)
+        < 1e-6
+    )
+
+
+def test_policy_estimates_processing_time_of_not_observed_batch_size() -> None:
+    # given
+    policy = AdaptiveBatchCollectionPolicy(config=AdaptiveBatchingConfig())
+    for batch_size, processing_time in [(1, 0.02), (3, 0.06)]:
+        frames = [
+            assembly_video_frame(source_id=i, frame_id=1, timestamp=START)
+            for i in range(batch_size)
+        ]
+        policy.register_batch_collected(
+            batch=list(enumerate(frames)),
+            closed_at=datetime.now() - timedelta(seconds=processing_time),
+        )
+        policy.register_batch_processed(
+            video_frames=frames, inferred_frames_number=batch_size
+        )
+
+    # when
+    result = policy.estimate_batch_processing_time(batch_size=5)
+
+    # then
+    assert result == pytest.approx(0.1, abs=0.01)
+
+
+def test_policy_estimates_processing_time_optimistically_when_single_batch_size_observed() -> (
+    None
+):
+    # given
+    policy = AdaptiveBatchCollectionPolicy(config=AdaptiveBatchingConfig())
+    frames = [assembly_video_frame(source_id=0, frame_id=1, timestamp=START)]
+    policy.register_batch_collected(
+        batch=[(0, frames[0])], closed_at=datetime.now() - timedelta(seconds=0.05)
+    )
+    policy.register_batch_processed(video_frames=frames, inferred_frames_number=1)
+
+    # when
+    result = policy.estimate_batch_processing_time(batch_size=4)
+
+    # then
+    assert result == pytest.approx(0.05, abs=0.01)
+
+
+def test_policy_batch_deadline_respects_latency_target_and_max_collection_timeout() -> (
+    None
+):
+    # given
+    policy = AdaptiveBatchCollectionPolicy(
+        config=AdaptiveBatchingConfig(latency_target=0.1, max_collection_timeout=0.3)
+    )
+    bounded_policy = AdaptiveBatchCollectionPolicy(
+        config=AdaptiveBatchingConfig(latency_target=0.1, max_collection_timeout=0.02)
+    )
+    frames = [
+        assembly_video_frame(source_id=0, frame_id=1, timestamp=START),
+        assembly_video_frame(
+            source_id=1, frame_id=1, timestamp=START + timedelta(seconds=0.05)
+        ),
+    ]
+
+    # when
+    deadline = policy.compute_batch_deadline(
+        collection_start=START, collected_frames=frames
+    )
+    bounded_deadline = bounded_policy.compute_batch_deadline(
+        collection_start=START, collected_frames=frames
+    )
+
+    # then
+    assert deadline == START + timedelta(seconds=0.1)
+    assert bounded_deadline == START + timedelta(seconds=0.02)
+
+
+def test_policy_does_not_select_sources_not_expected_before_deadline() -> None:
+    # given
+    policy = AdaptiveBatchCollectionPolicy(config=AdaptiveBatchingConfig())
+    for source_ord, interval in [(0, 0.5), (1, 0.04)]:
+        for frame_id in range(2):
+            policy.register_frame(
+                source_ord=source_ord,
+                frame=assembly_video_frame(
+                    source_id=source_ord,
+                    frame_id=frame_id,
+                    timestamp=START + timedelta(seconds=interval * frame_id),
+                ),
+            )
+
+    # when
+    result = policy.select_source_to_wait_for(
+        missing_sources=[0, 1, 2], deadline=START + timedelta(seconds=0.1)
+    )
+    result_when_unknown_source_not_missing = policy.select_source_to_wait_for(
+        missing_sources=[0, 1], deadline=START + timedelta(seconds=0.1)
+    )
+    result_when_nothing_expected = policy.select_source_to_wait_for(
+        missing_sources=[0], deadline=START + timedelta(seconds=0.1)
+    )
+
+    # then
+    assert result == 2, "Expected source with unknown cadence to be awaited first"
+    assert result_when_unknown_source_not_missing == 1
+    assert result_when_nothing_expected is None
+
+
+def test_policy_statistics() -> None:
+    # given
+    policy = AdaptiveBatchCollectionPolicy(config=AdaptiveBatchingConfig())
+    closed_at = START + timedelta(seconds=0.1)
+    policy.register_batch_collected(
+        batch=[
+            (0, assembly_video_frame(source_id=3, frame_id=1, timestamp=START)),
+            (
+                1,
+                assembly_video_frame(
+                    source_id=4,
+                    frame_id=1,
+                    timestamp=START + timedelta(seconds=0.08),
+                ),
+            ),
+        ],
+        closed_at=closed_at,
+    )
+    policy.register_batch_collected(
+        batch=[
+            (
+                0,
+                assembly_video_frame(
+                    source_id=3, frame_id=2, timestamp=START + timedelta(seconds=0.1)
+                ),
+            )
+        ],
+        closed_at=closed_at + timedelta(seconds=0.04),
+    )
+
+    # when
+    result = policy.get_statistics()
+
+    # then
+    assert result.batches_collected == 2
+    assert result.average_batch_size == 1.5
+    assert result.sources[0].source_id == 3
+    assert result.sources[0].frames_collected == 2
+    assert result.sources[0].average_queueing_delay == pytest.approx(0.07)
+    assert result.sources[0].max_queueing_delay == pytest.approx(0.1)
+    assert result.sources[1].average_queueing_delay == pytest.approx(0.02)
+
+
+class PacedVideoSource:
+    def __init__(self, source_id: int, interval: float):
+        self.source_id = source_id
+        self._interval = interval
+        self._frames = Queue()
+        self._stop = Event()
+        self._thread = Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def read_frame(self, timeout: Optional[float] = None) -> Optional[VideoFrame]:
+        try:
+            return self._frames.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _produce(self) -> None:
+        frame_id = 1
+        while not self._stop.wait(timeout=self._interval):
+            self._frames.put(
+                assembly_video_frame(
+                    source_id=self.source_id,
+                    frame_id=frame_id,
+                    timestamp=datetime.now(),
+                )
+            )
+            frame_id += 1
+
+
+def test_video_sources_manager_does_not_hold_batches_for_laggy_source() -> None:
+    # given
+    sources = [
+        PacedVideoSource(source_id=0, interval=0.02),
+        PacedVideoSource(source_id=1, interval=0.4),
+    ]
+    policy = AdaptiveBatchCollectionPolicy(
+        config=AdaptiveBatchingConfig(latency_target=0.05)
+    )
+    manager = VideoSourcesManager.init(
+        video_sources=VideoSources(
+            all_sources=sources,
+            allow_reconnection=[False, False],
+            managed_sources=[],
+        ),
+        should_stop=lambda: False,
+        on_reconnection_error=lambda source_id, error: None,
+        batching_policy=policy,
+    )
+
+    # when
+    batches = []
+    try:
+        started = time.monotonic()
+        while time.monotonic() - started < 1.5:
+            batches.append(
+                manager.retrieve_frames_from_sources(batch_collection_timeout=None)
+            )
+    finally:
+        for source in sources:
+            source.stop()
+
+    # then
+    statistics = policy.get_statistics()
+    assert statistics.sources[0].frames_collected >= 40
+    assert statistics.sources[1].frames_collected >= 2
+    assert (
+        statistics.sources[0].average_queueing_delay < 0.05
+    ), "Expected frames of fast source not to wait for laggy one"
+    assert all(
+        [f.source_id for f in batch] == sorted(f.source_id for f in batch)
+        for batch in batches
+    ), "Expected frames to be ordered as sources"
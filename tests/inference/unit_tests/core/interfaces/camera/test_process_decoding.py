@@ -0,0 +1,173 @@
+import gc
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.exceptions import SourceConnectionError
+from inference.core.interfaces.camera.process_decoding import (
+    ProcessVideoFrameProducer,
+    SharedMemoryFramesRing,
+)
+from inference.core.interfaces.camera.video_source import (
+    BufferConsumptionStrategy,
+    BufferFillingStrategy,
+    CV2VideoFrameProducer,
+    DecodingBackend,
+    VideoSource,
+)
+
+
+def test_process_video_frame_producer_when_invalid_video_reference_given() -> None:
+    # when
+    producer = ProcessVideoFrameProducer("invalid")
+
+    # then
+    assert producer.isOpened() is False
+    assert producer.grab() is False
+    with pytest.raises(SourceConnectionError):
+        _ = producer.discover_source_properties()
+
+
+@pytest.mark.timeout(90)
+def test_process_video_frame_producer_decodes_the_same_frames_as_cv2_producer(
+    local_video_path: str,
+) -> None:
+    # given
+    producer = ProcessVideoFrameProducer(local_video_path, ring_size=4)
+    reference_producer = CV2VideoFrameProducer(local_video_path)
+    frames_compared = 0
+
+    try:
+        # when
+        producer.initialize_source_properties({})
+        properties = producer.discover_source_properties()
+        reference_properties = reference_producer.discover_source_properties()
+        while producer.grab():
+            assert reference_producer.grab() is True
+            success, frame = producer.retrieve()
+            _, reference_frame = reference_producer.retrieve()
+
+            # then
+            assert success is True
+            assert np.array_equal(frame, reference_frame)
+            frames_compared += 1
+    finally:
+        producer.release()
+        reference_producer.release()
+
+    # then
+    assert properties == reference_properties
+    assert frames_compared == 431, "Each frame of video must be decoded"
+
+
+@pytest.mark.timeout(90)
+def test_process_video_frame_producer_recycles_shared_memory_slots(
+    local_video_path: str,
+) -> None:
+    # given
+    producer = ProcessVideoFrameProducer(local_video_path, ring_size=2)
+    held_frames = []
+
+    try:
+        # when
+        for _ in range(5):
+            producer.grab()
+            held_frames.append(producer.retrieve()[1])
+        slots_when_frames_held = producer._frames_ring.free_slots
+        held_frames = held_frames[:1]
+        gc.collect()
+        slots_when_frames_released = producer._frames_ring.free_slots
+        producer.grab()
+        _, next_frame = producer.retrieve()
+    finally:
+        producer.release()
+
+    # then
+    assert slots_when_frames_held == 0, "Held frames must occupy all slots of ring"
+    assert (
+        slots_when_frames_released == 2
+    ), "Slots of released frames must be returned (first frame is copied to allocate ring)"
+    assert next_frame.base is not None, "Frame is expected to be view of shared memory"
+    assert held_frames[0].shape == (240, 426, 3)
+
+
+def test_shared_memory_frames_ring_when_slots_exhausted() -> None:
+    # given
+    ring = SharedMemoryFramesRing(slot_size=12, slots=2)
+
+    try:
+        # when
+        first_slot = ring.acquire_slot()
+        second_slot = ring.acquire_slot()
+        third_slot = ring.acquire_slot()
+    finally:
+        ring.release()
+
+    # then
+    assert {first_slot, second_slot} == {0, 1}
+    assert third_slot is None, "No slot is expected to be given when all are in use"
+
+
+def test_shared_memory_frames_ring_returns_slot_when_frame_and_its_views_are_collected() -> (
+    None
+):
+    # given
+    ring = SharedMemoryFramesRing(slot_size=12, slots=2)
+    slot = ring.acquire_slot()
+    frame = ring.wrap_slot(slot=slot, shape=(2, 2, 3), dtype="|u1")
+    frame[...] = 7
+    view = frame[0]
+
+    try:
+        # when
+        del frame
+        gc.collect()
+        free_slots_when_view_alive = ring.free_slots
+        del view
+        gc.collect()
+        free_slots_when_view_collected = ring.free_slots
+    finally:
+        ring.release()
+
+    # then
+    assert (
+        free_slots_when_view_alive == 1
+    ), "Slot must be kept while view of frame alive"
+    assert free_slots_when_view_collected == 2
+
+
+def test_shared_memory_frames_ring_keeps_frames_valid_after_release() -> None:
+    # given
+    ring = SharedMemoryFramesRing(slot_size=12, slots=2)
+    frame = ring.wrap_slot(slot=ring.acquire_slot(), shape=(2, 2, 3), dtype="|u1")
+    frame[...] = 7
+
+    # when
+    ring.release()
+
+    # then
+    assert np.all(frame == 7), "Frame must stay valid after ring is released"
+    assert ring.acquire_slot() is None, "Released ring must not give out slots"
+
+
+@pytest.mark.timeout(90)
+@pytest.mark.slow
+def test_video_source_with_process_decoding_backend_when_frames_must_not_be_dropped(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=local_video_path,
+        buffer_filling_strategy=BufferFillingStrategy.WAIT,
+        buffer_consumption_strategy=BufferConsumptionStrategy.LAZY,
+        decoding_backend=DecodingBackend.PROCESS,
+        shared_memory_ring_size=4,
+    )
+
+    # when
+    source.start()
+    frames = [frame for frame in source]
+
+    # then
+    assert len(frames) == 431, "Each frame of video must be emitted"
+    assert [frame.frame_id for frame in frames] == list(range(1, 432))
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.entities import (
+    FramesGatingConfig,
+    FramesGatingMethod,
+)
+from inference.core.interfaces.stream.frames_gating import FramesGate
+
+START = datetime(2024, 1, 1)
+
+
+def assembly_video_frame(
+    image: np.ndarray, frame_id: int, source_id: int = 0, seconds: float = 0.0
+) -> VideoFrame:
+    return VideoFrame(
+        image=image,
+        frame_id=frame_id,
+        frame_timestamp=START + timedelta(seconds=seconds),
+        source_id=source_id,
+    )
+
+
+def assembly_scene(with_object: bool = False, noise_seed: int = 0) -> np.ndarray:
+    image = np.full((240, 320, 3), 90, dtype=np.uint8)
+    image[:, 160:] = 170
+    noise = np.random.default_rng(noise_seed).integers(-3, 4, size=image.shape)
+    image = (image + noise).astype(np.uint8)
+    if with_object:
+        image[100:180, 40:120] = 255
+    return image
+
+
+@pytest.mark.parametrize(
+    "method",
+    [FramesGatingMethod.FRAME_DIFFERENCE, FramesGatingMethod.PERCEPTUAL_HASH],
+)
+def test_frames_gate_skips_frames_without_change_and_infers_changed_ones(
+    method: FramesGatingMethod,
+) -> None:
+    # given
+    gate = FramesGate(config=FramesGatingConfig(method=method))
+    frames = [
+        assembly_video_frame(image=assembly_scene(noise_seed=0), frame_id=1),
+        assembly_video_frame(image=assembly_scene(noise_seed=1), frame_id=2),
+        assembly_video_frame(
+            image=assembly_scene(with_object=True, noise_seed=2), frame_id=3
+        ),
+        assembly_video_frame(
+            image=assembly_scene(with_object=True, noise_seed=3), frame_id=4
+        ),
+    ]
+
+    # when
+    selected = [gate.select_frames_for_inference(video_frames=[f]) for f in frames]
+
+    # then
+    assert [len(s) for s in selected] == [
+        1,
+        0,
+        1,
+        0,
+    ], "Expected noise to be ignored and new object to trigger inference"
+    assert gate.get_statistics() == {0: {"inferred_frames": 2, "skipped_frames": 2}}
+
+
+def test_frames_gate_forces_inference_after_refresh_interval() -> None:
+    # given
+    gate = FramesGate(config=FramesGatingConfig(refresh_interval=1.0))
+    image = assembly_scene()
+
+    # when
+    selected = [
+        gate.select_frames_for_inference(
+            video_frames=[assembly_video_frame(image, frame_id=i, seconds=i * 0.4)]
+        )
+        for i in range(6)
+    ]
+
+    # then
+    assert [len(s) for s in selected] == [1, 0, 0, 1, 0, 0]
+
+
+def test_frames_gate_re_emits_predictions_of_last_inferred_frame_of_source() -> None:
+    # given
+    gate = FramesGate(
+        config=FramesGatingConfig(
+            reused_predictions_adapter=lambda p, f: {**p, "frame_id": f.frame_id}
+        )
+    )
+    first_batch = [
+        assembly_video_frame(assembly_scene(), frame_id=1, source_id=0),
+        assembly_video_frame(assembly_scene(), frame_id=1, source_id=1),
+    ]
+    second_batch = [
+        assembly_video_frame(assembly_scene(), frame_id=2, source_id=0),
+        assembly_video_frame(assembly_scene(with_object=True), frame_id=2, source_id=1),
+    ]
+
+    # when
+    first_inferred = gate.select_frames_for_inference(video_frames=first_batch)
+    second_inferred = gate.select_frames_for_inference(video_frames=second_batch)
+    first_predictions = gate.complete_predictions(
+        predictions=[{"source": 0}, {"source": 1}],
+        inferred_frames=first_inferred,
+        video_frames=first_batch,
+    )
+    second_predictions = gate.complete_predictions(
+        predictions=[{"source": 1, "object": True}],
+        inferred_frames=second_inferred,
+        video_frames=second_batch,
+    )
+
+    # then
+    assert first_predictions == [{"source": 0}, {"source": 1}]
+    assert second_inferred == [second_batch[1]]
+    assert second_predictions == [
+        {"source": 0, "frame_id": 2},
+        {"source": 1, "object": True},
+    ], "Expected predictions of skipped frame to be re-emitted through adapter"
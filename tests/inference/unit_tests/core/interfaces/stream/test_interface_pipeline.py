@@ -1,9 +1,11 @@
+import time
 from collections import defaultdict
 from datetime import datetime
 from functools import partial
 from queue import Queue
 from threading import Lock
 from typing import Any, List, Optional, Tuple, Union
+from unittest import mock
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -16,7 +18,7 @@ from inference.core.entities.responses.inference import (
     ObjectDetectionInferenceResponse,
     ObjectDetectionPrediction,
 )
-from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.camera.entities import AdaptiveBatchingConfig, VideoFrame
 from inference.core.interfaces.camera.exceptions import (
     EndOfStreamError,
     SourceConnectionError,
@@ -28,13 +30,24 @@ from inference.core.interfaces.camera.video_source import (
     VideoSource,
     lock_state_transition,
 )
-from inference.core.interfaces.stream.entities import ModelConfig
-from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
+from inference.core.interfaces.stream.entities import (
+    FramesGatingConfig,
+    InferenceStage,
+    ModelConfig,
+    StagedInferenceHandler,
+)
+from inference.core.interfaces.stream.inference_pipeline import (
+    InferencePipeline,
+    SinkMode,
+)
+from inference.core.interfaces.stream.model_handlers import roboflow_models
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
+    build_staged_roboflow_model_handler,
     default_process_frame,
 )
 from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
 from inference.core.interfaces.stream.watchdog import BasePipelineWatchDog
+from inference.core.models.utils.batching import create_batches
 
 
 class VideoSourceStub:
@@ -658,3 +671,350 @@ def test_inference_pipeline_works_correctly_against_multiple_video_files_with_ac
     assert frames_by_sources[1] == list(
         range(1, 431 * 2 + 1)
     ), "Order of prediction frames violated for source 1"
+
+
+def build_staged_handler_stub(
+    failing_stage: Optional[InferenceStage] = None,
+) -> StagedInferenceHandler:
+    def preprocess(video_frames: List[VideoFrame]) -> List[int]:
+        if failing_stage is InferenceStage.PREPROCESSING:
+            raise ValueError()
+        time.sleep(0.001)
+        return [f.frame_id for f in video_frames]
+
+    def infer(frames_ids: List[int]) -> List[int]:
+        if failing_stage is InferenceStage.MODEL_INFERENCE:
+            raise ValueError()
+        time.sleep(0.002)
+        return [frame_id * 2 for frame_id in frames_ids]
+
+    def postprocess(
+        raw_output: List[int], video_frames: List[VideoFrame]
+    ) -> List[dict]:
+        if failing_stage is InferenceStage.POSTPROCESSING:
+            raise ValueError()
+        return [{"value": value} for value in raw_output]
+
+    return StagedInferenceHandler(
+        preprocess=preprocess,
+        infer=infer,
+        postprocess=postprocess,
+    )
+
+
+@pytest.mark.parametrize("max_in_flight_batches", [1, 4])
+def test_inference_pipeline_works_correctly_with_staged_inference_handler(
+    max_in_flight_batches: int,
+) -> None:
+    # given
+    video_source_1 = VideoSourceStub(
+        frames_number=50, is_file=False, rounds=1, source_id=0
+    )
+    video_source_2 = VideoSourceStub(
+        frames_number=50, is_file=False, rounds=1, source_id=1
+    )
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source_1, video_source_2])
+    predictions = []
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=build_staged_handler_stub(),
+        video_sources=[video_source_1, video_source_2],
+        on_prediction=on_prediction,
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+        sink_mode=SinkMode.SEQUENTIAL,
+        max_in_flight_batches=max_in_flight_batches,
+    )
+
+    def stop() -> None:
+        inference_pipeline._stop = True
+
+    video_source_1.on_end = stop
+    video_source_2.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=True)
+    inference_pipeline.join()
+    report = watchdog.get_report()
+
+    # then
+    assert len(predictions) > 0, "Expected to process some frames"
+    for video_frame, prediction in predictions:
+        assert prediction == {
+            "value": video_frame.frame_id * 2
+        }, "Expected prediction to be matched with its frame"
+    for source_id in [0, 1]:
+        frames_ids = [p[0].frame_id for p in predictions if p[0].source_id == source_id]
+        assert frames_ids == sorted(
+            frames_ids
+        ), f"Order of prediction frames violated for source {source_id}"
+    for latency_report in report.latency_reports:
+        assert latency_report.preprocessing_latency > 0
+        assert latency_report.model_inference_latency > 0
+        assert latency_report.postprocessing_latency is not None
+        assert (
+            latency_report.inference_latency is not None
+        ), "Expected inference latency to be reported when batches overlap"
+
+
+@pytest.mark.parametrize("max_in_flight_batches", [1, 4])
+def test_inference_pipeline_with_frames_gating_re_emits_predictions_for_static_frames(
+    max_in_flight_batches: int,
+) -> None:
+    # given
+    video_source_1 = VideoSourceStub(
+        frames_number=50, is_file=False, rounds=1, source_id=0
+    )
+    video_source_2 = VideoSourceStub(
+        frames_number=50, is_file=False, rounds=1, source_id=1
+    )
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source_1, video_source_2])
+    inferred_frames = []
+    predictions = []
+    staged_handler = build_staged_handler_stub()
+
+    def preprocess(video_frames: List[VideoFrame]) -> List[int]:
+        inferred_frames.extend(video_frames)
+        return staged_handler.preprocess(video_frames)
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=StagedInferenceHandler(
+            preprocess=preprocess,
+            infer=staged_handler.infer,
+            postprocess=staged_handler.postprocess,
+        ),
+        video_sources=[video_source_1, video_source_2],
+        on_prediction=on_prediction,
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+        sink_mode=SinkMode.SEQUENTIAL,
+        max_in_flight_batches=max_in_flight_batches,
+        frames_gating=FramesGatingConfig(refresh_interval=60.0),
+    )
+
+    def stop() -> None:
+        inference_pipeline._stop = True
+
+    video_source_1.on_end = stop
+    video_source_2.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=True)
+    inference_pipeline.join()
+
+    # then
+    assert (
+        len(inferred_frames) == 2
+    ), "Expected only first frame of each static source to be inferred"
+    assert len(predictions) > 2, "Expected predictions to be emitted for all frames"
+    first_frames_ids = {f.source_id: f.frame_id for f in inferred_frames}
+    for video_frame, prediction in predictions:
+        assert prediction == {
+            "value": first_frames_ids[video_frame.source_id] * 2
+        }, "Expected predictions of first frame of source to be re-emitted"
+
+
+def test_inference_pipeline_with_adaptive_batching_reports_batching_statistics() -> (
+    None
+):
+    # given
+    video_source_1 = VideoSourceStub(
+        frames_number=50, is_file=False, rounds=1, source_id=0
+    )
+    video_source_2 = VideoSourceStub(
+        frames_number=50, is_file=False, rounds=1, source_id=1
+    )
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source_1, video_source_2])
+    predictions = []
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=build_staged_handler_stub(),
+        video_sources=[video_source_1, video_source_2],
+        on_prediction=on_prediction,
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+        sink_mode=SinkMode.SEQUENTIAL,
+        adaptive_batching=AdaptiveBatchingConfig(latency_target=0.5),
+    )
+
+    def stop() -> None:
+        inference_pipeline._stop = True
+
+    video_source_1.on_end = stop
+    video_source_2.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=True)
+    inference_pipeline.join()
+    statistics = inference_pipeline.get_batching_statistics()
+
+    # then
+    assert len(predictions) == 100, "Expected all frames to be processed"
+    assert statistics.batches_collected == 50
+    assert statistics.average_batch_size == 2.0
+    assert {s.source_id for s in statistics.sources.values()} == {0, 1}
+    assert set(statistics.batch_processing_times.keys()) == {
+        2
+    }, "Expected processing time of batches of size 2 to be learned"
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.parametrize(
+    "failing_stage",
+    [
+        InferenceStage.PREPROCESSING,
+        InferenceStage.MODEL_INFERENCE,
+        InferenceStage.POSTPROCESSING,
+    ],
+)
+def test_inference_pipeline_with_staged_inference_handler_when_stage_fails(
+    failing_stage: InferenceStage,
+) -> None:
+    # given
+    video_source = VideoSourceStub(frames_number=100, is_file=False, rounds=1)
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source])
+    status_updates = []
+    predictions = []
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=build_staged_handler_stub(failing_stage=failing_stage),
+        video_sources=[video_source],
+        on_prediction=on_prediction,
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[status_updates.append],
+        max_in_flight_batches=2,
+    )
+
+    def stop() -> None:
+        inference_pipeline._stop = True
+
+    video_source.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=True)
+    inference_pipeline.join()
+
+    # then
+    assert predictions == [], "Expected no predictions to be dispatched"
+    errors = [u for u in status_updates if u.event_type == "INFERENCE_ERROR"]
+    assert len(errors) == 1, "Expected error to be reported once"
+    assert errors[0].payload["error_type"] == "ValueError"
+
+
+class StagedModelStub(ModelStub):
+    def __init__(self, batch_size: int):
+        super().__init__()
+        self.batching_enabled = False
+        self.batch_size = batch_size
+        self.task_type = "object-detection"
+        self.endpoint = "some/1"
+        self.preprocessed_batches_sizes = []
+
+    def infer(self, image: Any, **kwargs) -> List[ObjectDetectionInferenceResponse]:
+        results = []
+        for batch in create_batches(sequence=image, batch_size=self.batch_size):
+            img_in, metadata = self.preprocess(batch, **kwargs)
+            predicted = self.predict(img_in, **kwargs)
+            results.extend(self.postprocess(predicted, metadata, **kwargs))
+        return results
+
+    def preprocess(self, image: List[np.ndarray], **kwargs) -> Tuple[np.ndarray, dict]:
+        self.preprocessed_batches_sizes.append(len(image))
+        return np.stack(image), {"img_dims": [i.shape[:2] for i in image]}
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
+        return (img_in.reshape((img_in.shape[0], -1)).sum(axis=1),)
+
+    def postprocess(
+        self,
+        predictions: Tuple[np.ndarray],
+        metadata: dict,
+        confidence: float,
+        **kwargs,
+    ) -> List[ObjectDetectionInferenceResponse]:
+        return [
+            ObjectDetectionInferenceResponse(
+                predictions=[
+                    ObjectDetectionPrediction(
+                        **{
+                            "x": float(value),
+                            "y": 20,
+                            "width": 30,
+                            "height": 40,
+                            "confidence": confidence,
+                            "class": "car",
+                            "class_id": 3,
+                        }
+                    )
+                ],
+                image=InferenceResponseImage(width=dims[1], height=dims[0]),
+            )
+            for value, dims in zip(predictions[0], metadata["img_dims"])
+        ]
+
+
+@mock.patch.object(roboflow_models, "usage_collector")
+def test_staged_roboflow_model_handler_gives_the_same_results_as_default_one(
+    usage_collector_mock: MagicMock,
+) -> None:
+    # given
+    model = StagedModelStub(batch_size=2)
+    inference_config = ModelConfig.init(confidence=0.7, iou_threshold=0.5)
+    video_frames = [
+        VideoFrame(
+            image=np.ones((32, 48, 3), dtype=np.uint8) * i,
+            frame_id=i,
+            frame_timestamp=datetime.now(),
+            source_id=i,
+        )
+        for i in range(3)
+    ]
+    staged_handler = build_staged_roboflow_model_handler(
+        model=model, inference_config=inference_config
+    )
+
+    # when
+    staged_result = staged_handler.postprocess(
+        staged_handler.infer(staged_handler.preprocess(video_frames)),
+        video_frames,
+    )
+    default_result = default_process_frame(
+        video_frame=video_frames, model=model, inference_config=inference_config
+    )
+
+    # then
+    for result in staged_result + default_result:
+        for prediction in result["predictions"]:
+            del prediction["detection_id"]
+    assert staged_result == default_result
+    assert model.preprocessed_batches_sizes == [
+        2,
+        1,
+        2,
+        1,
+    ], "Expected the same batching as in model.infer(...)"
+    usage_collector_mock.record_usage.assert_called_once()
@@ -0,0 +1,364 @@
+import os.path
+import time
+from typing import List, Optional
+from unittest import mock
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from inference.core.interfaces.stream import parallel_video_processing
+from inference.core.interfaces.stream.parallel_video_processing import (
+    SegmentsResultsMerger,
+    TracksStitcher,
+    VideoSegment,
+    VideoSegmentFrameProducer,
+    get_total_frames,
+    plan_video_segments,
+    process_video_in_parallel,
+    put_segment_result,
+)
+
+
+def assembly_tracked_result(
+    boxes: List[tuple], tracker_ids: List[int], class_name: str = "car"
+) -> dict:
+    return {
+        "count": len(boxes),
+        "predictions": {
+            "image": {"width": 640, "height": 480},
+            "predictions": [
+                {
+                    "x": x,
+                    "y": y,
+                    "width": 20.0,
+                    "height": 20.0,
+                    "class": class_name,
+                    "class_id": 0,
+                    "confidence": 0.9,
+                    "tracker_id": tracker_id,
+                }
+                for (x, y), tracker_id in zip(boxes, tracker_ids)
+            ],
+        },
+    }
+
+
+def get_tracker_ids(result: dict) -> List[Optional[int]]:
+    return [p["tracker_id"] for p in result["predictions"]["predictions"]]
+
+
+def test_plan_video_segments_when_keyframes_not_known() -> None:
+    # when
+    result = plan_video_segments(
+        total_frames=100, keyframes=[], segments_number=3, overlap_frames=10
+    )
+
+    # then
+    assert result == [
+        VideoSegment(segment_id=0, start_frame=0, end_frame=33, processing_start=0),
+        VideoSegment(segment_id=1, start_frame=33, end_frame=67, processing_start=23),
+        VideoSegment(segment_id=2, start_frame=67, end_frame=100, processing_start=57),
+    ]
+
+
+def test_plan_video_segments_snaps_boundaries_to_keyframes() -> None:
+    # when
+    result = plan_video_segments(
+        total_frames=100,
+        keyframes=[0, 30, 60, 90],
+        segments_number=4,
+        overlap_frames=5,
+    )
+
+    # then
+    assert [(s.start_frame, s.end_frame) for s in result] == [
+        (0, 30),
+        (30, 60),
+        (60, 100),
+    ], "Expected boundaries 25 and 50 to snap to keyframes 30 and 60, while 75 collapses with 60"
+    assert [s.processing_start for s in result] == [0, 25, 55]
+
+
+def test_plan_video_segments_when_more_segments_than_frames_requested() -> None:
+    # when
+    result = plan_video_segments(
+        total_frames=2, keyframes=[], segments_number=8, overlap_frames=30
+    )
+
+    # then
+    assert result == [
+        VideoSegment(segment_id=0, start_frame=0, end_frame=1, processing_start=0),
+        VideoSegment(segment_id=1, start_frame=1, end_frame=2, processing_start=0),
+    ]
+
+
+def test_segments_results_merger_emits_results_in_frames_order() -> None:
+    # given
+    segments = plan_video_segments(
+        total_frames=6, keyframes=[], segments_number=2, overlap_frames=1
+    )
+    emitted = []
+    merger = SegmentsResultsMerger(
+        segments=segments,
+        on_prediction=lambda result, frame_index: emitted.append(
+            (frame_index, result["frame"])
+        ),
+    )
+
+    # when
+    for frame_index in range(2, 6):
+        merger.add_result(
+            segment_id=1, frame_index=frame_index, result={"frame": frame_index}
+        )
+    merger.complete_segment(segment_id=1)
+    emitted_before_first_segment = list(emitted)
+    for frame_index in range(3):
+        merger.add_result(
+            segment_id=0, frame_index=frame_index, result={"frame": frame_index}
+        )
+    merger.complete_segment(segment_id=0)
+
+    # then
+    assert emitted_before_first_segment == []
+    assert emitted == [
+        (i, i) for i in range(6)
+    ], "Expected overlap frame 2 of segment 1 not to be emitted twice"
+    assert merger.is_completed() is True
+
+
+def test_segments_results_merger_releases_results_once_they_leave_buffer() -> None:
+    # given
+    segments = plan_video_segments(
+        total_frames=6, keyframes=[], segments_number=2, overlap_frames=1
+    )
+    released = []
+    merger = SegmentsResultsMerger(
+        segments=segments,
+        on_prediction=MagicMock(),
+        on_result_released=released.append,
+    )
+
+    # when
+    for frame_index in range(2, 6):
+        merger.add_result(
+            segment_id=1, frame_index=frame_index, result={"frame": frame_index}
+        )
+    released_before_first_segment = list(released)
+    for frame_index in range(3):
+        merger.add_result(
+            segment_id=0, frame_index=frame_index, result={"frame": frame_index}
+        )
+    merger.complete_segment(segment_id=0)
+
+    # then
+    assert released_before_first_segment == []
+    assert released == [0, 0, 0, 1, 1, 1, 1], "Expected overlap result released too"
+
+
+def test_tracks_stitcher_maps_tracks_of_next_segment_onto_tracks_of_previous_one() -> (
+    None
+):
+    # given
+    stitcher = TracksStitcher(overlap_frames=2)
+    stitcher.start_segment(overlap_results=[], continues_previous=False)
+    for frame_index in range(3):
+        stitcher.remap_tracks(
+            frame_index=frame_index,
+            result=assembly_tracked_result(
+                boxes=[(100 + frame_index, 100), (300, 200)], tracker_ids=[7, 9]
+            ),
+        )
+
+    # when
+    stitcher.start_segment(
+        overlap_results=[
+            (
+                frame_index,
+                assembly_tracked_result(
+                    boxes=[(300, 200), (100 + frame_index, 100)], tracker_ids=[1, 2]
+                ),
+            )
+            for frame_index in (1, 2)
+        ],
+        continues_previous=True,
+    )
+    next_frame_result = stitcher.remap_tracks(
+        frame_index=3,
+        result=assembly_tracked_result(
+            boxes=[(103, 100), (300, 200), (500, 400)], tracker_ids=[2, 1, 3]
+        ),
+    )
+
+    # then
+    assert get_tracker_ids(next_frame_result) == [
+        7,
+        9,
+        10,
+    ], "Expected matched tracks to keep ids and new track to get id not used before"
+
+
+def test_tracks_stitcher_does_not_match_tracks_of_different_classes() -> None:
+    # given
+    stitcher = TracksStitcher(overlap_frames=1)
+    stitcher.start_segment(overlap_results=[], continues_previous=False)
+    stitcher.remap_tracks(
+        frame_index=0,
+        result=assembly_tracked_result(boxes=[(100, 100)], tracker_ids=[4]),
+    )
+
+    # when
+    stitcher.start_segment(
+        overlap_results=[
+            (
+                0,
+                assembly_tracked_result(
+                    boxes=[(100, 100)], tracker_ids=[1], class_name="person"
+                ),
+            )
+        ],
+        continues_previous=True,
+    )
+    result = stitcher.remap_tracks(
+        frame_index=1,
+        result=assembly_tracked_result(
+            boxes=[(100, 100)], tracker_ids=[1], class_name="person"
+        ),
+    )
+
+    # then
+    assert get_tracker_ids(result) == [5]
+
+
+def test_video_segment_frame_producer_reads_only_frames_of_segment(
+    empty_local_dir: str,
+) -> None:
+    # given
+    video_path = os.path.join(empty_local_dir, "video.avi")
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for frame_index in range(20):
+        writer.write(np.full((48, 64, 3), frame_index * 10, dtype=np.uint8))
+    writer.release()
+    producer = VideoSegmentFrameProducer(video=video_path, start_frame=5, end_frame=8)
+
+    # when
+    properties = producer.discover_source_properties()
+    frames_values = []
+    while producer.grab():
+        _, frame = producer.retrieve()
+        frames_values.append(round(float(frame.mean())))
+    producer.release()
+
+    # then
+    assert properties.total_frames == 3
+    assert properties.is_file is True
+    assert frames_values == [50, 60, 70]
+
+
+def test_video_segment_frame_producer_reads_till_end_of_file_when_end_not_given(
+    empty_local_dir: str,
+) -> None:
+    # given
+    video_path = os.path.join(empty_local_dir, "video.avi")
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for frame_index in range(20):
+        writer.write(np.full((48, 64, 3), frame_index * 10, dtype=np.uint8))
+    writer.release()
+    producer = VideoSegmentFrameProducer(
+        video=video_path, start_frame=16, end_frame=None
+    )
+
+    # when
+    properties = producer.discover_source_properties()
+    frames_values = []
+    while producer.grab():
+        _, frame = producer.retrieve()
+        frames_values.append(round(float(frame.mean())))
+    producer.release()
+
+    # then
+    assert properties.total_frames == 4
+    assert frames_values == [160, 170, 180, 190]
+
+
+def test_get_total_frames_when_frames_count_not_reported() -> None:
+    # given
+    video = MagicMock()
+    video.isOpened.return_value = True
+    video.get.return_value = 0.0
+
+    # when
+    with mock.patch.object(
+        parallel_video_processing.cv2, "VideoCapture", return_value=video
+    ):
+        with pytest.raises(ValueError):
+            _ = get_total_frames(video_path="video.mp4")
+
+    # then
+    video.release.assert_called_once()
+
+
+def kill_worker(**kwargs) -> None:
+    os._exit(3)
+
+
+@pytest.mark.timeout(60)
+@mock.patch.object(parallel_video_processing, "RESULTS_POLL_TIMEOUT", 0.05)
+@mock.patch.object(parallel_video_processing, "process_video_segment", kill_worker)
+@mock.patch.object(parallel_video_processing, "find_keyframes", return_value=[])
+@mock.patch.object(parallel_video_processing, "get_total_frames", return_value=10)
+def test_process_video_in_parallel_when_worker_dies_without_reporting_failure(
+    get_total_frames_mock: MagicMock,
+    find_keyframes_mock: MagicMock,
+) -> None:
+    # when
+    with pytest.raises(RuntimeError, match="exit code: 3"):
+        _ = process_video_in_parallel(
+            video_path="video.mp4",
+            on_prediction=MagicMock(),
+            workflow_specification={},
+            max_workers=2,
+        )
+
+
+def produce_segment_results(segment, results_queue, results_credits, **kwargs) -> None:
+    if segment.segment_id == 0:
+        # the first segment is slow - results of the next one must wait for it
+        time.sleep(0.5)
+    for frame_index in range(segment.processing_start, segment.end_frame):
+        put_segment_result(
+            results_queue=results_queue,
+            results_credits=results_credits,
+            segment_id=segment.segment_id,
+            frame_index=frame_index,
+            result={"frame": frame_index},
+        )
+    results_queue.put((segment.segment_id, "completed", None))
+
+
+@pytest.mark.timeout(60)
+@mock.patch.object(
+    parallel_video_processing, "process_video_segment", produce_segment_results
+)
+@mock.patch.object(parallel_video_processing, "find_keyframes", return_value=[])
+@mock.patch.object(parallel_video_processing, "get_total_frames", return_value=400)
+def test_process_video_in_parallel_when_results_buffer_is_smaller_than_segments(
+    get_total_frames_mock: MagicMock,
+    find_keyframes_mock: MagicMock,
+) -> None:
+    # given
+    emitted = []
+
+    # when
+    _ = process_video_in_parallel(
+        video_path="video.mp4",
+        on_prediction=lambda result, frame_index: emitted.append(frame_index),
+        workflow_specification={},
+        max_workers=2,
+        overlap_frames=2,
+        max_buffered_results=8,
+    )
+
+    # then
+    assert emitted == list(range(400))
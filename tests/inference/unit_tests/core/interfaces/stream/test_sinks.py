@@ -1,7 +1,10 @@
 import json
+import threading
+import time
 from datetime import datetime
 from functools import partial
 from typing import List, Union
+from unittest import mock
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -12,14 +15,21 @@ from inference.core.entities.responses.inference import (
     ObjectDetectionPrediction,
 )
 from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream import sinks
+from inference.core.interfaces.stream.entities import SinkOverflowPolicy
 from inference.core.interfaces.stream.sinks import (
+    BinaryUDPSink,
     ImageWithSourceID,
     InMemoryBufferSink,
     UDPSink,
+    VideoFileSink,
     active_learning_sink,
     multi_sink,
     render_boxes,
 )
+from inference.core.interfaces.stream.udp_binary_protocol import (
+    BinaryPredictionsDecoder,
+)
 
 
 def test_render_boxes_completes_successfully() -> None:
@@ -229,6 +239,103 @@ def test_udp_sends_data_through_socket() -> None:
     assert "emission_time" in decoded_message["inference_metadata"]
 
 
+def test_binary_udp_sink_sends_predictions_decodable_by_decoder() -> None:
+    # given
+    socket = MagicMock()
+    frame_timestamp = datetime.now()
+    video_frame = VideoFrame(
+        image=np.ones((128, 128, 3), dtype=np.uint8) * 255,
+        frame_id=1,
+        frame_timestamp=frame_timestamp,
+        source_id=2,
+    )
+    predictions = {
+        "predictions": [
+            {
+                "x": 10.5,
+                "y": 20.5,
+                "width": 30.0,
+                "height": 40.0,
+                "confidence": 0.5,
+                "class": "car",
+                "class_id": 3,
+                "points": [{"x": float(i), "y": float(i)} for i in range(1000)],
+            }
+        ]
+    }
+    udp_sink = BinaryUDPSink(
+        ip_address="127.0.0.1",
+        port=9090,
+        udp_socket=socket,
+    )
+    decoder = BinaryPredictionsDecoder()
+
+    # when
+    udp_sink.send_predictions(video_frame=video_frame, predictions=predictions)
+
+    # then
+    assert socket.sendto.call_count > 1, "Expected large payload to be fragmented"
+    assert all(
+        c[0][1] == ("127.0.0.1", 9090) for c in socket.sendto.call_args_list
+    ), "Data must be sent to 127.0.0.1:9090"
+    decoded = []
+    for c in socket.sendto.call_args_list:
+        decoded.extend(decoder.decode_datagram(datagram=c[0][0]))
+    assert len(decoded) == 1
+    metadata = decoded[0].pop("inference_metadata")
+    assert decoded[0] == predictions
+    assert (
+        "inference_metadata" not in predictions
+    ), "Expected predictions not to be mutated"
+    assert metadata["source_id"] == 2
+    assert metadata["frame_id"] == 1
+    assert metadata["frame_decoding_time"] == frame_timestamp.isoformat()
+
+
+def test_binary_udp_sink_coalesces_frames_predictions() -> None:
+    # given
+    socket = MagicMock()
+    video_frames = [
+        VideoFrame(
+            image=np.ones((128, 128, 3), dtype=np.uint8) * 255,
+            frame_id=frame_id,
+            frame_timestamp=datetime.now(),
+            source_id=0,
+        )
+        for frame_id in range(1, 6)
+    ]
+    udp_sink = BinaryUDPSink(
+        ip_address="127.0.0.1",
+        port=9090,
+        udp_socket=socket,
+        max_coalesced_frames=3,
+        max_coalescing_delay=60.0,
+    )
+    decoder = BinaryPredictionsDecoder()
+
+    # when
+    for video_frame in video_frames[:2]:
+        udp_sink.send_predictions(
+            video_frame=video_frame, predictions={"some": "value"}
+        )
+    sent_before_limit_reached = socket.sendto.call_count
+    for video_frame in video_frames[2:]:
+        udp_sink.send_predictions(
+            video_frame=video_frame, predictions={"some": "value"}
+        )
+    sent_before_flush = socket.sendto.call_count
+    udp_sink.flush()
+
+    # then
+    assert sent_before_limit_reached == 0
+    assert sent_before_flush == 1
+    decoded = [
+        [p["inference_metadata"]["frame_id"] for p in decoder.decode_datagram(c[0][0])]
+        for c in socket.sendto.call_args_list
+    ]
+    assert decoded == [[1, 2, 3], [4, 5]]
+
+
 def test_multi_sink_when_error_occurs() -> None:
     # given
     video_frame = VideoFrame(
@@ -397,6 +504,89 @@ def test_active_learning_sink_with_batch_input() -> None:
     )
 
 
+def assembly_frames_for_video_file_sink(frames_number: int) -> list:
+    predictions = ObjectDetectionInferenceResponse(
+        predictions=[],
+        image=InferenceResponseImage(width=64, height=64),
+    ).model_dump(by_alias=True, exclude_none=True)
+    return [
+        (
+            predictions,
+            VideoFrame(
+                image=np.zeros((64, 64, 3), dtype=np.uint8),
+                frame_id=i,
+                frame_timestamp=datetime.now(),
+            ),
+        )
+        for i in range(frames_number)
+    ]
+
+
+@mock.patch.object(sinks.cv2, "VideoWriter")
+def test_video_file_sink_encoding_in_background_with_block_policy(
+    video_writer_mock: MagicMock,
+) -> None:
+    # given
+    status_updates = []
+    video_writer_mock.return_value.write.side_effect = lambda _: time.sleep(0.01)
+    sink = VideoFileSink.init(
+        video_file_name="output.avi",
+        display_size=(64, 64),
+        fps_monitor=None,
+        quiet=True,
+        video_frame_size=(64, 64),
+        background_encoding=True,
+        encoding_queue_size=2,
+        overflow_policy=SinkOverflowPolicy.BLOCK,
+        status_update_handlers=[status_updates.append],
+    )
+
+    # when
+    for predictions, video_frame in assembly_frames_for_video_file_sink(10):
+        sink.on_prediction(predictions, video_frame)
+    sink.release()
+
+    # then
+    assert video_writer_mock.return_value.write.call_count == 10
+    assert len(status_updates) == 1, "Expected statistics to be reported on release"
+    assert status_updates[0].event_type == "VIDEO_FILE_SINK_STATISTICS"
+    assert status_updates[0].payload["encoded_frames"] == 10
+    assert status_updates[0].payload["dropped_frames"] == 0
+    assert status_updates[0].payload["encoding_latency"]["max"] > 0
+
+
+@mock.patch.object(sinks.cv2, "VideoWriter")
+def test_video_file_sink_encoding_in_background_with_drop_policy(
+    video_writer_mock: MagicMock,
+) -> None:
+    # given
+    encoding_allowed = threading.Event()
+    video_writer_mock.return_value.write.side_effect = lambda _: encoding_allowed.wait()
+    sink = VideoFileSink.init(
+        video_file_name="output.avi",
+        display_size=(64, 64),
+        fps_monitor=None,
+        quiet=True,
+        video_frame_size=(64, 64),
+        background_encoding=True,
+        encoding_queue_size=2,
+        overflow_policy=SinkOverflowPolicy.DROP,
+    )
+
+    # when
+    for predictions, video_frame in assembly_frames_for_video_file_sink(10):
+        sink.on_prediction(predictions, video_frame)
+    encoding_allowed.set()
+    sink.release()
+    statistics = sink.get_statistics()
+
+    # then
+    assert (
+        statistics["dropped_frames"] >= 7
+    ), "Expected frames over queue size (and the one being encoded) to be dropped"
+    assert statistics["encoded_frames"] + statistics["dropped_frames"] == 10
+
+
 def test_in_memory_buffer_sink_for_singular_input() -> None:
     # given
     sink = InMemoryBufferSink.init(queue_size=2)
@@ -428,6 +618,32 @@ def test_in_memory_buffer_sink_for_singular_input() -> None:
     assert empty_status is True, "Expected buffer to be purged during test"
 
 
+def test_in_memory_buffer_sink_wait_for_prediction() -> None:
+    # given
+    sink = InMemoryBufferSink.init(queue_size=2)
+    video_frame = VideoFrame(
+        image=np.ones((128, 128, 3), dtype=np.uint8) * 255,
+        frame_id=1,
+        frame_timestamp=datetime.now(),
+    )
+    timer = threading.Timer(
+        0.05,
+        sink.on_prediction,
+        kwargs={"predictions": {"some": 1}, "video_frame": video_frame},
+    )
+
+    # when
+    status_before_prediction = sink.wait_for_prediction(timeout=0.01)
+    timer.start()
+    status_after_prediction = sink.wait_for_prediction(timeout=5.0)
+    timer.join()
+
+    # then
+    assert status_before_prediction is False, "Expected wait to time out"
+    assert status_after_prediction is True, "Expected wait to end on prediction"
+    assert sink.consume_prediction()[0] == [{"some": 1}]
+
+
 def test_in_memory_buffer_sink_for_batch_input() -> None:
     # given
     sink = InMemoryBufferSink.init(queue_size=2)
@@ -0,0 +1,187 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from inference.core.interfaces.stream.udp_binary_protocol import (
+    BinaryPredictionsDecoder,
+    FrameMetadata,
+    MalformedDatagramError,
+    build_datagrams,
+    encode_frame,
+)
+
+FRAME_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def assembly_frame(frame_id: int, predictions: dict, source_id: int = 3) -> bytes:
+    return encode_frame(
+        metadata=FrameMetadata(
+            source_id=source_id,
+            frame_id=frame_id,
+            frame_decoding_time=FRAME_TIMESTAMP,
+            emission_time=FRAME_TIMESTAMP,
+        ),
+        predictions=predictions,
+    )
+
+
+def assembly_segmentation_predictions(detections: int, points: int) -> dict:
+    return {
+        "image": {"width": 1920, "height": 1080},
+        "time": 0.025,
+        "predictions": [
+            {
+                "x": 100.5 + i,
+                "y": 200.25,
+                "width": 30.0,
+                "height": 40.0,
+                "confidence": 0.5,
+                "class": "car" if i % 2 else "truck",
+                "class_id": i % 2,
+                "detection_id": str(uuid.uuid4()),
+                "points": [{"x": float(j), "y": float(j) + 0.5} for j in range(points)],
+            }
+            for i in range(detections)
+        ],
+    }
+
+
+def test_decoder_restores_predictions_of_different_structures() -> None:
+    # given
+    predictions = [
+        assembly_segmentation_predictions(detections=3, points=4),
+        {
+            "predictions": [
+                {
+                    "x": 10.0,
+                    "y": 20.0,
+                    "width": 4.0,
+                    "height": 8.0,
+                    "confidence": 0.75,
+                    "class": "person",
+                    "class_id": 0,
+                    "tracker_id": 7,
+                    "keypoints": [
+                        {
+                            "x": 1.0,
+                            "y": 2.0,
+                            "confidence": 0.25,
+                            "class_id": 0,
+                            "class_name": "nose",
+                        }
+                    ],
+                },
+                {
+                    "x": 11.0,
+                    "y": 21.0,
+                    "width": 4.0,
+                    "height": 8.0,
+                    "confidence": 0.5,
+                    "class": "person",
+                    "class_id": 0,
+                    "keypoints": [],
+                    "parent_id": None,
+                },
+            ]
+        },
+        {
+            "top": "cat",
+            "confidence": 0.875,
+            "predictions": [],
+            "is_cat": True,
+            "visualization": None,
+            "big_number": 2**40,
+            "ids": [1, "a", [2.5]],
+        },
+    ]
+    encoded_frames = [
+        assembly_frame(frame_id=i, predictions=p) for i, p in enumerate(predictions)
+    ]
+    datagrams = build_datagrams(
+        sequence_number=0, encoded_frames=encoded_frames, max_datagram_size=65000
+    )
+    decoder = BinaryPredictionsDecoder()
+
+    # when
+    result = decoder.decode_datagram(datagram=datagrams[0])
+
+    # then
+    assert len(datagrams) == 1
+    for frame_id, (decoded, original) in enumerate(zip(result, predictions)):
+        metadata = decoded.pop("inference_metadata")
+        assert (
+            decoded == original
+        ), "Expected values representable as float32 to be restored exactly"
+        assert metadata == {
+            "source_id": 3,
+            "frame_id": frame_id,
+            "frame_decoding_time": FRAME_TIMESTAMP.isoformat(),
+            "emission_time": FRAME_TIMESTAMP.isoformat(),
+        }
+
+
+def test_decoder_reassembles_fragments_received_in_any_order() -> None:
+    # given
+    predictions = assembly_segmentation_predictions(detections=20, points=100)
+    datagrams = build_datagrams(
+        sequence_number=41,
+        encoded_frames=[assembly_frame(frame_id=1, predictions=predictions)],
+        max_datagram_size=1472,
+    )
+    decoder = BinaryPredictionsDecoder()
+
+    # when
+    results = [decoder.decode_datagram(datagram=d) for d in reversed(datagrams)]
+
+    # then
+    assert len(datagrams) > 1
+    assert all(len(d) <= 1472 for d in datagrams)
+    assert results[:-1] == [[]] * (len(datagrams) - 1)
+    assert len(results[-1]) == 1
+    results[-1][0].pop("inference_metadata")
+    assert results[-1][0] == predictions
+
+
+def test_decoder_drops_messages_with_missing_fragments_and_counts_lost_ones() -> None:
+    # given
+    predictions = assembly_segmentation_predictions(detections=5, points=50)
+    decoder = BinaryPredictionsDecoder(max_pending_messages=1)
+    incomplete_message = build_datagrams(
+        sequence_number=0,
+        encoded_frames=[assembly_frame(frame_id=1, predictions=predictions)],
+        max_datagram_size=500,
+    )
+    messages = [
+        build_datagrams(
+            sequence_number=sequence_number,
+            encoded_frames=[assembly_frame(frame_id=1, predictions=predictions)],
+            max_datagram_size=500,
+        )
+        for sequence_number in (1, 4)
+    ]
+
+    # when
+    decoder.decode_datagram(datagram=incomplete_message[0])
+    decoded = []
+    for message in messages:
+        for datagram in message:
+            decoded.extend(decoder.decode_datagram(datagram=datagram))
+
+    # then
+    assert len(decoded) == 2
+    assert decoder.dropped_messages == 1
+    assert decoder.lost_messages == 2, "Expected messages 2 and 3 to be reported lost"
+
+
+@pytest.mark.parametrize(
+    "datagram",
+    [b"RFPB", b'{"some": "json"}', b"XXXX\x01\x00\x00\x00\x00\x00\x00\x01\x00"],
+)
+def test_decoder_when_malformed_datagram_given(datagram: bytes) -> None:
+    # given
+    decoder = BinaryPredictionsDecoder()
+
+    # when
+    with pytest.raises(MalformedDatagramError):
+        _ = decoder.decode_datagram(datagram=datagram)
@@ -6,6 +6,7 @@ import numpy as np
 
 from inference.core.interfaces.camera.entities import VideoFrame
 from inference.core.interfaces.stream.entities import (
+    InferenceStage,
     LatencyMonitorReport,
     ModelActivityEvent,
 )
@@ -15,6 +16,9 @@ from inference.core.interfaces.stream.watchdog import (
     average_property_values,
     compute_events_latency,
 )
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WorkflowsMetricsCollector,
+)
 
 
 def assembly_latency_monitor_report(
@@ -293,3 +297,76 @@ def test_base_watchdog_gives_correct_report_when_all_events_are_in_series_relate
     assert (
         result.sources_metadata[0] == "METADATA"
     ), "Metadata must match mocked video source response"
+
+
+def test_base_watchdog_report_when_workflows_metrics_collector_registered() -> None:
+    # given
+    watchdog = BasePipelineWatchDog()
+    collector = WorkflowsMetricsCollector()
+    collector.record_step_execution(
+        workflow_id="my_workflow",
+        step_name="model",
+        block_type="ObjectDetectionModel",
+        duration=0.02,
+        batch_size=1,
+    )
+
+    # when
+    watchdog.register_workflows_metrics_collector(collector=collector)
+    result = watchdog.get_report()
+
+    # then
+    assert len(result.workflows_steps_metrics) == 1
+    assert result.workflows_steps_metrics[0].step_name == "model"
+    assert len(result.workflows_blocks_metrics) == 1
+    assert result.workflows_blocks_metrics[0].block_type == "ObjectDetectionModel"
+
+
+def test_base_watchdog_report_when_workflows_metrics_collector_not_registered() -> None:
+    # given
+    watchdog = BasePipelineWatchDog()
+
+    # when
+    result = watchdog.get_report()
+
+    # then
+    assert result.workflows_steps_metrics == []
+    assert result.workflows_blocks_metrics == []
+
+
+def test_base_watchdog_report_when_inference_of_frames_overlaps() -> None:
+    # given
+    watchdog = BasePipelineWatchDog()
+    video_source = MagicMock()
+    video_source.source_id = 0
+    watchdog.register_video_sources(video_sources=[video_source])
+    frames = [
+        VideoFrame(
+            image=np.zeros((128, 128, 3), dtype=np.uint8),
+            source_id=0,
+            frame_id=frame_id,
+            frame_timestamp=datetime.now(),
+        )
+        for frame_id in [1, 2]
+    ]
+
+    # when
+    watchdog.on_model_inference_started(frames=[frames[0]])
+    watchdog.on_model_inference_started(frames=[frames[1]])
+    watchdog.on_inference_stage_finished(
+        stage=InferenceStage.MODEL_INFERENCE, frames=[frames[0]], duration=0.2
+    )
+    watchdog.on_model_prediction_ready(frames=[frames[0]])
+    watchdog.on_inference_stage_finished(
+        stage=InferenceStage.MODEL_INFERENCE, frames=[frames[1]], duration=0.4
+    )
+    watchdog.on_model_prediction_ready(frames=[frames[1]])
+    result = watchdog.get_report()
+
+    # then
+    assert (
+        result.latency_reports[0].inference_latency is not None
+    ), "Expected events to be matched by frame id"
+    assert abs(result.latency_reports[0].model_inference_latency - 0.3) < 1e-6
+    assert result.latency_reports[0].preprocessing_latency is None
+    assert result.latency_reports[0].postprocessing_latency is None
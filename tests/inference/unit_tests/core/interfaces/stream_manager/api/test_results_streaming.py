@@ -0,0 +1,131 @@
+import asyncio
+import json
+from typing import AsyncIterator, List
+
+import pytest
+
+from inference.core.interfaces.stream_manager.api.entities import ResultsDropPolicy
+from inference.core.interfaces.stream_manager.api.results_streaming import (
+    buffer_results,
+    serialise_server_sent_event,
+)
+
+
+async def produce_results(
+    results: List[int], produced: List[int], error: bool = False
+) -> AsyncIterator[int]:
+    for result in results:
+        produced.append(result)
+        yield result
+    if error:
+        raise RuntimeError("producer failed")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "drop_policy, expected_results",
+    [
+        (ResultsDropPolicy.DROP_OLDEST, [(4, 4), (5, 4)]),
+        (ResultsDropPolicy.DROP_NEWEST, [(0, 4), (1, 4)]),
+    ],
+)
+async def test_buffer_results_when_consumer_does_not_keep_up(
+    drop_policy: ResultsDropPolicy, expected_results: list
+) -> None:
+    # given
+    produced = []
+    results = buffer_results(
+        results=produce_results(results=list(range(6)), produced=produced),
+        buffer_size=2,
+        drop_policy=drop_policy,
+    )
+
+    # when
+    # producer never awaits - so it overflows the buffer before first result is taken
+    consumed = [result async for result in results]
+
+    # then
+    assert produced == list(range(6)), "All results are expected to be read"
+    assert consumed == expected_results
+
+
+@pytest.mark.asyncio
+async def test_buffer_results_when_block_policy_used() -> None:
+    # given
+    produced = []
+    results = buffer_results(
+        results=produce_results(results=list(range(6)), produced=produced),
+        buffer_size=2,
+        drop_policy=ResultsDropPolicy.BLOCK,
+    )
+
+    # when
+    first_result = await results.__anext__()
+    await asyncio.sleep(0.05)
+    produced_while_consumer_waits = list(produced)
+    remaining_results = [result async for result in results]
+
+    # then
+    assert first_result == (0, 0)
+    assert produced_while_consumer_waits == [
+        0,
+        1,
+        2,
+        3,
+    ], "Expected producer to be stopped once buffer is full"
+    assert remaining_results == [(i, 0) for i in range(1, 6)]
+
+
+@pytest.mark.asyncio
+async def test_buffer_results_when_producer_fails() -> None:
+    # given
+    results = buffer_results(
+        results=produce_results(results=[1], produced=[], error=True),
+        buffer_size=2,
+    )
+
+    # when
+    first_result = await results.__anext__()
+    with pytest.raises(RuntimeError):
+        _ = await results.__anext__()
+
+    # then
+    assert first_result == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_buffer_results_when_consumer_closes_buffer_while_producer_blocked() -> (
+    None
+):
+    # given
+    closed = []
+
+    async def produce_endless_results() -> AsyncIterator[int]:
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.append(True)
+
+    results = buffer_results(
+        results=produce_endless_results(),
+        buffer_size=2,
+        drop_policy=ResultsDropPolicy.BLOCK,
+    )
+
+    # when
+    _ = await results.__anext__()
+    await asyncio.sleep(0.05)
+    await results.aclose()
+
+    # then
+    assert closed == [True], "Expected producer to be closed with the buffer"
+
+
+def test_serialise_server_sent_event() -> None:
+    # when
+    result = serialise_server_sent_event(data={"some": "data"}, event="result")
+
+    # then
+    assert result == b'event: result\ndata: {"some": "data"}\n\n'
+    assert json.loads(result.decode("utf-8").split("data: ")[1]) == {"some": "data"}
@@ -1,4 +1,5 @@
 import asyncio
+import base64
 import json
 from typing import Type
 from unittest import mock
@@ -44,6 +45,9 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
     MessageToBigError,
     TransmissionChannelClosed,
 )
+from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    encode_binary_frame,
+)
 
 
 def test_build_response_when_all_optional_fields_are_filled() -> None:
@@ -435,7 +439,10 @@ async def test_stream_manager_client_can_successfully_list_pipelines(
     )
     writer = DummyStreamWriter()
     establish_socket_connection_mock.return_value = (reader, writer)
-    expected_command = {"type": CommandType.LIST_PIPELINES}
+    expected_command = {
+        "type": CommandType.LIST_PIPELINES,
+        "response_encoding": "binary",
+    }
     client = StreamManagerClient.init(
         host="127.0.0.1",
         port=7070,
@@ -525,7 +532,11 @@ async def test_stream_manager_client_can_successfully_terminate_pipeline(
     )
     writer = DummyStreamWriter()
     establish_socket_connection_mock.return_value = (reader, writer)
-    expected_command = {"type": CommandType.TERMINATE, "pipeline_id": "my_pipeline"}
+    expected_command = {
+        "type": CommandType.TERMINATE,
+        "pipeline_id": "my_pipeline",
+        "response_encoding": "binary",
+    }
     client = StreamManagerClient.init(
         host="127.0.0.1",
         port=7070,
@@ -566,7 +577,11 @@ async def test_stream_manager_client_can_successfully_pause_pipeline(
     )
     writer = DummyStreamWriter()
     establish_socket_connection_mock.return_value = (reader, writer)
-    expected_command = {"type": CommandType.MUTE, "pipeline_id": "my_pipeline"}
+    expected_command = {
+        "type": CommandType.MUTE,
+        "pipeline_id": "my_pipeline",
+        "response_encoding": "binary",
+    }
     client = StreamManagerClient.init(
         host="127.0.0.1",
         port=7070,
@@ -607,7 +622,11 @@ async def test_stream_manager_client_can_successfully_resume_pipeline(
     )
     writer = DummyStreamWriter()
     establish_socket_connection_mock.return_value = (reader, writer)
-    expected_command = {"type": CommandType.RESUME, "pipeline_id": "my_pipeline"}
+    expected_command = {
+        "type": CommandType.RESUME,
+        "pipeline_id": "my_pipeline",
+        "response_encoding": "binary",
+    }
     client = StreamManagerClient.init(
         host="127.0.0.1",
         port=7070,
@@ -648,7 +667,11 @@ async def test_stream_manager_client_can_successfully_get_pipeline_status(
     )
     writer = DummyStreamWriter()
     establish_socket_connection_mock.return_value = (reader, writer)
-    expected_command = {"type": CommandType.STATUS, "pipeline_id": "my_pipeline"}
+    expected_command = {
+        "type": CommandType.STATUS,
+        "pipeline_id": "my_pipeline",
+        "response_encoding": "binary",
+    }
     client = StreamManagerClient.init(
         host="127.0.0.1",
         port=7070,
@@ -690,7 +713,11 @@ async def test_stream_manager_client_can_dispatch_error_response(
     )
     writer = DummyStreamWriter()
     establish_socket_connection_mock.return_value = (reader, writer)
-    expected_command = {"type": CommandType.RESUME, "pipeline_id": "my_pipeline"}
+    expected_command = {
+        "type": CommandType.RESUME,
+        "pipeline_id": "my_pipeline",
+        "response_encoding": "binary",
+    }
     client = StreamManagerClient.init(
         host="127.0.0.1",
         port=7070,
@@ -721,6 +748,120 @@ def assembly_socket_reader(message: dict, header_size: int) -> DummyStreamReader
     return DummyStreamReader(read_buffer_content=response_payload)
 
 
+@pytest.mark.asyncio
+@mock.patch.object(stream_manager_client, "establish_socket_connection")
+async def test_send_command_when_binary_frame_received(
+    establish_socket_connection_mock: AsyncMock,
+) -> None:
+    # given
+    response_message = encode_binary_frame(
+        document={
+            "response": {
+                "status": "success",
+                "image": {"type": "base64", "value": b"\xff\xd8jpeg"},
+            }
+        }
+    )
+    response_payload = (
+        len(response_message).to_bytes(length=4, byteorder="big") + response_message
+    )
+    reader = DummyStreamReader(read_buffer_content=response_payload)
+    establish_socket_connection_mock.return_value = (reader, DummyStreamWriter())
+    command = {"type": CommandType.CONSUME_RESULT, "pipeline_id": "my_pipeline"}
+
+    # when
+    result = await send_command(
+        host="127.0.0.1", port=7070, command=command, header_size=4, buffer_size=8
+    )
+
+    # then
+    assert result == {
+        "response": {
+            "status": "success",
+            "image": {
+                "type": "base64",
+                "value": base64.b64encode(b"\xff\xd8jpeg").decode("ascii"),
+            },
+        }
+    }, "Binary segments must be exposed as base64 strings, as in JSON responses"
+
+
+@pytest.mark.asyncio
+@mock.patch.object(stream_manager_client, "establish_socket_connection")
+async def test_stream_manager_client_can_subscribe_pipeline_results(
+    establish_socket_connection_mock: AsyncMock,
+) -> None:
+    # given
+    messages = [
+        {
+            "request_id": "my_request",
+            "pipeline_id": "my_pipeline",
+            "response": {"status": "success", "outputs": [], "frames_metadata": []},
+        },
+        {
+            "request_id": "my_request",
+            "pipeline_id": "my_pipeline",
+            "response": {
+                "status": "success",
+                "outputs": [{"some": "result"}],
+                "frames_metadata": [
+                    {
+                        "frame_timestamp": "2024-01-01T00:00:00",
+                        "frame_id": 1,
+                        "source_id": 0,
+                    }
+                ],
+            },
+        },
+        {
+            "request_id": "my_request",
+            "pipeline_id": "my_pipeline",
+            "response": {"status": "failure", "error_type": "not_found"},
+        },
+    ]
+    response_payload = b""
+    for message in messages:
+        serialised = json.dumps(message).encode("utf-8")
+        response_payload += len(serialised).to_bytes(length=4, byteorder="big")
+        response_payload += serialised
+    writer = DummyStreamWriter()
+    establish_socket_connection_mock.return_value = (
+        DummyStreamReader(read_buffer_content=response_payload),
+        writer,
+    )
+    client = StreamManagerClient.init(
+        host="127.0.0.1",
+        port=7070,
+        operations_timeout=1.0,
+        header_size=4,
+        buffer_size=16438,
+    )
+    results = []
+
+    # when
+    with pytest.raises(ProcessesManagerNotFoundError):
+        async for result in client.subscribe_pipeline_results(
+            pipeline_id="my_pipeline", excluded_fields=["a"]
+        ):
+            results.append(result)
+
+    # then
+    assert len(results) == 1, "Expected heartbeat message to be skipped"
+    assert results[0].outputs == [{"some": "result"}]
+    assert results[0].frames_metadata[0].frame_id == 1
+    assert_correct_command_sent(
+        writer=writer,
+        command={
+            "type": CommandType.SUBSCRIBE_RESULTS,
+            "pipeline_id": "my_pipeline",
+            "excluded_fields": ["a"],
+            "response_encoding": "binary",
+        },
+        header_size=4,
+        message="Expected subscription command to be sent",
+    )
+
+
 def assert_correct_command_sent(
     writer: DummyStreamWriter, command: dict, header_size: int, message: str
 ) -> None:
@@ -0,0 +1,176 @@
+import json
+from queue import Queue
+from threading import Thread
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.interfaces.stream_manager.manager_app import app
+from inference.core.interfaces.stream_manager.manager_app.app import (
+    PipelineResponses,
+    handle_command,
+    stream_results,
+)
+from inference.core.interfaces.stream_manager.manager_app.entities import (
+    CommandType,
+    ErrorType,
+    OperationStatus,
+)
+from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    describe_error,
+)
+
+
+def decode_sent_messages(connection: MagicMock) -> list:
+    result = []
+    for call in connection.sendall.call_args_list:
+        payload = call[0][0]
+        assert int.from_bytes(payload[:4], byteorder="big") == len(payload) - 4
+        result.append(json.loads(payload[4:]))
+    return result
+
+
+@mock.patch.object(app, "handle_command")
+def test_stream_results_pushes_results_until_error_is_reported(
+    handle_command_mock: MagicMock,
+) -> None:
+    # given
+    handle_command_mock.side_effect = [
+        {"status": OperationStatus.SUCCESS, "outputs": [], "frames_metadata": []},
+        {
+            "status": OperationStatus.SUCCESS,
+            "outputs": [{"some": "result"}],
+            "frames_metadata": [{"frame_id": 1}],
+        },
+        describe_error(error_type=ErrorType.NOT_FOUND),
+    ]
+    connection = MagicMock()
+
+    # when
+    stream_results(
+        connection=connection,
+        processes_table={},
+        request_id="my-request",
+        pipeline_id="my-pipeline",
+        command={
+            "type": CommandType.SUBSCRIBE_RESULTS,
+            "pipeline_id": "my-pipeline",
+            "excluded_fields": ["a"],
+        },
+    )
+
+    # then
+    assert decode_sent_messages(connection=connection) == [
+        {
+            "request_id": "my-request",
+            "response": {
+                "status": "success",
+                "outputs": [{"some": "result"}],
+                "frames_metadata": [{"frame_id": 1}],
+            },
+            "pipeline_id": "my-pipeline",
+        },
+        {
+            "request_id": "my-request",
+            "response": {"status": "failure", "error_type": "not_found"},
+            "pipeline_id": "my-pipeline",
+        },
+    ], "Expected empty result not to be sent before heartbeat interval elapses"
+    consume_command = handle_command_mock.call_args[1]["command"]
+    assert consume_command["type"] is CommandType.CONSUME_RESULT
+    assert consume_command["excluded_fields"] == ["a"]
+    assert consume_command["wait_timeout"] == app.RESULTS_STREAM_POLL_TIMEOUT
+    connection.close.assert_called_once()
+
+
+@mock.patch.object(app, "handle_command")
+def test_stream_results_when_subscriber_disconnects(
+    handle_command_mock: MagicMock,
+) -> None:
+    # given
+    handle_command_mock.return_value = {
+        "status": OperationStatus.SUCCESS,
+        "outputs": [{"some": "result"}],
+        "frames_metadata": [{"frame_id": 1}],
+    }
+    connection = MagicMock()
+    connection.sendall.side_effect = [None, BrokenPipeError()]
+
+    # when
+    stream_results(
+        connection=connection,
+        processes_table={},
+        request_id="my-request",
+        pipeline_id="my-pipeline",
+        command={"type": CommandType.SUBSCRIBE_RESULTS, "pipeline_id": "my-pipeline"},
+    )
+
+    # then
+    assert handle_command_mock.call_count == 2
+    connection.close.assert_called_once()
+
+
+def test_handle_command_does_not_hold_pipeline_lock_while_waiting_for_response() -> (
+    None
+):
+    # given
+    command_queue, responses_queue = Queue(), Queue()
+    processes_table = {"my-pipeline": (MagicMock(), command_queue, responses_queue)}
+    results = []
+    waiting_thread = Thread(
+        target=lambda: results.append(
+            handle_command(
+                processes_table=processes_table,
+                request_id="my-request",
+                pipeline_id="my-pipeline",
+                command={"type": CommandType.CONSUME_RESULT},
+            )
+        ),
+        daemon=True,
+    )
+
+    # when
+    waiting_thread.start()
+    sent_command = command_queue.get(timeout=5)
+    lock_acquired = app.PIPELINES_LOCKS["my-pipeline"].acquire(timeout=5)
+    if lock_acquired:
+        app.PIPELINES_LOCKS["my-pipeline"].release()
+    responses_queue.put(("my-request", {"status": OperationStatus.SUCCESS}))
+    waiting_thread.join(timeout=5)
+    app.join_inference_pipeline(
+        processes_table=processes_table, pipeline_id="my-pipeline"
+    )
+
+    # then
+    assert sent_command == ("my-request", {"type": CommandType.CONSUME_RESULT})
+    assert lock_acquired, "Expected lock of the pipeline not to be held while waiting"
+    assert results == [{"status": OperationStatus.SUCCESS}]
+
+
+def test_pipeline_responses_when_responses_arrive_out_of_order() -> None:
+    # given
+    responses_queue = Queue()
+    pipeline_responses = PipelineResponses(responses_queue=responses_queue)
+    for request_id in ["first", "second"]:
+        pipeline_responses.expect(request_id=request_id)
+    results = {}
+    threads = [
+        Thread(
+            target=lambda rid=request_id: results.update(
+                {rid: pipeline_responses.get(request_id=rid)}
+            ),
+            daemon=True,
+        )
+        for request_id in ["first", "second"]
+    ]
+
+    # when
+    for thread in threads:
+        thread.start()
+    responses_queue.put(("not-awaited", {"id": "not-awaited"}))
+    responses_queue.put(("second", {"id": "second"}))
+    responses_queue.put(("first", {"id": "first"}))
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # then
+    assert results == {"first": {"id": "first"}, "second": {"id": "second"}}
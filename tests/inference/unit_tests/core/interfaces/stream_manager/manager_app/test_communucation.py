@@ -17,6 +17,9 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
     MalformedPayloadError,
     TransmissionChannelClosed,
 )
+from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    encode_binary_frame,
+)
 
 
 def test_receive_socket_data_when_header_is_malformed() -> None:
@@ -102,6 +105,27 @@ def test_receive_socket_data_complete_successfully_despite_fragmented_message()
     assert result == {"some": "data"}, "Decoded date must be equal to input payload"
 
 
+def test_receive_socket_data_when_binary_frame_given() -> None:
+    # given
+    socket = MagicMock()
+    data = encode_binary_frame(document={"some": b"binary-data"})
+    socket.recv.side_effect = [
+        len(data).to_bytes(length=4, byteorder="big"),
+        data[:5],
+        data[5:],
+    ]
+
+    # when
+    result = receive_socket_data(
+        source=socket,
+        header_size=4,
+        buffer_size=5,
+    )
+
+    # then
+    assert result == {"some": b"binary-data"}
+
+
 def test_receive_socket_data_when_timeout_error_should_be_reraised() -> None:
     # given
     socket = MagicMock()
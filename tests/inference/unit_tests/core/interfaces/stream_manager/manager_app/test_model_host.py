@@ -0,0 +1,485 @@
+from typing import Dict, Tuple
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from inference.core.entities.requests.clip import ClipImageEmbeddingRequest
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.interfaces.stream_manager.manager_app import model_host
+from inference.core.interfaces.stream_manager.manager_app.errors import ModelHostError
+from inference.core.interfaces.stream_manager.manager_app.model_host import (
+    FairBatchScheduler,
+    ModelHostClient,
+    ModelHostCommand,
+    PendingInference,
+    SharedModelHost,
+    get_batching_key,
+)
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+
+
+def assembly_pending_inference(
+    request_id: str,
+    pipeline_id: str,
+    images: int = 1,
+    submitted_at: float = 0.0,
+    confidence: float = 0.5,
+    model_id: str = "some/1",
+) -> PendingInference:
+    return PendingInference(
+        request_id=request_id,
+        pipeline_id=pipeline_id,
+        model_id=model_id,
+        request=ObjectDetectionInferenceRequest(
+            api_key="my-key",
+            model_id=model_id,
+            image={"type": "url", "value": "https://some.com/image.jpg"},
+            confidence=confidence,
+        ).model_copy(update={"image": None}),
+        images=[f"image-{i}" for i in range(images)],
+        single_image=images == 1,
+        submitted_at=submitted_at,
+    )
+
+
+def test_fair_batch_scheduler_interleaves_pipelines_in_batch() -> None:
+    # given
+    scheduler = FairBatchScheduler(max_batch_size=4)
+    for i in range(6):
+        scheduler.submit(
+            group_key=("a",),
+            pending_inference=assembly_pending_inference(
+                request_id=f"busy-{i}", pipeline_id="busy", submitted_at=i
+            ),
+        )
+    for i in range(2):
+        scheduler.submit(
+            group_key=("a",),
+            pending_inference=assembly_pending_inference(
+                request_id=f"calm-{i}", pipeline_id="calm", submitted_at=10 + i
+            ),
+        )
+
+    # when
+    first_batch = scheduler.next_batch(group_key=("a",))
+    second_batch = scheduler.next_batch(group_key=("a",))
+    third_batch = scheduler.next_batch(group_key=("a",))
+
+    # then
+    assert [p.request_id for p in first_batch] == [
+        "busy-0",
+        "calm-0",
+        "busy-1",
+        "calm-1",
+    ], "Pipeline submitting more frames must not starve the other one"
+    assert [p.request_id for p in second_batch] == [
+        "busy-2",
+        "busy-3",
+        "busy-4",
+        "busy-5",
+    ]
+    assert third_batch == []
+    assert scheduler.is_empty()
+
+
+def test_fair_batch_scheduler_respects_max_batch_size_in_images() -> None:
+    # given
+    scheduler = FairBatchScheduler(max_batch_size=4)
+    scheduler.submit(
+        group_key=("a",),
+        pending_inference=assembly_pending_inference(
+            request_id="first", pipeline_id="a", images=3
+        ),
+    )
+    scheduler.submit(
+        group_key=("a",),
+        pending_inference=assembly_pending_inference(
+            request_id="second", pipeline_id="b", images=3
+        ),
+    )
+
+    # when
+    is_full = scheduler.is_batch_full(group_key=("a",))
+    first_batch = scheduler.next_batch(group_key=("a",))
+    second_batch = scheduler.next_batch(group_key=("a",))
+
+    # then
+    assert is_full is True
+    assert [p.request_id for p in first_batch] == ["first"]
+    assert [p.request_id for p in second_batch] == ["second"]
+
+
+def test_fair_batch_scheduler_points_group_with_the_oldest_submission() -> None:
+    # given
+    scheduler = FairBatchScheduler(max_batch_size=4)
+    scheduler.submit(
+        group_key=("a",),
+        pending_inference=assembly_pending_inference(
+            request_id="1", pipeline_id="a", submitted_at=2.0
+        ),
+    )
+    scheduler.submit(
+        group_key=("b",),
+        pending_inference=assembly_pending_inference(
+            request_id="2", pipeline_id="b", submitted_at=1.0
+        ),
+    )
+
+    # when
+    result = scheduler.oldest_submission()
+
+    # then
+    assert result == (("b",), 1.0)
+
+
+def test_fair_batch_scheduler_remove_pipeline() -> None:
+    # given
+    scheduler = FairBatchScheduler(max_batch_size=4)
+    scheduler.submit(
+        group_key=("a",),
+        pending_inference=assembly_pending_inference(request_id="1", pipeline_id="a"),
+    )
+    scheduler.submit(
+        group_key=("a",),
+        pending_inference=assembly_pending_inference(request_id="2", pipeline_id="b"),
+    )
+
+    # when
+    removed = scheduler.remove_pipeline(pipeline_id="a")
+
+    # then
+    assert [p.request_id for p in removed] == ["1"]
+    assert [p.request_id for p in scheduler.next_batch(group_key=("a",))] == ["2"]
+
+
+def test_get_batching_key_when_requests_differ_only_in_identity() -> None:
+    # given
+    first = assembly_pending_inference(request_id="1", pipeline_id="a")
+    second = assembly_pending_inference(request_id="2", pipeline_id="b")
+    third = assembly_pending_inference(request_id="3", pipeline_id="b", confidence=0.9)
+
+    # when
+    first_key = get_batching_key(pending_inference=first)
+    second_key = get_batching_key(pending_inference=second)
+    third_key = get_batching_key(pending_inference=third)
+
+    # then
+    assert first_key == second_key, "Requests of different pipelines must be batched"
+    assert (
+        first_key != third_key
+    ), "Requests with different parameters must not be batched"
+
+
+class StubModelManager:
+    def add_model(self, model_id: str, api_key: str, model_id_alias=None) -> None:
+        if model_id == "invalid/1":
+            raise ValueError("Model not found")
+
+    def __contains__(self, model_id: str) -> bool:
+        return True
+
+    def infer_from_request_sync(self, model_id: str, request, **kwargs) -> list:
+        return [
+            {
+                "mean": float(image.value.mean()),
+                "shape": image.value.shape,
+                "batch_size": len(request.image),
+            }
+            for image in request.image
+        ]
+
+
+@pytest.mark.timeout(60)
+@mock.patch.object(model_host, "initialise_model_manager")
+def test_shared_model_host_serves_requests_of_multiple_pipelines(
+    initialise_model_manager_mock: mock.MagicMock,
+) -> None:
+    # given
+    initialise_model_manager_mock.return_value = StubModelManager()
+    host = SharedModelHost.init(max_batch_size=8, batch_collection_timeout=0.05)
+    host.start()
+    clients = []
+    try:
+        connection_details = host.get_connection_details()
+        clients = [
+            ModelHostClient.connect(
+                connection_details=connection_details,
+                pipeline_id=f"pipeline-{i}",
+                frames_ring_size=2,
+            )
+            for i in range(2)
+        ]
+
+        # when
+        clients[0].add_model(model_id="some/1", api_key="my-key")
+        with pytest.raises(ValueError):
+            clients[1].add_model(model_id="invalid/1", api_key="my-key")
+        results = [
+            client.infer_from_request_sync(
+                model_id="some/1",
+                request=ObjectDetectionInferenceRequest(
+                    api_key="my-key",
+                    model_id="some/1",
+                    image=[
+                        {
+                            "type": "numpy_object",
+                            "value": np.full((8, 8, 3), i * 10 + j, dtype=np.uint8),
+                        }
+                        for j in range(2)
+                    ],
+                ),
+            )
+            for i, client in enumerate(clients)
+        ]
+        report = clients[1].get_report()
+        shared_memory_bytes = clients[1].shared_memory_bytes
+    finally:
+        for client in clients:
+            client.close()
+        host.terminate()
+        host.join()
+
+    # then
+    assert [[r["mean"] for r in result] for result in results] == [
+        [0.0, 1.0],
+        [10.0, 11.0],
+    ], "Each pipeline must receive results of its own frames in order"
+    assert all(r["shape"] == (8, 8, 3) for result in results for r in result)
+    assert shared_memory_bytes == 2 * 8 * 8 * 3, "Frames must be sent via shared memory"
+    assert report["total"]["frames"] == 4
+    assert report["total"]["pipelines"] == 2
+    assert report["pipeline"]["frames"] == 2
+    assert report["pipeline"]["shared_memory_bytes"] == shared_memory_bytes
+
+
+def test_model_host_client_when_connection_closed() -> None:
+    # given
+    connection = mock.MagicMock()
+    connection.recv.side_effect = EOFError()
+    client = ModelHostClient(
+        connection=connection, pipeline_id="my-pipeline", frames_ring_size=0
+    )
+    client.start()
+    client._receiver_thread.join()
+    connection.send.side_effect = OSError()
+
+    # when
+    with pytest.raises(ModelHostError):
+        client.add_model(model_id="some/1", api_key="my-key")
+
+
+def test_get_batching_key_when_model_does_not_respond_for_each_image() -> None:
+    # given
+    pending_inferences = [
+        PendingInference(
+            request_id=request_id,
+            pipeline_id=request_id,
+            model_id="clip/1",
+            request=ClipImageEmbeddingRequest(
+                api_key="my-key",
+                image={"type": "url", "value": "https://some.com/image.jpg"},
+            ).model_copy(update={"image": None}),
+            images=["image"],
+            single_image=True,
+            submitted_at=0.0,
+        )
+        for request_id in ("1", "2")
+    ]
+
+    # when
+    keys = [
+        get_batching_key(pending_inference=pending_inference)
+        for pending_inference in pending_inferences
+    ]
+
+    # then
+    assert keys[0] != keys[1], "Requests of such models must not be merged"
+
+
+def assembly_host_with_model_manager(
+    model_manager: mock.MagicMock,
+) -> Tuple[SharedModelHost, Dict[str, mock.MagicMock]]:
+    host = SharedModelHost(
+        authkey=b"key",
+        address_queue=mock.MagicMock(),
+        max_batch_size=8,
+        batch_collection_timeout=0.01,
+    )
+    host._model_manager = model_manager
+    connections = {}
+    for pipeline_id in ("a", "b"):
+        connection = mock.MagicMock()
+        connection.resolve_images.side_effect = lambda images: images
+        connections[pipeline_id] = connection
+    return host, connections
+
+
+def test_shared_model_host_execute_batch_when_model_responds_for_each_image() -> None:
+    # given
+    model_manager = mock.MagicMock()
+    model_manager.infer_from_request_sync.side_effect = lambda model_id, request: [
+        f"response-{image}" for image in request.image
+    ]
+    host, connections = assembly_host_with_model_manager(model_manager=model_manager)
+    batch = [
+        assembly_pending_inference(request_id="1", pipeline_id="a", images=1),
+        assembly_pending_inference(request_id="2", pipeline_id="b", images=2),
+    ]
+
+    # when
+    host._execute_batch(batch=batch, connections=connections)
+
+    # then
+    assert model_manager.infer_from_request_sync.call_count == 1
+    connections["a"].respond.assert_called_once_with(
+        request_id="1", result="response-image-0"
+    )
+    connections["b"].respond.assert_called_once_with(
+        request_id="2", result=["response-image-0", "response-image-1"]
+    )
+
+
+def test_shared_model_host_execute_batch_when_model_does_not_respond_for_each_image() -> (
+    None
+):
+    # given
+    model_manager = mock.MagicMock()
+    model_manager.infer_from_request_sync.side_effect = (
+        lambda model_id, request: f"response-{request.image}"
+    )
+    host, connections = assembly_host_with_model_manager(model_manager=model_manager)
+    batch = [
+        assembly_pending_inference(request_id="1", pipeline_id="a", images=1),
+        assembly_pending_inference(request_id="2", pipeline_id="b", images=2),
+    ]
+
+    # when
+    host._execute_batch(batch=batch, connections=connections)
+
+    # then
+    assert model_manager.infer_from_request_sync.call_count == 3
+    connections["a"].respond.assert_called_once_with(
+        request_id="1", result="response-image-0"
+    )
+    connections["b"].respond.assert_called_once_with(
+        request_id="2", result="response-['image-0', 'image-1']"
+    )
+
+
+def test_shared_model_host_execute_batch_when_model_responds_with_empty_list() -> None:
+    # given
+    model_manager = mock.MagicMock()
+    model_manager.infer_from_request_sync.return_value = []
+    host, connections = assembly_host_with_model_manager(model_manager=model_manager)
+    batch = [assembly_pending_inference(request_id="1", pipeline_id="a", images=1)]
+
+    # when
+    host._execute_batch(batch=batch, connections=connections)
+
+    # then
+    connections["a"].respond.assert_called_once_with(request_id="1", result=[])
+    connections["a"].respond_error.assert_not_called()
+
+
+def test_shared_model_host_execute_batch_when_inference_fails() -> None:
+    # given
+    model_manager = mock.MagicMock()
+    model_manager.infer_from_request_sync.side_effect = ValueError("Some error")
+    host, connections = assembly_host_with_model_manager(model_manager=model_manager)
+    batch = [
+        assembly_pending_inference(request_id="1", pipeline_id="a", images=1),
+        assembly_pending_inference(request_id="2", pipeline_id="b", images=1),
+    ]
+
+    # when
+    host._execute_batch(batch=batch, connections=connections)
+
+    # then
+    assert connections["a"].respond_error.call_args[1]["request_id"] == "1"
+    assert connections["b"].respond_error.call_args[1]["request_id"] == "2"
+    connections["a"].respond.assert_not_called()
+
+
+@mock.patch.object(model_host, "MODEL_HOST_RESPONSE_TIMEOUT", 0.05)
+def test_model_host_client_when_host_does_not_respond() -> None:
+    # given
+    client = ModelHostClient(
+        connection=mock.MagicMock(), pipeline_id="my-pipeline", frames_ring_size=0
+    )
+
+    # when
+    with pytest.raises(ModelHostError):
+        client.add_model(model_id="some/1", api_key="my-key")
+
+    # then
+    assert client._pending == {}, "Expected pending request to be dropped"
+
+
+class InMemoryModelManager:
+    def __init__(self):
+        self._models = {}
+        self.added_models = []
+
+    def add_model(self, model_id: str, api_key: str, model_id_alias=None) -> None:
+        self.added_models.append(model_id)
+        self._models[model_id_alias or model_id] = api_key
+
+    def remove(self, model_id: str) -> str:
+        return self._models.pop(model_id)
+
+    def keys(self):
+        return self._models.keys()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, model_id: str) -> bool:
+        return model_id in self._models
+
+    def infer_from_request_sync(self, model_id: str, request, **kwargs) -> list:
+        if model_id not in self._models:
+            raise KeyError(model_id)
+        images = request.image if isinstance(request.image, list) else [request.image]
+        return [f"{model_id}-{image}" for image in images]
+
+
+def test_shared_model_host_when_models_of_pipelines_exceed_models_cache_size() -> None:
+    # given
+    model_manager = InMemoryModelManager()
+    host, connections = assembly_host_with_model_manager(
+        model_manager=WithFixedSizeCache(model_manager, max_size=1)
+    )
+    for pipeline_id, model_id in [("a", "some/1"), ("b", "other/1")]:
+        host._handle_command(
+            hosted_connection=connections[pipeline_id],
+            request_id=f"add-{pipeline_id}",
+            command=ModelHostCommand.ADD_MODEL,
+            payload={"model_id": model_id, "api_key": "my-key", "model_id_alias": None},
+        )
+
+    # when
+    for pipeline_id, model_id in [("a", "some/1"), ("b", "other/1"), ("a", "some/1")]:
+        host._execute_batch(
+            batch=[
+                assembly_pending_inference(
+                    request_id=pipeline_id, pipeline_id=pipeline_id, model_id=model_id
+                )
+            ],
+            connections=connections,
+        )
+
+    # then
+    connections["a"].respond_error.assert_not_called()
+    connections["b"].respond_error.assert_not_called()
+    assert connections["a"].respond.call_args_list[-2:] == [
+        mock.call(request_id="a", result=["some/1-image-0"]),
+        mock.call(request_id="a", result=["some/1-image-0"]),
+    ]
+    assert model_manager.added_models == [
+        "some/1",
+        "other/1",
+        "some/1",
+        "other/1",
+        "some/1",
+    ], "Expected evicted models to be loaded back before inference"
@@ -2,13 +2,22 @@ import datetime
 import json
 from enum import Enum
 
+import pytest
+
 from inference.core.interfaces.stream_manager.manager_app.entities import (
     ErrorType,
     OperationStatus,
 )
+from inference.core.interfaces.stream_manager.manager_app.errors import (
+    MalformedPayloadError,
+)
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    decode_binary_frame,
     describe_error,
+    deserialise_payload,
+    encode_binary_frame,
     prepare_error_response,
+    prepare_response,
     serialise_to_json,
 )
 
@@ -124,3 +133,84 @@ def test_prepare_error_response() -> None:
         },
         "pipeline_id": "my_pipeline",
     }
+
+
+def test_prepare_response_when_binary_response_requested() -> None:
+    # given
+    response = {
+        "status": OperationStatus.SUCCESS,
+        "outputs": [{"image": {"type": "base64", "value": b"\x00\x01raw"}}],
+        "frames_metadata": [{"frame_timestamp": datetime.datetime(2024, 1, 1)}],
+    }
+
+    # when
+    payload = prepare_response(
+        request_id="my_request",
+        response=response,
+        pipeline_id="my_pipeline",
+        binary=True,
+    )
+    decoded_response = deserialise_payload(payload=payload)
+
+    # then
+    assert b"\x00\x01raw" in payload, "Bytes are expected to be sent as they are"
+    assert decoded_response == {
+        "request_id": "my_request",
+        "response": {
+            "status": "success",
+            "outputs": [{"image": {"type": "base64", "value": b"\x00\x01raw"}}],
+            "frames_metadata": [{"frame_timestamp": "2024-01-01T00:00:00"}],
+        },
+        "pipeline_id": "my_pipeline",
+    }
+
+
+def test_deserialise_payload_when_json_payload_given() -> None:
+    # when
+    result = deserialise_payload(payload=b'{"some": "data"}')
+
+    # then
+    assert result == {"some": "data"}
+
+
+def test_decode_binary_frame_when_frame_is_truncated() -> None:
+    # given
+    payload = encode_binary_frame(document={"value": b"some-bytes"})
+
+    # when
+    with pytest.raises(MalformedPayloadError):
+        _ = decode_binary_frame(payload=payload[:-2])
+
+
+def test_decode_binary_frame_when_payload_contains_dicts_looking_like_references() -> (
+    None
+):
+    # given
+    document = {
+        "value": b"some-bytes",
+        "user_data": [
+            {"$segment": 0},
+            {"$$segment": "escaped-looking"},
+            {"$segment": 1, "other": "key"},
+            "$segment",
+        ],
+    }
+
+    # when
+    payload = encode_binary_frame(document=document)
+    result = decode_binary_frame(payload=payload)
+
+    # then
+    assert result == document
+
+
+def test_decode_binary_frame_when_escaped_reference_nested_in_escaped_one() -> None:
+    # given
+    document = {"$segment": {"$segment": b"raw"}}
+
+    # when
+    payload = encode_binary_frame(document=document)
+    result = decode_binary_frame(payload=payload)
+
+    # then
+    assert result == document
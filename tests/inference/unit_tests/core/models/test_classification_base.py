@@ -0,0 +1,132 @@
+from unittest import mock
+
+import numpy as np
+
+from inference.core.models import classification_base
+from inference.core.models.classification_base import (
+    ClassificationBaseOnnxRoboflowInferenceModel,
+)
+
+
+def _create_model(multiclass: bool) -> ClassificationBaseOnnxRoboflowInferenceModel:
+    model = ClassificationBaseOnnxRoboflowInferenceModel.__new__(
+        ClassificationBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["a", "b", "c", "d"]
+    model.multiclass = multiclass
+    return model
+
+
+@mock.patch.object(classification_base.OnnxRoboflowInferenceModel, "infer")
+def test_infer_passes_parameters_to_post_processing(
+    infer_mock: mock.MagicMock,
+) -> None:
+    # given
+    model = _create_model(multiclass=False)
+
+    # when
+    _ = model.infer("image", confidence=0.7, top_k=3, predictions_format="columnar")
+
+    # then
+    kwargs = infer_mock.call_args[1]
+    assert kwargs["confidence"] == 0.7
+    assert kwargs["top_k"] == 3
+    assert kwargs["predictions_format"] == "columnar"
+
+
+def test_softmax_when_batch_given() -> None:
+    # when
+    result = ClassificationBaseOnnxRoboflowInferenceModel.softmax(
+        np.array([[0.0, 0.0], [1.0, 1.0], [0.0, np.log(3)]])
+    )
+
+    # then
+    assert np.allclose(result, [[0.5, 0.5], [0.5, 0.5], [0.25, 0.75]])
+
+
+def test_make_response_for_batch_of_single_label_predictions() -> None:
+    # given
+    model = _create_model(multiclass=False)
+    predictions = [np.log(np.array([[0.1, 0.2, 0.3, 0.4], [0.4, 0.3, 0.2, 0.1]]))]
+
+    # when
+    result = model.make_response(predictions, img_dims=[(100, 200), (300, 400)])
+
+    # then
+    assert len(result) == 2
+    assert [p.class_name for p in result[0].predictions] == ["d", "c", "b", "a"]
+    assert [p.confidence for p in result[0].predictions] == [0.4, 0.3, 0.2, 0.1]
+    assert (result[0].top, result[0].confidence) == ("d", 0.4)
+    assert [p.class_name for p in result[1].predictions] == ["a", "b", "c", "d"]
+    assert (result[1].top, result[1].confidence) == ("a", 0.4)
+    assert (result[1].image.width, result[1].image.height) == (400, 300)
+
+
+def test_make_response_for_single_label_predictions_when_top_k_given() -> None:
+    # given
+    model = _create_model(multiclass=False)
+    predictions = [np.log(np.array([[0.1, 0.2, 0.3, 0.4]]))]
+
+    # when
+    result = model.make_response(predictions, img_dims=[(100, 200)], top_k=2)
+
+    # then
+    assert [p.class_name for p in result[0].predictions] == ["d", "c"]
+    assert (result[0].top, result[0].confidence) == ("d", 0.4)
+
+
+def test_make_response_for_single_label_predictions_when_filtering_by_confidence() -> (
+    None
+):
+    # given
+    model = _create_model(multiclass=False)
+    predictions = [np.log(np.array([[0.1, 0.2, 0.3, 0.4]]))]
+
+    # when
+    result = model.make_response(
+        predictions, img_dims=[(100, 200)], confidence=0.5, filter_by_confidence=True
+    )
+
+    # then
+    assert result[0].predictions == []
+    assert (result[0].top, result[0].confidence) == ("d", 0.4)
+
+
+def test_make_response_for_multi_label_predictions_when_filtering_by_confidence() -> (
+    None
+):
+    # given
+    model = _create_model(multiclass=True)
+    predictions = [np.array([[0.9, 0.2, 0.6, 0.1]])]
+
+    # when
+    result = model.make_response(
+        predictions, img_dims=[(100, 200)], confidence=0.5, filter_by_confidence=True
+    )
+
+    # then
+    assert list(result[0].predictions.keys()) == ["a", "c"]
+    assert result[0].predictions["c"].class_id == 2
+    assert result[0].predicted_classes == ["a", "c"]
+
+
+def test_make_response_for_multi_label_predictions_when_columnar_format_and_top_k() -> (
+    None
+):
+    # given
+    model = _create_model(multiclass=True)
+    predictions = [np.array([[0.9, 0.2, 0.6, 0.1]])]
+
+    # when
+    result = model.make_response(
+        predictions,
+        img_dims=[(100, 200)],
+        confidence=0.5,
+        top_k=3,
+        predictions_format="columnar",
+    )
+
+    # then
+    assert result[0].predictions.class_id.tolist() == [0, 1, 2]
+    assert result[0].predictions.confidence.tolist() == [0.9, 0.2, 0.6]
+    assert result[0].predicted_classes == ["a", "c"]
@@ -0,0 +1,182 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from inference.core.models import instance_segmentation_base
+from inference.core.models.instance_segmentation_base import (
+    InstanceSegmentationBaseOnnxRoboflowInferenceModel,
+)
+
+
+@mock.patch.object(instance_segmentation_base.OnnxRoboflowInferenceModel, "infer")
+def test_infer_passes_predictions_format_to_post_processing(
+    infer_mock: mock.MagicMock,
+) -> None:
+    # given
+    model = InstanceSegmentationBaseOnnxRoboflowInferenceModel.__new__(
+        InstanceSegmentationBaseOnnxRoboflowInferenceModel
+    )
+
+    # when
+    _ = model.infer(
+        "image",
+        predictions_format="columnar",
+        visualize_predictions=False,
+    )
+
+    # then
+    kwargs = infer_mock.call_args[1]
+    assert kwargs["predictions_format"] == "columnar"
+    assert kwargs["visualize_predictions"] is False
+
+
+class WhiteRegionSegmentationModel(InstanceSegmentationBaseOnnxRoboflowInferenceModel):
+    # segments white pixels of input, confidence grows with the region area
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        result = np.zeros((len(img_in), 10, 7 + 32), dtype=np.float32)
+        protos = np.full((len(img_in), 32, 16, 16), -5, dtype=np.float32)
+        for i, image in enumerate(img_in):
+            protos[i, 0] = np.where(image[0, ::4, ::4] > 0.5, 5, -5)
+            ys, xs = np.nonzero(image[0] > 0.5)
+            if len(xs) == 0:
+                continue
+            x1, y1, x2, y2 = xs.min(), ys.min(), xs.max() + 1, ys.max() + 1
+            confidence = 0.5 + 0.4 * min((x2 - x1) * (y2 - y1) / 2000, 1)
+            result[i, 0, :7] = [
+                (x1 + x2) / 2,
+                (y1 + y2) / 2,
+                x2 - x1,
+                y2 - y1,
+                confidence,
+                confidence,
+                0.1,
+            ]
+            result[i, 0, 7] = 1.0
+        return result, protos
+
+
+def _create_model() -> WhiteRegionSegmentationModel:
+    model = WhiteRegionSegmentationModel.__new__(WhiteRegionSegmentationModel)
+    model.class_names = ["a", "b"]
+    model.preproc = {}
+    model.resize_method = "Stretch to"
+    model.img_size_h = 64
+    model.img_size_w = 64
+    model.batching_enabled = True
+    model.batch_size = "batch"
+    model.image_loader_threadpool = ThreadPoolExecutor(max_workers=2)
+    return model
+
+
+@pytest.mark.parametrize("mask_format", ["polygon", "rle", "bitmask"])
+def test_infer_when_slice_larger_than_image(mask_format: str) -> None:
+    # given
+    model = _create_model()
+    image = np.zeros((60, 64, 3), dtype=np.uint8)
+    image[20:40, 10:30] = 255
+
+    # when
+    expected_result = model.infer(
+        image, confidence=0.5, iou_threshold=0.5, mask_format=mask_format
+    )
+    result = model.infer(
+        image,
+        confidence=0.5,
+        iou_threshold=0.5,
+        mask_format=mask_format,
+        slice_width=100,
+        slice_height=100,
+    )
+
+    # then
+    assert len(result[0].predictions) == 1
+    assert result[0].predictions[0].dict(exclude={"detection_id"}) == expected_result[
+        0
+    ].predictions[0].dict(exclude={"detection_id"})
+
+
+def test_infer_when_object_split_between_tiles() -> None:
+    # given
+    model = _create_model()
+    image = np.zeros((300, 500, 3), dtype=np.uint8)
+    image[100:140, 200:240] = 255
+
+    # when
+    result = model.infer(
+        image,
+        confidence=0.5,
+        iou_threshold=0.5,
+        mask_format="bitmask",
+        slice_width=64,
+        slice_height=64,
+    )
+
+    # then
+    assert len(result[0].predictions) == 1
+    prediction = result[0].predictions[0]
+    assert (prediction.x, prediction.y) == (220, 120)
+    assert (prediction.bitmask.x, prediction.bitmask.y) == (
+        prediction.x - prediction.width / 2,
+        prediction.y - prediction.height / 2,
+    )
+
+
+def test_infer_when_batch_of_images_of_different_sizes_segmented_into_polygons() -> (
+    None
+):
+    # given
+    model = _create_model()
+    images = [
+        np.zeros((64, 64, 3), dtype=np.uint8),
+        np.zeros((128, 256, 3), dtype=np.uint8),
+        np.zeros((300, 100, 3), dtype=np.uint8),
+    ]
+    images[0][16:48, 16:48] = 255
+    images[2][60:240, 20:80] = 255
+
+    # when
+    result = model.infer(images, confidence=0.5, iou_threshold=0.5)
+
+    # then
+    assert [len(response.predictions) for response in result] == [1, 0, 1]
+    for response in (result[0], result[2]):
+        prediction = response.predictions[0]
+        xs = np.array([point.x for point in prediction.points])
+        ys = np.array([point.y for point in prediction.points])
+        assert len(xs) > 0
+        assert np.all(np.abs(xs - prediction.x) <= prediction.width / 2 + 4)
+        assert np.all(np.abs(ys - prediction.y) <= prediction.height / 2 + 4)
+    assert (result[2].predictions[0].x, result[2].predictions[0].y) == (50, 150)
+
+
+def test_infer_when_static_crop_disabled_for_polygons() -> None:
+    # given
+    model = _create_model()
+    model.preproc = {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 25,
+            "y_min": 25,
+            "x_max": 75,
+            "y_max": 75,
+        }
+    }
+    image = np.zeros((128, 128, 3), dtype=np.uint8)
+    image[16:48, 16:48] = 255
+
+    # when
+    result = model.infer(
+        image, confidence=0.5, iou_threshold=0.5, disable_preproc_static_crop=True
+    )
+
+    # then
+    prediction = result[0].predictions[0]
+    assert (prediction.x, prediction.y) == (32, 32)
+    xs = np.array([point.x for point in prediction.points])
+    ys = np.array([point.y for point in prediction.points])
+    assert np.all((xs >= 12) & (xs <= 52)), "Expected polygon not shifted by crop"
+    assert np.all((ys >= 12) & (ys <= 52)), "Expected polygon not shifted by crop"
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from unittest import mock
+
+import numpy as np
+
+from inference.core.models import roboflow
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+
+
+class WhiteRegionDetectionModel(ObjectDetectionBaseOnnxRoboflowInferenceModel):
+    # detects bounding box of white pixels of input, confidence grows with box area
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
+        result = np.zeros((len(img_in), 10, 7), dtype=np.float32)
+        for i, image in enumerate(img_in):
+            ys, xs = np.nonzero(image[0] > 0.5)
+            if len(xs) == 0:
+                continue
+            x1, y1, x2, y2 = xs.min(), ys.min(), xs.max() + 1, ys.max() + 1
+            confidence = 0.5 + 0.4 * min((x2 - x1) * (y2 - y1) / 2000, 1)
+            result[i, 0] = [
+                (x1 + x2) / 2,
+                (y1 + y2) / 2,
+                x2 - x1,
+                y2 - y1,
+                confidence,
+                confidence,
+                0.1,
+            ]
+        return (result,)
+
+
+def _create_model() -> WhiteRegionDetectionModel:
+    model = WhiteRegionDetectionModel.__new__(WhiteRegionDetectionModel)
+    model.class_names = ["a", "b"]
+    model.preproc = {}
+    model.resize_method = "Stretch to"
+    model.img_size_h = 64
+    model.img_size_w = 64
+    model.batching_enabled = True
+    model.batch_size = "batch"
+    model.image_loader_threadpool = ThreadPoolExecutor(max_workers=2)
+    return model
+
+
+def test_infer_when_slice_larger_than_image() -> None:
+    # given
+    model = _create_model()
+    image = np.zeros((60, 64, 3), dtype=np.uint8)
+    image[20:40, 10:30] = 255
+
+    # when
+    expected_result = model.infer(image, confidence=0.5, iou_threshold=0.5)
+    result = model.infer(
+        image, confidence=0.5, iou_threshold=0.5, slice_width=100, slice_height=100
+    )
+
+    # then
+    assert len(result[0].predictions) == 1
+    assert result[0].predictions[0].dict(exclude={"detection_id"}) == expected_result[
+        0
+    ].predictions[0].dict(exclude={"detection_id"})
+    assert result[0].image == expected_result[0].image
+
+
+def test_infer_when_object_split_between_tiles() -> None:
+    # given
+    model = _create_model()
+    image = np.zeros((300, 500, 3), dtype=np.uint8)
+    image[100:140, 200:240] = 255
+
+    # when
+    result = model.infer(
+        image, confidence=0.5, iou_threshold=0.5, slice_width=64, slice_height=64
+    )
+
+    # then
+    assert len(result[0].predictions) == 1
+    prediction = result[0].predictions[0]
+    assert (prediction.x, prediction.y) == (220, 120)
+    assert (prediction.width, prediction.height) == (40, 40)
+    assert (result[0].image.width, result[0].image.height) == (500, 300)
+
+
+@mock.patch.object(roboflow, "MAX_BATCH_SIZE", 4)
+def test_infer_runs_tiles_in_chunks_of_max_batch_size() -> None:
+    # given
+    model = _create_model()
+    image = np.zeros((128, 160, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(
+        WhiteRegionDetectionModel, "predict", wraps=model.predict
+    ) as predict_mock:
+        result = model.infer(
+            image, confidence=0.5, iou_threshold=0.5, slice_width=64, slice_height=64
+        )
+
+    # then
+    assert [call[0][0].shape[0] for call in predict_mock.call_args_list] == [4, 4, 1]
+    assert result[0].predictions == []
+
+
+@mock.patch.object(roboflow, "FIX_BATCH_SIZE", True)
+@mock.patch.object(roboflow, "MAX_BATCH_SIZE", 4)
+def test_infer_pads_chunks_of_tiles_when_batch_size_is_fixed() -> None:
+    # given
+    model = _create_model()
+    image = np.zeros((128, 160, 3), dtype=np.uint8)
+    image[70:110, 100:140] = 255
+
+    # when
+    with mock.patch.object(
+        WhiteRegionDetectionModel, "predict", wraps=model.predict
+    ) as predict_mock:
+        result = model.infer(
+            image, confidence=0.5, iou_threshold=0.5, slice_width=64, slice_height=64
+        )
+
+    # then
+    assert [call[0][0].shape[0] for call in predict_mock.call_args_list] == [4, 4, 4]
+    assert len(result[0].predictions) == 1
+    assert (result[0].predictions[0].x, result[0].predictions[0].y) == (120, 90)
+
+
+def test_infer_pads_chunks_of_tiles_to_static_batch_size_of_model() -> None:
+    # given
+    model = _create_model()
+    model.batching_enabled = False
+    model.batch_size = 4
+    image = np.zeros((60, 64, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(
+        WhiteRegionDetectionModel, "predict", wraps=model.predict
+    ) as predict_mock:
+        result = model.infer_tiled(
+            image,
+            slice_width=100,
+            slice_height=100,
+            slice_overlap_ratio_width=0.2,
+            slice_overlap_ratio_height=0.2,
+            confidence=0.5,
+            iou_threshold=0.5,
+        )
+
+    # then
+    assert [call[0][0].shape[0] for call in predict_mock.call_args_list] == [4]
+    assert result[0].predictions == []
@@ -3,6 +3,8 @@ from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
+import numpy as np
 import pytest
 
 from inference.core.exceptions import ModelArtefactError
@@ -14,6 +16,8 @@ from inference.core.models.roboflow import (
     get_color_mapping_from_environment,
     is_model_artefacts_bucket_available,
 )
+from inference.core.utils import preprocess
+from inference.core.utils.preprocessing_cache import request_preprocessing_cache_scope
 
 
 @mock.patch.object(roboflow, "AWS_ACCESS_KEY_ID", None)
@@ -194,3 +198,159 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+@mock.patch.object(roboflow, "REDUCED_IMAGE_DECODING_ENABLED", True)
+def test_preproc_image_when_image_decoded_in_reduced_resolution() -> None:
+    # given
+    model = roboflow.OnnxRoboflowInferenceModel.__new__(
+        roboflow.OnnxRoboflowInferenceModel
+    )
+    model.preproc = {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 25,
+            "y_min": 0,
+            "x_max": 75,
+            "y_max": 100,
+        }
+    }
+    model.resize_method = "Stretch to"
+    model.img_size_h, model.img_size_w = 100, 100
+    image = np.zeros((800, 1600, 3), dtype=np.uint8)
+    image[:, 800:] = 255
+    encoded_image = cv2.imencode(".jpg", image)[1].tobytes()
+
+    # when
+    result, img_dims = model.preproc_image(encoded_image)
+
+    # then
+    assert img_dims == (800, 1600), "Expected original size of image to be reported"
+    assert result.shape == (1, 3, 100, 100)
+    assert np.all(result[0, :, :, :45] < 10)
+    assert np.all(result[0, :, :, 55:] > 245)
+
+
+def test_resize_to_model_input_when_image_of_exact_input_shape_given() -> None:
+    # given
+    model = roboflow.OnnxRoboflowInferenceModel.__new__(
+        roboflow.OnnxRoboflowInferenceModel
+    )
+    model.resize_method = "Fit (black edges) in"
+    model.img_size_h, model.img_size_w = 100, 200
+    image = np.random.default_rng(42).integers(0, 256, (100, 200, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(roboflow, "letterbox_image") as letterbox_image_mock:
+        result = model.resize_to_model_input(image, is_bgr=False)
+
+    # then
+    letterbox_image_mock.assert_not_called()
+    assert np.array_equal(result[0], np.transpose(image, (2, 0, 1)))
+
+
+def test_resize_to_model_input_when_interpolation_configured_for_model() -> None:
+    # given
+    model = roboflow.OnnxRoboflowInferenceModel.__new__(
+        roboflow.OnnxRoboflowInferenceModel
+    )
+    model.resize_method = "Stretch to"
+    model.resize_interpolation = "nearest"
+    model.img_size_h, model.img_size_w = 50, 50
+    image = np.random.default_rng(42).integers(0, 256, (100, 100, 3), dtype=np.uint8)
+
+    # when
+    result = model.resize_to_model_input(image, is_bgr=False)
+
+    # then
+    expected_result = cv2.resize(image, (50, 50), interpolation=cv2.INTER_NEAREST)
+    assert np.array_equal(result[0], np.transpose(expected_result, (2, 0, 1)))
+
+
+@mock.patch.object(roboflow, "REDUCED_IMAGE_DECODING_ENABLED", False)
+@mock.patch.object(preprocess, "DISABLE_PREPROC_GRAYSCALE", False)
+def test_preproc_image_when_grayscale_conversion_enabled() -> None:
+    # given
+    model = roboflow.OnnxRoboflowInferenceModel.__new__(
+        roboflow.OnnxRoboflowInferenceModel
+    )
+    model.preproc = {"grayscale": {"enabled": True}}
+    model.resize_method = "Fit (grey edges) in"
+    model.img_size_h, model.img_size_w = 100, 100
+    image = np.zeros((200, 100, 3), dtype=np.uint8)
+    image[:, :, 2] = 255
+
+    # when
+    result, img_dims = model.preproc_image(image)
+
+    # then
+    assert img_dims == (200, 100)
+    assert result.shape == (1, 3, 100, 100)
+    assert np.all(result[0, :, :, 25:75] == 76), "Expected luminance of red colour"
+    assert np.all(result[0, :, :, :25] == 114), "Expected grey padding"
+
+
+@mock.patch.object(roboflow, "REDUCED_IMAGE_DECODING_ENABLED", False)
+def test_preproc_image_when_models_with_the_same_preprocessing_run_within_request() -> (
+    None
+):
+    # given
+    models = []
+    for _ in range(2):
+        model = roboflow.OnnxRoboflowInferenceModel.__new__(
+            roboflow.OnnxRoboflowInferenceModel
+        )
+        model.preproc = {}
+        model.resize_method = "Stretch to"
+        model.img_size_h, model.img_size_w = 50, 50
+        models.append(model)
+    image = np.random.default_rng(42).integers(0, 256, (100, 100, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(
+        roboflow.OnnxRoboflowInferenceModel,
+        "load_and_prepare_image",
+        return_value=(image, (100, 100), True),
+    ) as load_and_prepare_image_mock:
+        with request_preprocessing_cache_scope():
+            first_result, first_dims = models[0].preproc_image(image)
+            second_result, second_dims = models[1].preproc_image(image)
+
+    # then
+    assert load_and_prepare_image_mock.call_count == 1
+    assert first_dims == second_dims == (100, 100)
+    assert np.array_equal(first_result, second_result)
+    assert first_result is not second_result, "Expected model input not to be shared"
+
+
+@mock.patch.object(roboflow, "REDUCED_IMAGE_DECODING_ENABLED", False)
+def test_preproc_image_when_models_with_different_preprocessing_run_within_request() -> (
+    None
+):
+    # given
+    models = []
+    for size in (50, 60):
+        model = roboflow.OnnxRoboflowInferenceModel.__new__(
+            roboflow.OnnxRoboflowInferenceModel
+        )
+        model.preproc = {}
+        model.resize_method = "Stretch to"
+        model.img_size_h, model.img_size_w = size, size
+        models.append(model)
+    image = np.random.default_rng(42).integers(0, 256, (100, 100, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(
+        roboflow.OnnxRoboflowInferenceModel,
+        "preprocess_image",
+        side_effect=lambda image, **kwargs: (image, image.shape[:2]),
+    ) as preprocess_image_mock:
+        with request_preprocessing_cache_scope() as cache:
+            first_result, _ = models[0].preproc_image(image)
+            second_result, _ = models[1].preproc_image(image)
+
+    # then
+    assert preprocess_image_mock.call_count == 2
+    assert first_result.shape == (1, 3, 50, 50)
+    assert second_result.shape == (1, 3, 60, 60)
+    assert len(cache) == 3, "Expected decoded image and two model inputs cached"
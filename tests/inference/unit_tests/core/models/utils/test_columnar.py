@@ -0,0 +1,119 @@
+import numpy as np
+import orjson
+
+from inference.core.models.utils.columnar import (
+    columnar_predictions_requested,
+    make_columnar_classification,
+    make_columnar_detections,
+    make_columnar_detections_response,
+    predictions_to_array,
+    select_predictions_of_classes,
+)
+
+
+def test_columnar_predictions_requested_when_visualisation_requested() -> None:
+    # when
+    result = columnar_predictions_requested(
+        predictions_format="columnar", visualize_predictions=True
+    )
+
+    # then
+    assert result is False
+
+
+def test_columnar_predictions_requested_when_columnar_format_requested() -> None:
+    # when
+    result = columnar_predictions_requested(predictions_format="columnar")
+
+    # then
+    assert result is True
+
+
+def test_predictions_to_array_when_empty_predictions_given() -> None:
+    # when
+    result = predictions_to_array(predictions=[])
+
+    # then
+    assert result.shape == (0, 7)
+
+
+def test_select_predictions_of_classes() -> None:
+    # given
+    predictions = np.array(
+        [
+            [0, 0, 10, 10, 0.9, 0.9, 0],
+            [0, 0, 10, 10, 0.8, 0.8, 1],
+            [0, 0, 10, 10, 0.7, 0.7, 2],
+        ]
+    )
+
+    # when
+    result = select_predictions_of_classes(
+        predictions=predictions,
+        class_names=["a", "b", "c"],
+        class_filter=["a", "c"],
+    )
+
+    # then
+    assert result.tolist() == [True, False, True]
+
+
+def test_select_predictions_of_classes_when_filter_not_given() -> None:
+    # when
+    result = select_predictions_of_classes(
+        predictions=np.zeros((2, 7)),
+        class_names=["a"],
+        class_filter=None,
+    )
+
+    # then
+    assert result.tolist() == [True, True]
+
+
+def test_make_columnar_detections_response_serialisation() -> None:
+    # given
+    predictions = np.array(
+        [
+            [10, 20, 30, 60, 0.9, 0.9, 1],
+            [0, 0, 10, 10, 0.5, 0.5, 0],
+        ]
+    )
+    columns = make_columnar_detections(
+        predictions=predictions, class_names=["cat", "dog"]
+    )
+
+    # when
+    response = make_columnar_detections_response(
+        predictions=columns, image_dims=(100, 200)
+    )
+    result = orjson.loads(
+        orjson.dumps(response.model_dump(mode="json", by_alias=True, exclude_none=True))
+    )
+
+    # then
+    detection_ids = result["predictions"].pop("detection_id")
+    assert result == {
+        "image": {"width": 200, "height": 100},
+        "predictions_format": "columnar",
+        "predictions": {
+            "class_id": [1, 0],
+            "class": ["dog", "cat"],
+            "confidence": [0.9, 0.5],
+            "xyxy": [[10.0, 20.0, 30.0, 60.0], [0.0, 0.0, 10.0, 10.0]],
+        },
+    }
+    assert len(set(detection_ids)) == 2, "Expected unique id of each detection"
+
+
+def test_make_columnar_classification() -> None:
+    # when
+    result = make_columnar_classification(
+        class_names=["a", "b", "c"],
+        confidence=np.array([0.2, 0.5, 0.3]),
+        class_id=np.array([1, 2, 0]),
+    )
+
+    # then
+    assert result.class_id.tolist() == [1, 2, 0]
+    assert result.class_name == ["b", "c", "a"]
+    assert result.confidence.tolist() == [0.5, 0.3, 0.2]
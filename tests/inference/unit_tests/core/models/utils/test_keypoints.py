@@ -1,7 +1,14 @@
 from typing import List
 
+import numpy as np
+import pytest
+
 from inference.core.entities.responses.inference import Keypoint
+from inference.core.exceptions import ModelArtefactError
 from inference.core.models.utils.keypoints import (
+    model_keypoints_batch_to_array,
+    model_keypoints_batch_to_columns,
+    model_keypoints_batch_to_response,
     model_keypoints_to_response,
     superset_keypoints_count,
 )
@@ -230,3 +237,176 @@ def test_model_keypoints_to_response_padded_points() -> None:
             ),
         ],
     )
+
+
+def test_model_keypoints_batch_to_response() -> None:
+    # given
+    keypoints_metadata = {
+        0: {0: "nose", 1: "left_eye", 2: "right_eye"},
+        1: {0: "head", 1: "tail"},
+    }
+    keypoints = np.array(
+        [
+            [100, 100, 0.5, 200, 200, 0.2, 300, 300, 0.9],
+            [10, 10, 0.9, 20, 20, 0.8, 0, 0, 0.0],
+        ]
+    )
+
+    # when
+    result = model_keypoints_batch_to_response(
+        keypoints_metadata=keypoints_metadata,
+        keypoints=keypoints,
+        predicted_objects_classes_ids=np.array([0, 1]),
+        keypoint_confidence_threshold=0.3,
+    )
+
+    # then
+    assert result == [
+        [
+            {
+                "x": 100,
+                "y": 100,
+                "confidence": 0.5,
+                "class_id": 0,
+                "class_name": "nose",
+            },
+            {
+                "x": 300,
+                "y": 300,
+                "confidence": 0.9,
+                "class_id": 2,
+                "class_name": "right_eye",
+            },
+        ],
+        [
+            {
+                "x": 10,
+                "y": 10,
+                "confidence": 0.9,
+                "class_id": 0,
+                "class_name": "head",
+            },
+            {
+                "x": 20,
+                "y": 20,
+                "confidence": 0.8,
+                "class_id": 1,
+                "class_name": "tail",
+            },
+        ],
+    ]
+
+
+def test_model_keypoints_batch_to_response_matches_per_object_conversion() -> None:
+    # given
+    keypoints_metadata = {
+        0: {i: f"keypoint_{i}" for i in range(17)},
+        1: {i: f"other_keypoint_{i}" for i in range(5)},
+    }
+    keypoints = np.random.default_rng(42).random((20, 51))
+    classes_ids = np.array([0, 1] * 10)
+
+    # when
+    result = model_keypoints_batch_to_response(
+        keypoints_metadata=keypoints_metadata,
+        keypoints=keypoints,
+        predicted_objects_classes_ids=classes_ids,
+        keypoint_confidence_threshold=0.5,
+    )
+
+    # then
+    expected_result = [
+        model_keypoints_to_response(
+            keypoints_metadata=keypoints_metadata,
+            keypoints=object_keypoints,
+            predicted_object_class_id=class_id,
+            keypoint_confidence_threshold=0.5,
+        )
+        for object_keypoints, class_id in zip(keypoints.tolist(), classes_ids.tolist())
+    ]
+    assert [
+        [Keypoint(**keypoint) for keypoint in object_keypoints]
+        for object_keypoints in result
+    ] == expected_result
+
+
+def test_model_keypoints_batch_to_response_when_metadata_not_available() -> None:
+    # when
+    with pytest.raises(ModelArtefactError):
+        _ = model_keypoints_batch_to_response(
+            keypoints_metadata=None,
+            keypoints=np.zeros((1, 9)),
+            predicted_objects_classes_ids=np.array([0]),
+            keypoint_confidence_threshold=0.0,
+        )
+
+
+def test_model_keypoints_batch_to_array() -> None:
+    # given
+    keypoints_metadata = {
+        0: {0: "nose", 1: "left_eye", 2: "right_eye"},
+        1: {0: "head", 1: "tail"},
+    }
+    keypoints = np.array(
+        [
+            [100, 100, 0.5, 200, 200, 0.2, 300, 300, 0.9],
+            [10, 10, 0.9, 20, 20, 0.8, 0, 0, 0.0],
+        ]
+    )
+
+    # when
+    result = model_keypoints_batch_to_array(
+        keypoints_metadata=keypoints_metadata,
+        keypoints=keypoints,
+        predicted_objects_classes_ids=np.array([0, 1]),
+    )
+
+    # then
+    assert result == [
+        [[100, 100, 0.5], [200, 200, 0.2], [300, 300, 0.9]],
+        [[10, 10, 0.9], [20, 20, 0.8]],
+    ]
+
+
+def test_model_keypoints_batch_to_columns() -> None:
+    # given
+    keypoints_metadata = {
+        0: {0: "nose", 1: "left_eye", 2: "right_eye"},
+        1: {0: "head", 1: "tail"},
+    }
+    keypoints = np.array(
+        [
+            [100, 100, 0.5, 200, 200, 0.2, 300, 300, 0.9],
+            [10, 10, 0.9, 20, 20, 0.8, 0, 0, 0.0],
+        ]
+    )
+
+    # when
+    result = model_keypoints_batch_to_columns(
+        keypoints_metadata=keypoints_metadata,
+        keypoints=keypoints,
+        predicted_objects_classes_ids=np.array([0, 1]),
+        keypoint_confidence_threshold=0.3,
+    )
+
+    # then
+    expected_result = np.array(
+        [
+            [[100, 100, 0.5], [np.nan] * 3, [300, 300, 0.9]],
+            [[10, 10, 0.9], [20, 20, 0.8], [np.nan] * 3],
+        ]
+    )
+    assert np.allclose(result, expected_result, equal_nan=True)
+
+
+def test_model_keypoints_batch_to_columns_when_no_objects_detected() -> None:
+    # when
+    result = model_keypoints_batch_to_columns(
+        keypoints_metadata={0: {0: "nose"}},
+        keypoints=np.zeros((0, 3)),
+        predicted_objects_classes_ids=np.zeros((0,)),
+        keypoint_confidence_threshold=0.0,
+    )
+
+    # then
+    assert result.shape == (0, 1, 3)
@@ -0,0 +1,148 @@
+import numpy as np
+
+from inference.core.models.utils.tiling import (
+    generate_tiles,
+    get_tiles_dims,
+    merge_tiles_predictions,
+    tiled_inference_requested,
+)
+
+
+def test_tiled_inference_requested_when_only_one_dimension_given() -> None:
+    # when
+    result = tiled_inference_requested(slice_width=640, slice_height=None)
+
+    # then
+    assert result is False
+
+
+def test_generate_tiles_when_image_not_divisible_by_slices() -> None:
+    # when
+    result = generate_tiles(
+        image_shape=(300, 1000),
+        slice_wh=(640, 300),
+        overlap_ratio_wh=(0.2, 0.2),
+    )
+
+    # then
+    assert result.tolist() == [[0, 0, 640, 300], [360, 0, 1000, 300]]
+
+
+def test_generate_tiles_spreads_tiles_evenly() -> None:
+    # when
+    result = generate_tiles(
+        image_shape=(100, 1200),
+        slice_wh=(640, 100),
+        overlap_ratio_wh=(0.2, 0.0),
+    )
+
+    # then
+    assert result.tolist() == [
+        [0, 0, 640, 100],
+        [280, 0, 920, 100],
+        [560, 0, 1200, 100],
+    ], "Expected all tiles of full size, with overlap not smaller than requested"
+
+
+def test_generate_tiles_when_slice_larger_than_image() -> None:
+    # when
+    result = generate_tiles(
+        image_shape=(200, 300),
+        slice_wh=(640, 640),
+        overlap_ratio_wh=(0.2, 0.2),
+    )
+
+    # then
+    assert result.tolist() == [[0, 0, 300, 200]]
+
+
+def test_get_tiles_dims() -> None:
+    # when
+    result = get_tiles_dims(tiles=np.array([[10, 20, 110, 70]]))
+
+    # then
+    assert result == [(50, 100)]
+
+
+def test_merge_tiles_predictions() -> None:
+    # given
+    tiles = np.array([[0, 0, 100, 100], [80, 0, 180, 100], [0, 0, 50, 50]])
+    tiles_predictions = [
+        [
+            [80, 10, 100, 30, 0.6, 0.6, 0],  # object cut by the tile border
+            [10, 10, 20, 20, 0.9, 0.9, 0],
+            [12, 12, 22, 22, 0.8, 0.8, 1],
+        ],
+        [[0, 10, 30, 30, 0.7, 0.7, 0]],
+        [],
+    ]
+
+    # when
+    result = merge_tiles_predictions(
+        tiles_predictions=tiles_predictions,
+        tiles=tiles,
+        tiles_images_indices=np.array([0, 0, 1]),
+        images_number=2,
+        iou_threshold=0.5,
+        class_agnostic=False,
+        max_detections=300,
+    )
+
+    # then
+    assert len(result) == 2
+    assert result[0][0].tolist() == [
+        [10, 10, 20, 20, 0.9, 0.9, 0],
+        [12, 12, 22, 22, 0.8, 0.8, 1],
+        [80, 10, 110, 30, 0.7, 0.7, 0],
+    ]
+    assert result[0][1].tolist() == [[0, 1], [0, 2], [1, 0]]
+    assert result[1][0].shape == (0, 7)
+    assert result[1][1].shape == (0, 2)
+
+
+def test_merge_tiles_predictions_does_not_suppress_predictions_of_the_same_tile() -> (
+    None
+):
+    # given
+    tiles_predictions = [
+        [
+            [10, 10, 50, 50, 0.9, 0.9, 0],
+            [20, 20, 30, 30, 0.8, 0.8, 0],
+        ],
+    ]
+
+    # when
+    result = merge_tiles_predictions(
+        tiles_predictions=tiles_predictions,
+        tiles=np.array([[0, 0, 100, 100]]),
+        tiles_images_indices=np.array([0]),
+        images_number=1,
+        iou_threshold=0.5,
+        class_agnostic=False,
+        max_detections=300,
+    )
+
+    # then
+    assert len(result[0][0]) == 2
+
+
+def test_merge_tiles_predictions_when_keypoints_given() -> None:
+    # given
+    tiles_predictions = [[[10, 10, 20, 20, 0.9, 0.9, 0, 15, 15, 0.5, 16, 16, 0.6]]]
+
+    # when
+    result = merge_tiles_predictions(
+        tiles_predictions=tiles_predictions,
+        tiles=np.array([[100, 200, 300, 400]]),
+        tiles_images_indices=np.array([0]),
+        images_number=1,
+        iou_threshold=0.5,
+        class_agnostic=False,
+        max_detections=300,
+        keypoints_start_index=7,
+    )
+
+    # then
+    assert result[0][0].tolist() == [
+        [110, 210, 120, 220, 0.9, 0.9, 0, 115, 215, 0.5, 116, 216, 0.6]
+    ]
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from inference.core.nms import np_detections_non_max_suppression
+
+
+def test_np_detections_non_max_suppression_when_no_detections_given() -> None:
+    # when
+    result = np_detections_non_max_suppression(np.zeros((0, 7)))
+
+    # then
+    assert result.shape == (0,)
+
+
+def test_np_detections_non_max_suppression_is_class_aware() -> None:
+    # given
+    detections = np.array(
+        [
+            [0, 0, 10, 10, 0.5, 0.5, 0],
+            [0, 0, 10, 11, 0.9, 0.9, 0],
+            [0, 0, 10, 10, 0.7, 0.7, 1],
+            [50, 50, 60, 60, 0.6, 0.6, 0],
+        ]
+    )
+
+    # when
+    result = np_detections_non_max_suppression(detections, iou_thresh=0.5)
+
+    # then
+    assert result.tolist() == [1, 2, 3]
+
+
+def test_np_detections_non_max_suppression_when_class_agnostic() -> None:
+    # given
+    detections = np.array(
+        [
+            [0, 0, 10, 10, 0.5, 0.5, 0],
+            [0, 0, 10, 11, 0.9, 0.9, 0],
+            [0, 0, 10, 10, 0.7, 0.7, 1],
+        ]
+    )
+
+    # when
+    result = np_detections_non_max_suppression(
+        detections, iou_thresh=0.5, class_agnostic=True
+    )
+
+    # then
+    assert result.tolist() == [1]
+
+
+def test_np_detections_non_max_suppression_when_intersection_over_smaller_used() -> (
+    None
+):
+    # given
+    detections = np.array(
+        [
+            [0, 0, 100, 100, 0.9, 0.9, 0],
+            [0, 0, 20, 20, 0.8, 0.8, 0],
+        ]
+    )
+
+    # when
+    iou_result = np_detections_non_max_suppression(detections, iou_thresh=0.5)
+    ios_result = np_detections_non_max_suppression(
+        detections, iou_thresh=0.5, match_metric="ios"
+    )
+
+    # then
+    assert iou_result.tolist() == [0, 1]
+    assert ios_result.tolist() == [0]
+
+
+def test_np_detections_non_max_suppression_when_groups_given() -> None:
+    # given
+    detections = np.array(
+        [
+            [0, 0, 10, 10, 0.9, 0.9, 0],
+            [0, 0, 10, 10, 0.8, 0.8, 0],
+            [0, 0, 10, 10, 0.7, 0.7, 0],
+        ]
+    )
+
+    # when
+    result = np_detections_non_max_suppression(
+        detections, iou_thresh=0.5, groups=np.array([0, 0, 1])
+    )
+
+    # then
+    assert result.tolist() == [0, 1]
+
+
+def test_np_detections_non_max_suppression_respects_max_detections() -> None:
+    # given
+    detections = np.array(
+        [
+            [0, 0, 10, 10, 0.5, 0.5, 0],
+            [20, 20, 30, 30, 0.9, 0.9, 0],
+            [40, 40, 50, 50, 0.7, 0.7, 0],
+        ]
+    )
+
+    # when
+    result = np_detections_non_max_suppression(detections, max_detections=2)
+
+    # then
+    assert result.tolist() == [1, 2]
+
+
+def test_np_detections_non_max_suppression_when_invalid_metric_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = np_detections_non_max_suppression(np.zeros((1, 7)), match_metric="invalid")
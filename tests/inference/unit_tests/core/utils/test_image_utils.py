@@ -1,4 +1,5 @@
 import io
+import os
 import pickle
 from typing import Any
 from unittest import mock
@@ -6,6 +7,7 @@ from unittest.mock import MagicMock
 
 import cv2
 import numpy as np
+import pybase64
 import pytest
 from _pytest.fixtures import FixtureRequest
 from PIL import Image
@@ -20,15 +22,19 @@ from inference.core.exceptions import (
 )
 from inference.core.utils import image_utils
 from inference.core.utils.image_utils import (
+    DecodingSizeHint,
     ImageType,
     attempt_loading_image_from_string,
+    choose_decoding_reduction_factor,
     choose_image_decoding_flags,
     convert_gray_image_to_bgr,
     extract_image_payload_and_type,
+    get_jpeg_image_size,
     load_image,
     load_image_base64,
     load_image_from_buffer,
     load_image_from_encoded_bytes,
+    load_image_from_file,
     load_image_from_numpy_str,
     load_image_from_url,
     load_image_rgb,
@@ -452,7 +458,7 @@ def test_load_image_with_inferred_type_when_value_is_url(
     assert result[0] is load_image_from_url_mock.return_value
     assert result[1] is True
     load_image_from_url_mock.assert_called_once_with(
-        value=url, cv_imread_flags=cv2.IMREAD_COLOR
+        value=url, cv_imread_flags=cv2.IMREAD_COLOR, size_hint=None
     )
 
 
@@ -485,6 +491,7 @@ def test_load_image_with_inferred_type_when_value_is_unknown_and_should_be_tried
     attempt_loading_image_from_string_mock.assert_called_once_with(
         value=value,
         cv_imread_flags=cv2.IMREAD_COLOR,
+        size_hint=None,
     )
 
 
@@ -736,7 +743,9 @@ def test_load_image_with_known_type_when_load_from_url_succeeds(
     # then
     assert result[1] is True
     assert result[0] == url_loader_mock.return_value
-    url_loader_mock.assert_called_once_with("http://some/image.jpg", cv2.IMREAD_COLOR)
+    url_loader_mock.assert_called_once_with(
+        "http://some/image.jpg", cv2.IMREAD_COLOR, None
+    )
 
 
 @mock.patch.object(image_utils, "IMAGE_LOADERS")
@@ -955,3 +964,171 @@ def test_load_image_rgb_on_rgb_image(load_image_mock: MagicMock) -> None:
     assert result.shape == (128, 128, 3)
     assert np.all(result[:, :, 0] == 1)
     assert np.all(result[:, :, -1] == 255)
+
+
+def _encode_jpeg(image: np.ndarray, exif_orientation: int = 1) -> bytes:
+    pil_image = Image.fromarray(image[:, :, ::-1])
+    exif = pil_image.getexif()
+    exif[0x0112] = exif_orientation
+    with io.BytesIO() as buffer:
+        pil_image.save(buffer, format="JPEG", exif=exif)
+        return buffer.getvalue()
+
+
+def test_get_jpeg_image_size_when_bytes_are_not_jpeg(
+    image_as_png_bytes: bytes,
+) -> None:
+    # when
+    result = get_jpeg_image_size(image_np=np.frombuffer(image_as_png_bytes, np.uint8))
+
+    # then
+    assert result is None
+
+
+@pytest.mark.parametrize(
+    "apply_orientation, expected_result", [(True, (200, 100)), (False, (100, 200))]
+)
+def test_get_jpeg_image_size_when_exif_orientation_transposes_image(
+    apply_orientation: bool,
+    expected_result: tuple,
+) -> None:
+    # given
+    encoded = _encode_jpeg(np.zeros((100, 200, 3), dtype=np.uint8), exif_orientation=6)
+
+    # when
+    result = get_jpeg_image_size(
+        image_np=np.frombuffer(encoded, np.uint8),
+        apply_orientation=apply_orientation,
+    )
+
+    # then
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "image_size, size_hint, expected_result",
+    [
+        ((3000, 4000), DecodingSizeHint(height=640, width=640), 4),
+        ((3000, 4000), DecodingSizeHint(height=300, width=300), 8),
+        ((1000, 1000), DecodingSizeHint(height=640, width=640), 1),
+        (
+            (3000, 4000),
+            DecodingSizeHint(
+                height=640, width=640, resize_method="Fit (black edges) in"
+            ),
+            4,
+        ),
+        (
+            (3000, 4000),
+            DecodingSizeHint(
+                height=720, width=720, resize_method="Fit (grey edges) in"
+            ),
+            4,
+        ),
+        ((3002, 4000), DecodingSizeHint(height=640, width=640), 2),
+        ((3001, 4000), DecodingSizeHint(height=640, width=640), 1),
+        (
+            (3000, 4000),
+            DecodingSizeHint(
+                height=640,
+                width=640,
+                static_crop={"x_min": 10, "y_min": 10, "x_max": 60, "y_max": 60},
+            ),
+            2,
+        ),
+    ],
+)
+def test_choose_decoding_reduction_factor(
+    image_size: tuple,
+    size_hint: DecodingSizeHint,
+    expected_result: int,
+) -> None:
+    # when
+    result = choose_decoding_reduction_factor(
+        image_size=image_size, size_hint=size_hint
+    )
+
+    # then
+    assert result == expected_result
+
+
+def test_load_image_from_encoded_bytes_when_jpeg_can_be_decoded_in_reduced_resolution() -> (
+    None
+):
+    # given
+    image = np.zeros((400, 800, 3), dtype=np.uint8)
+    image[100:300, 200:600] = 255
+    size_hint = DecodingSizeHint(height=100, width=100)
+
+    # when
+    result = load_image_from_encoded_bytes(
+        value=_encode_jpeg(image=image), size_hint=size_hint
+    )
+
+    # then
+    assert size_hint.reduction_factor == 4
+    assert result.shape == (100, 200, 3)
+    assert np.all(result[30:70, 55:145] > 200)
+    assert np.all(result[:20] < 50)
+
+
+def test_load_image_from_encoded_bytes_when_reduced_decoding_respects_auto_orient() -> (
+    None
+):
+    # given
+    encoded = _encode_jpeg(np.zeros((400, 800, 3), dtype=np.uint8), exif_orientation=6)
+    size_hint = DecodingSizeHint(height=100, width=100)
+
+    # when
+    result = load_image_from_encoded_bytes(value=encoded, size_hint=size_hint)
+
+    # then
+    assert size_hint.reduction_factor == 4
+    assert result.shape == (200, 100, 3)
+
+
+def test_load_image_from_encoded_bytes_when_png_given_with_size_hint(
+    image_as_png_bytes: bytes,
+    image_as_numpy: np.ndarray,
+) -> None:
+    # given
+    size_hint = DecodingSizeHint(height=1, width=1)
+
+    # when
+    result = load_image_from_encoded_bytes(
+        value=image_as_png_bytes, size_hint=size_hint
+    )
+
+    # then
+    assert size_hint.reduction_factor == 1
+    assert np.allclose(result, image_as_numpy)
+
+
+def test_load_image_when_base64_jpeg_given_with_size_hint() -> None:
+    # given
+    encoded = pybase64.b64encode(_encode_jpeg(np.zeros((64, 64, 3), dtype=np.uint8)))
+    request = InferenceRequestImage(value=encoded, type=ImageType.BASE64)
+    size_hint = DecodingSizeHint(height=16, width=16)
+
+    # when
+    result, is_bgr = load_image(value=request, size_hint=size_hint)
+
+    # then
+    assert is_bgr is True
+    assert size_hint.reduction_factor == 4
+    assert result.shape == (16, 16, 3)
+
+
+def test_load_image_from_file_when_size_hint_given(empty_local_dir: str) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "image.jpg")
+    with open(path, "wb") as f:
+        f.write(_encode_jpeg(np.zeros((64, 128, 3), dtype=np.uint8)))
+    size_hint = DecodingSizeHint(height=32, width=32)
+
+    # when
+    result = load_image_from_file(value=path, size_hint=size_hint)
+
+    # then
+    assert size_hint.reduction_factor == 2
+    assert result.shape == (32, 64, 3)
@@ -1,6 +1,7 @@
 from contextlib import ExitStack as DoesNotRaise
 from typing import Any, Dict, List, Tuple
 
+import cv2
 import numpy as np
 import pytest
 
@@ -8,17 +9,30 @@ from inference.core.exceptions import PostProcessingError
 from inference.core.utils.postprocess import (
     clip_boxes_coordinates,
     clip_keypoints_coordinates,
+    concatenate_polygons,
     cosine_similarity,
     crop_mask,
+    get_bbox_pixels_roi,
+    get_origin_to_mask_transform,
     get_static_crop_dimensions,
+    mask_crop2rle,
+    mask_crops2poly,
+    masks2poly,
     post_process_bboxes,
     post_process_keypoints,
     post_process_polygons,
+    post_process_polygons_batch,
+    process_mask_accurate,
+    process_mask_accurate_roi,
+    resize_mask_roi,
+    rle_counts2string,
     scale_bboxes,
     scale_polygons,
+    select_top_classes,
     shift_bboxes,
     shift_keypoints,
     sigmoid,
+    split_polygons,
     standardise_static_crop,
     stretch_bboxes,
     stretch_keypoints,
@@ -96,6 +110,150 @@ def test_crop_mask() -> None:
     assert np.allclose(result, expected_result)
 
 
+def test_process_mask_accurate_roi_matches_full_size_masks() -> None:
+    # given
+    rng = np.random.default_rng(seed=42)
+    protos = rng.normal(size=(32, 120, 160)).astype(np.float32)
+    masks_in = rng.normal(size=(20, 32)).astype(np.float32) * 0.3
+    x_min = rng.uniform(-10, 500, size=20)
+    y_min = rng.uniform(-10, 380, size=20)
+    bboxes = np.stack(
+        [
+            x_min,
+            y_min,
+            x_min + rng.uniform(1, 250, size=20),
+            y_min + rng.uniform(1, 250, size=20),
+        ],
+        axis=1,
+    )
+    expected_masks = process_mask_accurate(
+        protos=protos, masks_in=masks_in, bboxes=bboxes.copy(), shape=(480, 640)
+    )
+
+    # when
+    result = process_mask_accurate_roi(
+        protos=protos, masks_in=masks_in, bboxes=bboxes, shape=(480, 640)
+    )
+
+    # then
+    assert len(result) == 20
+    for expected_mask, (crop, (x, y)) in zip(expected_masks, result):
+        mask = np.zeros((480, 640), dtype=bool)
+        mask[y : y + crop.shape[0], x : x + crop.shape[1]] = crop
+        assert np.array_equal(mask, expected_mask > 0)
+    for expected_polygon, polygon in zip(
+        masks2poly(expected_masks), mask_crops2poly(result)
+    ):
+        assert np.allclose(polygon, expected_polygon)
+
+
+def test_get_bbox_pixels_roi_when_bbox_exceeds_image() -> None:
+    # when
+    result = get_bbox_pixels_roi(
+        bbox=np.array([-5.5, 10.2, 700.0, 20.0]), shape=(480, 640)
+    )
+
+    # then
+    assert result == (0, 11, 640, 20)
+
+
+def test_resize_mask_roi_matches_linear_resize() -> None:
+    # given
+    mask = np.random.default_rng(seed=42).random((40, 30)).astype(np.float32)
+    expected_result = cv2.resize(mask, (90, 160), interpolation=cv2.INTER_LINEAR)
+
+    # when
+    result = resize_mask_roi(
+        mask=mask, roi=(10, 20, 90, 100), scale_x=30 / 90, scale_y=40 / 160
+    )
+
+    # then
+    assert np.allclose(result, expected_result[20:100, 10:90], atol=1e-5)
+
+
+def test_get_origin_to_mask_transform_for_letterbox_and_static_crop() -> None:
+    # given
+    preproc = {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 50,
+            "y_min": 0,
+            "x_max": 100,
+            "y_max": 100,
+        }
+    }
+
+    # when
+    result = get_origin_to_mask_transform(
+        origin_shape=(200, 400),
+        infer_shape=(640, 640),
+        mask_shape=(160, 160),
+        preproc=preproc,
+        resize_method="Fit (black edges) in",
+    )
+
+    # then
+    # cropped image 200x200 is scaled by 3.2 into inference space, which is 4x larger than masks
+    assert np.allclose(result, (0.8, 0.8, -160.0, 0.0))
+
+
+def test_get_origin_to_mask_transform_for_not_supported_resize() -> None:
+    # when
+    with pytest.raises(PostProcessingError):
+        _ = get_origin_to_mask_transform(
+            origin_shape=(200, 400),
+            infer_shape=(640, 640),
+            mask_shape=(160, 160),
+            preproc={},
+            resize_method="Center Crop",
+        )
+
+
+def test_mask_crop2rle() -> None:
+    # given
+    crop = np.array([[0, 1], [1, 1]], dtype=bool)
+    mask = np.zeros((3, 4), dtype=bool)
+    mask[1:3, 2:4] = crop
+    flat_mask = mask.flatten(order="F")
+    expected_boundaries = np.flatnonzero(np.diff(flat_mask.astype(np.int8))) + 1
+
+    # when
+    result = mask_crop2rle(crop=crop, offset=(2, 1), shape=(3, 4))
+
+    # then
+    assert np.array_equal(np.cumsum(result)[:-1], expected_boundaries)
+    assert sum(result) == 12
+    assert result == [8, 1, 1, 2]
+
+
+def test_mask_crop2rle_when_mask_is_empty() -> None:
+    # when
+    result = mask_crop2rle(
+        crop=np.zeros((2, 2), dtype=bool), offset=(0, 0), shape=(3, 4)
+    )
+
+    # then
+    assert result == [12]
+
+
+def test_mask_crop2rle_when_runs_span_whole_columns() -> None:
+    # when
+    result = mask_crop2rle(
+        crop=np.ones((3, 2), dtype=bool), offset=(1, 0), shape=(3, 4)
+    )
+
+    # then
+    assert result == [3, 6, 3]
+
+
+def test_rle_counts2string() -> None:
+    # when
+    result = rle_counts2string(counts=[7, 1, 1, 3, 100])
+
+    # then
+    assert result == "7112S3"
+
+
 def test_standardise_static_crop() -> None:
     # when
     result = standardise_static_crop(
@@ -856,3 +1014,209 @@ def test_post_process_keypoints_when_crop_was_taken_and_fit_to_padding_method_us
 
     # then
     assert np.allclose(np.array(result), expected_result)
+
+
+def test_post_process_keypoints_when_batch_of_images_with_different_sizes_provided() -> (
+    None
+):
+    # given
+    predictions = [
+        [[0, 1, 2, 3, 4, 5, 6, 32, 32, 0.8, 48, 48, 0.9, 96, 64, 0.8]],
+        [],
+        [
+            [0, 1, 2, 3, 4, 5, 6, 32, 32, 0.8, 48, 48, 0.9, 96, 64, 0.8],
+            [0, 1, 2, 3, 4, 5, 6, 0, 16, 0.7, 128, 8, 0.6, 64, 32, 0.5],
+        ],
+    ]
+    # first image: scaled 0.25x, leaving 32px padding on OX each side
+    # third image: scaled 0.5x, leaving 16px padding on OY each side
+    expected_result = [
+        [[0, 1, 2, 3, 4, 5, 6, 0, 128, 0.8, 64, 192, 0.9, 256, 256, 0.8]],
+        [],
+        [
+            [0, 1, 2, 3, 4, 5, 6, 64, 32, 0.8, 96, 64, 0.9, 192, 64, 0.8],
+            [0, 1, 2, 3, 4, 5, 6, 0, 0, 0.7, 256, 0, 0.6, 128, 32, 0.5],
+        ],
+    ]
+
+    # when
+    result = post_process_keypoints(
+        predictions=predictions,
+        keypoints_start_index=7,
+        infer_shape=(64, 128),
+        img_dims=[(256, 256), (200, 100), (64, 256)],
+        preproc={},
+        resize_method="Fit (black edges) in",
+    )
+
+    # then
+    assert len(result) == 3
+    assert np.allclose(np.array(result[0]), np.array(expected_result[0]))
+    assert result[1] == []
+    assert np.allclose(np.array(result[2]), np.array(expected_result[2]))
+
+
+def test_select_top_classes_when_no_limits_given() -> None:
+    # given
+    scores = np.array([[0.1, 0.5, 0.2, 0.2], [0.4, 0.3, 0.2, 0.1]])
+
+    # when
+    result = select_top_classes(scores=scores)
+
+    # then
+    assert [r.tolist() for r in result] == [[1, 2, 3, 0], [0, 1, 2, 3]]
+
+
+def test_select_top_classes_when_top_k_given() -> None:
+    # given
+    scores = np.array([[0.1, 0.2, 0.3, 0.3, 0.1], [0.4, 0.3, 0.2, 0.1, 0.0]])
+
+    # when
+    result = select_top_classes(scores=scores, top_k=2)
+
+    # then
+    assert [r.tolist() for r in result] == [[2, 3], [0, 1]]
+
+
+def test_select_top_classes_when_top_k_cuts_ties() -> None:
+    # given
+    scores = np.array([[0.1, 0.3, 0.3, 0.3]])
+
+    # when
+    result = select_top_classes(scores=scores, top_k=2)
+
+    # then
+    assert [r.tolist() for r in result] == [[1, 2]]
+
+
+def test_select_top_classes_when_confidence_threshold_given() -> None:
+    # given
+    scores = np.array([[0.1, 0.6, 0.2, 0.9], [0.1, 0.1, 0.2, 0.3]])
+
+    # when
+    result = select_top_classes(scores=scores, top_k=5, confidence_threshold=0.5)
+
+    # then
+    assert [r.tolist() for r in result] == [[3, 1], []]
+
+
+def test_post_process_bboxes_when_batch_contains_images_without_predictions() -> None:
+    # given
+    predictions = [
+        [[16, 16, 48, 48, 0.9, 0.9, 1]],
+        [],
+        [[0, 0, 64, 32, 0.8, 0.8, 0], [-8, 8, 72, 70, 0.7, 0.7, 1]],
+    ]
+
+    # when
+    result = post_process_bboxes(
+        predictions=predictions,
+        infer_shape=(64, 64),
+        img_dims=[(128, 128), (10, 10), (64, 256)],
+        preproc={},
+        resize_method="Fit (black edges) in",
+    )
+
+    # then
+    assert result[0] == [[32, 32, 96, 96, 0.9, 0.9, 1]]
+    assert result[1] == []
+    # 256x64 image is letterboxed into 64x16 region with 24px of padding along OY
+    assert result[2] == [
+        [0, 0, 256, 32, 0.8, 0.8, 0],
+        [0, 0, 256, 64, 0.7, 0.7, 1],
+    ]
+
+
+def test_concatenate_polygons_and_split_polygons() -> None:
+    # given
+    polygons = [
+        [np.array([[1, 2], [3, 4]]), np.array([[5, 6], [7, 8], [9, 10]])],
+        [],
+        [[(11, 12)]],
+    ]
+
+    # when
+    points, polygons_counts, points_counts = concatenate_polygons(polygons=polygons)
+    split_result = split_polygons(points=points, counts=points_counts)
+
+    # then
+    assert points.shape == (6, 2)
+    assert polygons_counts == [2, 0, 1]
+    assert points_counts == [2, 3, 1]
+    assert [polygon.tolist() for polygon in split_result] == [
+        [[1, 2], [3, 4]],
+        [[5, 6], [7, 8], [9, 10]],
+        [[11, 12]],
+    ]
+
+
+def test_post_process_polygons_batch_when_images_of_different_sizes_given() -> None:
+    # given
+    polygons = [
+        [np.array([[10, 10], [20, 20], [10, 20]], dtype=np.float32)],
+        [],
+        [
+            np.array([[25, 20], [35, 30]], dtype=np.float32),
+            np.zeros((0, 2), dtype=np.float32),
+            np.array([[75, 70]], dtype=np.float32),
+        ],
+    ]
+    img_dims = [(100, 100), (50, 50), (200, 100)]
+    preproc = {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 10,
+            "y_min": 10,
+            "x_max": 90,
+            "y_max": 90,
+        }
+    }
+
+    # when
+    result = post_process_polygons_batch(
+        polygons=polygons,
+        img_dims=img_dims,
+        infer_shape=(100, 100),
+        preproc=preproc,
+        resize_method="Fit (black edges) in",
+    )
+
+    # then
+    assert [len(image_polygons) for image_polygons in result] == [1, 0, 3]
+    for image_polygons, image_result, img_dim in zip(polygons, result, img_dims):
+        expected_result = post_process_polygons(
+            origin_shape=img_dim,
+            polys=image_polygons,
+            infer_shape=(100, 100),
+            preproc=preproc,
+            resize_method="Fit (black edges) in",
+        )
+        for polygon, expected_polygon in zip(image_result, expected_result):
+            assert np.allclose(polygon, expected_polygon)
+    assert np.allclose(result[2][0], [[10, 52], [26, 68]])
+    assert result[2][1].shape == (0, 2)
+
+
+def test_post_process_polygons_batch_when_static_crop_disabled() -> None:
+    # given
+    polygons = [[np.array([[10, 20], [30, 40]])]]
+
+    # when
+    result = post_process_polygons_batch(
+        polygons=polygons,
+        img_dims=[(200, 100)],
+        infer_shape=(100, 100),
+        preproc={
+            "static-crop": {
+                "enabled": True,
+                "x_min": 10,
+                "y_min": 10,
+                "x_max": 90,
+                "y_max": 90,
+            }
+        },
+        disable_preproc_static_crop=True,
+    )
+
+    # then
+    assert np.allclose(result[0][0], [[10, 40], [30, 80]])
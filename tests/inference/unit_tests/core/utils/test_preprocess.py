@@ -1,6 +1,7 @@
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
@@ -11,7 +12,10 @@ from inference.core.utils.preprocess import (
     apply_contrast_adjustment,
     contrast_adjustments_should_be_applied,
     grayscale_conversion_should_be_applied,
+    image_to_model_input,
+    letterbox_image,
     prepare,
+    select_resize_interpolation,
     static_crop_should_be_applied,
     take_static_crop,
 )
@@ -296,3 +300,117 @@ def test_prepare_when_misconfiguration_error_is_encountered(
             image=np.zeros((128, 128, 3), dtype=np.uint8),
             preproc={"static-crop": {"enabled": True}},
         )
+
+
+@mock.patch.object(preprocess, "DISABLE_PREPROC_CONTRAST", False)
+@mock.patch.object(preprocess, "DISABLE_PREPROC_GRAYSCALE", False)
+@mock.patch.object(preprocess, "apply_grayscale_conversion")
+def test_prepare_when_contrast_equalisation_already_made_image_grayscale(
+    apply_grayscale_conversion_mock: MagicMock,
+) -> None:
+    # given
+    image = np.random.default_rng(42).integers(0, 256, (64, 64, 3), dtype=np.uint8)
+
+    # when
+    result, img_dims = prepare(
+        image=image,
+        preproc={
+            "contrast": {"enabled": True, "type": "Histogram Equalization"},
+            "grayscale": {"enabled": True},
+        },
+    )
+
+    # then
+    apply_grayscale_conversion_mock.assert_not_called()
+    assert img_dims == (64, 64)
+    assert np.all(result[:, :, 0] == result[:, :, 1])
+    assert np.all(result[:, :, 0] == result[:, :, 2])
+
+
+@pytest.mark.parametrize(
+    "interpolation, image_shape, expected_result",
+    [
+        ("nearest", (1000, 1000, 3), cv2.INTER_NEAREST),
+        ("cubic", (1000, 1000, 3), cv2.INTER_CUBIC),
+        ("auto", (2000, 1000, 3), cv2.INTER_AREA),
+        ("auto", (800, 800, 3), cv2.INTER_LINEAR),
+        ("auto", (320, 320, 3), cv2.INTER_CUBIC),
+    ],
+)
+def test_select_resize_interpolation(
+    interpolation: str, image_shape: tuple, expected_result: int
+) -> None:
+    # when
+    result = select_resize_interpolation(
+        interpolation=interpolation,
+        image_shape=image_shape,
+        desired_size=(640, 640),
+    )
+
+    # then
+    assert result == expected_result
+
+
+def test_select_resize_interpolation_when_interpolation_is_not_known() -> None:
+    # when
+    with pytest.raises(PreProcessingError):
+        _ = select_resize_interpolation(
+            interpolation="invalid",
+            image_shape=(100, 100, 3),
+            desired_size=(640, 640),
+        )
+
+
+@pytest.mark.parametrize(
+    "image_shape", [(100, 300, 3), (300, 100, 3), (100, 300), (100, 300, 4)]
+)
+def test_letterbox_image(image_shape: tuple) -> None:
+    # given
+    image = np.random.default_rng(42).integers(0, 256, image_shape, dtype=np.uint8)
+    resized = cv2.resize(image, (200, 66) if image_shape[1] > 100 else (66, 200))
+    vertical, horizontal = (67, 67) if image_shape[1] > 100 else (0, 0)
+    expected_result = cv2.copyMakeBorder(
+        resized,
+        vertical,
+        200 - resized.shape[0] - vertical,
+        (200 - resized.shape[1]) // 2,
+        200 - resized.shape[1] - (200 - resized.shape[1]) // 2,
+        cv2.BORDER_CONSTANT,
+        value=(114, 100, 50),
+    )
+
+    # when
+    result = letterbox_image(image=image, desired_size=(200, 200), color=(114, 100, 50))
+
+    # then
+    assert result.shape == expected_result.shape
+    assert np.array_equal(result, expected_result)
+
+
+def test_image_to_model_input_when_bgr_image_given() -> None:
+    # given
+    image = np.zeros((20, 30, 3), dtype=np.uint8)
+    image[:, :, 0] = 10
+
+    # when
+    result = image_to_model_input(image=image, is_bgr=True)
+
+    # then
+    assert result.shape == (1, 3, 20, 30)
+    assert result.dtype == np.float32
+    assert np.all(result[0, 2] == 10)
+    assert np.all(result[0, :2] == 0)
+
+
+def test_image_to_model_input_when_grayscale_conversion_requested() -> None:
+    # given
+    image = np.random.default_rng(42).integers(0, 256, (20, 30, 3), dtype=np.uint8)
+    expected_channel = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    # when
+    result = image_to_model_input(image=image, is_bgr=True, grayscale=True)
+
+    # then
+    assert result.shape == (1, 3, 20, 30)
+    for channel in range(3):
+        assert np.array_equal(result[0, channel], expected_channel)
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from inference.core.utils import preprocessing_cache
+from inference.core.utils.preprocessing_cache import (
+    RequestPreprocessingCache,
+    bind_request_preprocessing_cache,
+    get_request_preprocessing_cache,
+    request_preprocessing_cache_scope,
+)
+
+
+def test_get_or_compute_when_value_not_cached() -> None:
+    # given
+    cache = RequestPreprocessingCache()
+    image = np.zeros((10, 10, 3), dtype=np.uint8)
+    compute = MagicMock(return_value="value")
+
+    # when
+    first_result = cache.get_or_compute(image=image, key="key", compute=compute)
+    second_result = cache.get_or_compute(image=image, key="key", compute=compute)
+
+    # then
+    assert first_result == "value"
+    assert second_result == "value"
+    compute.assert_called_once()
+
+
+def test_get_or_compute_when_different_keys_used() -> None:
+    # given
+    cache = RequestPreprocessingCache()
+    image = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    # when
+    first_result = cache.get_or_compute(image=image, key="a", compute=lambda: 1)
+    second_result = cache.get_or_compute(image=image, key="b", compute=lambda: 2)
+
+    # then
+    assert (first_result, second_result) == (1, 2)
+    assert len(cache) == 2
+
+
+def test_get_when_numpy_images_of_equal_content_given() -> None:
+    # given
+    cache = RequestPreprocessingCache()
+    image = np.zeros((10, 10, 3), dtype=np.uint8)
+    cache.set(image=image, key="key", value="value")
+
+    # when
+    result_for_the_same_image = cache.get(image=image, key="key")
+    result_for_equal_image = cache.get(image=image.copy(), key="key")
+
+    # then
+    assert result_for_the_same_image == "value"
+    assert result_for_equal_image is None, "Expected numpy images matched by identity"
+
+
+def test_get_when_encoded_images_of_equal_content_given() -> None:
+    # given
+    cache = RequestPreprocessingCache()
+    cache.set(image={"type": "base64", "value": "aGVsbG8="}, key="key", value="value")
+
+    # when
+    result = cache.get(
+        image={"type": "base64", "value": "".join(["aGVs", "bG8="])}, key="key"
+    )
+
+    # then
+    assert result == "value", "Expected encoded images matched by content"
+
+
+def test_request_preprocessing_cache_scope_when_scopes_nested() -> None:
+    # when
+    with request_preprocessing_cache_scope() as outer_cache:
+        with request_preprocessing_cache_scope() as inner_cache:
+            pass
+        cache_after_inner_scope = get_request_preprocessing_cache()
+
+    # then
+    assert outer_cache is not None
+    assert inner_cache is outer_cache
+    assert cache_after_inner_scope is outer_cache
+    assert get_request_preprocessing_cache() is None
+
+
+@mock.patch.object(preprocessing_cache, "REQUEST_PREPROCESSING_CACHE_ENABLED", False)
+def test_request_preprocessing_cache_scope_when_cache_disabled() -> None:
+    # when
+    with request_preprocessing_cache_scope() as cache:
+        cache_in_scope = get_request_preprocessing_cache()
+
+    # then
+    assert cache is None
+    assert cache_in_scope is None
+
+
+def test_bind_request_preprocessing_cache_when_function_run_in_threads() -> None:
+    # given
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with request_preprocessing_cache_scope() as cache:
+            # when
+            not_bound_results = list(
+                executor.map(lambda _: get_request_preprocessing_cache(), range(2))
+            )
+            bound_results = list(
+                executor.map(
+                    bind_request_preprocessing_cache(
+                        lambda _: get_request_preprocessing_cache()
+                    ),
+                    range(2),
+                )
+            )
+
+    # then
+    assert not_bound_results == [None, None]
+    assert bound_results == [cache, cache]
+
+
+def test_bind_request_preprocessing_cache_when_no_cache_active() -> None:
+    # given
+    function = MagicMock()
+
+    # when
+    result = bind_request_preprocessing_cache(function)
+
+    # then
+    assert result is function
@@ -0,0 +1,238 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List
+from unittest import mock
+
+import cv2
+import numpy as np
+import pytest
+import requests
+
+from inference.core.exceptions import InputImageLoadError
+from inference.core.utils import image_utils, url_images
+from inference.core.utils.image_utils import load_image_from_url
+from inference.core.utils.url_images import (
+    URLImagesBytesCache,
+    fetch_concurrently,
+    fetch_image_bytes,
+)
+
+IMAGE = np.zeros((32, 48, 3), dtype=np.uint8)
+IMAGE[8:24, 16:32] = 255
+IMAGE_BYTES = cv2.imencode(".png", IMAGE)[1].tobytes()
+
+
+class LocalImagesServer:
+    def __init__(self) -> None:
+        self.requests_paths: List[str] = []
+        self.clients_ports: List[int] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._build_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _build_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.requests_paths.append(self.path)
+                server.clients_ports.append(self.client_address[1])
+                if self.path == "/image.png":
+                    self._respond(body=IMAGE_BYTES)
+                elif self.path == "/large-declared":
+                    self._respond(body=b"x" * 2048)
+                elif self.path == "/large-streamed":
+                    self.send_response(200)
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    for _ in range(4):
+                        self.wfile.write(b"200\r\n" + b"x" * 512 + b"\r\n")
+                    self.wfile.write(b"0\r\n\r\n")
+                elif self.path == "/slow":
+                    time.sleep(0.5)
+                    self._respond(body=IMAGE_BYTES)
+                else:
+                    self._respond(body=b"not found", status=404)
+
+            def _respond(self, body: bytes, status: int = 200) -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def local_images_server() -> Generator[LocalImagesServer, None, None]:
+    server = LocalImagesServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_fetch_image_bytes_when_resource_exists(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # when
+    result = fetch_image_bytes(url=f"{local_images_server.base_url}/image.png")
+
+    # then
+    assert result == IMAGE_BYTES
+
+
+def test_fetch_image_bytes_reuses_connections(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # when
+    for _ in range(3):
+        _ = fetch_image_bytes(url=f"{local_images_server.base_url}/image.png")
+
+    # then
+    assert len(local_images_server.requests_paths) == 3
+    assert (
+        len(set(local_images_server.clients_ports)) == 1
+    ), "Expected single kept-alive connection to serve all requests"
+
+
+def test_fetch_image_bytes_when_resource_not_found(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # when
+    with pytest.raises(requests.HTTPError):
+        _ = fetch_image_bytes(url=f"{local_images_server.base_url}/missing.png")
+
+
+@mock.patch.object(url_images, "URL_IMAGE_MAX_BYTES", 1024)
+@pytest.mark.parametrize("path", ["/large-declared", "/large-streamed"])
+def test_fetch_image_bytes_when_resource_exceeds_size_limit(
+    local_images_server: LocalImagesServer,
+    path: str,
+) -> None:
+    # when
+    with pytest.raises(InputImageLoadError):
+        _ = fetch_image_bytes(url=f"{local_images_server.base_url}{path}")
+
+
+@mock.patch.object(url_images, "URL_IMAGE_READ_TIMEOUT", 0.1)
+def test_fetch_image_bytes_when_read_timeout_exceeded(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # when
+    with pytest.raises(requests.Timeout):
+        _ = fetch_image_bytes(url=f"{local_images_server.base_url}/slow")
+
+
+def test_fetch_image_bytes_when_cache_enabled(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # given
+    cache = URLImagesBytesCache(ttl=60.0, max_bytes=1024 * 1024)
+    url = f"{local_images_server.base_url}/image.png"
+
+    # when
+    with mock.patch.object(url_images, "URL_IMAGES_CACHE", cache):
+        first_result = fetch_image_bytes(url=url)
+        second_result = fetch_image_bytes(url=url)
+
+    # then
+    assert first_result == second_result == IMAGE_BYTES
+    assert local_images_server.requests_paths == ["/image.png"]
+
+
+def test_urls_images_bytes_cache_when_entry_expired() -> None:
+    # given
+    cache = URLImagesBytesCache(ttl=0.05, max_bytes=1024)
+    cache.set(url="https://some.com/a.jpg", content=b"a")
+
+    # when
+    result_before_expiry = cache.get(url="https://some.com/a.jpg")
+    time.sleep(0.1)
+    result_after_expiry = cache.get(url="https://some.com/a.jpg")
+
+    # then
+    assert result_before_expiry == b"a"
+    assert result_after_expiry is None
+
+
+def test_urls_images_bytes_cache_evicts_least_recently_used_entries() -> None:
+    # given
+    cache = URLImagesBytesCache(ttl=60.0, max_bytes=10)
+    cache.set(url="a", content=b"aaaa")
+    cache.set(url="b", content=b"bbbb")
+    _ = cache.get(url="a")
+
+    # when
+    cache.set(url="c", content=b"cccc")
+
+    # then
+    assert cache.get(url="a") == b"aaaa"
+    assert cache.get(url="b") is None
+    assert cache.get(url="c") == b"cccc"
+
+
+def test_urls_images_bytes_cache_when_disabled() -> None:
+    # given
+    cache = URLImagesBytesCache(ttl=0.0, max_bytes=1024)
+
+    # when
+    cache.set(url="a", content=b"aaaa")
+
+    # then
+    assert cache.enabled is False
+    assert cache.get(url="a") is None
+
+
+def test_fetch_concurrently_preserves_order_and_runs_in_parallel() -> None:
+    # given
+    def fetch(value: int) -> int:
+        time.sleep(0.2)
+        return value * 2
+
+    # when
+    start = time.monotonic()
+    result = fetch_concurrently(fetch, list(range(8)))
+    duration = time.monotonic() - start
+
+    # then
+    assert result == [0, 2, 4, 6, 8, 10, 12, 14]
+    assert duration < 1.0
+
+
+@mock.patch.object(image_utils, "ALLOW_NON_HTTPS_URL_INPUT", True)
+@mock.patch.object(image_utils, "ALLOW_URL_INPUT_WITHOUT_FQDN", True)
+def test_load_image_from_url_when_served_by_local_server(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # when
+    result = load_image_from_url(value=f"{local_images_server.base_url}/image.png")
+
+    # then
+    assert np.array_equal(result, IMAGE)
+
+
+@mock.patch.object(image_utils, "ALLOW_NON_HTTPS_URL_INPUT", True)
+@mock.patch.object(image_utils, "ALLOW_URL_INPUT_WITHOUT_FQDN", True)
+@mock.patch.object(url_images, "URL_IMAGE_MAX_BYTES", 1024)
+def test_load_image_from_url_when_image_exceeds_size_limit(
+    local_images_server: LocalImagesServer,
+) -> None:
+    # when
+    with pytest.raises(InputImageLoadError):
+        _ = load_image_from_url(value=f"{local_images_server.base_url}/large-declared")
@@ -0,0 +1,50 @@
+import json
+import os.path
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.interfaces.stream import parallel_video_processing
+from inference_cli.lib.video_adapter import process_video_with_workflow
+
+
+@mock.patch.object(parallel_video_processing, "get_total_frames")
+@mock.patch.object(parallel_video_processing, "process_video_in_parallel")
+def test_process_video_with_workflow_saves_results_in_frames_order(
+    process_video_in_parallel_mock: MagicMock,
+    get_total_frames_mock: MagicMock,
+    empty_directory: str,
+) -> None:
+    # given
+    get_total_frames_mock.return_value = 2
+
+    def process_video(on_prediction, **kwargs) -> None:
+        on_prediction({"count": 3}, 0)
+        on_prediction({"count": 5}, 1)
+
+    process_video_in_parallel_mock.side_effect = process_video
+    output_location = os.path.join(empty_directory, "results", "video.jsonl")
+
+    # when
+    process_video_with_workflow(
+        video_path="/some/video.mp4",
+        output_location=output_location,
+        workspace_name="my-workspace",
+        workflow_id="my-workflow",
+        max_workers=3,
+        api_key="my-api-key",
+    )
+
+    # then
+    with open(output_location) as f:
+        results = [json.loads(line) for line in f.readlines()]
+    assert results == [
+        {"frame_index": 0, "count": 3},
+        {"frame_index": 1, "count": 5},
+    ]
+    call_kwargs = process_video_in_parallel_mock.call_args[1]
+    assert call_kwargs["max_workers"] == 3
+    assert call_kwargs["api_key"] == "my-api-key"
+    assert (
+        call_kwargs["overlap_frames"]
+        == parallel_video_processing.DEFAULT_OVERLAP_FRAMES
+    )
@@ -37,6 +37,7 @@ from inference_sdk.http.errors import (
     InvalidParameterError,
     ModelNotSelectedError,
     ModelTaskTypeNotSupportedError,
+    ResultsStreamError,
     WrongClientModeError,
 )
 
@@ -4192,6 +4193,74 @@ def test_consume_inference_pipeline_result_when_pipeline_id_not_found(requests_m
         _ = http_client.consume_inference_pipeline_result(pipeline_id="my-pipeline")
 
 
+def test_stream_inference_pipeline_results(requests_mock: Mocker) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.get(
+        f"{api_url}/inference_pipelines/my-pipeline/results_stream",
+        text='event: result\ndata: {"outputs": [1]}\n\n'
+        'event: result\ndata: {"outputs": [2]}\n\n',
+        headers={"Content-Type": "text/event-stream; charset=utf-8"},
+    )
+
+    # when
+    result = list(
+        http_client.stream_inference_pipeline_results(
+            pipeline_id="my-pipeline",
+            excluded_fields=["a"],
+            drop_policy="drop_newest",
+        )
+    )
+
+    # then
+    assert result == [{"outputs": [1]}, {"outputs": [2]}]
+    assert requests_mock.request_history[0].qs == {
+        "api_key": ["my-api-key"],
+        "excluded_fields": ["a"],
+        "drop_policy": ["drop_newest"],
+    }, "Expected query to contain API key and subscription parameters"
+
+
+def test_stream_inference_pipeline_results_when_error_event_received(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.get(
+        f"{api_url}/inference_pipelines/my-pipeline/results_stream",
+        text='event: result\ndata: {"outputs": [1]}\n\n'
+        'event: error\ndata: {"message": "Pipeline terminated"}\n\n',
+        headers={"Content-Type": "text/event-stream; charset=utf-8"},
+    )
+    results = http_client.stream_inference_pipeline_results(pipeline_id="my-pipeline")
+
+    # when
+    first_result = next(results)
+    with pytest.raises(ResultsStreamError):
+        _ = next(results)
+
+    # then
+    assert first_result == {"outputs": [1]}
+
+
+def test_stream_inference_pipeline_results_when_pipeline_id_not_found(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.get(
+        f"{api_url}/inference_pipelines/my-pipeline/results_stream",
+        status_code=404,
+    )
+
+    # when
+    with pytest.raises(HTTPCallErrorError):
+        _ = http_client.stream_inference_pipeline_results(pipeline_id="my-pipeline")
+
+
 def test_start_inference_pipeline_with_workflow_when_configuration_does_not_specify_workflow() -> None:
     # given
     api_url = "http://some.com"
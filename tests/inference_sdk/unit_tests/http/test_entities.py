@@ -1,6 +1,7 @@
 from inference_sdk.http.entities import (
     CLASSIFICATION_TASK,
     DEFAULT_IMAGE_EXTENSIONS,
+    KEYPOINTS_DETECTION_TASK,
     OBJECT_DETECTION_TASK,
     HTTPClientMode,
     InferenceConfiguration,
@@ -156,3 +157,26 @@ def test_to_api_call_parameters_for_api_v1_object_detection() -> None:
         "source": "config-test",
         "source_info": "config-test-source-info",
     }
+
+
+def test_to_api_call_parameters_for_api_v1_keypoints_detection() -> None:
+    # given
+    configuration = InferenceConfiguration(
+        confidence_threshold=0.5,
+        keypoint_confidence_threshold=0.3,
+        keypoints_format="array",
+    )
+
+    # when
+    result = configuration.to_api_call_parameters(
+        client_mode=HTTPClientMode.V1, task_type=KEYPOINTS_DETECTION_TASK
+    )
+
+    # then
+    assert result == {
+        "confidence": 0.5,
+        "keypoint_confidence": 0.3,
+        "keypoints_format": "array",
+        "disable_active_learning": False,
+        "visualize_predictions": False,
+    }
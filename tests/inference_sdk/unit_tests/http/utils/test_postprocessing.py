@@ -20,6 +20,7 @@ from inference_sdk.http.utils.post_processing import (
     adjust_prediction_with_bbox_and_points_to_client_scaling_factor,
     combine_clip_embeddings,
     combine_gaze_detections,
+    decode_columnar_predictions,
     decode_workflow_output_image,
     decode_workflow_outputs,
     filter_model_descriptions,
@@ -716,3 +717,152 @@ def test_filter_model_descriptions_when_input_with_multiple_matches_given() -> N
 
     # then
     assert result == ModelDescription(model_id="some/1", task_type="object-detection")
+
+
+def test_decode_columnar_predictions_when_regular_predictions_given() -> None:
+    # given
+    prediction = {"predictions": [{"class": "a", "confidence": 0.5}]}
+
+    # when
+    result = decode_columnar_predictions(prediction=prediction)
+
+    # then
+    assert result is prediction
+
+
+def test_decode_columnar_predictions_when_detections_with_keypoints_given() -> None:
+    # given
+    prediction = {
+        "image": {"width": 200, "height": 100},
+        "predictions_format": "columnar",
+        "predictions": {
+            "class_id": [1],
+            "class": ["cat"],
+            "confidence": [0.9],
+            "xyxy": [[10.0, 20.0, 30.0, 60.0]],
+            "keypoints": [[[15.0, 25.0, 0.8], [None, None, None]]],
+        },
+        "keypoints_names": {"cat": ["nose", "tail"]},
+    }
+
+    # when
+    result = decode_columnar_predictions(prediction=prediction)
+
+    # then
+    assert isinstance(result["predictions"][0].pop("detection_id"), str)
+    assert result == {
+        "image": {"width": 200, "height": 100},
+        "predictions": [
+            {
+                "x": 20.0,
+                "y": 40.0,
+                "width": 20.0,
+                "height": 40.0,
+                "confidence": 0.9,
+                "class": "cat",
+                "class_id": 1,
+                "keypoints": [
+                    {
+                        "x": 15.0,
+                        "y": 25.0,
+                        "confidence": 0.8,
+                        "class_id": 0,
+                        "class_name": "nose",
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_decode_columnar_predictions_when_polygons_given() -> None:
+    # given
+    prediction = {
+        "predictions_format": "columnar",
+        "predictions": {
+            "class_id": [0],
+            "class": ["cat"],
+            "confidence": [0.9],
+            "xyxy": [[10.0, 20.0, 30.0, 60.0]],
+            "points": [[[10.0, 20.0], [30.0, 60.0]]],
+        },
+    }
+
+    # when
+    result = decode_columnar_predictions(prediction=prediction)
+
+    # then
+    assert result["predictions"][0]["points"] == [
+        {"x": 10.0, "y": 20.0},
+        {"x": 30.0, "y": 60.0},
+    ]
+
+
+def test_decode_columnar_predictions_when_detection_ids_given() -> None:
+    # given
+    prediction = {
+        "predictions_format": "columnar",
+        "predictions": {
+            "class_id": [0, 1],
+            "class": ["cat", "dog"],
+            "confidence": [0.9, 0.8],
+            "xyxy": [[10.0, 20.0, 30.0, 60.0], [0.0, 0.0, 10.0, 10.0]],
+            "detection_id": ["first", "second"],
+        },
+    }
+
+    # when
+    result = decode_columnar_predictions(prediction=prediction)
+
+    # then
+    assert [p["detection_id"] for p in result["predictions"]] == ["first", "second"]
+
+
+def test_decode_columnar_predictions_when_classification_given() -> None:
+    # given
+    prediction = {
+        "predictions_format": "columnar",
+        "predictions": {
+            "class_id": [1, 0],
+            "class": ["dog", "cat"],
+            "confidence": [0.7, 0.3],
+        },
+    }
+
+    # when
+    result = decode_columnar_predictions(prediction=prediction)
+
+    # then
+    assert result == {
+        "predictions": [
+            {"class": "dog", "class_id": 1, "confidence": 0.7},
+            {"class": "cat", "class_id": 0, "confidence": 0.3},
+        ],
+        "top": "dog",
+        "confidence": 0.7,
+    }
+
+
+def test_decode_columnar_predictions_when_multi_label_classification_given() -> None:
+    # given
+    prediction = {
+        "predictions_format": "columnar",
+        "predictions": {
+            "class_id": [0, 1],
+            "class": ["cat", "dog"],
+            "confidence": [0.3, 0.7],
+        },
+        "predicted_classes": ["dog"],
+    }
+
+    # when
+    result = decode_columnar_predictions(prediction=prediction)
+
+    # then
+    assert result == {
+        "predictions": {
+            "cat": {"confidence": 0.3, "class_id": 0},
+            "dog": {"confidence": 0.7, "class_id": 1},
+        },
+        "predicted_classes": ["dog"],
+    }
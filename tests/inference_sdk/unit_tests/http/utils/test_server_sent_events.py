@@ -0,0 +1,28 @@
+from inference_sdk.http.utils.server_sent_events import parse_server_sent_events
+
+
+def test_parse_server_sent_events() -> None:
+    # given
+    lines = [
+        ": keep-alive comment",
+        "event: result",
+        'data: {"a": 1}',
+        "",
+        "",
+        "data: multi",
+        "data:line",
+        "id: 3",
+        "",
+        "event: error",
+        "data: last event without trailing empty line",
+    ]
+
+    # when
+    result = list(parse_server_sent_events(lines=lines))
+
+    # then
+    assert result == [
+        ("result", '{"a": 1}'),
+        (None, "multi\nline"),
+        ("error", "last event without trailing empty line"),
+    ]
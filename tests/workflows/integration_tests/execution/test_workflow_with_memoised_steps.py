@@ -0,0 +1,132 @@
+from unittest import mock
+
+from inference.core.env import WORKFLOWS_MAX_CONCURRENT_STEPS
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.formatters.expression import v1
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.v1 import core
+
+WORKFLOW_WITH_PARAMETERS_ONLY_STEP = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowParameter", "name": "reference"},
+    ],
+    "steps": [
+        {
+            "type": "Expression",
+            "name": "expression",
+            "data": {"reference": "$inputs.reference"},
+            "switch": {
+                "type": "CasesDefinition",
+                "cases": [
+                    {
+                        "type": "CaseDefinition",
+                        "condition": {
+                            "type": "StatementGroup",
+                            "statements": [
+                                {
+                                    "type": "BinaryStatement",
+                                    "left_operand": {
+                                        "type": "DynamicOperand",
+                                        "operand_name": "reference",
+                                    },
+                                    "comparator": {"type": "=="},
+                                    "right_operand": {
+                                        "type": "StaticOperand",
+                                        "value": "a",
+                                    },
+                                }
+                            ],
+                        },
+                        "result": {"type": "StaticCaseResult", "value": "PASS"},
+                    }
+                ],
+                "default": {"type": "StaticCaseResult", "value": "FAIL"},
+            },
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "result",
+            "selector": "$steps.expression.output",
+        }
+    ],
+}
+
+
+def test_workflow_with_parameters_only_step_memoises_step_output_across_runs(
+    model_manager: ModelManager,
+) -> None:
+    """
+    Expression step depends only on workflow parameter, so its output is the same
+    for each video frame - we expect the step to be executed only when the
+    parameter changes.
+    """
+    # given
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_PARAMETERS_ONLY_STEP,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+    )
+
+    # when
+    with mock.patch.object(
+        v1.ExpressionBlockV1,
+        "run",
+        autospec=True,
+        side_effect=v1.ExpressionBlockV1.run,
+    ) as run_mock:
+        results = [
+            execution_engine.run(runtime_parameters={"reference": reference})
+            for reference in ["a", "a", "a", "b", "b", "a"]
+        ]
+
+    # then
+    assert [r[0]["result"] for r in results] == [
+        "PASS",
+        "PASS",
+        "PASS",
+        "FAIL",
+        "FAIL",
+        "PASS",
+    ], "Expected memoisation not to change results"
+    assert (
+        run_mock.call_count == 3
+    ), "Expected step to be executed only when parameter changes"
+
+
+@mock.patch.object(core, "ENABLE_WORKFLOWS_STEPS_OUTPUTS_MEMOISATION", False)
+def test_workflow_with_parameters_only_step_when_memoisation_disabled(
+    model_manager: ModelManager,
+) -> None:
+    # given
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_PARAMETERS_ONLY_STEP,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+    )
+
+    # when
+    with mock.patch.object(
+        v1.ExpressionBlockV1,
+        "run",
+        autospec=True,
+        side_effect=v1.ExpressionBlockV1.run,
+    ) as run_mock:
+        for _ in range(3):
+            execution_engine.run(runtime_parameters={"reference": "a"})
+
+    # then
+    assert run_mock.call_count == 3
@@ -0,0 +1,98 @@
+from unittest import mock
+
+from inference.core.env import WORKFLOWS_MAX_CONCURRENT_STEPS
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WorkflowsMetricsCollector,
+)
+from inference.core.workflows.execution_engine.v1 import core
+
+WORKFLOW_WITH_BATCH_ORIENTED_STEP = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowImage", "name": "image"},
+    ],
+    "steps": [
+        {
+            "type": "AbsoluteStaticCrop",
+            "name": "crop",
+            "image": "$inputs.image",
+            "x_center": 100,
+            "y_center": 100,
+            "width": 50,
+            "height": 50,
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "result",
+            "selector": "$steps.crop.crops",
+        }
+    ],
+}
+
+
+def test_workflow_execution_records_steps_metrics(
+    model_manager: ModelManager,
+    crowd_image,
+) -> None:
+    # given
+    collector = WorkflowsMetricsCollector(measure_resources=True)
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    with mock.patch.object(core, "WORKFLOWS_METRICS_COLLECTOR", collector):
+        execution_engine = ExecutionEngine.init(
+            workflow_definition=WORKFLOW_WITH_BATCH_ORIENTED_STEP,
+            init_parameters=workflow_init_parameters,
+            max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+            workflow_id="my_workflow",
+        )
+
+    # when
+    for _ in range(2):
+        execution_engine.run(runtime_parameters={"image": [crowd_image, crowd_image]})
+    steps_report = collector.get_steps_report()
+    blocks_report = collector.get_blocks_report()
+
+    # then
+    assert len(steps_report) == 1
+    assert steps_report[0].workflow_id == "my_workflow"
+    assert steps_report[0].step_name == "crop"
+    assert steps_report[0].block_type == "roboflow_core/absolute_static_crop@v1"
+    assert (
+        steps_report[0].executions == 2
+    ), "Expected batch-oriented step to be measured once per workflow run"
+    assert steps_report[0].batch_size_mean == 2.0
+    assert steps_report[0].images_bytes == 4 * crowd_image.nbytes
+    assert len(blocks_report) == 1
+    assert blocks_report[0].executions == 2
+
+
+@mock.patch.object(core, "WORKFLOWS_METRICS_COLLECTOR", None)
+def test_workflow_execution_when_steps_metrics_disabled(
+    model_manager: ModelManager,
+    crowd_image,
+) -> None:
+    # given
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_BATCH_ORIENTED_STEP,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+    )
+
+    # when
+    result = execution_engine.run(runtime_parameters={"image": crowd_image})
+
+    # then
+    assert result[0]["result"].numpy_image.shape == (50, 50, 3)
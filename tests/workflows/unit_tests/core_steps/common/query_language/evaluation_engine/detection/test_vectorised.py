@@ -0,0 +1,276 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    StatementGroup,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    compile_eval_function,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.vectorised import (
+    build_detections_mask_function,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.detections.base import (
+    filter_detections,
+)
+
+
+def property_statement(
+    property_name: str,
+    comparator: str,
+    value: Any = None,
+    parameter_name: Optional[str] = None,
+    negate: bool = False,
+) -> dict:
+    if parameter_name is not None:
+        right_operand = {"type": "DynamicOperand", "operand_name": parameter_name}
+    else:
+        right_operand = {"type": "StaticOperand", "value": value}
+    return {
+        "type": "BinaryStatement",
+        "left_operand": {
+            "type": "DynamicOperand",
+            "operations": [
+                {"type": "ExtractDetectionProperty", "property_name": property_name}
+            ],
+        },
+        "comparator": {"type": comparator},
+        "right_operand": right_operand,
+        "negate": negate,
+    }
+
+
+def statement_group(*statements: dict, operator: str = "or") -> StatementGroup:
+    return StatementGroup.model_validate(
+        {"type": "StatementGroup", "statements": list(statements), "operator": operator}
+    )
+
+
+def generate_detections(n: int = 200) -> sv.Detections:
+    rng = np.random.default_rng(seed=42)
+    top_left = rng.uniform(0, 500, size=(n, 2))
+    sizes = rng.uniform(1, 100, size=(n, 2))
+    class_id = rng.integers(0, 3, size=n)
+    return sv.Detections(
+        xyxy=np.concatenate([top_left, top_left + sizes], axis=1).astype(np.float32),
+        confidence=rng.uniform(size=n).astype(np.float32),
+        class_id=class_id,
+        data={"class_name": np.array(["car", "truck", "person"])[class_id]},
+    )
+
+
+def filter_with_interpreter(
+    detections: sv.Detections,
+    definition: StatementGroup,
+    parameters: Dict[str, Any],
+) -> sv.Detections:
+    return filter_detections(
+        detections=detections,
+        filtering_fun=compile_eval_function(definition=definition),
+        global_parameters=parameters,
+    )
+
+
+@pytest.mark.parametrize(
+    "definition, parameters",
+    [
+        (statement_group(property_statement("class_name", "==", "car")), {}),
+        (statement_group(property_statement("class_name", "!=", "car")), {}),
+        (statement_group(property_statement("class_id", "(Number) ==", 1)), {}),
+        (statement_group(property_statement("class_id", "(Number) !=", 1.0)), {}),
+        (
+            statement_group(
+                property_statement("class_name", "in (Sequence)", ["car", "truck"])
+            ),
+            {},
+        ),
+        (statement_group(property_statement("class_id", "in (Sequence)", [])), {}),
+        (statement_group(property_statement("confidence", "(Number) >", 0.3)), {}),
+        (statement_group(property_statement("confidence", "(Number) >=", 0.5)), {}),
+        (statement_group(property_statement("size", "(Number) <", 1000)), {}),
+        (statement_group(property_statement("x_min", "(Number) <=", 250.5)), {}),
+        (statement_group(property_statement("y_max", "(Number) >", 300)), {}),
+        (
+            statement_group(
+                property_statement("confidence", "(Number) >", parameter_name="t")
+            ),
+            {"t": 0.7},
+        ),
+        (
+            statement_group(
+                property_statement("center", "(Detection) in zone", parameter_name="z")
+            ),
+            {"z": [[0, 0], [300, 0], [300, 300], [0, 300]]},
+        ),
+        (
+            statement_group(
+                property_statement("class_name", "==", "car"),
+                property_statement("confidence", "(Number) >=", 0.5, negate=True),
+                operator="and",
+            ),
+            {},
+        ),
+        (
+            statement_group(
+                property_statement("class_name", "==", "car"),
+                property_statement("size", "(Number) >", 5000),
+                operator="or",
+            ),
+            {},
+        ),
+    ],
+)
+def test_mask_function_gives_the_same_result_as_interpreter(
+    definition: StatementGroup,
+    parameters: Dict[str, Any],
+) -> None:
+    # given
+    detections = generate_detections()
+    mask_function = build_detections_mask_function(definition=definition)
+
+    # when
+    result = filter_detections(
+        detections=detections,
+        filtering_fun=compile_eval_function(definition=definition),
+        global_parameters=parameters,
+        mask_function=mask_function,
+    )
+
+    # then
+    expected_result = filter_with_interpreter(
+        detections=detections, definition=definition, parameters=parameters
+    )
+    assert mask_function is not None, "Expected definition to be lowered"
+    assert mask_function(detections, parameters) is not None
+    assert len(expected_result) < len(detections), "Expected filter to be selective"
+    assert result == expected_result
+
+
+def test_mask_function_gives_the_same_result_as_interpreter_at_float_precision_boundary() -> (
+    None
+):
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10]] * 3, dtype=np.float32),
+        confidence=np.array([0.3, 0.5, 0.7], dtype=np.float32),
+        class_id=np.array([0, 0, 0]),
+    )
+    definition = statement_group(property_statement("confidence", "(Number) >", 0.3))
+    mask_function = build_detections_mask_function(definition=definition)
+
+    # when
+    result = filter_detections(
+        detections=detections,
+        filtering_fun=compile_eval_function(definition=definition),
+        global_parameters={},
+        mask_function=mask_function,
+    )
+
+    # then
+    expected_result = filter_with_interpreter(
+        detections=detections, definition=definition, parameters={}
+    )
+    assert result == expected_result
+    assert len(result) == 3, "float32(0.3) is greater than 0.3"
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        statement_group(
+            {
+                "type": "UnaryStatement",
+                "operand": {"type": "DynamicOperand", "operand_name": "_"},
+                "operator": {"type": "Exists"},
+            }
+        ),
+        statement_group(property_statement("class_name", "(String) startsWith", "c")),
+        statement_group(property_statement("center", "==", [1, 1])),
+        statement_group(property_statement("confidence", "(Detection) in zone", [])),
+        statement_group(
+            {
+                "type": "BinaryStatement",
+                "left_operand": {"type": "StaticOperand", "value": 0.5},
+                "comparator": {"type": "(Number) <"},
+                "right_operand": {
+                    "type": "DynamicOperand",
+                    "operations": [
+                        {
+                            "type": "ExtractDetectionProperty",
+                            "property_name": "confidence",
+                        }
+                    ],
+                },
+            }
+        ),
+        statement_group(
+            property_statement("class_name", "==", "car"),
+            property_statement("class_name", "(String) endsWith", "r"),
+        ),
+    ],
+)
+def test_build_detections_mask_function_when_definition_cannot_be_lowered(
+    definition: StatementGroup,
+) -> None:
+    # when
+    result = build_detections_mask_function(definition=definition)
+
+    # then
+    assert result is None
+
+
+@pytest.mark.parametrize(
+    "definition, parameters",
+    [
+        (statement_group(property_statement("confidence", "(Number) >", "0.5")), {}),
+        (statement_group(property_statement("class_name", "==", 1)), {}),
+        (statement_group(property_statement("class_name", "in (Sequence)", "car")), {}),
+        (
+            statement_group(property_statement("class_id", "in (Sequence)", [1, "a"])),
+            {},
+        ),
+        (
+            statement_group(
+                property_statement("confidence", "(Number) >", parameter_name="t")
+            ),
+            {},
+        ),
+        (
+            statement_group(
+                property_statement("confidence", "(Number) >", parameter_name="t")
+            ),
+            {"t": np.float32(0.5)},
+        ),
+    ],
+)
+def test_mask_function_falls_back_to_interpreter_when_values_not_supported(
+    definition: StatementGroup,
+    parameters: Dict[str, Any],
+) -> None:
+    # given
+    detections = generate_detections()
+    mask_function = build_detections_mask_function(definition=definition)
+
+    # when
+    result = mask_function(detections, parameters)
+
+    # then
+    assert result is None
+
+
+def test_mask_function_falls_back_to_interpreter_when_class_names_are_objects() -> None:
+    # given
+    detections = generate_detections()
+    detections.data["class_name"] = detections.data["class_name"].astype(object)
+    mask_function = build_detections_mask_function(
+        definition=statement_group(property_statement("class_name", "==", "car"))
+    )
+
+    # when
+    result = mask_function(detections, {})
+
+    # then
+    assert result is None
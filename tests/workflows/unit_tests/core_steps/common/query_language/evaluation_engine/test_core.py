@@ -0,0 +1,69 @@
+from unittest import mock
+
+import numpy as np
+
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    StatementGroup,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine import (
+    core,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    build_eval_function,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.utils import (
+    hash_definition,
+)
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+)
+
+
+def create_definition(reference: object) -> StatementGroup:
+    return StatementGroup.model_validate(
+        {
+            "type": "StatementGroup",
+            "statements": [
+                {
+                    "type": "BinaryStatement",
+                    "left_operand": {"type": "DynamicOperand", "operand_name": "a"},
+                    "comparator": {"type": "=="},
+                    "right_operand": {"type": "StaticOperand", "value": reference},
+                }
+            ],
+        }
+    )
+
+
+@mock.patch.object(
+    core,
+    "EVAL_FUNCTIONS_CACHE",
+    BasicWorkflowsCache(
+        cache_size=16,
+        hash_functions=[("definition", hash_definition), ("execution_context", str)],
+    ),
+)
+def test_build_eval_function_reuses_function_compiled_for_equal_definition() -> None:
+    # when
+    first_function = build_eval_function(definition=create_definition(reference=1))
+    second_function = build_eval_function(definition=create_definition(reference=1))
+    third_function = build_eval_function(definition=create_definition(reference=2))
+
+    # then
+    assert first_function is second_function
+    assert third_function is not first_function
+    assert first_function({"a": 1}) is True
+    assert third_function({"a": 1}) is False
+
+
+def test_build_eval_function_when_definition_cannot_be_serialised() -> None:
+    # given
+    definition = create_definition(reference=np.array([1, 2]))
+
+    # when
+    first_function = build_eval_function(definition=definition)
+    second_function = build_eval_function(definition=definition)
+
+    # then
+    assert first_function is not second_function, "Expected not to be cached"
+    assert first_function({"a": 1}).tolist() == [True, False]
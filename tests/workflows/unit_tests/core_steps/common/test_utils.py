@@ -1,14 +1,25 @@
 from copy import deepcopy
+from unittest import mock
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 import supervision as sv
 
+from inference.core.cache.memory import MemoryCache
+from inference.core.entities.requests.clip import (
+    ClipImageEmbeddingRequest,
+    ClipTextEmbeddingRequest,
+)
+from inference.core.entities.responses.clip import ClipEmbeddingResponse
+from inference.core.workflows.core_steps.common import utils
 from inference.core.workflows.core_steps.common.utils import (
     add_inference_keypoints_to_sv_detections,
     attach_parents_coordinates_to_sv_detections,
     attach_prediction_type_info,
     attach_prediction_type_info_to_sv_detections_batch,
+    calculate_cosine_similarity_matrix,
+    compare_images_with_texts_using_clip_locally,
     convert_inference_detections_batch_to_sv_detections,
     filter_out_unwanted_classes_from_sv_detections_batch,
     grab_batch_parameters,
@@ -1205,3 +1216,135 @@ def test_remove_unexpected_keys_from_dictionary_when_part_of_keys_are_not_expect
 
     # then
     assert result == {"a": 1}
+
+
+def test_calculate_cosine_similarity_matrix() -> None:
+    # given
+    a = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 3.0]])
+    b = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+    # when
+    result = calculate_cosine_similarity_matrix(a=a, b=b)
+
+    # then
+    assert np.allclose(result, np.array([[1.0, 0.0], [0.0, 1.0], [0.5**0.5, 0.5**0.5]]))
+
+
+def test_calculate_cosine_similarity_matrix_when_empty_input_given() -> None:
+    # when
+    result = calculate_cosine_similarity_matrix(
+        a=np.zeros((0, 2)), b=np.array([[1.0, 0.0]])
+    )
+
+    # then
+    assert result.shape == (0, 1)
+
+
+@mock.patch.object(utils, "cache", MemoryCache())
+@mock.patch.object(utils, "CLIP_MAX_BATCH_SIZE", 2)
+def test_compare_images_with_texts_using_clip_locally_embeds_texts_once_and_images_in_batches() -> (
+    None
+):
+    # given
+    model_manager = MagicMock()
+    model_manager.infer_from_request_sync.side_effect = [
+        ClipEmbeddingResponse(embeddings=[[1.0, 0.0], [0.0, 1.0]]),
+        ClipEmbeddingResponse(embeddings=[[1.0, 0.0], [0.0, 1.0]]),
+        ClipEmbeddingResponse(embeddings=[[1.0, 1.0]]),
+    ]
+    images = Batch(
+        content=[
+            WorkflowImageData(
+                parent_metadata=ImageParentMetadata(parent_id=f"image_{i}"),
+                numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+            )
+            for i in range(3)
+        ],
+        indices=[(0,), (1,), (2,)],
+    )
+
+    # when
+    result = compare_images_with_texts_using_clip_locally(
+        model_manager=model_manager,
+        images=images,
+        texts=["a", "b"],
+        clip_version="ViT-B-16",
+        api_key="my-api-key",
+    )
+
+    # then
+    model_manager.add_model.assert_called_once_with("clip/ViT-B-16", "my-api-key")
+    requests = [
+        call[0][1] for call in model_manager.infer_from_request_sync.call_args_list
+    ]
+    assert isinstance(requests[0], ClipTextEmbeddingRequest)
+    assert requests[0].text == ["a", "b"]
+    assert [type(r) for r in requests[1:]] == [ClipImageEmbeddingRequest] * 2
+    assert [len(r.image) for r in requests[1:]] == [2, 1]
+    assert len(result) == 3
+    assert np.allclose(result[0]["similarity"], [1.0, 0.0])
+    assert np.allclose(result[1]["similarity"], [0.0, 1.0])
+    assert np.allclose(result[2]["similarity"], [0.5**0.5, 0.5**0.5])
+
+
+@mock.patch.object(utils, "cache", MemoryCache())
+def test_compare_images_with_texts_using_clip_locally_reuses_cached_text_embeddings() -> (
+    None
+):
+    # given
+    model_manager = MagicMock()
+    model_manager.infer_from_request_sync.side_effect = [
+        ClipEmbeddingResponse(embeddings=[[1.0, 0.0], [0.0, 1.0]]),
+        ClipEmbeddingResponse(embeddings=[[1.0, 0.0]]),
+        ClipEmbeddingResponse(embeddings=[[0.0, 1.0]]),
+        ClipEmbeddingResponse(embeddings=[[1.0, 1.0]]),
+        ClipEmbeddingResponse(embeddings=[[0.0, 1.0]]),
+    ]
+    images = Batch(
+        content=[
+            WorkflowImageData(
+                parent_metadata=ImageParentMetadata(parent_id="image"),
+                numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+            )
+        ],
+        indices=[(0,)],
+    )
+
+    # when
+    first_result = compare_images_with_texts_using_clip_locally(
+        model_manager=model_manager,
+        images=images,
+        texts=["a", "b"],
+        clip_version="ViT-B-16",
+        api_key="my-api-key",
+    )
+    second_result = compare_images_with_texts_using_clip_locally(
+        model_manager=model_manager,
+        images=images,
+        texts=["b", "a"],
+        clip_version="ViT-B-16",
+        api_key="my-api-key",
+    )
+    third_result = compare_images_with_texts_using_clip_locally(
+        model_manager=model_manager,
+        images=images,
+        texts=["a", "c"],
+        clip_version="ViT-B-16",
+        api_key="my-api-key",
+    )
+
+    # then
+    requests = [
+        call[0][1] for call in model_manager.infer_from_request_sync.call_args_list
+    ]
+    assert [type(r) for r in requests] == [
+        ClipTextEmbeddingRequest,
+        ClipImageEmbeddingRequest,
+        ClipImageEmbeddingRequest,
+        ClipTextEmbeddingRequest,
+        ClipImageEmbeddingRequest,
+    ], "Expected text embeddings to be calculated only for texts not seen before"
+    assert requests[3].text == ["c"]
+    assert np.allclose(first_result[0]["similarity"], [1.0, 0.0])
+    assert np.allclose(second_result[0]["similarity"], [1.0, 0.0])
+    assert np.allclose(third_result[0]["similarity"], [0.0, 0.5**0.5])
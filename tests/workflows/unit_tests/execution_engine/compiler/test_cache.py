@@ -83,3 +83,26 @@ def test_cache_being_emptied_properly() -> None:
     assert cache.get(key_one) is None
     assert cache.get(key_two) == "my_value_2"
     assert cache.get(key_three) == "my_value_3"
+
+
+def test_cache_when_the_same_key_cached_multiple_times() -> None:
+    # given
+    cache = BasicWorkflowsCache[str](
+        cache_size=2,
+        hash_functions=[("some", lambda v: str(v))],
+    )
+    key_one = cache.get_hash_key(some=1)
+    key_two = cache.get_hash_key(some=2)
+    key_three = cache.get_hash_key(some=3)
+
+    # when
+    cache.cache(key=key_one, value="my_value_1")
+    cache.cache(key=key_one, value="my_value_1")
+    cache.cache(key=key_two, value="my_value_2")
+    cache.cache(key=key_three, value="my_value_3")
+    cache.cache(key=key_one, value="my_value_1")
+
+    # then
+    assert cache.get(key_one) == "my_value_1"
+    assert cache.get(key_two) is None
+    assert cache.get(key_three) == "my_value_3"
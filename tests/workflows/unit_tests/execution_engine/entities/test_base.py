@@ -7,6 +7,8 @@ import cv2
 import numpy as np
 import pytest
 
+from inference.core.utils.image_utils import attempt_loading_image_from_string
+from inference.core.utils.preprocessing_cache import request_preprocessing_cache_scope
 from inference.core.workflows.execution_engine.entities import base
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
@@ -574,3 +576,32 @@ def test_workflow_image_data_to_inference_format_when_numpy_not_preferred_but_ba
     # then
     assert result["type"] == "base64"
     assert result["value"] == "base64_value"
+
+
+def test_getting_np_image_when_images_of_the_same_base64_representation_decoded_within_request() -> (
+    None
+):
+    # given
+    base64_image = base64.b64encode(
+        cv2.imencode(".jpg", np.zeros((192, 168, 3), dtype=np.uint8))[1]
+    ).decode("ascii")
+    images = [
+        WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id=f"parent_{i}"),
+            base64_image=base64_image,
+        )
+        for i in range(2)
+    ]
+
+    # when
+    with request_preprocessing_cache_scope():
+        with mock.patch.object(
+            base,
+            "attempt_loading_image_from_string",
+            side_effect=attempt_loading_image_from_string,
+        ) as decoding_mock:
+            results = [image.numpy_image for image in images]
+
+    # then
+    assert decoding_mock.call_count == 1
+    assert results[0] is results[1]
@@ -0,0 +1,196 @@
+from enum import Enum
+
+import numpy as np
+
+from inference.core.workflows.execution_engine.v1.entities import FlowControl
+from inference.core.workflows.execution_engine.v1.executor.memoisation import (
+    StepsOutputsMemory,
+    fingerprint_step_input,
+)
+
+
+class MyEnum(Enum):
+    A = "a"
+    B = "b"
+
+
+def test_fingerprint_step_input_is_stable_for_equal_inputs() -> None:
+    # given
+    first_input = {
+        "a": 1,
+        "b": [1.5, "some", None, True],
+        "c": {"x": np.array([1, 2, 3]), "y": MyEnum.A},
+    }
+    second_input = {
+        "c": {"y": MyEnum.A, "x": np.array([1, 2, 3])},
+        "b": [1.5, "some", None, True],
+        "a": 1,
+    }
+
+    # when
+    first_result = fingerprint_step_input(step_input=first_input)
+    second_result = fingerprint_step_input(step_input=second_input)
+
+    # then
+    assert first_result is not None
+    assert first_result == second_result
+
+
+def test_fingerprint_step_input_changes_when_input_changes() -> None:
+    # given
+    base_input = {"a": 1, "b": np.array([1, 2, 3]), "c": MyEnum.A}
+
+    # when
+    base_result = fingerprint_step_input(step_input=base_input)
+    changed_value_result = fingerprint_step_input(step_input={**base_input, "a": 2})
+    changed_type_result = fingerprint_step_input(step_input={**base_input, "a": "1"})
+    changed_array_result = fingerprint_step_input(
+        step_input={**base_input, "b": np.array([1, 2, 4])}
+    )
+    changed_dtype_result = fingerprint_step_input(
+        step_input={**base_input, "b": np.array([1, 2, 3], dtype=np.uint8)}
+    )
+    changed_enum_result = fingerprint_step_input(
+        step_input={**base_input, "c": MyEnum.B}
+    )
+
+    # then
+    assert (
+        len(
+            {
+                base_result,
+                changed_value_result,
+                changed_type_result,
+                changed_array_result,
+                changed_dtype_result,
+                changed_enum_result,
+            }
+        )
+        == 6
+    ), "Expected each change of input to produce different fingerprint"
+
+
+def test_fingerprint_step_input_when_value_cannot_be_fingerprinted() -> None:
+    # when
+    result = fingerprint_step_input(step_input={"a": 1, "b": object()})
+
+    # then
+    assert result is None
+
+
+def test_steps_outputs_memory_retrieve_when_nothing_registered() -> None:
+    # given
+    memory = StepsOutputsMemory()
+
+    # when
+    result = memory.retrieve(step_selector="$steps.a", fingerprint="fingerprint")
+
+    # then
+    assert result is None
+
+
+def test_steps_outputs_memory_retrieve_when_fingerprint_matches() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    memory.register(
+        step_selector="$steps.a",
+        fingerprint="fingerprint",
+        output={"value": [1, 2, 3]},
+    )
+
+    # when
+    result = memory.retrieve(step_selector="$steps.a", fingerprint="fingerprint")
+
+    # then
+    assert result == {"value": [1, 2, 3]}
+
+
+def test_steps_outputs_memory_retrieve_when_fingerprint_does_not_match() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    memory.register(
+        step_selector="$steps.a",
+        fingerprint="fingerprint",
+        output={"value": [1, 2, 3]},
+    )
+
+    # when
+    result = memory.retrieve(step_selector="$steps.a", fingerprint="other")
+
+    # then
+    assert result is None
+
+
+def test_steps_outputs_memory_keeps_only_last_output_of_step() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    memory.register(step_selector="$steps.a", fingerprint="first", output={"value": 1})
+    memory.register(step_selector="$steps.a", fingerprint="second", output={"value": 2})
+
+    # when
+    first_result = memory.retrieve(step_selector="$steps.a", fingerprint="first")
+    second_result = memory.retrieve(step_selector="$steps.a", fingerprint="second")
+
+    # then
+    assert first_result is None
+    assert second_result == {"value": 2}
+
+
+def test_steps_outputs_memory_does_not_share_memoised_values() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    output = {"value": [1, 2, 3]}
+    memory.register(step_selector="$steps.a", fingerprint="fingerprint", output=output)
+
+    # when
+    output["value"].append(4)
+    retrieved = memory.retrieve(step_selector="$steps.a", fingerprint="fingerprint")
+    retrieved["value"].append(5)
+    result = memory.retrieve(step_selector="$steps.a", fingerprint="fingerprint")
+
+    # then
+    assert result == {"value": [1, 2, 3]}
+
+
+def test_steps_outputs_memory_memoises_flow_control() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    memory.register(
+        step_selector="$steps.a",
+        fingerprint="fingerprint",
+        output=FlowControl(mode="select_step", context="$steps.b"),
+    )
+
+    # when
+    result = memory.retrieve(step_selector="$steps.a", fingerprint="fingerprint")
+
+    # then
+    assert result == FlowControl(mode="select_step", context="$steps.b")
+
+
+def test_steps_outputs_memory_invalidate_single_step() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    memory.register(step_selector="$steps.a", fingerprint="fa", output={"value": 1})
+    memory.register(step_selector="$steps.b", fingerprint="fb", output={"value": 2})
+
+    # when
+    memory.invalidate(step_selector="$steps.a")
+
+    # then
+    assert memory.retrieve(step_selector="$steps.a", fingerprint="fa") is None
+    assert memory.retrieve(step_selector="$steps.b", fingerprint="fb") == {"value": 2}
+
+
+def test_steps_outputs_memory_invalidate_all_steps() -> None:
+    # given
+    memory = StepsOutputsMemory()
+    memory.register(step_selector="$steps.a", fingerprint="fa", output={"value": 1})
+    memory.register(step_selector="$steps.b", fingerprint="fb", output={"value": 2})
+
+    # when
+    memory.invalidate()
+
+    # then
+    assert memory.retrieve(step_selector="$steps.a", fingerprint="fa") is None
+    assert memory.retrieve(step_selector="$steps.b", fingerprint="fb") is None
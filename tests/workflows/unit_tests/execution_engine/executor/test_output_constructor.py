@@ -336,6 +336,26 @@ def test_create_array_for_dimension_two() -> None:
     ]
 
 
+def test_create_array_for_dimension_two_when_indices_are_not_sorted() -> None:
+    # when
+    result = create_array(
+        indices=np.array(
+            [(4, 2), (0, 2), (6, 1), (4, 0), (1, 0), (0, 0), (6, 0), (4, 1)]
+        )
+    )
+
+    # then
+    assert result == [
+        [None, None, None],
+        [None],
+        [],
+        [],
+        [None, None, None],
+        [],
+        [None, None],
+    ]
+
+
 def test_create_array_for_dimension_three() -> None:
     # when
     result = create_array(
@@ -190,6 +190,34 @@ def test_assemble_runtime_parameters_when_image_is_provided_in_batch() -> None:
     )
 
 
+@mock.patch.object(runtime_input_assembler, "load_image_from_url")
+def test_assemble_runtime_parameters_when_images_are_provided_in_batch_as_urls(
+    load_image_from_url_mock: MagicMock,
+) -> None:
+    # given
+    load_image_from_url_mock.side_effect = lambda value: np.full(
+        (192, 168, 3), int(value[-5]), dtype=np.uint8
+    )
+    runtime_parameters = {
+        "image1": [
+            {"type": "url", "value": f"https://some.com/image{i}.jpg"} for i in range(5)
+        ]
+    }
+    defined_inputs = [WorkflowImage(type="WorkflowImage", name="image1")]
+
+    # when
+    result = assemble_runtime_parameters(
+        runtime_parameters=runtime_parameters,
+        defined_inputs=defined_inputs,
+    )
+
+    # then
+    assert len(result["image1"]) == 5
+    for i, image in enumerate(result["image1"]):
+        assert image.parent_metadata.parent_id == f"image1.[{i}]"
+        assert np.all(image.numpy_image == i), "Expected order of images preserved"
+
+
 def test_assemble_runtime_parameters_when_parameter_not_provided() -> None:
     # given
     runtime_parameters = {}
@@ -0,0 +1,39 @@
+from contextvars import ContextVar
+
+from inference.core.workflows.execution_engine.v1.executor.utils import (
+    run_steps_in_parallel,
+)
+
+VARIABLE: ContextVar[str] = ContextVar("variable", default="default")
+
+
+def test_run_steps_in_parallel_when_context_of_caller_is_set() -> None:
+    # given
+    token = VARIABLE.set("value")
+
+    # when
+    try:
+        result = run_steps_in_parallel(
+            steps=[lambda: VARIABLE.get(), lambda: VARIABLE.get()],
+            max_workers=2,
+        )
+    finally:
+        VARIABLE.reset(token)
+
+    # then
+    assert result == ["value", "value"]
+
+
+def test_run_steps_in_parallel_when_steps_modify_context() -> None:
+    # given
+    def step() -> str:
+        previous_value = VARIABLE.get()
+        VARIABLE.set("modified")
+        return previous_value
+
+    # when
+    result = run_steps_in_parallel(steps=[step, step, step], max_workers=1)
+
+    # then
+    assert result == ["default", "default", "default"]
+    assert VARIABLE.get() == "default"
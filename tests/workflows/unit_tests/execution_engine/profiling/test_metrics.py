@@ -0,0 +1,363 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from inference.core.workflows.core_steps.formatters.expression.v1 import (
+    BlockManifest as ExpressionManifest,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    ImageParentMetadata,
+    WorkflowImageData,
+)
+from inference.core.workflows.execution_engine.profiling import metrics
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    LatencyHistogram,
+    WorkflowsMetricsCollector,
+    calculate_images_bytes,
+)
+
+
+def test_latency_histogram_when_nothing_observed() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    result = histogram.quantile(0.5)
+
+    # then
+    assert result is None
+    assert histogram.count == 0
+
+
+def test_latency_histogram_quantiles_are_within_observed_buckets() -> None:
+    # given
+    histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0, float("inf")))
+    for _ in range(90):
+        histogram.observe(0.005)
+    for _ in range(10):
+        histogram.observe(0.5)
+
+    # when
+    p50 = histogram.quantile(0.5)
+    p99 = histogram.quantile(0.99)
+
+    # then
+    assert 0.0 < p50 <= 0.01
+    assert 0.1 < p99 <= 0.5, "Quantile cannot exceed max observed value"
+    assert histogram.cumulative_counts() == [90, 90, 100, 100]
+    assert abs(histogram.sum - 5.45) < 1e-6
+    assert histogram.max == 0.5
+
+
+def test_latency_histogram_quantile_in_overflow_bucket() -> None:
+    # given
+    histogram = LatencyHistogram(buckets=(0.01, float("inf")))
+    histogram.observe(3.0)
+
+    # when
+    result = histogram.quantile(0.99)
+
+    # then
+    assert result == 3.0
+
+
+def test_collector_records_aggregates_per_step_and_per_block_type() -> None:
+    # given
+    collector = WorkflowsMetricsCollector()
+
+    # when
+    collector.record_step_execution(
+        workflow_id="a",
+        step_name="model",
+        block_type="ObjectDetectionModel",
+        duration=0.1,
+        batch_size=4,
+        images_bytes=100,
+        peak_memory_delta_bytes=10,
+    )
+    collector.record_step_execution(
+        workflow_id="b",
+        step_name="model",
+        block_type="ObjectDetectionModel",
+        duration=0.3,
+        batch_size=2,
+        images_bytes=50,
+        peak_memory_delta_bytes=30,
+    )
+    steps_report = collector.get_steps_report()
+    blocks_report = collector.get_blocks_report()
+
+    # then
+    assert len(steps_report) == 2, "Expected separate aggregates for each workflow"
+    assert {(r.workflow_id, r.step_name) for r in steps_report} == {
+        ("a", "model"),
+        ("b", "model"),
+    }
+    assert len(blocks_report) == 1, "Expected aggregates for single block type"
+    block_report = blocks_report[0]
+    assert block_report.block_type == "ObjectDetectionModel"
+    assert block_report.workflow_id is None
+    assert block_report.executions == 2
+    assert abs(block_report.latency_mean - 0.2) < 1e-6
+    assert block_report.latency_max == 0.3
+    assert block_report.batch_size_mean == 3.0
+    assert block_report.batch_size_max == 4
+    assert block_report.images_bytes == 150
+    assert block_report.peak_memory_delta_bytes == 30
+
+
+def test_collector_measure_step_execution_when_execution_sampled() -> None:
+    # given
+    collector = WorkflowsMetricsCollector(sampling_rate=1.0, measure_resources=True)
+    manifest = ExpressionManifest.model_validate(
+        {
+            "type": "Expression",
+            "name": "expression",
+            "data": {},
+            "switch": {
+                "type": "CasesDefinition",
+                "cases": [],
+                "default": {"type": "StaticCaseResult", "value": 1},
+            },
+        }
+    )
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="some"),
+        numpy_image=np.zeros((10, 10, 3), dtype=np.uint8),
+    )
+
+    # when
+    with collector.for_workflow(workflow_id="my_workflow").measure_step_execution(
+        step_name="expression",
+        step_manifest=manifest,
+        batch_size=1,
+        step_input={"data": {"image": image}},
+    ):
+        pass
+    result = collector.get_steps_report()
+
+    # then
+    assert len(result) == 1
+    assert result[0].workflow_id == "my_workflow"
+    assert result[0].step_name == "expression"
+    assert (
+        result[0].block_type == "roboflow_core/expression@v1"
+    ), "Expected block type to be resolved into canonical identifier"
+    assert result[0].executions == 1
+    assert result[0].images_bytes == 300
+
+
+def test_collector_measure_step_execution_when_sampling_disabled() -> None:
+    # given
+    collector = WorkflowsMetricsCollector(sampling_rate=0.0)
+
+    # when
+    with collector.measure_step_execution(
+        workflow_id="my_workflow",
+        step_name="expression",
+        step_manifest=mock.MagicMock(),
+        batch_size=1,
+        step_input={},
+    ):
+        pass
+
+    # then
+    assert collector.get_steps_report() == []
+    assert collector.get_blocks_report() == []
+
+
+def test_collector_measure_step_execution_when_step_raises_error() -> None:
+    # given
+    collector = WorkflowsMetricsCollector(sampling_rate=1.0)
+
+    # when
+    with pytest.raises(ValueError):
+        with collector.measure_step_execution(
+            workflow_id="my_workflow",
+            step_name="expression",
+            step_manifest=mock.MagicMock(),
+            batch_size=1,
+            step_input={},
+        ):
+            raise ValueError()
+
+    # then
+    assert collector.get_steps_report() == [], "Failed executions are not measured"
+
+
+def test_collector_reset() -> None:
+    # given
+    collector = WorkflowsMetricsCollector()
+    collector.record_step_execution(
+        workflow_id=None,
+        step_name="model",
+        block_type="ObjectDetectionModel",
+        duration=0.1,
+        batch_size=1,
+    )
+
+    # when
+    collector.reset()
+
+    # then
+    assert collector.get_steps_report() == []
+    assert collector.get_blocks_report() == []
+
+
+def test_calculate_images_bytes_does_not_decode_images() -> None:
+    # given
+    decoded_image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="decoded"),
+        numpy_image=np.zeros((10, 10, 3), dtype=np.uint8),
+    )
+    not_decoded_image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="not_decoded"),
+        image_reference="/some/path.jpg",
+    )
+    value = {
+        "images": Batch(
+            content=[decoded_image, not_decoded_image], indices=[(0,), (1,)]
+        ),
+        "other": [decoded_image, "some"],
+    }
+
+    # when
+    with mock.patch.object(
+        WorkflowImageData, "numpy_image", new_callable=mock.PropertyMock
+    ) as numpy_image_mock:
+        result = calculate_images_bytes(value=value)
+
+    # then
+    assert result == 600
+    numpy_image_mock.assert_not_called()
+
+
+def test_get_peak_memory_usage_when_resource_module_not_available() -> None:
+    # when
+    with mock.patch.object(metrics, "resource", None):
+        result = metrics.get_peak_memory_usage()
+
+    # then
+    assert result == 0
+
+
+def test_get_current_memory_usage_when_procfs_not_available() -> None:
+    # when
+    with mock.patch.object(metrics, "PROC_STATM_PATH", "/not/existing/statm"):
+        result = metrics.get_current_memory_usage()
+
+    # then
+    assert result == 0
+
+
+def test_measure_step_execution_when_memory_released_by_step() -> None:
+    # given
+    collector = WorkflowsMetricsCollector(sampling_rate=1.0, measure_resources=True)
+    manifest = ExpressionManifest.model_validate(
+        {
+            "type": "Expression",
+            "name": "expression",
+            "data": {},
+            "switch": {
+                "type": "CasesDefinition",
+                "cases": [],
+                "default": {"type": "StaticCaseResult", "value": 1},
+            },
+        }
+    )
+
+    # when
+    with mock.patch.object(
+        metrics, "get_current_memory_usage", side_effect=[2048, 1024]
+    ):
+        with collector.measure_step_execution(
+            workflow_id="my_workflow",
+            step_name="expression",
+            step_manifest=manifest,
+            batch_size=1,
+            step_input={},
+        ):
+            pass
+
+    # then
+    step_report = collector.get_steps_report()[0]
+    assert step_report.peak_memory_delta_bytes == 0
+
+
+def test_collector_measure_step_execution_when_resources_not_measured() -> None:
+    # given
+    collector = WorkflowsMetricsCollector(sampling_rate=1.0)
+    manifest = ExpressionManifest.model_validate(
+        {
+            "type": "Expression",
+            "name": "expression",
+            "data": {},
+            "switch": {
+                "type": "CasesDefinition",
+                "cases": [],
+                "default": {"type": "StaticCaseResult", "value": 1},
+            },
+        }
+    )
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="some"),
+        numpy_image=np.zeros((10, 10, 3), dtype=np.uint8),
+    )
+
+    # when
+    with mock.patch.object(metrics, "get_current_memory_usage") as memory_usage_mock:
+        with collector.measure_step_execution(
+            workflow_id="my_workflow",
+            step_name="expression",
+            step_manifest=manifest,
+            batch_size=1,
+            step_input={"data": {"image": image}},
+        ):
+            pass
+
+    # then
+    step_report = collector.get_steps_report()[0]
+    assert step_report.executions == 1
+    assert step_report.images_bytes == 0
+    memory_usage_mock.assert_not_called()
+
+
+def test_collector_record_step_execution_when_workflow_id_not_given() -> None:
+    # given
+    collector = WorkflowsMetricsCollector()
+
+    # when
+    collector.record_step_execution(
+        workflow_id=None,
+        step_name="user_defined_name",
+        block_type="ObjectDetectionModel",
+        duration=0.1,
+        batch_size=1,
+    )
+
+    # then
+    assert collector.get_steps_report() == [], "Ad-hoc steps must not be labels"
+    assert collector.get_blocks_report()[0].executions == 1
+
+
+def test_collector_record_step_execution_when_max_steps_exceeded() -> None:
+    # given
+    collector = WorkflowsMetricsCollector(max_steps=2)
+
+    # when
+    for workflow_id in ["a", "b", "c", "d", "a"]:
+        collector.record_step_execution(
+            workflow_id=workflow_id,
+            step_name="model",
+            block_type="ObjectDetectionModel",
+            duration=0.1,
+            batch_size=1,
+        )
+
+    # then
+    steps_report = {
+        (r.workflow_id, r.step_name): r.executions for r in collector.get_steps_report()
+    }
+    assert steps_report == {("a", "model"): 2, ("b", "model"): 1, ("other", "other"): 2}
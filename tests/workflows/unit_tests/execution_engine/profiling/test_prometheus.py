@@ -0,0 +1,68 @@
+from prometheus_client import CollectorRegistry, generate_latest
+
+from inference.core.workflows.execution_engine.profiling.metrics import (
+    WorkflowsMetricsCollector,
+)
+from inference.core.workflows.execution_engine.profiling.prometheus import (
+    register_workflows_metrics_in_prometheus,
+)
+
+
+def test_register_workflows_metrics_in_prometheus_exposes_aggregates() -> None:
+    # given
+    registry = CollectorRegistry()
+    collector = WorkflowsMetricsCollector()
+    collector.record_step_execution(
+        workflow_id="my_workflow",
+        step_name="model",
+        block_type="ObjectDetectionModel",
+        duration=0.02,
+        batch_size=4,
+        images_bytes=1024,
+        peak_memory_delta_bytes=2048,
+    )
+
+    # when
+    register_workflows_metrics_in_prometheus(
+        metrics_collector=collector, registry=registry
+    )
+    result = generate_latest(registry).decode("utf-8")
+
+    # then
+    assert (
+        'workflows_step_execution_seconds_bucket{block_type="ObjectDetectionModel",'
+        'le="0.025",step="model",workflow_id="my_workflow"} 1.0' in result
+    )
+    assert (
+        'workflows_step_execution_seconds_count{block_type="ObjectDetectionModel",'
+        'step="model",workflow_id="my_workflow"} 1.0' in result
+    )
+    assert (
+        'workflows_block_batch_elements_total{block_type="ObjectDetectionModel"} 4.0'
+        in result
+    )
+    assert (
+        'workflows_block_images_bytes_total{block_type="ObjectDetectionModel"} 1024.0'
+        in result
+    )
+    assert (
+        'workflows_block_peak_memory_delta_bytes{block_type="ObjectDetectionModel"} 2048.0'
+        in result
+    )
+
+
+def test_register_workflows_metrics_in_prometheus_when_registered_twice() -> None:
+    # given
+    registry = CollectorRegistry()
+    collector = WorkflowsMetricsCollector()
+
+    # when
+    first_result = register_workflows_metrics_in_prometheus(
+        metrics_collector=collector, registry=registry
+    )
+    second_result = register_workflows_metrics_in_prometheus(
+        metrics_collector=collector, registry=registry
+    )
+
+    # then
+    assert first_result is second_result, "Expected collector to be registered once"